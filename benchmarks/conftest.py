@@ -0,0 +1,81 @@
+"""
+Shared fixtures for the benchmark suite.
+
+Results are saved as JSON under .benchmarks/ (one file per run, named after the
+commit), so two commits can be compared with:
+
+    pytest benchmarks --benchmark-compare=0001 --benchmark-compare-fail=mean:10%
+
+The endpoint benchmarks run against a synthetic encrypted database, its size
+is selected with --portfolio-size (see synthetic.SPECS).
+"""
+
+import asyncio
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from domain.data_init import DatasourceInitContext, DatasourceInitParams
+from domain.user import User
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.db.manager import DBManager
+from benchmarks.synthetic import SPECS, PortfolioGenerator, SyntheticPortfolio
+
+_PASSWORD = "benchmark"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--portfolio-size",
+        choices=sorted(SPECS),
+        default="large",
+        help="Synthetic portfolio used by the endpoint benchmarks",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    option = config.option
+    if not getattr(option, "benchmark_json", None) and not getattr(
+        option, "benchmark_save", None
+    ):
+        option.benchmark_autosave = True
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def portfolio_db(request, tmp_path_factory, event_loop_runner):
+    """Encrypted database filled with the synthetic portfolio."""
+    spec = SPECS[request.config.getoption("--portfolio-size")]
+    user_path = tmp_path_factory.mktemp("portfolio")
+    user = User(
+        id=UUID(int=spec.seed),
+        username="benchmark",
+        path=user_path,
+        last_login=datetime.now(),
+    )
+
+    client = DBClient()
+    manager = DBManager(client)
+    event_loop_runner(
+        manager.initialize(
+            DatasourceInitParams(
+                user=user,
+                password=_PASSWORD,
+                context=DatasourceInitContext(config=None),
+            )
+        )
+    )
+    portfolio: SyntheticPortfolio = event_loop_runner(
+        PortfolioGenerator(client, spec).generate()
+    )
+
+    yield client, portfolio, user_path
+    event_loop_runner(manager.lock())
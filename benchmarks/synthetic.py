@@ -0,0 +1,614 @@
+"""
+Deterministic synthetic portfolio for the endpoint benchmarks.
+
+Everything is written through the SQL repositories, so the generated database
+goes through the same migrations and write paths as real data. The same spec
+and seed always produce the same rows (ids included), which keeps results
+comparable between commits.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from domain.auto_contributions import (
+    AutoContributions,
+    ContributionFrequency,
+    ContributionTargetType,
+    PeriodicContribution,
+)
+from domain.crypto import (
+    AddressSource,
+    CryptoCurrencyType,
+    CryptoWallet,
+    HDAddress,
+    HDWallet,
+)
+from domain.dezimal import Dezimal
+from domain.earnings_expenses import FlowFrequency, FlowType, PeriodicFlow
+from domain.entity import Entity, EntityOrigin, EntityType
+from domain.fetch_record import DataSource
+from domain.global_position import (
+    Account,
+    Accounts,
+    AccountType,
+    CryptoCurrencies,
+    CryptoCurrencyPosition,
+    CryptoCurrencyWallet,
+    EquityType,
+    FundDetail,
+    FundInvestments,
+    FundType,
+    GlobalPosition,
+    InterestType,
+    Loan,
+    Loans,
+    LoanType,
+    ProductType,
+    StockDetail,
+    StockInvestments,
+)
+from domain.public_key import CoinType, ScriptType
+from domain.real_estate import (
+    BasicInfo,
+    CostPayload,
+    LoanPayload,
+    Location,
+    PurchaseInfo,
+    RealEstate,
+    RealEstateFlow,
+    RealEstateFlowSubtype,
+    RentPayload,
+    ValuationInfo,
+)
+from domain.transactions import AccountTx, StockTx, Transactions, TxType
+from infrastructure.repository import (
+    AutoContributionsRepository,
+    EntityRepository,
+    PositionRepository,
+    TransactionRepository,
+)
+from infrastructure.repository.crypto.crypto_wallet_repository import (
+    CryptoWalletRepository,
+)
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.earnings_expenses.periodic_flow_repository import (
+    PeriodicFlowRepository,
+)
+from infrastructure.repository.real_estate.real_estate_repository import (
+    RealEstateRepository,
+)
+
+_TX_BATCH = 5_000
+
+
+@dataclass(frozen=True)
+class PortfolioSpec:
+    entities: int = 6
+    years: int = 3
+    transactions: int = 100_000
+    stocks_per_entity: int = 12
+    funds_per_entity: int = 4
+    real_estate: int = 3
+    hd_wallets: int = 2
+    addresses_per_wallet: int = 50
+    end: date = date(2025, 12, 31)
+    seed: int = 1
+
+
+SPECS = {
+    "small": PortfolioSpec(
+        entities=3,
+        years=1,
+        transactions=10_000,
+        stocks_per_entity=6,
+        funds_per_entity=2,
+        real_estate=1,
+        hd_wallets=1,
+        addresses_per_wallet=20,
+    ),
+    "large": PortfolioSpec(),
+}
+
+
+@dataclass
+class SyntheticPortfolio:
+    spec: PortfolioSpec
+    start: date
+    end: date
+    entities: list[Entity] = field(default_factory=list)
+    wallet_entities: list[Entity] = field(default_factory=list)
+    real_estate: list[RealEstate] = field(default_factory=list)
+    transaction_count: int = 0
+    snapshot_count: int = 0
+
+
+class PortfolioGenerator:
+    def __init__(self, client: DBClient, spec: PortfolioSpec):
+        self._client = client
+        self._spec = spec
+        self._rng = random.Random(spec.seed)
+        self._entity_repository = EntityRepository(client=client)
+        self._position_repository = PositionRepository(client=client)
+        self._transaction_repository = TransactionRepository(client=client)
+        self._contributions_repository = AutoContributionsRepository(client=client)
+        self._periodic_flow_repository = PeriodicFlowRepository(client=client)
+        self._real_estate_repository = RealEstateRepository(client=client)
+        self._wallet_repository = CryptoWalletRepository(client=client)
+
+    async def generate(self) -> SyntheticPortfolio:
+        spec = self._spec
+        portfolio = SyntheticPortfolio(
+            spec=spec,
+            start=spec.end - timedelta(days=365 * spec.years - 1),
+            end=spec.end,
+        )
+        async with self._client.tx():
+            portfolio.entities = await self._insert_entities(
+                spec.entities, "Bank", EntityType.FINANCIAL_INSTITUTION
+            )
+            portfolio.wallet_entities = await self._insert_entities(
+                spec.hd_wallets, "Wallet", EntityType.CRYPTO_WALLET
+            )
+            wallet_ids = await self._insert_hd_wallets(portfolio.wallet_entities)
+            mortgages = self._mortgages(portfolio)
+
+            portfolio.snapshot_count = await self._insert_snapshots(
+                portfolio, wallet_ids, mortgages
+            )
+            portfolio.transaction_count = await self._insert_transactions(portfolio)
+            await self._insert_contributions(portfolio)
+            await self._insert_flows(portfolio)
+            portfolio.real_estate = await self._insert_real_estate(portfolio, mortgages)
+        return portfolio
+
+    def _uuid(self) -> UUID:
+        return UUID(int=self._rng.getrandbits(128), version=4)
+
+    def _amount(self, value: float) -> Dezimal:
+        return Dezimal(f"{value:.2f}")
+
+    async def _insert_entities(
+        self, count: int, prefix: str, entity_type: EntityType
+    ) -> list[Entity]:
+        entities = []
+        for i in range(count):
+            entity = Entity(
+                id=self._uuid(),
+                name=f"{prefix} {i + 1}",
+                natural_id=None,
+                type=entity_type,
+                origin=EntityOrigin.MANUAL,
+                icon_url=None,
+            )
+            await self._entity_repository.insert(entity)
+            entities.append(entity)
+        return entities
+
+    async def _insert_hd_wallets(self, wallet_entities: list[Entity]) -> list[UUID]:
+        wallet_ids = []
+        for n, entity in enumerate(wallet_entities):
+            wallet = CryptoWallet(
+                id=self._uuid(),
+                entity_id=entity.id,
+                addresses=[],
+                name=f"HD wallet {n + 1}",
+                address_source=AddressSource.DERIVED,
+                hd_wallet=None,
+            )
+            hd_wallet = HDWallet(
+                xpub=f"xpub{n:04d}{self._rng.getrandbits(256):064x}",
+                addresses=[
+                    HDAddress(
+                        address=f"bc1q{n:02d}{change}{index:05d}",
+                        index=index,
+                        change=change,
+                        path=f"m/84'/0'/0'/{change}/{index}",
+                        pubkey=f"{self._rng.getrandbits(264):066x}",
+                        balance=self._amount(self._rng.uniform(0, 0.05)),
+                    )
+                    for change in (0, 1)
+                    for index in range(self._spec.addresses_per_wallet // 2)
+                ],
+                script_type=ScriptType.P2WPKH,
+                coin_type=CoinType.BITCOIN,
+            )
+            await self._wallet_repository.insert(wallet)
+            await self._wallet_repository.insert_hd_wallet(wallet.id, hd_wallet)
+            await self._wallet_repository.insert_hd_addresses(
+                wallet.id, hd_wallet.addresses
+            )
+            wallet_ids.append(wallet.id)
+        return wallet_ids
+
+    def _mortgages(self, portfolio: SyntheticPortfolio) -> list[Loan]:
+        # Held by the first entity, one per property
+        holder = portfolio.entities[0]
+        mortgages = []
+        for i in range(self._spec.real_estate):
+            amount = self._rng.randrange(120_000, 400_000, 1000)
+            creation = date(2015 + i, 3, 1)
+            loan = Loan(
+                id=None,
+                type=LoanType.MORTGAGE,
+                currency="EUR",
+                current_installment=self._amount(amount / 300),
+                interest_rate=Dezimal("0.025"),
+                loan_amount=Dezimal(amount),
+                creation=creation,
+                maturity=date(creation.year + 30, 3, 1),
+                principal_outstanding=Dezimal(amount),
+                name=f"Mortgage {i + 1}",
+            )
+            loan.compute_hash(str(holder.id))
+            mortgages.append(loan)
+        return mortgages
+
+    async def _insert_snapshots(
+        self,
+        portfolio: SyntheticPortfolio,
+        wallet_ids: list[UUID],
+        mortgages: list[Loan],
+    ) -> int:
+        spec = self._spec
+        days = (portfolio.end - portfolio.start).days + 1
+        prices = {
+            entity.id: [
+                self._rng.uniform(20, 400) for _ in range(spec.stocks_per_entity)
+            ]
+            for entity in portfolio.entities
+        }
+        cash = {
+            entity.id: self._rng.uniform(2_000, 50_000) for entity in portfolio.entities
+        }
+        btc_price = 30_000.0
+        count = 0
+
+        for day_offset in range(days):
+            day = portfolio.start + timedelta(days=day_offset)
+            at = datetime.combine(day, time(12), tzinfo=timezone.utc)
+            btc_price *= math.exp(self._rng.gauss(0, 0.03))
+
+            for n, entity in enumerate(portfolio.entities):
+                entity_prices = prices[entity.id]
+                for s in range(len(entity_prices)):
+                    entity_prices[s] *= math.exp(self._rng.gauss(0.0002, 0.012))
+                cash[entity.id] = max(0.0, cash[entity.id] + self._rng.gauss(15, 400))
+
+                products = {
+                    ProductType.ACCOUNT: Accounts(
+                        [
+                            Account(
+                                id=self._uuid(),
+                                total=self._amount(cash[entity.id]),
+                                currency="EUR",
+                                type=AccountType.CHECKING,
+                                name="Main",
+                            )
+                        ]
+                    ),
+                    ProductType.STOCK_ETF: StockInvestments(
+                        [self._stock(s, price) for s, price in enumerate(entity_prices)]
+                    ),
+                    ProductType.FUND: FundInvestments(
+                        [
+                            self._fund(f, day_offset)
+                            for f in range(spec.funds_per_entity)
+                        ]
+                    ),
+                }
+                if n == 0 and mortgages:
+                    products[ProductType.LOAN] = Loans(
+                        [self._mortgage_at(loan, day) for loan in mortgages]
+                    )
+                await self._position_repository.save(
+                    GlobalPosition(
+                        id=self._uuid(),
+                        entity=entity,
+                        date=at,
+                        products=products,
+                    )
+                )
+                count += 1
+
+            for entity, wallet_id in zip(portfolio.wallet_entities, wallet_ids):
+                amount = Dezimal("0.85")
+                await self._position_repository.save(
+                    GlobalPosition(
+                        id=self._uuid(),
+                        entity=entity,
+                        date=at,
+                        products={
+                            ProductType.CRYPTO: CryptoCurrencies(
+                                [
+                                    CryptoCurrencyWallet(
+                                        id=wallet_id,
+                                        assets=[
+                                            CryptoCurrencyPosition(
+                                                id=self._uuid(),
+                                                symbol="BTC",
+                                                amount=amount,
+                                                type=CryptoCurrencyType.NATIVE,
+                                                name="Bitcoin",
+                                                market_value=self._amount(
+                                                    0.85 * btc_price
+                                                ),
+                                                currency="EUR",
+                                            )
+                                        ],
+                                    )
+                                ]
+                            )
+                        },
+                    )
+                )
+                count += 1
+        return count
+
+    def _stock(self, index: int, price: float) -> StockDetail:
+        shares = 10 + index * 3
+        return StockDetail(
+            id=self._uuid(),
+            name=f"Stock {index}",
+            ticker=f"STK{index}",
+            isin=f"US{index:010d}",
+            shares=Dezimal(shares),
+            market_value=self._amount(shares * price),
+            currency="EUR",
+            type=EquityType.ETF if index % 3 == 0 else EquityType.STOCK,
+            initial_investment=self._amount(shares * 100),
+        )
+
+    def _fund(self, index: int, day_offset: int) -> FundDetail:
+        shares = 50 + index * 10
+        return FundDetail(
+            id=self._uuid(),
+            name=f"Fund {index}",
+            isin=f"LU{index:010d}",
+            market=None,
+            shares=Dezimal(shares),
+            market_value=self._amount(shares * (20 + day_offset * 0.004)),
+            currency="EUR",
+            type=FundType.MUTUAL_FUND,
+            initial_investment=self._amount(shares * 20),
+        )
+
+    def _mortgage_at(self, loan: Loan, day: date) -> Loan:
+        elapsed = max(0, (day - loan.creation).days)
+        total = (loan.maturity - loan.creation).days
+        outstanding = float(loan.loan_amount) * max(0.0, 1 - elapsed / total)
+        return Loan(
+            id=self._uuid(),
+            type=loan.type,
+            currency=loan.currency,
+            current_installment=loan.current_installment,
+            interest_rate=loan.interest_rate,
+            loan_amount=loan.loan_amount,
+            creation=loan.creation,
+            maturity=loan.maturity,
+            principal_outstanding=self._amount(outstanding),
+            name=loan.name,
+            hash=loan.hash,
+        )
+
+    async def _insert_transactions(self, portfolio: SyntheticPortfolio) -> int:
+        spec = self._spec
+        span_seconds = (portfolio.end - portfolio.start).days * 86_400
+        start = datetime.combine(portfolio.start, time(), tzinfo=timezone.utc)
+        account_txs, investment_txs = [], []
+
+        for i in range(spec.transactions):
+            entity = portfolio.entities[i % len(portfolio.entities)]
+            when = start + timedelta(seconds=self._rng.randrange(span_seconds))
+            amount = self._amount(self._rng.uniform(5, 2_500))
+            if i % 5 < 3:
+                account_txs.append(
+                    AccountTx(
+                        id=self._uuid(),
+                        ref=f"acc-{i}",
+                        name=f"Payment {i % 997}",
+                        amount=amount,
+                        currency="EUR",
+                        type=TxType.TRANSFER_OUT if i % 2 else TxType.TRANSFER_IN,
+                        date=when,
+                        entity=entity,
+                        source=DataSource.REAL,
+                        product_type=ProductType.ACCOUNT,
+                        fees=Dezimal(0),
+                        retentions=Dezimal(0),
+                    )
+                )
+            else:
+                stock = i % spec.stocks_per_entity
+                investment_txs.append(
+                    StockTx(
+                        id=self._uuid(),
+                        ref=f"inv-{i}",
+                        name=f"Stock {stock}",
+                        amount=amount,
+                        currency="EUR",
+                        type=TxType.BUY if i % 4 else TxType.SELL,
+                        date=when,
+                        entity=entity,
+                        source=DataSource.REAL,
+                        product_type=ProductType.STOCK_ETF,
+                        shares=Dezimal(1 + i % 20),
+                        price=self._amount(float(amount) / (1 + i % 20)),
+                        fees=Dezimal("1.50"),
+                        net_amount=amount,
+                        isin=f"US{stock:010d}",
+                        ticker=f"STK{stock}",
+                    )
+                )
+            if len(account_txs) + len(investment_txs) >= _TX_BATCH:
+                await self._transaction_repository.save(
+                    Transactions(investment=investment_txs, account=account_txs)
+                )
+                account_txs, investment_txs = [], []
+
+        if account_txs or investment_txs:
+            await self._transaction_repository.save(
+                Transactions(investment=investment_txs, account=account_txs)
+            )
+        return spec.transactions
+
+    async def _insert_contributions(self, portfolio: SyntheticPortfolio):
+        for entity in portfolio.entities:
+            contributions = [
+                PeriodicContribution(
+                    id=self._uuid(),
+                    alias=f"Plan {s}",
+                    target=f"US{s:010d}",
+                    target_name=f"Stock {s}",
+                    target_type=ContributionTargetType.STOCK_ETF,
+                    amount=Dezimal(100 + 50 * s),
+                    currency="EUR",
+                    since=portfolio.start,
+                    until=None,
+                    frequency=ContributionFrequency.MONTHLY,
+                    active=True,
+                    source=DataSource.REAL,
+                )
+                for s in range(2)
+            ]
+            await self._contributions_repository.save(
+                entity.id, AutoContributions(periodic=contributions), DataSource.REAL
+            )
+
+    async def _insert_flows(self, portfolio: SyntheticPortfolio):
+        flows = [
+            ("Salary", "3200", FlowType.EARNING, FlowFrequency.MONTHLY),
+            ("Groceries", "85", FlowType.EXPENSE, FlowFrequency.WEEKLY),
+            ("Utilities", "140", FlowType.EXPENSE, FlowFrequency.MONTHLY),
+            ("Insurance", "600", FlowType.EXPENSE, FlowFrequency.YEARLY),
+        ]
+        for name, amount, flow_type, frequency in flows:
+            await self._periodic_flow_repository.save(
+                self._periodic_flow(
+                    name, Dezimal(amount), flow_type, frequency, portfolio.start
+                )
+            )
+
+    def _periodic_flow(
+        self,
+        name: str,
+        amount: Dezimal,
+        flow_type: FlowType,
+        frequency: FlowFrequency,
+        since: date,
+        until: Optional[date] = None,
+    ) -> PeriodicFlow:
+        return PeriodicFlow(
+            id=self._uuid(),
+            name=name,
+            amount=amount,
+            currency="EUR",
+            flow_type=flow_type,
+            frequency=frequency,
+            category=None,
+            enabled=True,
+            since=since,
+            until=until,
+            icon=None,
+        )
+
+    async def _insert_real_estate(
+        self, portfolio: SyntheticPortfolio, mortgages: list[Loan]
+    ) -> list[RealEstate]:
+        properties = []
+        for i, loan in enumerate(mortgages):
+            is_rented = i % 2 == 1
+            price = loan.loan_amount * Dezimal("1.25")
+            flows = [
+                self._real_estate_flow(
+                    RealEstateFlowSubtype.LOAN,
+                    self._periodic_flow(
+                        f"{loan.name} installment",
+                        loan.current_installment,
+                        FlowType.EXPENSE,
+                        FlowFrequency.MONTHLY,
+                        loan.creation,
+                        loan.maturity,
+                    ),
+                    LoanPayload(
+                        type=LoanType.MORTGAGE,
+                        loan_amount=loan.loan_amount,
+                        interest_rate=loan.interest_rate,
+                        euribor_rate=None,
+                        interest_type=InterestType.FIXED,
+                        fixed_years=None,
+                        principal_outstanding=loan.principal_outstanding,
+                    ),
+                    linked_loan_hash=loan.hash,
+                ),
+                self._real_estate_flow(
+                    RealEstateFlowSubtype.COST,
+                    self._periodic_flow(
+                        f"Property {i + 1} tax",
+                        Dezimal(450),
+                        FlowType.EXPENSE,
+                        FlowFrequency.YEARLY,
+                        loan.creation,
+                    ),
+                    CostPayload(tax_deductible=True),
+                ),
+            ]
+            if is_rented:
+                flows.append(
+                    self._real_estate_flow(
+                        RealEstateFlowSubtype.RENT,
+                        self._periodic_flow(
+                            f"Property {i + 1} rent",
+                            Dezimal(950),
+                            FlowType.EARNING,
+                            FlowFrequency.MONTHLY,
+                            loan.creation,
+                        ),
+                        RentPayload(),
+                    )
+                )
+            for flow in flows:
+                await self._periodic_flow_repository.save(flow.periodic_flow)
+
+            real_estate = RealEstate(
+                id=self._uuid(),
+                basic_info=BasicInfo(
+                    name=f"Property {i + 1}",
+                    is_residence=i == 0,
+                    is_rented=is_rented,
+                ),
+                location=Location(),
+                purchase_info=PurchaseInfo(
+                    date=loan.creation, price=price, expenses=[]
+                ),
+                valuation_info=ValuationInfo(
+                    estimated_market_value=price * Dezimal("1.2"),
+                    valuations=[],
+                    annual_appreciation=Dezimal("0.02"),
+                ),
+                flows=flows,
+                currency="EUR",
+                rental_data=None,
+            )
+            await self._real_estate_repository.insert(real_estate)
+            properties.append(real_estate)
+        return properties
+
+    @staticmethod
+    def _real_estate_flow(
+        subtype: RealEstateFlowSubtype,
+        periodic_flow: PeriodicFlow,
+        payload,
+        linked_loan_hash: Optional[str] = None,
+    ) -> RealEstateFlow:
+        return RealEstateFlow(
+            periodic_flow_id=periodic_flow.id,
+            periodic_flow=periodic_flow,
+            flow_subtype=subtype,
+            description=periodic_flow.name,
+            payload=payload,
+            linked_loan_hash=linked_loan_hash,
+        )
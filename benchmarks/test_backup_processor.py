@@ -0,0 +1,82 @@
+import random
+import tracemalloc
+
+import pytest
+
+from domain.backup import BackupFileType, BackupProcessRequest
+from infrastructure.cloud.backup.backup_processor_adapter import (
+    BackupProcessorV1,
+    BackupProcessorV2,
+)
+
+DB_SIZE = 200 * 1024 * 1024
+PAGE_SIZE = 4096
+PASSWORD = "benchmark"
+
+
+@pytest.fixture(scope="module")
+def database_file(tmp_path_factory):
+    # Roughly as compressible as a real export: half of every page is
+    # repeated row data, the rest random (ids, hashes, free space noise)
+    rng = random.Random(41)
+    rows = [rng.randbytes(PAGE_SIZE // 2) for _ in range(64)]
+    path = tmp_path_factory.mktemp("backup") / "synthetic.db"
+    with open(path, "wb") as f:
+        for _ in range(DB_SIZE // PAGE_SIZE):
+            f.write(rng.choice(rows))
+            f.write(rng.randbytes(PAGE_SIZE // 2))
+    return path
+
+
+def _request(payload, target=None) -> BackupProcessRequest:
+    return BackupProcessRequest(
+        protocol=0,
+        password=PASSWORD,
+        type=BackupFileType.DATA,
+        payload=payload,
+        target=target,
+    )
+
+
+def _measure(benchmark, fn):
+    """Times fn and stores the traced peak allocation of one extra run."""
+    benchmark.pedantic(fn, rounds=3)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_mb"] = round(peak / 1024 / 1024, 1)
+
+
+@pytest.mark.benchmark(group="backup-compile-200mb")
+def test_v1_compile(benchmark, database_file):
+    processor = BackupProcessorV1()
+    # V1 callers hand over the whole export, loading it is part of the cost
+    _measure(benchmark, lambda: processor.compile(_request(database_file.read_bytes())))
+
+
+@pytest.mark.benchmark(group="backup-compile-200mb")
+def test_v2_compile(benchmark, database_file, tmp_path):
+    processor = BackupProcessorV2()
+    target = tmp_path / "compiled"
+    _measure(benchmark, lambda: processor.compile(_request(database_file, target)))
+
+
+@pytest.mark.benchmark(group="backup-decompile-200mb")
+def test_v1_decompile(benchmark, database_file, tmp_path):
+    processor = BackupProcessorV1()
+    compiled = tmp_path / "compiled"
+    processor.compile(_request(database_file.read_bytes(), compiled))
+    _measure(benchmark, lambda: processor.decompile(_request(compiled.read_bytes())))
+
+
+@pytest.mark.benchmark(group="backup-decompile-200mb")
+def test_v2_decompile(benchmark, database_file, tmp_path):
+    processor = BackupProcessorV2()
+    compiled = tmp_path / "compiled"
+    restored = tmp_path / "restored"
+    processor.compile(_request(database_file, compiled))
+    _measure(benchmark, lambda: processor.decompile(_request(compiled, restored)))
+    assert restored.stat().st_size == DB_SIZE
@@ -0,0 +1,65 @@
+import operator
+import random
+
+import pytest
+
+from domain.dezimal import Dezimal
+
+SIZE = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def values() -> list[Dezimal]:
+    rng = random.Random(7)
+    return [Dezimal(f"{rng.uniform(-1000, 1000):.2f}") for _ in range(SIZE)]
+
+
+@pytest.fixture(scope="module")
+def others(values) -> list[Dezimal]:
+    return values[1:] + values[:1]
+
+
+def _pairwise(op, values, others):
+    return list(map(op, values, others))
+
+
+@pytest.mark.benchmark(group="dezimal-1m")
+def test_add(benchmark, values, others):
+    result = benchmark.pedantic(
+        _pairwise, args=(operator.add, values, others), rounds=3
+    )
+    assert len(result) == SIZE
+
+
+@pytest.mark.benchmark(group="dezimal-1m")
+def test_mul(benchmark, values, others):
+    result = benchmark.pedantic(
+        _pairwise, args=(operator.mul, values, others), rounds=3
+    )
+    assert len(result) == SIZE
+
+
+@pytest.mark.benchmark(group="dezimal-1m")
+def test_mul_int(benchmark, values):
+    result = benchmark.pedantic(
+        _pairwise, args=(operator.mul, values, [3] * SIZE), rounds=3
+    )
+    assert len(result) == SIZE
+
+
+@pytest.mark.benchmark(group="dezimal-1m")
+def test_compare(benchmark, values, others):
+    result = benchmark.pedantic(_pairwise, args=(operator.lt, values, others), rounds=3)
+    assert len(result) == SIZE
+
+
+@pytest.mark.benchmark(group="dezimal-1m")
+def test_equal(benchmark, values, others):
+    result = benchmark.pedantic(_pairwise, args=(operator.eq, values, others), rounds=3)
+    assert len(result) == SIZE
+
+
+@pytest.mark.benchmark(group="dezimal-1m")
+def test_sum(benchmark, values):
+    result = benchmark.pedantic(sum, args=(values, Dezimal(0)), rounds=3)
+    assert isinstance(result, Dezimal)
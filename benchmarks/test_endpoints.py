@@ -0,0 +1,243 @@
+"""
+Latency of the hot read endpoints over the synthetic portfolio, measured
+through the Quart test client so routing, use cases, repositories and JSON
+serialisation are all included.
+"""
+
+from typing import Optional
+
+import pytest
+
+from application.ports.historic_metal_price_provider import HistoricMetalPriceProvider
+from application.use_cases.export_file import ExportFileImpl
+from application.use_cases.forecast import ForecastImpl
+from application.use_cases.get_contributions import GetContributionsImpl
+from application.use_cases.get_money_events import GetMoneyEventsImpl
+from application.use_cases.get_networth_timeline import GetNetworthTimelineImpl
+from application.use_cases.get_pending_flows import GetPendingFlowsImpl
+from application.use_cases.get_periodic_flows import GetPeriodicFlowsImpl
+from application.use_cases.get_position import GetPositionImpl
+from application.use_cases.get_transactions import GetTransactionsImpl
+from domain.commodity import CommodityType
+from domain.dezimal import Dezimal
+from domain.exchange_rate import HistoricMetalRates
+from domain.export import FileFormat
+from infrastructure.calculations.monte_carlo_simulator import MonteCarloSimulator
+from infrastructure.controller.config import quart
+from infrastructure.controller.routes.export_file import export_file
+from infrastructure.controller.routes.forecast import forecast
+from infrastructure.controller.routes.get_money_events import get_money_events
+from infrastructure.controller.routes.networth_timeline import networth_timeline
+from infrastructure.controller.routes.positions import positions
+from infrastructure.controller.routes.transactions import transactions
+from infrastructure.file_storage.exchange_rate_sqlite_storage import (
+    ExchangeRateSQLiteStorage,
+)
+from infrastructure.repository import (
+    AutoContributionsRepository,
+    EntityRepository,
+    HistoricRepository,
+    PositionRepository,
+    TransactionRepository,
+)
+from infrastructure.repository.earnings_expenses.pending_flow_repository import (
+    PendingFlowRepository,
+)
+from infrastructure.repository.earnings_expenses.periodic_flow_repository import (
+    PeriodicFlowRepository,
+)
+from infrastructure.repository.networth_timeline.networth_timeline_repository import (
+    NetworthTimelineSQLRepository,
+)
+from infrastructure.repository.real_estate.real_estate_repository import (
+    RealEstateRepository,
+)
+from infrastructure.repository.templates.template_repository import TemplateRepository
+from infrastructure.table.csv_file_table_adapter import CSVFileTableAdapter
+from infrastructure.table.table_rw_dispatcher import TableRWDispatcher
+from infrastructure.templating.templated_data_generator import TemplatedDataGenerator
+
+_RATES = {"EUR": {"USD": Dezimal("1.08"), "GBP": Dezimal("0.86")}}
+
+
+class _NoMetalPrices(HistoricMetalPriceProvider):
+    # The synthetic portfolio holds no commodities
+    async def get_partial_historic_rates(
+        self, commodity: CommodityType, **kwargs
+    ) -> Optional[HistoricMetalRates]:
+        return None
+
+
+@pytest.fixture(scope="module")
+def client(portfolio_db, event_loop_runner):
+    db_client, _, user_path = portfolio_db
+
+    position_repository = PositionRepository(client=db_client)
+    transaction_repository = TransactionRepository(client=db_client)
+    entity_repository = EntityRepository(client=db_client)
+    auto_contrib_repository = AutoContributionsRepository(client=db_client)
+    periodic_flow_repository = PeriodicFlowRepository(client=db_client)
+    pending_flow_repository = PendingFlowRepository(client=db_client)
+    real_estate_repository = RealEstateRepository(client=db_client)
+
+    exchange_rate_storage = ExchangeRateSQLiteStorage(str(user_path / "rates"))
+    event_loop_runner(exchange_rate_storage.save(_RATES))
+
+    get_position = GetPositionImpl(position_repository, entity_repository)
+    get_transactions = GetTransactionsImpl(transaction_repository, entity_repository)
+    get_networth_timeline = GetNetworthTimelineImpl(
+        NetworthTimelineSQLRepository(client=db_client),
+        exchange_rate_storage,
+        entity_repository,
+        real_estate_repository,
+        _NoMetalPrices(),
+    )
+    get_money_events_uc = GetMoneyEventsImpl(
+        GetContributionsImpl(auto_contrib_repository, entity_repository),
+        GetPeriodicFlowsImpl(periodic_flow_repository),
+        GetPendingFlowsImpl(pending_flow_repository),
+        entity_repository,
+        position_repository,
+    )
+    forecast_uc = ForecastImpl(
+        position_port=position_repository,
+        auto_contributions_port=auto_contrib_repository,
+        periodic_flow_port=periodic_flow_repository,
+        pending_flow_port=pending_flow_repository,
+        real_estate_port=real_estate_repository,
+        entity_port=entity_repository,
+        forecast_simulator=MonteCarloSimulator(),
+    )
+    csv_adapter = CSVFileTableAdapter()
+    export_file_uc = ExportFileImpl(
+        position_repository,
+        auto_contrib_repository,
+        transaction_repository,
+        HistoricRepository(client=db_client),
+        entity_repository,
+        TemplateRepository(client=db_client),
+        TemplatedDataGenerator(),
+        TableRWDispatcher({FileFormat.CSV: csv_adapter, FileFormat.TSV: csv_adapter}),
+    )
+
+    app = quart(user_path / "static")
+
+    @app.route("/api/v1/positions", methods=["GET"])
+    async def positions_route():
+        return await positions(get_position)
+
+    @app.route("/api/v1/transactions", methods=["GET"])
+    async def transactions_route():
+        return await transactions(get_transactions)
+
+    @app.route("/api/v1/networth-timeline", methods=["GET"])
+    async def networth_timeline_route():
+        return await networth_timeline(get_networth_timeline)
+
+    @app.route("/api/v1/events", methods=["GET"])
+    async def money_events_route():
+        return await get_money_events(get_money_events_uc)
+
+    @app.route("/api/v1/forecast", methods=["POST"])
+    async def forecast_route():
+        return await forecast(forecast_uc)
+
+    @app.route("/api/v1/data/export/file", methods=["POST"])
+    async def export_file_route():
+        return await export_file(export_file_uc)
+
+    return app.test_client()
+
+
+def _request(event_loop_runner, call):
+    response = event_loop_runner(call())
+    assert response.status_code == 200, event_loop_runner(response.get_data())
+    return event_loop_runner(response.get_data())
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_positions(benchmark, client, event_loop_runner):
+    body = benchmark(
+        _request, event_loop_runner, lambda: client.get("/api/v1/positions")
+    )
+    assert body
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_transactions_page(benchmark, client, event_loop_runner):
+    body = benchmark(
+        _request,
+        event_loop_runner,
+        lambda: client.get("/api/v1/transactions?page=20&limit=100"),
+    )
+    assert body
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_networth_timeline_full_computation(
+    benchmark, client, portfolio_db, event_loop_runner
+):
+    db_client = portfolio_db[0]
+
+    async def reset():
+        # Forces every round to recompute the whole timeline
+        async with db_client.tx() as cursor:
+            await cursor.execute("DELETE FROM networth_timeline_points")
+            await cursor.execute("DELETE FROM networth_timeline_meta")
+
+    body = benchmark.pedantic(
+        _request,
+        args=(
+            event_loop_runner,
+            lambda: client.get("/api/v1/networth-timeline?base_currency=EUR"),
+        ),
+        setup=lambda: event_loop_runner(reset()),
+        rounds=3,
+    )
+    assert body
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_networth_timeline_cached(benchmark, client, event_loop_runner):
+    url = "/api/v1/networth-timeline?base_currency=EUR"
+    _request(event_loop_runner, lambda: client.get(url))
+
+    body = benchmark(_request, event_loop_runner, lambda: client.get(url))
+    assert body
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_money_events(benchmark, client, portfolio_db, event_loop_runner):
+    end = portfolio_db[1].end
+    url = f"/api/v1/events?from_date={end.replace(day=1)}&to_date={end}"
+
+    body = benchmark(_request, event_loop_runner, lambda: client.get(url))
+    assert body
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_forecast(benchmark, client, portfolio_db, event_loop_runner):
+    end = portfolio_db[1].end
+    payload = {"target_date": end.replace(year=end.year + 10).isoformat()}
+
+    body = benchmark(
+        _request,
+        event_loop_runner,
+        lambda: client.post("/api/v1/forecast", json=payload),
+    )
+    assert body
+
+
+@pytest.mark.benchmark(group="endpoints")
+def test_export_transactions_csv(benchmark, client, event_loop_runner):
+    payload = {"format": "CSV", "feature": "TRANSACTIONS", "number_format": "ENGLISH"}
+
+    body = benchmark.pedantic(
+        _request,
+        args=(
+            event_loop_runner,
+            lambda: client.post("/api/v1/data/export/file", json=payload),
+        ),
+        rounds=3,
+    )
+    assert body
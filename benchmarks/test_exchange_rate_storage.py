@@ -0,0 +1,87 @@
+import asyncio
+import random
+import sqlite3
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+from domain.dezimal import Dezimal
+from infrastructure.file_storage.exchange_rate_sqlite_storage import (
+    ExchangeRateSQLiteStorage,
+)
+
+YEARS = 10
+CURRENCY_COUNT = 40
+
+START = datetime.combine(datetime(2015, 1, 1), time(12), tzinfo=timezone.utc)
+DAYS = [START + timedelta(days=i) for i in range(365 * YEARS)]
+CURRENCIES = ["EUR"] + [f"C{i:02d}" for i in range(CURRENCY_COUNT - 1)]
+
+
+def _matrices() -> list[dict[str, dict[str, Dezimal]]]:
+    rng = random.Random(47)
+    levels = {currency: rng.uniform(0.5, 150) for currency in CURRENCIES[1:]}
+    matrices = []
+    for _ in DAYS:
+        for currency in levels:
+            levels[currency] *= 1 + rng.uniform(-0.01, 0.01)
+        eur = {currency: Dezimal(f"{level:.6f}") for currency, level in levels.items()}
+        matrices.append(
+            {
+                "EUR": eur,
+                "C00": {"EUR": Dezimal(1) / eur["C00"]},
+            }
+        )
+    return matrices
+
+
+@pytest.fixture(scope="module")
+def matrices():
+    return _matrices()
+
+
+def _load(path, matrices) -> ExchangeRateSQLiteStorage:
+    storage = ExchangeRateSQLiteStorage(str(path))
+    for saved_at, matrix in zip(DAYS, matrices):
+        storage._store_snapshot(matrix, saved_at)
+    return storage
+
+
+@pytest.fixture(scope="module")
+def history_dir(tmp_path_factory, matrices):
+    path = tmp_path_factory.mktemp("rates")
+    _load(path, matrices)
+    return path
+
+
+@pytest.mark.benchmark(group="fx-history-load")
+def test_save_10y_daily_rates_40_currencies(benchmark, tmp_path_factory, matrices):
+    def run():
+        path = tmp_path_factory.mktemp("load")
+        _load(path, matrices)
+        return path
+
+    path = benchmark.pedantic(run, rounds=3)
+
+    with sqlite3.connect(path / ExchangeRateSQLiteStorage.FILENAME) as conn:
+        (rows,) = conn.execute("SELECT COUNT(*) FROM pivot_rates").fetchone()
+    assert rows == len(DAYS) * (CURRENCY_COUNT - 1)
+
+
+@pytest.mark.benchmark(group="fx-history-read")
+def test_get_after_restart_with_10y_history(benchmark, history_dir, matrices):
+    def run():
+        return asyncio.run(ExchangeRateSQLiteStorage(str(history_dir)).get())
+
+    rates = benchmark(run)
+
+    assert rates == matrices[-1]
+
+
+@pytest.mark.benchmark(group="fx-history-read")
+def test_daily_save_with_10y_history(benchmark, history_dir, matrices):
+    storage = ExchangeRateSQLiteStorage(str(history_dir))
+
+    benchmark(lambda: asyncio.run(storage.save(matrices[-1])))
+
+    assert asyncio.run(storage.get()) == matrices[-1]
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from domain.dezimal import Dezimal
+from domain.entity import Entity, EntityOrigin, EntityType
+from domain.fetch_record import DataSource
+from domain.global_position import ProductType
+from domain.transactions import StockTx, TxType
+from infrastructure.controller.config import QuartApp
+from infrastructure.controller.streaming import jsonify_stream
+
+TX_COUNT = 10_000
+
+
+@pytest.fixture(scope="module")
+def transactions() -> list[StockTx]:
+    entity = Entity(
+        id=uuid4(),
+        name="Broker",
+        natural_id=None,
+        type=EntityType.FINANCIAL_INSTITUTION,
+        origin=EntityOrigin.NATIVE,
+        icon_url=None,
+    )
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    return [
+        StockTx(
+            id=uuid4(),
+            ref=f"ref-{i}",
+            name=f"Stock {i % 300}",
+            amount=Dezimal(f"{1000 + i}.{i % 100:02d}"),
+            currency="EUR",
+            type=TxType.BUY if i % 3 else TxType.SELL,
+            date=start + timedelta(hours=i),
+            entity=entity,
+            source=DataSource.REAL,
+            product_type=ProductType.STOCK_ETF,
+            shares=Dezimal(f"{i % 50}.5"),
+            price=Dezimal("117.58"),
+            fees=Dezimal("1.25"),
+            net_amount=Dezimal(f"{999 + i}.{i % 100:02d}"),
+            isin=f"US{i:010d}",
+            ticker=f"T{i % 300}",
+        )
+        for i in range(TX_COUNT)
+    ]
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    return QuartApp(__name__, static_folder=str(tmp_path_factory.mktemp("static")))
+
+
+@pytest.mark.benchmark(group="json-10k-transactions")
+def test_stdlib_encoder(benchmark, app, transactions):
+    payload = {"transactions": transactions}
+    default = app.json.default
+
+    benchmark(lambda: json.dumps(payload, default=default, sort_keys=True))
+
+
+@pytest.mark.benchmark(group="json-10k-transactions")
+def test_provider_encoder(benchmark, app, transactions):
+    payload = {"transactions": transactions}
+
+    benchmark(lambda: app.json.dumps(payload))
+
+
+@pytest.mark.benchmark(group="json-10k-transactions")
+def test_streamed_response(benchmark, app, transactions):
+    async def consume():
+        async with app.app_context():
+            response = jsonify_stream(transactions, key="transactions")
+            return await response.get_data()
+
+    def run():
+        return asyncio.run(consume())
+
+    body = benchmark(run)
+    assert len(json.loads(body)["transactions"]) == TX_COUNT
@@ -0,0 +1,73 @@
+import asyncio
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from domain.dezimal import Dezimal
+from domain.global_position import InstallmentFrequency, InterestType
+from domain.loan_calculator import LoanCalculationParams
+from infrastructure.calculations.loan_calculator import LoanCalculator
+
+TODAY = date(2049, 6, 1)
+
+
+@pytest.fixture(scope="module")
+def calculator() -> LoanCalculator:
+    return LoanCalculator()
+
+
+@pytest.fixture(scope="module")
+def weekly_mixed_loan() -> LoanCalculationParams:
+    # 30 years of weekly installments, ~1560 periods across two rate regimes
+    return LoanCalculationParams(
+        loan_amount=Dezimal(250000),
+        interest_rate=Dezimal("0.01"),
+        interest_type=InterestType.MIXED,
+        euribor_rate=Dezimal("0.025"),
+        fixed_years=10,
+        start=date(2020, 1, 6),
+        end=date(2050, 1, 6),
+        principal_outstanding=None,
+        fixed_interest_rate=Dezimal("0.02"),
+        installment_frequency=InstallmentFrequency.WEEKLY,
+    )
+
+
+def _simulate_period_by_period(calc, p, today):
+    step = relativedelta(weeks=1)
+    ppy = p.installment_frequency.payments_per_year
+    outstanding = p.loan_amount
+    current = p.start
+    while current < today and current < p.end:
+        rate = calc._annual_rate_at(p, current) / ppy
+        remaining = max(1, calc._count_periods(p.installment_frequency, current, p.end))
+        payment = calc._round_cents(
+            calc._amortizing_payment(outstanding, rate, remaining)
+        )
+        outstanding = outstanding - (payment - calc._round_cents(outstanding * rate))
+        current = current + step
+    return outstanding
+
+
+@pytest.mark.benchmark(group="loan-30y-weekly-outstanding")
+def test_period_by_period_outstanding(benchmark, calculator, weekly_mixed_loan):
+    benchmark.pedantic(
+        _simulate_period_by_period,
+        args=(calculator, weekly_mixed_loan, TODAY),
+        rounds=3,
+    )
+
+
+@pytest.mark.benchmark(group="loan-30y-weekly-outstanding")
+def test_closed_form_outstanding(benchmark, calculator, weekly_mixed_loan):
+    outstanding = benchmark(
+        calculator._compute_outstanding_from_start, weekly_mixed_loan, TODAY
+    )
+    assert outstanding > Dezimal(0)
+
+
+@pytest.mark.benchmark(group="loan-30y-weekly-schedule")
+def test_full_schedule(benchmark, calculator, weekly_mixed_loan):
+    schedule = benchmark(lambda: asyncio.run(calculator.schedule(weekly_mixed_loan)))
+    assert schedule.installments[-1].principal_outstanding == Dezimal(0)
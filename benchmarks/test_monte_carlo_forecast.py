@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from domain.dezimal import Dezimal
+from domain.forecast import MonteCarloInputs, ReturnAssumption, SimulatedAsset
+from infrastructure.calculations.monte_carlo_simulator import MonteCarloSimulator
+
+PATHS = 10_000
+MONTHS = 30 * 12
+
+
+@pytest.fixture(scope="module")
+def inputs() -> MonteCarloInputs:
+    start = date(2025, 1, 1)
+    dates = [start + relativedelta(months=m) for m in range(1, MONTHS + 1)]
+    contributions = [Dezimal(500)] * MONTHS
+
+    def asset(asset_class, currency, mean, volatility, initial):
+        return SimulatedAsset(
+            asset_class=asset_class,
+            currency=currency,
+            returns=ReturnAssumption(
+                mean=Dezimal(mean), volatility=Dezimal(volatility)
+            ),
+            initial=Dezimal(initial),
+            contributions=contributions,
+        )
+
+    return MonteCarloInputs(
+        dates=dates,
+        base={
+            "EUR": [Dezimal(20000 + 300 * m) for m in range(MONTHS)],
+            "USD": [Dezimal(5000)] * MONTHS,
+        },
+        assets=[
+            asset("equities", "EUR", "0.07", "0.16", 80000),
+            asset("equities", "USD", "0.07", "0.16", 30000),
+            asset("crypto", "EUR", "0.15", "0.6", 5000),
+        ],
+        paths=PATHS,
+        percentiles=[5, 25, 50, 75, 95],
+        seed=42,
+    )
+
+
+@pytest.mark.benchmark(group="monte-carlo-10k-paths-30y")
+def test_monte_carlo_forecast(benchmark, inputs):
+    result = benchmark(MonteCarloSimulator().simulate, inputs)
+    assert len(result.points) == MONTHS
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from application.use_cases.calculate_savings import CalculateSavingsImpl
+from domain.calculations import (
+    SavingsCalculationRequest,
+    SavingsPeriodicity,
+    SavingsRetirementRequest,
+    SavingsScenarioRequest,
+)
+from domain.dezimal import Dezimal
+
+SCENARIOS = 50
+YEARS = 40
+
+
+@pytest.fixture(scope="module")
+def request_with_retirement() -> SavingsCalculationRequest:
+    # Every scenario solves its contribution from the retirement withdrawals
+    return SavingsCalculationRequest(
+        base_amount=Dezimal(10000),
+        years=YEARS,
+        periodicity=SavingsPeriodicity.MONTHLY,
+        scenarios=[
+            SavingsScenarioRequest(
+                scenario_id=f"s{i}",
+                annual_market_performance=Dezimal(i) / Dezimal(500),
+            )
+            for i in range(SCENARIOS)
+        ],
+        retirement=SavingsRetirementRequest(
+            withdrawal_amount=Dezimal(2000), withdrawal_years=25
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def request_with_targets() -> SavingsCalculationRequest:
+    # No horizon, every scenario derives its periods to reach the target
+    return SavingsCalculationRequest(
+        base_amount=Dezimal(10000),
+        years=None,
+        periodicity=SavingsPeriodicity.MONTHLY,
+        scenarios=[
+            SavingsScenarioRequest(
+                scenario_id=f"s{i}",
+                annual_market_performance=Dezimal(i + 1) / Dezimal(500),
+                periodic_contribution=Dezimal(400),
+                target_amount=Dezimal(1_000_000),
+            )
+            for i in range(SCENARIOS)
+        ],
+    )
+
+
+def _run(request: SavingsCalculationRequest):
+    return asyncio.run(CalculateSavingsImpl().execute(request))
+
+
+@pytest.mark.benchmark(group="savings-50-scenarios-40y-monthly")
+def test_retirement_contributions(benchmark, request_with_retirement):
+    result = benchmark(_run, request_with_retirement)
+    assert len(result.scenarios) == SCENARIOS
+
+
+@pytest.mark.benchmark(group="savings-50-scenarios-40y-monthly")
+def test_periods_to_target(benchmark, request_with_targets):
+    result = benchmark(_run, request_with_targets)
+    assert len(result.scenarios) == SCENARIOS
@@ -0,0 +1,219 @@
+import asyncio
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from domain.dezimal import Dezimal
+from domain.entity import Entity, EntityOrigin, EntityType, Feature
+from domain.export import FileFormat, NumberFormat, TemplatedDataProcessorParams
+from domain.fetch_record import DataSource
+from domain.global_position import (
+    EquityType,
+    FundDetail,
+    FundInvestments,
+    FundPortfolio,
+    FundType,
+    GlobalPosition,
+    ProductType,
+    StockDetail,
+    StockInvestments,
+)
+from domain.transactions import AccountTx, StockTx, TxType
+from infrastructure.table.csv_file_table_adapter import CSVFileTableAdapter
+from infrastructure.table.xlsx_file_table_adapter import XLSXFileTableAdapter
+from infrastructure.templating.templated_data_generator import TemplatedDataGenerator
+
+TX_COUNT = 100_000
+POSITION_COUNT = 20
+ENTRIES_PER_PRODUCT = 500
+
+
+def _entity(index: int) -> Entity:
+    return Entity(
+        id=UUID(int=index + 1),
+        name=f"Entity {index}",
+        natural_id=None,
+        type=EntityType.FINANCIAL_INSTITUTION,
+        origin=EntityOrigin.NATIVE,
+        icon_url=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def transactions() -> list:
+    entities = [_entity(i) for i in range(5)]
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    txs = []
+    for i in range(TX_COUNT):
+        common = dict(
+            id=UUID(int=i),
+            ref=f"ref-{i}",
+            amount=Dezimal(f"{1000 + i}.{i % 100:02d}"),
+            currency="EUR",
+            date=start + timedelta(minutes=i),
+            entity=entities[i % len(entities)],
+            source=DataSource.REAL,
+        )
+        if i % 2:
+            txs.append(
+                AccountTx(
+                    name=f"Payment {i % 997}",
+                    type=TxType.TRANSFER_OUT,
+                    product_type=ProductType.ACCOUNT,
+                    fees=Dezimal(0),
+                    retentions=Dezimal(0),
+                    **common,
+                )
+            )
+        else:
+            txs.append(
+                StockTx(
+                    name=f"Stock {i % 300}",
+                    type=TxType.BUY,
+                    product_type=ProductType.STOCK_ETF,
+                    shares=Dezimal(f"{i % 50}.5"),
+                    price=Dezimal("117.58"),
+                    fees=Dezimal("1.25"),
+                    isin=f"US{i:010d}",
+                    ticker=f"T{i % 300}",
+                    **common,
+                )
+            )
+    return txs
+
+
+@pytest.fixture(scope="module")
+def positions() -> list:
+    portfolio = FundPortfolio(id=UUID(int=1), name="Portfolio")
+    return [
+        GlobalPosition(
+            id=UUID(int=p),
+            entity=_entity(p),
+            date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            products={
+                ProductType.STOCK_ETF: StockInvestments(
+                    [
+                        StockDetail(
+                            id=UUID(int=i),
+                            name=f"Stock {i}",
+                            ticker=f"STK{i}",
+                            isin=f"US{i:010d}",
+                            shares=Dezimal(i + 1),
+                            market_value=Dezimal(f"{i}.37"),
+                            currency="EUR",
+                            type=EquityType.STOCK,
+                            initial_investment=Dezimal(i * 2),
+                        )
+                        for i in range(ENTRIES_PER_PRODUCT)
+                    ]
+                ),
+                ProductType.FUND: FundInvestments(
+                    [
+                        FundDetail(
+                            id=UUID(int=i),
+                            name=f"Fund {i}",
+                            isin=f"LU{i:010d}",
+                            market=None,
+                            shares=Dezimal(i + 1),
+                            market_value=Dezimal(f"{i}.11"),
+                            currency="EUR",
+                            type=FundType.MUTUAL_FUND,
+                            initial_investment=Dezimal(i * 3),
+                            portfolio=portfolio,
+                        )
+                        for i in range(ENTRIES_PER_PRODUCT)
+                    ]
+                ),
+            },
+        )
+        for p in range(POSITION_COUNT)
+    ]
+
+
+def _params(feature: Feature, products: list[ProductType]):
+    return TemplatedDataProcessorParams(
+        template=None,
+        number_format=NumberFormat.EUROPEAN,
+        feature=feature,
+        products=products,
+        datetime_format="%d/%m/%Y %H:%M:%S",
+        date_format=None,
+    )
+
+
+async def _collect(rows) -> list:
+    return [row async for row in rows]
+
+
+def _tx_params():
+    return _params(Feature.TRANSACTIONS, [ProductType.STOCK_ETF, ProductType.ACCOUNT])
+
+
+def _measure(benchmark, fn):
+    """Times fn and stores the traced peak allocation of one extra run."""
+    result = benchmark.pedantic(fn, rounds=3)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_mb"] = round(peak / 1024 / 1024, 1)
+    return result
+
+
+@pytest.mark.benchmark(group="templated-export")
+def test_export_100k_transactions(benchmark, transactions):
+    generator = TemplatedDataGenerator()
+
+    def run():
+        return asyncio.run(_collect(generator.process(transactions, _tx_params())))
+
+    rows = benchmark.pedantic(run, rounds=3)
+    assert len(rows) == TX_COUNT + 1
+
+
+@pytest.mark.benchmark(group="templated-export")
+def test_export_20k_position_entries(benchmark, positions):
+    generator = TemplatedDataGenerator()
+
+    def run():
+        params = _params(Feature.POSITION, [ProductType.STOCK_ETF, ProductType.FUND])
+        return asyncio.run(_collect(generator.process(positions, params)))
+
+    rows = benchmark.pedantic(run, rounds=3)
+    assert len(rows) == POSITION_COUNT * ENTRIES_PER_PRODUCT * 2 + 1
+
+
+async def _write(adapter, rows, file_format: FileFormat) -> int:
+    # Chunks are dropped as a response body would, only their size is kept
+    size = 0
+    async for chunk in adapter.convert(rows, file_format):
+        size += len(chunk)
+    return size
+
+
+@pytest.mark.benchmark(group="templated-export-file")
+def test_export_100k_transactions_csv(benchmark, transactions):
+    generator = TemplatedDataGenerator()
+    adapter = CSVFileTableAdapter()
+
+    def run():
+        rows = generator.process(transactions, _tx_params())
+        return asyncio.run(_write(adapter, rows, FileFormat.CSV))
+
+    assert _measure(benchmark, run) > 0
+
+
+@pytest.mark.benchmark(group="templated-export-file")
+def test_export_100k_transactions_xlsx(benchmark, transactions):
+    generator = TemplatedDataGenerator()
+    adapter = XLSXFileTableAdapter()
+
+    def run():
+        rows = generator.process(transactions, _tx_params())
+        return asyncio.run(_write(adapter, rows, FileFormat.XLSX))
+
+    assert _measure(benchmark, run) > 0
@@ -0,0 +1,125 @@
+import logging
+
+import pytest
+
+from domain.entity import Feature
+from domain.export import NumberFormat
+from domain.fetch_record import DataSource
+from domain.global_position import ProductType
+from domain.importing import ImportCandidate, TemplatedDataParserParams
+from domain.template import Template, TemplatedField
+from domain.template_type import TemplateType
+from infrastructure.templating.templated_data_parser import TemplateDataParser
+
+ROW_COUNT = 50_000
+
+COLUMNS = [
+    "ref",
+    "name",
+    "amount",
+    "currency",
+    "type",
+    "date",
+    "entity",
+    "isin",
+    "ticker",
+    "shares",
+    "price",
+    "fees",
+    "order_date",
+    "equity_type",
+]
+
+
+def _row(i: int) -> list[str]:
+    # Roughly 7% of the rows carry an invalid or missing cell
+    return [
+        f"ref-{i}",
+        f"Stock {i % 300}",
+        f"{1 + i % 9}.{i % 1000:03d},{i % 100:02d}" if i % 61 else "n/a",
+        "EUR" if i % 97 else "EURO",
+        "BUY" if i % 2 else "sell",
+        f"{1 + i % 28:02d}/{1 + i % 12:02d}/20{15 + i % 10} {i % 24:02d}:{i % 60:02d}"
+        if i % 53
+        else f"{1 + i % 28:02d}/{1 + i % 12:02d}/2020",
+        f"Broker {i % 5}",
+        f"US{i % 5000:010d}",
+        f"T{i % 300}",
+        f"{i % 50},5" if i % 211 else "",
+        "117,58",
+        "1,25" if i % 3 else "",
+        "" if i % 7 else f"{1 + i % 28:02d}/01/2024",
+        "STOCK" if i % 89 else "BOND",
+    ]
+
+
+@pytest.fixture(scope="module")
+def candidate() -> ImportCandidate:
+    template = Template(
+        id=None,
+        name="Transactions",
+        feature=Feature.TRANSACTIONS,
+        type=TemplateType.IMPORT,
+        fields=[TemplatedField(field=column, name=None) for column in COLUMNS],
+        products=[ProductType.STOCK_ETF],
+    )
+    params = TemplatedDataParserParams(
+        template=template,
+        number_format=NumberFormat.EUROPEAN,
+        feature=Feature.TRANSACTIONS,
+        product=ProductType.STOCK_ETF,
+        datetime_format="%d/%m/%Y %H:%M",
+        date_format="%d/%m/%Y",
+        params={},
+    )
+    rows = [_row(i) for i in range(ROW_COUNT)]
+    return ImportCandidate(
+        name="Transactions",
+        source=DataSource.MANUAL,
+        params=params,
+        data=[COLUMNS] + rows,
+    )
+
+
+@pytest.fixture(autouse=True)
+def quiet_parser():
+    # Skipped rows are logged one by one
+    logging.disable(logging.WARNING)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def _import(parser: TemplateDataParser, candidate: ImportCandidate):
+    txs, _, errors = parser._load_txs(candidate, {}, {})
+    return txs, errors
+
+
+@pytest.fixture(scope="module")
+def row_parsed(candidate):
+    return _import(TemplateDataParser(bulk=False), candidate)
+
+
+@pytest.mark.benchmark(group="templated-import")
+def test_import_50k_transactions_rows(benchmark, candidate):
+    parser = TemplateDataParser(bulk=False)
+
+    txs, errors = benchmark.pedantic(
+        lambda: _import(parser, candidate), rounds=3, iterations=1
+    )
+    assert len(txs) < ROW_COUNT
+    assert errors
+
+
+@pytest.mark.benchmark(group="templated-import")
+def test_import_50k_transactions_bulk(benchmark, candidate, row_parsed):
+    parser = TemplateDataParser(bulk=True)
+
+    txs, errors = benchmark.pedantic(
+        lambda: _import(parser, candidate), rounds=3, iterations=1
+    )
+
+    expected_txs, expected_errors = row_parsed
+    assert errors == expected_errors
+    assert [(tx.ref, tx.amount, tx.date, tx.shares) for tx in txs] == [
+        (tx.ref, tx.amount, tx.date, tx.shares) for tx in expected_txs
+    ]
@@ -0,0 +1,23 @@
+import abc
+from pathlib import Path
+from uuid import UUID
+
+from domain.backup import BackupDeltaResult, BackupFileType, BackupManifest
+
+
+class BackupDeltaCalculator(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def build_manifest(
+        self, backup_type: BackupFileType, base_id: UUID, source: Path
+    ) -> BackupManifest:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def diff(
+        self, manifest: BackupManifest, source: Path, target: Path
+    ) -> BackupDeltaResult:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def apply(self, base_id: UUID, base: Path, delta: Path, target: Path) -> bool:
+        raise NotImplementedError
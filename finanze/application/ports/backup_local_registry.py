@@ -1,6 +1,7 @@
 import abc
+from typing import Optional
 
-from domain.backup import BackupsInfo, BackupInfo
+from domain.backup import BackupsInfo, BackupInfo, BackupFileType, BackupManifest
 
 
 class BackupLocalRegistry(metaclass=abc.ABCMeta):
@@ -11,3 +12,13 @@ class BackupLocalRegistry(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     async def insert(self, entries: list[BackupInfo]):
         raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_manifest(
+        self, backup_type: BackupFileType
+    ) -> Optional[BackupManifest]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def save_manifest(self, manifest: BackupManifest):
+        raise NotImplementedError
@@ -25,6 +25,12 @@ class CryptoWalletPort(metaclass=abc.ABCMeta):
     ) -> List[CryptoWallet]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID], hd_addresses: bool
+    ) -> dict[UUID, List[CryptoWallet]]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     async def exists_by_entity_and_address(self, entity_id: UUID, address: str) -> bool:
         raise NotImplementedError
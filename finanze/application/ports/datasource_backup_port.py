@@ -1,5 +1,6 @@
 import abc
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 from domain.user import User
@@ -10,10 +11,14 @@ class Backupable(metaclass=abc.ABCMeta):
     async def export(self) -> bytes:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def export_to(self, target: Path):
+        raise NotImplementedError
+
     @abc.abstractmethod
     async def import_data(
         self,
-        data: bytes,
+        data: bytes | Path,
         initialize: bool = False,
         user: Optional[User] = None,
         password: Optional[str] = None,
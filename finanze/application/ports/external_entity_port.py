@@ -25,6 +25,12 @@ class ExternalEntityPort(metaclass=abc.ABCMeta):
     async def get_by_entity_id(self, entity_id: UUID) -> Optional[ExternalEntity]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID]
+    ) -> dict[UUID, ExternalEntity]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     async def delete_by_id(self, ee_id: UUID):
         raise NotImplementedError
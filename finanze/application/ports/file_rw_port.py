@@ -1,4 +1,5 @@
 import abc
+from typing import AsyncIterable, AsyncIterator
 
 from domain.export import FileFormat
 from domain.file_upload import FileUpload
@@ -6,7 +7,9 @@ from domain.file_upload import FileUpload
 
 class TableRWPort(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    async def convert(self, rows: list[list[str]], format: FileFormat) -> bytes:
+    def convert(
+        self, rows: AsyncIterable[list[str]], format: FileFormat
+    ) -> AsyncIterator[bytes]:
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -1,11 +1,12 @@
 import abc
+from typing import Optional
 
 from domain.auto_contributions import AutoContributions
 from domain.entity_login import EntityLoginParams, EntityLoginResult
 from domain.exception.exceptions import FeatureNotSupported
 from domain.fetch_result import FetchOptions
-from domain.global_position import GlobalPosition, HistoricalPosition
-from domain.transactions import Transactions
+from domain.global_position import GlobalPosition, HistoricalPosition, ProductType
+from domain.transactions import Transactions, TxWatermark
 
 
 class FinancialEntityFetcher(metaclass=abc.ABCMeta):
@@ -22,7 +23,10 @@ class FinancialEntityFetcher(metaclass=abc.ABCMeta):
         raise FeatureNotSupported
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         raise FeatureNotSupported
 
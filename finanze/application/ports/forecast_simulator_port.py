@@ -0,0 +1,9 @@
+import abc
+
+from domain.forecast import MonteCarloInputs, MonteCarloResult
+
+
+class ForecastSimulatorPort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def simulate(self, inputs: MonteCarloInputs) -> MonteCarloResult:
+        raise NotImplementedError
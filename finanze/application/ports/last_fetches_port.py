@@ -8,6 +8,11 @@ class LastFetchesPort(metaclass=abc.ABCMeta):
     async def get_by_entity_id(self, entity_id: UUID) -> list[FetchRecord]:
         raise NotImplementedError
 
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID]
+    ) -> dict[UUID, list[FetchRecord]]:
+        raise NotImplementedError
+
     async def get_by_entity_account_id(
         self, entity_account_id: UUID
     ) -> list[FetchRecord]:
@@ -2,7 +2,11 @@ import abc
 from datetime import date
 
 from domain.global_position import InstallmentFrequency
-from domain.loan_calculator import LoanCalculationParams, LoanCalculationResult
+from domain.loan_calculator import (
+    LoanCalculationParams,
+    LoanCalculationResult,
+    LoanSchedule,
+)
 
 
 class LoanCalculatorPort(metaclass=abc.ABCMeta):
@@ -10,6 +14,10 @@ class LoanCalculatorPort(metaclass=abc.ABCMeta):
     async def calculate(self, params: LoanCalculationParams) -> LoanCalculationResult:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def schedule(self, params: LoanCalculationParams) -> LoanSchedule:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def next_installment_date(
         self, start: date, end: date, frequency: InstallmentFrequency, today: date
@@ -0,0 +1,9 @@
+import abc
+
+from domain.notification import Notification
+
+
+class NotificationPort(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def publish(self, notification: Notification):
+        raise NotImplementedError
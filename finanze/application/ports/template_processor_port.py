@@ -1,11 +1,12 @@
 import abc
+from typing import AsyncIterator
 
 from domain.export import TemplatedDataProcessorParams
 
 
 class TemplateProcessorPort(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    async def process(
+    def process(
         self, data: list, params: TemplatedDataProcessorParams
-    ) -> list[list[str]]:
+    ) -> AsyncIterator[list[str]]:
         raise NotImplementedError
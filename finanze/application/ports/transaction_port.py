@@ -3,7 +3,13 @@ from typing import Optional
 from uuid import UUID
 
 from domain.fetch_record import DataSource
-from domain.transactions import BaseTx, TransactionQueryRequest, Transactions
+from domain.global_position import ProductType
+from domain.transactions import (
+    BaseTx,
+    TransactionQueryRequest,
+    Transactions,
+    TxWatermark,
+)
 
 
 class TransactionPort(metaclass=abc.ABCMeta):
@@ -23,6 +29,12 @@ class TransactionPort(metaclass=abc.ABCMeta):
     async def get_refs_by_entity_account(self, entity_account_id: UUID) -> set[str]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    async def get_watermarks_by_entity_account(
+        self, entity_account_id: UUID
+    ) -> dict[ProductType, TxWatermark]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     async def get_by_entity(self, entity_id: UUID) -> Transactions:
         raise NotImplementedError
@@ -0,0 +1,11 @@
+from application.ports.loan_calculator_port import LoanCalculatorPort
+from domain.loan_calculator import LoanCalculationParams, LoanSchedule
+from domain.use_cases.calculate_loan_schedule import CalculateLoanSchedule
+
+
+class CalculateLoanScheduleImpl(CalculateLoanSchedule):
+    def __init__(self, loan_calculator: LoanCalculatorPort):
+        self._loan_calculator = loan_calculator
+
+    async def execute(self, params: LoanCalculationParams) -> LoanSchedule:
+        return await self._loan_calculator.schedule(params)
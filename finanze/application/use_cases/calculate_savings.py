@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import replace
 from decimal import InvalidOperation, ROUND_HALF_UP
+from math import ceil, log, log1p
 from typing import List, Optional
 
 from domain.calculations import (
@@ -15,10 +16,15 @@ from domain.calculations import (
     SavingsScenarioRequest,
     SavingsScenarioResult,
 )
+from domain.amortization import annuity_due_value, future_value
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import CalculationInputError, MissingFieldsError
 from domain.use_cases.calculate_savings import CalculateSavings
 
+# Longest horizon considered when deriving the periods needed for a target
+_MAX_YEARS = 200
+_CENT = Dezimal("0.01").val
+
 
 class CalculateSavingsImpl(CalculateSavings):
     async def execute(
@@ -65,6 +71,11 @@ class CalculateSavingsImpl(CalculateSavings):
     def _solve_periods_for_target(
         self, request: SavingsCalculationRequest, scenario: SavingsScenarioRequest
     ) -> Optional[int]:
+        """
+        First period whose balance reaches the target. The balance is monotonic
+        in the number of periods, so the logarithmic estimate only has to be
+        corrected by a bounded search over the closed form balance.
+        """
         if not scenario.target_amount or request.base_amount is None:
             return None
         rate = self._period_rate(
@@ -74,16 +85,28 @@ class CalculateSavingsImpl(CalculateSavings):
         periodic = scenario.periodic_contribution or Dezimal(0)
         if rate == Dezimal(0) and periodic == Dezimal(0):
             return None
-        periods = 0
-        balance = base
         target = scenario.target_amount
-        while balance < target and periods < 200 * request.periodicity.periods_per_year:
-            balance = balance + periodic
-            balance = balance + (balance * rate)
-            periods += 1
-        if balance < target:
+        limit = _MAX_YEARS * request.periodicity.periods_per_year
+        if base >= target or future_value(base, rate, periodic, limit) < target:
             return None
-        return periods if periods > 0 else None
+
+        def reached(periods: int) -> bool:
+            return future_value(base, rate, periodic, periods) >= target
+
+        low, high = 0, limit
+        estimate = _estimate_periods(base, rate, periodic, target)
+        if estimate is not None:
+            near_low = max(0, estimate - 1)
+            near_high = min(limit, estimate + 1)
+            if not reached(near_low) and reached(near_high):
+                low, high = near_low, near_high
+        while high - low > 1:
+            middle = (low + high) // 2
+            if reached(middle):
+                high = middle
+            else:
+                low = middle
+        return high
 
     def _normalize_scenario(
         self, scenario: SavingsScenarioRequest, request: SavingsCalculationRequest
@@ -146,6 +169,10 @@ class CalculateSavingsImpl(CalculateSavings):
         scenario: SavingsScenarioRequest,
         rate: Dezimal,
     ) -> Dezimal:
+        """
+        Contribution whose accumulated balance exactly funds the retirement
+        withdrawals: FV(base, contribution, accumulation) = PV_due(withdrawals).
+        """
         if (
             request.retirement is None
             or request.retirement.withdrawal_amount is None
@@ -158,90 +185,17 @@ class CalculateSavingsImpl(CalculateSavings):
             request.retirement.withdrawal_years * request.periodicity.periods_per_year
         )
         accumulation_periods = request.years * request.periodicity.periods_per_year
-        withdrawal = request.retirement.withdrawal_amount
         base = request.base_amount or Dezimal(0)
-        initial_estimate = self._estimate_contribution_for_retirement(
-            base, rate, accumulation_periods, withdrawal, retirement_periods
+        required_balance = annuity_due_value(
+            request.retirement.withdrawal_amount, rate, retirement_periods
         )
-        contribution = self._refine_contribution_via_simulation(
-            base,
-            rate,
-            accumulation_periods,
-            withdrawal,
-            retirement_periods,
-            initial_estimate,
+        shortfall = required_balance - future_value(
+            base, rate, Dezimal(0), accumulation_periods
         )
-        return self._round_cents(contribution)
-
-    def _estimate_contribution_for_retirement(
-        self,
-        base: Dezimal,
-        rate: Dezimal,
-        accumulation_periods: int,
-        withdrawal: Dezimal,
-        retirement_periods: int,
-    ) -> Dezimal:
-        if rate == Dezimal(0):
-            total_needed = withdrawal * Dezimal(retirement_periods)
-            if total_needed <= base:
-                return Dezimal(0)
-            shortfall = total_needed - base
-            return shortfall / Dezimal(accumulation_periods)
-        growth = (Dezimal(1) + rate) ** accumulation_periods
-        base_at_retirement = base * growth
-        discount = Dezimal(1) - (Dezimal(1) + rate) ** (-retirement_periods)
-        pv_ordinary = withdrawal * discount / rate
-        required_balance = pv_ordinary * (Dezimal(1) + rate)
-        if required_balance <= base_at_retirement:
+        if shortfall <= Dezimal(0):
             return Dezimal(0)
-        shortfall = required_balance - base_at_retirement
-        annuity = (growth - Dezimal(1)) / rate
-        return shortfall / annuity
-
-    def _refine_contribution_via_simulation(
-        self,
-        base: Dezimal,
-        rate: Dezimal,
-        accumulation_periods: int,
-        withdrawal: Dezimal,
-        retirement_periods: int,
-        initial_estimate: Dezimal,
-    ) -> Dezimal:
-        low = Dezimal(0)
-        high = initial_estimate * Dezimal(3)
-        if high == Dezimal(0):
-            high = withdrawal * Dezimal(2)
-        tolerance = Dezimal("0.01")
-        for _ in range(100):
-            mid = (low + high) / Dezimal(2)
-            final_balance = self._simulate_full_cycle(
-                base, rate, accumulation_periods, mid, withdrawal, retirement_periods
-            )
-            if abs(final_balance) < tolerance:
-                return mid
-            if final_balance > Dezimal(0):
-                high = mid
-            else:
-                low = mid
-        return (low + high) / Dezimal(2)
-
-    def _simulate_full_cycle(
-        self,
-        base: Dezimal,
-        rate: Dezimal,
-        accumulation_periods: int,
-        contribution: Dezimal,
-        withdrawal: Dezimal,
-        retirement_periods: int,
-    ) -> Dezimal:
-        balance = base
-        for _ in range(accumulation_periods):
-            balance = balance + contribution
-            balance = balance + self._round_cents(balance * rate)
-        final_balance = self._simulate_retirement_balance(
-            balance, rate, retirement_periods, withdrawal
-        )
-        return final_balance
+        per_unit = future_value(Dezimal(0), rate, Dezimal(1), accumulation_periods)
+        return self._round_cents(shortfall / per_unit)
 
     def _solve_required_contribution_periods(
         self,
@@ -283,8 +237,9 @@ class CalculateSavingsImpl(CalculateSavings):
         total_contrib = Dezimal(0)
         total_revaluation = Dezimal(0)
         base_amount = request.base_amount or Dezimal(0)
+        contribution = scenario.periodic_contribution
+        contributed = self._round_cents(contribution)
         for idx in range(1, periods + 1):
-            contribution = scenario.periodic_contribution
             balance = balance + contribution
             total_contrib = total_contrib + contribution
             revaluation = self._round_cents(balance * rate)
@@ -294,10 +249,10 @@ class CalculateSavingsImpl(CalculateSavings):
             accumulation_periods.append(
                 SavingsPeriodEntry(
                     period_index=idx,
-                    contributed=self._round_cents(contribution),
+                    contributed=contributed,
                     total_contributed=self._round_cents(total_contrib),
-                    revaluation=self._round_cents(revaluation),
-                    total_revaluation=self._round_cents(total_revaluation),
+                    revaluation=revaluation,
+                    total_revaluation=total_revaluation,
                     total_invested=total_invested,
                     balance=self._round_cents(balance),
                 )
@@ -313,7 +268,7 @@ class CalculateSavingsImpl(CalculateSavings):
         return SavingsScenarioResult(
             scenario_id=scenario.scenario_id,
             annual_market_performance=scenario.annual_market_performance,
-            periodic_contribution=self._round_cents(scenario.periodic_contribution),
+            periodic_contribution=contributed,
             accumulation_periods=accumulation_periods,
             total_contributions=self._round_cents(total_contrib),
             total_revaluation=self._round_cents(total_revaluation),
@@ -384,7 +339,7 @@ class CalculateSavingsImpl(CalculateSavings):
                     period_index=index,
                     withdrawal=self._round_cents(withdrawal),
                     total_withdrawn=self._round_cents(total_withdrawn),
-                    revaluation=self._round_cents(revaluation),
+                    revaluation=revaluation,
                     balance=self._round_cents(current_balance),
                 )
             )
@@ -405,24 +360,6 @@ class CalculateSavingsImpl(CalculateSavings):
             periods=periods,
         )
 
-    def _simulate_retirement_balance(
-        self,
-        balance: Dezimal,
-        rate: Dezimal,
-        periods: int,
-        withdrawal: Dezimal,
-    ) -> Dezimal:
-        current = balance
-        for i in range(1, periods + 1):
-            if current <= Dezimal(0):
-                remaining_periods = periods - i + 1
-                return Dezimal(0) - (withdrawal * Dezimal(remaining_periods))
-            w = withdrawal if current >= withdrawal else current
-            current = current - w
-            if i < periods and current > Dezimal(0):
-                current = current + self._round_cents(current * rate)
-        return current
-
     def _solve_withdrawal_amount(
         self, balance: Dezimal, rate: Dezimal, periods_target: int
     ) -> Dezimal:
@@ -449,9 +386,7 @@ class CalculateSavingsImpl(CalculateSavings):
         if not amount.val.is_finite():
             raise CalculationInputError("calculation produced non-finite amount")
         try:
-            return Dezimal(
-                amount.val.quantize(Dezimal(0.01).val, rounding=ROUND_HALF_UP)
-            )
+            return Dezimal(amount.val.quantize(_CENT, rounding=ROUND_HALF_UP))
         except InvalidOperation as error:
             raise CalculationInputError(
                 "calculation produced non-finite amount"
@@ -480,3 +415,20 @@ class CalculateSavingsImpl(CalculateSavings):
                         "retirement.withdrawal_amount | retirement.withdrawal_years",
                     ]
                 )
+
+
+def _estimate_periods(
+    base: Dezimal, rate: Dezimal, contribution: Dezimal, target: Dezimal
+) -> Optional[int]:
+    """
+    Periods solving FV_n = target in floating point, the balance follows
+    FV_n = L + (base - L)*(1+r)^n with L = -C*(1+r)/r.
+    """
+    r, c = float(rate), float(contribution)
+    try:
+        if r == 0:
+            return ceil((float(target) - float(base)) / c)
+        limit = -c * (1 + r) / r
+        return ceil(log((float(target) - limit) / (float(base) - limit)) / log1p(r))
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return None
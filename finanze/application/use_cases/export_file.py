@@ -1,6 +1,6 @@
 from asyncio import Lock
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from application.ports.auto_contributions_port import AutoContributionsPort
@@ -26,6 +26,14 @@ from domain.historic import HistoricQueryRequest
 from domain.use_cases.export_file import ExportFile
 
 
+async def _with_header(
+    header: list[str], rows: AsyncIterator[list[str]]
+) -> AsyncIterator[list[str]]:
+    yield header
+    async for row in rows:
+        yield row
+
+
 def _content_type_for_format(export_format: FileFormat) -> str:
     if export_format == FileFormat.CSV:
         return "text/csv"
@@ -62,26 +70,28 @@ class ExportFileImpl(ExportFile):
         if self._lock.locked():
             raise ExecutionConflict()
 
+        # Guards loading the data, rows are then mapped and written while the
+        # file is sent
         async with self._lock:
             rows = await self._build_rows(request)
-            if not rows:
+            header = await anext(rows, None)
+            if header is None:
                 raise ExportException("No data available for export")
 
-            timestamp = datetime.now(tzlocal()).strftime("%Y%m%d_%H%M%S")
-            filename = f"export_{request.feature.lower()}_{timestamp}.{request.format.name.lower()}"
+        timestamp = datetime.now(tzlocal()).strftime("%Y%m%d_%H%M%S")
+        filename = f"export_{request.feature.lower()}_{timestamp}.{request.format.name.lower()}"
 
-            content_type = _content_type_for_format(request.format)
+        content_type = _content_type_for_format(request.format)
 
-            data = await self._table_rw_port.convert(rows, request.format)
+        data = self._table_rw_port.convert(_with_header(header, rows), request.format)
 
-            return FileExportResult(
-                filename=filename,
-                content_type=content_type,
-                data=data,
-                size=len(data),
-            )
+        return FileExportResult(
+            filename=filename,
+            content_type=content_type,
+            data=data,
+        )
 
-    async def _build_rows(self, request: FileExportRequest) -> list[list[str]]:
+    async def _build_rows(self, request: FileExportRequest) -> AsyncIterator[list[str]]:
         feature = request.feature
         products = request.data or []
         disabled_entities = [
@@ -122,7 +132,7 @@ class ExportFileImpl(ExportFile):
             datetime_format=request.datetime_format,
             date_format=request.date_format,
         )
-        return await self._template_processor.process(data, params)
+        return self._template_processor.process(data, params)
 
     async def _build_auto_contribution_rows(self, disabled_entities, template, request):
         contributions = await self._auto_contr_port.get_all_grouped_by_entity(
@@ -137,7 +147,7 @@ class ExportFileImpl(ExportFile):
             datetime_format=request.datetime_format,
             date_format=request.date_format,
         )
-        return await self._template_processor.process(data, params)
+        return self._template_processor.process(data, params)
 
     async def _build_transaction_rows(
         self, products, disabled_entities, template, request
@@ -152,7 +162,7 @@ class ExportFileImpl(ExportFile):
             datetime_format=request.datetime_format,
             date_format=request.date_format,
         )
-        return await self._template_processor.process(data, params)
+        return self._template_processor.process(data, params)
 
     async def _build_historic_rows(
         self, products, disabled_entities, template, request
@@ -172,7 +182,7 @@ class ExportFileImpl(ExportFile):
             datetime_format=request.datetime_format,
             date_format=request.date_format,
         )
-        return await self._template_processor.process(data, params)
+        return self._template_processor.process(data, params)
 
     async def _resolve_template(self, template_config) -> Optional[object]:
         if not template_config:
@@ -210,12 +210,9 @@ class ExportSheetsImpl(ExportSheets):
             if config.lastUpdate:
                 table = [_map_top_row(params)]
 
-            table.extend(
-                await self._template_processor.process(
-                    data,
-                    params,
-                )
-            )
+            # The Sheets API takes the whole range in a single update
+            async for row in self._template_processor.process(data, params):
+                table.append(row)
             await self._sheets_port.update(table, credentials, sheets_params)
 
     async def _map_template_params(
@@ -15,11 +15,15 @@ from application.ports.crypto_price_provider import CryptoAssetInfoProvider
 from application.ports.crypto_wallet_port import CryptoWalletPort
 from application.ports.external_integration_port import ExternalIntegrationPort
 from application.ports.last_fetches_port import LastFetchesPort
+from application.ports.notification_port import NotificationPort
 from application.ports.position_port import PositionPort
 from application.ports.public_key_derivation import PublicKeyDerivation
 from application.ports.transaction_handler_port import TransactionHandlerPort
 from application.use_cases.derive_crypto_addresses import get_coin_type_from_entity_id
-from application.use_cases.fetch_financial_data import handle_cooldown
+from application.use_cases.fetch_financial_data import (
+    handle_cooldown,
+    notify_fetch_progress,
+)
 from domain import native_entities
 from domain.crypto import (
     CryptoFetchRequest,
@@ -49,6 +53,7 @@ from domain.fetch_result import (
     FetchResult,
     FetchResultCode,
 )
+from domain.notification import FetchPhase
 from domain.global_position import (
     CryptoCurrencies,
     CryptoCurrencyPosition,
@@ -79,6 +84,7 @@ class FetchCryptoDataImpl(FetchCryptoData):
         external_integration_port: ExternalIntegrationPort,
         transaction_handler_port: TransactionHandlerPort,
         public_key_derivation: PublicKeyDerivation,
+        notification_port: Optional[NotificationPort] = None,
     ):
         self._position_port = position_port
         self._entity_fetchers = entity_fetchers
@@ -89,6 +95,7 @@ class FetchCryptoDataImpl(FetchCryptoData):
         self._external_integration_port = external_integration_port
         self._transaction_handler_port = transaction_handler_port
         self._public_key_derivation = public_key_derivation
+        self._notification_port = notification_port
 
         self._locks: dict[UUID, Lock] = {}
 
@@ -171,6 +178,10 @@ class FetchCryptoDataImpl(FetchCryptoData):
         options: FetchOptions,
         integrations: EnabledExternalIntegrations,
     ) -> FetchedData:
+        await notify_fetch_progress(
+            self._notification_port, entity.id, FetchPhase.POSITION
+        )
+
         entity_wallets = await self._crypto_wallet_port.get_by_entity_id(
             entity.id, hd_addresses=True
         )
@@ -271,9 +282,12 @@ class FetchCryptoDataImpl(FetchCryptoData):
 
             await self._update_last_fetch(entity.id, [Feature.POSITION])
 
-            return FetchedData(
-                position=position,
-            )
+        await notify_fetch_progress(
+            self._notification_port, entity.id, FetchPhase.SAVED
+        )
+        return FetchedData(
+            position=position,
+        )
 
     @staticmethod
     def _collect_asset_identifiers(
@@ -1,7 +1,7 @@
 import logging
 from asyncio import Lock
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from application.ports.entity_port import EntityPort
@@ -11,9 +11,13 @@ from application.ports.external_entity_fetcher import (
 from application.ports.external_entity_port import ExternalEntityPort
 from application.ports.external_integration_port import ExternalIntegrationPort
 from application.ports.last_fetches_port import LastFetchesPort
+from application.ports.notification_port import NotificationPort
 from application.ports.position_port import PositionPort
 from application.ports.transaction_handler_port import TransactionHandlerPort
-from application.use_cases.fetch_financial_data import handle_cooldown
+from application.use_cases.fetch_financial_data import (
+    handle_cooldown,
+    notify_fetch_progress,
+)
 from dateutil.tz import tzlocal
 from domain.entity import EntityOrigin, Feature
 from domain.exception.exceptions import (
@@ -37,6 +41,7 @@ from domain.fetch_result import (
     FetchResult,
     FetchResultCode,
 )
+from domain.notification import FetchPhase
 from domain.use_cases.fetch_external_financial_data import FetchExternalFinancialData
 
 
@@ -52,6 +57,7 @@ class FetchExternalFinancialDataImpl(FetchExternalFinancialData):
         external_integration_port: ExternalIntegrationPort,
         last_fetches_port: LastFetchesPort,
         transaction_handler_port: TransactionHandlerPort,
+        notification_port: Optional[NotificationPort] = None,
     ):
         self._entity_port = entity_port
         self._external_entity_port = external_entity_port
@@ -60,6 +66,7 @@ class FetchExternalFinancialDataImpl(FetchExternalFinancialData):
         self._external_integration_port = external_integration_port
         self._last_fetches_port = last_fetches_port
         self._transaction_handler_port = transaction_handler_port
+        self._notification_port = notification_port
 
         self._lock = Lock()
 
@@ -106,6 +113,9 @@ class FetchExternalFinancialDataImpl(FetchExternalFinancialData):
                     external_entity=external_entity,
                     entity=entity,
                 )
+                await notify_fetch_progress(
+                    self._notification_port, entity_id, FetchPhase.POSITION
+                )
                 position = await provider.global_position(fetch_request)
 
                 async with self._transaction_handler_port.start():
@@ -114,9 +124,12 @@ class FetchExternalFinancialDataImpl(FetchExternalFinancialData):
 
                     await self._update_last_fetch(entity_id, [Feature.POSITION])
 
-                    return FetchResult(
-                        FetchResultCode.COMPLETED, data=FetchedData(position=position)
-                    )
+                await notify_fetch_progress(
+                    self._notification_port, entity_id, FetchPhase.SAVED
+                )
+                return FetchResult(
+                    FetchResultCode.COMPLETED, data=FetchedData(position=position)
+                )
 
             except ExternalEntityFailed:
                 return FetchResult(FetchResultCode.REMOTE_FAILED)
@@ -18,6 +18,7 @@ from application.ports.feature_flag_port import FeatureFlagPort
 from application.ports.historic_port import HistoricPort
 from application.ports.last_fetches_port import LastFetchesPort
 from application.ports.loan_calculator_port import LoanCalculatorPort
+from application.ports.notification_port import NotificationPort
 from application.ports.position_port import PositionPort
 from application.ports.public_keychain_loader import PublicKeychainLoader
 from application.ports.real_estate_port import RealEstatePort
@@ -48,6 +49,12 @@ from domain.global_position import (
     RealEstateCFDetail,
 )
 from domain.loan_calculator import LoanCalculationParams
+from domain.notification import (
+    FetchPhase,
+    FetchProgress,
+    Notification,
+    NotificationType,
+)
 from domain.historic import (
     BaseHistoricEntry,
     FactoringEntry,
@@ -161,6 +168,28 @@ def handle_cooldown(last_fetches, update_cooldown) -> Optional[FetchResult]:
     return None
 
 
+async def notify_fetch_progress(
+    notification_port: Optional[NotificationPort],
+    entity_id: UUID,
+    phase: FetchPhase,
+    entity_account_id: Optional[UUID] = None,
+):
+    if notification_port is None:
+        return
+
+    await notification_port.publish(
+        Notification(
+            type=NotificationType.FETCH_PROGRESS,
+            data=FetchProgress(
+                entity_id=entity_id,
+                phase=phase,
+                entity_account_id=entity_account_id,
+            ),
+            date=datetime.now(tzlocal()),
+        )
+    )
+
+
 class FetchFinancialDataImpl(FetchFinancialData):
     def __init__(
         self,
@@ -181,6 +210,7 @@ class FetchFinancialDataImpl(FetchFinancialData):
         loan_calculator: LoanCalculatorPort,
         real_estate_port: RealEstatePort,
         feature_flag_port: FeatureFlagPort,
+        notification_port: Optional[NotificationPort] = None,
     ):
         self._position_port = position_port
         self._auto_contr_repository = auto_contr_port
@@ -199,6 +229,7 @@ class FetchFinancialDataImpl(FetchFinancialData):
         self._loan_calculator = loan_calculator
         self._real_estate_port = real_estate_port
         self._feature_flag_port = feature_flag_port
+        self._notification_port = notification_port
 
         self._locks: dict[UUID, Lock] = {}
 
@@ -272,6 +303,7 @@ class FetchFinancialDataImpl(FetchFinancialData):
                 keychain=keychain,
                 feature_flags=self._feature_flag_port.get_all(),
             )
+            await self._notify(entity, FetchPhase.LOGIN, entity_account_id)
             login_result = await specific_fetcher.login(login_request)
             login_result_code = login_result.code
             login_message = login_result.message
@@ -348,6 +380,7 @@ class FetchFinancialDataImpl(FetchFinancialData):
     ) -> FetchResult:
         position = None
         if Feature.POSITION in features:
+            await self._notify(entity, FetchPhase.POSITION, entity_account_id)
             position = await specific_fetcher.global_position()
             position.entity_account_id = entity_account_id
             await self._enrich_crypto_assets(position)
@@ -355,6 +388,7 @@ class FetchFinancialDataImpl(FetchFinancialData):
 
         auto_contributions = None
         if Feature.AUTO_CONTRIBUTIONS in features:
+            await self._notify(entity, FetchPhase.AUTO_CONTRIBUTIONS, entity_account_id)
             auto_contributions = await specific_fetcher.auto_contributions()
             if auto_contributions:
                 for contrib in auto_contributions.periodic:
@@ -364,14 +398,34 @@ class FetchFinancialDataImpl(FetchFinancialData):
         historical_position = None
         if Feature.TRANSACTIONS in features:
             registered_txs = {}
+            since = None
             if not options.deep:
                 registered_txs = (
                     await self._transaction_port.get_refs_by_entity_account(
                         entity_account_id
                     )
                 )
+                since = await self._transaction_port.get_watermarks_by_entity_account(
+                    entity_account_id
+                )
+
+            await self._notify(entity, FetchPhase.TRANSACTIONS, entity_account_id)
+            transactions = await specific_fetcher.transactions(
+                registered_txs, options, since=since
+            )
 
-            transactions = await specific_fetcher.transactions(registered_txs, options)
+            if transactions and registered_txs:
+                # Watermarks are inclusive, txs from the watermark day come back again
+                transactions.investment = [
+                    tx
+                    for tx in transactions.investment or []
+                    if tx.ref not in registered_txs
+                ]
+                transactions.account = [
+                    tx
+                    for tx in transactions.account or []
+                    if tx.ref not in registered_txs
+                ]
 
             if transactions:
                 for tx in transactions.investment or []:
@@ -380,6 +434,7 @@ class FetchFinancialDataImpl(FetchFinancialData):
                     tx.entity_account_id = entity_account_id
 
                 if Feature.HISTORIC in features:
+                    await self._notify(entity, FetchPhase.HISTORIC, entity_account_id)
                     historical_position = await specific_fetcher.historical_position()
 
         old_position_id = None
@@ -430,7 +485,14 @@ class FetchFinancialDataImpl(FetchFinancialData):
                 transactions=transactions,
                 historic=historic,
             )
-            return FetchResult(FetchResultCode.COMPLETED, data=data)
+
+        await self._notify(entity, FetchPhase.SAVED, entity_account_id)
+        return FetchResult(FetchResultCode.COMPLETED, data=data)
+
+    async def _notify(self, entity: Entity, phase: FetchPhase, entity_account_id: UUID):
+        await notify_fetch_progress(
+            self._notification_port, entity.id, phase, entity_account_id
+        )
 
     def _compute_historic_entry(
         self, entity, inv, txs_by_name, entity_account_id: UUID = None
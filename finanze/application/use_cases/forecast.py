@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+from collections import Counter
 from copy import deepcopy
-from datetime import date, timedelta
+from datetime import date
+from itertools import pairwise
 from typing import Callable, Dict, Optional
-from uuid import UUID
 
 from application.ports.auto_contributions_port import AutoContributionsPort
 from application.ports.entity_port import EntityPort
+from application.ports.forecast_simulator_port import ForecastSimulatorPort
 from application.ports.pending_flow_port import PendingFlowPort
 from application.ports.periodic_flow_port import PeriodicFlowPort
 from application.ports.position_port import PositionPort
 from application.ports.real_estate_port import RealEstatePort
 from dateutil.relativedelta import relativedelta
+from domain.amortization import balance_after
 from domain.auto_contributions import (
     ContributionFrequency,
     ContributionQueryRequest,
@@ -20,11 +23,20 @@ from domain.auto_contributions import (
 )
 from domain.constants import CAPITAL_GAINS_BASE_TAX
 from domain.dezimal import Dezimal
-from domain.earnings_expenses import FlowFrequency, FlowType
+from domain.earnings_expenses import (
+    FlowFrequency,
+    FlowType,
+    PendingFlow,
+    PeriodicFlow,
+)
 from domain.forecast import (
     CashDelta,
+    ForecastPoint,
     ForecastRequest,
     ForecastResult,
+    MonteCarloInputs,
+    ReturnAssumption,
+    SimulatedAsset,
     RealEstateEquityForecast,
 )
 from domain.global_position import (
@@ -38,15 +50,149 @@ from domain.global_position import (
     FundPortfolios,
     GlobalPosition,
     Loan,
-    Loans,
     ProductType,
     RealEstateCFInvestments,
     StockInvestments,
 )
 from domain.real_estate import RealEstate, RealEstateFlowSubtype
+from domain.recurrence import Recurrence
 from domain.use_cases.forecast import Forecast
 
 
+_CASH = "cash"
+_EQUITIES = "equities"
+_FIXED_INCOME = "fixed_income"
+_CRYPTO = "crypto"
+_COMMODITY = "commodity"
+_POSITION_BUCKETS = (_CASH, _EQUITIES, _FIXED_INCOME, _CRYPTO, _COMMODITY)
+
+
+def _months_between(from_date: date, to_date: date) -> int:
+    """Forecast months from from_date to to_date, a partial month counts as one."""
+    months_delta = relativedelta(to_date, from_date)
+    return (
+        months_delta.years * 12
+        + months_delta.months
+        + (1 if months_delta.days > 0 else 0)
+    )
+
+
+def _growth(annual_increase: Optional[Dezimal], months: int) -> Dezimal:
+    if annual_increase is None or annual_increase <= Dezimal(0) or months <= 0:
+        return Dezimal(1)
+    return (Dezimal(1) + annual_increase / 12) ** months
+
+
+def _add_to(
+    amounts: dict[str, Dezimal], currency: Optional[str], amount: Optional[Dezimal]
+) -> None:
+    if currency is None or amount is None:
+        return
+    amounts[currency] = amounts.get(currency, Dezimal(0)) + amount
+
+
+class _SimulationCollector:
+    """
+    Gathers the Monte Carlo inputs while the deterministic engine advances:
+    the simulated asset classes (equities, crypto and commodities) initial
+    values and monthly contributions, and everything else as the base.
+    """
+
+    _CLASSES = {
+        _EQUITIES: "avg_annual_market_increase",
+        _CRYPTO: "avg_annual_crypto_increase",
+        _COMMODITY: "avg_annual_commodity_increase",
+    }
+
+    def __init__(
+        self,
+        request: ForecastRequest,
+        months: int,
+        initial: dict[str, dict[str, Dezimal]],
+    ):
+        monte_carlo = request.monte_carlo
+        requested = {
+            _EQUITIES: monte_carlo.market,
+            _CRYPTO: monte_carlo.crypto,
+            _COMMODITY: monte_carlo.commodity,
+        }
+        # Classes without assumptions grow deterministically at the average rate
+        self._returns: dict[str, ReturnAssumption] = {}
+        for asset_class, avg_field in self._CLASSES.items():
+            returns = requested[asset_class]
+            if returns is None:
+                avg = getattr(request, avg_field) or Dezimal(0)
+                returns = ReturnAssumption(mean=avg, volatility=Dezimal(0))
+            self._returns[asset_class] = returns
+
+        self._request = monte_carlo
+        self._months = months
+        self._initial = {
+            asset_class: dict(initial[asset_class]) for asset_class in self._CLASSES
+        }
+        self._contributions: dict[tuple[str, str], list[Dezimal]] = {}
+        self._dates: list[date] = []
+        self._base: dict[str, list[Dezimal]] = {}
+
+    def add_contributions(
+        self,
+        month: int,
+        before: dict[str, dict[str, Dezimal]],
+        after: dict[str, dict[str, Dezimal]],
+    ) -> None:
+        for asset_class in self._CLASSES:
+            previous = before[asset_class]
+            for currency, amount in after[asset_class].items():
+                added = amount - previous.get(currency, Dezimal(0))
+                if added == Dezimal(0):
+                    continue
+                series = self._contributions.setdefault(
+                    (asset_class, currency), [Dezimal(0)] * self._months
+                )
+                series[month - 1] = series[month - 1] + added
+
+    def add_point(
+        self, point: ForecastPoint, amounts: dict[str, dict[str, Dezimal]]
+    ) -> None:
+        base: dict[str, Dezimal] = {}
+        for values in (point.cash, amounts[_FIXED_INCOME], point.real_estate_equity):
+            for currency, amount in values.items():
+                _add_to(base, currency, amount)
+        for currency, amount in point.debt.items():
+            _add_to(base, currency, -amount)
+
+        month = len(self._dates)
+        self._dates.append(point.date)
+        for currency, amount in base.items():
+            self._base.setdefault(currency, [Dezimal(0)] * self._months)[month] = amount
+
+    def inputs(self) -> MonteCarloInputs:
+        assets: list[SimulatedAsset] = []
+        keys = set(self._contributions)
+        for asset_class, initial in self._initial.items():
+            keys.update((asset_class, currency) for currency in initial)
+        for asset_class, currency in sorted(keys):
+            assets.append(
+                SimulatedAsset(
+                    asset_class=asset_class,
+                    currency=currency,
+                    returns=self._returns[asset_class],
+                    initial=self._initial[asset_class].get(currency, Dezimal(0)),
+                    contributions=self._contributions.get(
+                        (asset_class, currency), [Dezimal(0)] * self._months
+                    ),
+                )
+            )
+        return MonteCarloInputs(
+            dates=self._dates,
+            base=self._base,
+            assets=assets,
+            paths=self._request.paths,
+            percentiles=self._request.percentiles,
+            seed=self._request.seed,
+        )
+
+
 def _calculate_value_increase(from_date: date, to_date: date, annual_increase: Dezimal):
     if annual_increase is None or annual_increase <= Dezimal(0):
         return Dezimal(0)
@@ -74,6 +220,7 @@ class ForecastImpl(Forecast):
         pending_flow_port: PendingFlowPort,
         real_estate_port: RealEstatePort,
         entity_port: EntityPort,
+        forecast_simulator: Optional[ForecastSimulatorPort] = None,
     ) -> None:
         self._position_port = position_port
         self._auto_contributions_port = auto_contributions_port
@@ -81,6 +228,7 @@ class ForecastImpl(Forecast):
         self._pending_flow_port = pending_flow_port
         self._real_estate_port = real_estate_port
         self._entity_port = entity_port
+        self._forecast_simulator = forecast_simulator
 
     # ---------- Resolve linked loans ----------
     async def _resolve_linked_loans(
@@ -108,117 +256,22 @@ class ForecastImpl(Forecast):
         return hashes
 
     # ---------- Helpers for occurrences ----------
-    def _advance_after_today(
-        self, start: date, every: FlowFrequency, today: date
-    ) -> date:
-        if every == FlowFrequency.DAILY:
-            return today + timedelta(days=1)
-        if every == FlowFrequency.WEEKLY:
-            days_since = (today - start).days
-            weeks_passed = days_since // 7
-            candidate = start + timedelta(weeks=weeks_passed + 1)
-            return (
-                candidate
-                if candidate > today
-                else start + timedelta(weeks=weeks_passed + 2)
-            )
-        if every == FlowFrequency.BIWEEKLY:
-            days_since = (today - start).days
-            periods_passed = days_since // 14
-            candidate = start + timedelta(weeks=(periods_passed + 1) * 2)
-            return (
-                candidate
-                if candidate > today
-                else start + timedelta(weeks=(periods_passed + 2) * 2)
-            )
-        if every == FlowFrequency.SEMIMONTHLY:
-            days_since = (today - start).days
-            periods_passed = days_since // 15
-            candidate = start + timedelta(days=(periods_passed + 1) * 15)
-            return (
-                candidate
-                if candidate > today
-                else start + timedelta(days=(periods_passed + 2) * 15)
-            )
-        # Monthly-based frequencies
-        months_map = {
-            FlowFrequency.EVERY_TWO_MONTHS: 2,
-            FlowFrequency.MONTHLY: 1,
-            FlowFrequency.QUARTERLY: 3,
-            FlowFrequency.EVERY_FOUR_MONTHS: 4,
-            FlowFrequency.SEMIANNUALLY: 6,
-            FlowFrequency.YEARLY: 12,
-        }
-        if every in months_map:
-            step = months_map[every]
-            nxt = start
-            while nxt <= today:
-                nxt = nxt + relativedelta(months=step)
-            return nxt
-        # Fallback to avoid None
-        return today + timedelta(days=1)
-
-    def _add_step(self, current: date, every: FlowFrequency) -> date:
-        if every == FlowFrequency.DAILY:
-            return current + timedelta(days=1)
-        if every == FlowFrequency.WEEKLY:
-            return current + timedelta(weeks=1)
-        if every == FlowFrequency.BIWEEKLY:
-            return current + timedelta(weeks=2)
-        if every == FlowFrequency.SEMIMONTHLY:
-            return current + timedelta(days=15)
-        months_map = {
-            FlowFrequency.EVERY_TWO_MONTHS: 2,
-            FlowFrequency.MONTHLY: 1,
-            FlowFrequency.QUARTERLY: 3,
-            FlowFrequency.EVERY_FOUR_MONTHS: 4,
-            FlowFrequency.SEMIANNUALLY: 6,
-            FlowFrequency.YEARLY: 12,
-        }
-        if every in months_map:
-            return current + relativedelta(months=months_map[every])
-        return current
-
-    def _count_periodic_occurrences(
-        self, start: date, every: FlowFrequency, until: Optional[date], target: date
+    def _count_occurrences(
+        self, recurrence: Recurrence, until: Optional[date], target: date
     ) -> int:
+        start = recurrence.start
         if start > target:
             return 0
         if until and start > until:
             return 0
         today = date.today()
-        first = start
-        if first <= today:
-            first = self._advance_after_today(start, every, today)
-        if until and first > until:
-            return 0
-        count = 0
-        current = first
-        while current <= target and (not until or current <= until):
-            count += 1
-            current = self._add_step(current, every)
-        return count
-
-    def _count_biweekly(self, start: date, until: Optional[date], target: date) -> int:
-        if start > target:
-            return 0
-        today = date.today()
-        first = start
-        if first <= today:
-            days_since = (today - start).days
-            weeks_interval = 2
-            periods_passed = days_since // (weeks_interval * 7)
-            first = start + timedelta(weeks=(periods_passed + 1) * weeks_interval)
-            if first <= today:
-                first = start + timedelta(weeks=(periods_passed + 2) * weeks_interval)
-        if until and first > until:
-            return 0
-        count = 0
-        current = first
-        while current <= target and (not until or current <= until):
-            count += 1
-            current = current + timedelta(weeks=2)
-        return count
+        first = recurrence.index_after(today) if start <= today else 0
+        return recurrence.count(first, min(target, until) if until else target)
+
+    def _count_periodic_occurrences(
+        self, start: date, every: FlowFrequency, until: Optional[date], target: date
+    ) -> int:
+        return self._count_occurrences(Recurrence.for_flow(start, every), until, target)
 
     def _count_contrib_occurrences(
         self,
@@ -227,36 +280,29 @@ class ForecastImpl(Forecast):
         until: Optional[date],
         target: date,
     ) -> int:
-        mapping = {
-            ContributionFrequency.WEEKLY: FlowFrequency.WEEKLY,
-            ContributionFrequency.MONTHLY: FlowFrequency.MONTHLY,
-            ContributionFrequency.BIMONTHLY: FlowFrequency.EVERY_TWO_MONTHS,
-            ContributionFrequency.EVERY_FOUR_MONTHS: FlowFrequency.EVERY_FOUR_MONTHS,
-            ContributionFrequency.QUARTERLY: FlowFrequency.QUARTERLY,
-            ContributionFrequency.SEMIANNUAL: FlowFrequency.SEMIANNUALLY,
-            ContributionFrequency.YEARLY: FlowFrequency.YEARLY,
-        }
-        if freq == ContributionFrequency.BIWEEKLY:
-            return self._count_biweekly(start, until, target)
-        if freq in mapping:
-            return self._count_periodic_occurrences(start, mapping[freq], until, target)
-        return 0
+        return self._count_occurrences(
+            Recurrence.for_contribution(start, freq), until, target
+        )
 
     # ---------- Cash delta from pending and periodic flows ----------
-    async def _linked_real_estate_periodic_ids(self) -> set:
+    def _linked_real_estate_periodic_ids(self, real_estates: list[RealEstate]) -> set:
         ids: set = set()
-        all_re = await self._real_estate_port.get_all()
-        for re in all_re:
+        for re in real_estates:
             for f in re.flows:
                 if f.periodic_flow_id is not None:
                     ids.add(f.periodic_flow_id)
         return ids
 
-    async def _build_cash_delta_from_flows(self, target: date) -> Dict[str, Dezimal]:
+    def _flows_cash_delta(
+        self,
+        target: date,
+        pending_flows: list[PendingFlow],
+        periodic_flows: list[PeriodicFlow],
+        linked_ids: set,
+    ) -> Dict[str, Dezimal]:
         today = date.today()
         cash_delta: Dict[str, Dezimal] = {}
         # Pending flows
-        pending_flows = await self._pending_flow_port.get_all()
         for pf in pending_flows:
             if not pf.enabled:
                 continue
@@ -272,8 +318,6 @@ class ForecastImpl(Forecast):
                 cash_delta.get(pf.currency, Dezimal(0)) + sign * pf.amount
             )
         # Periodic flows (exclude linked flows)
-        linked_ids = await self._linked_real_estate_periodic_ids()
-        periodic_flows = await self._periodic_flow_port.get_all()
         for flow in periodic_flows:
             if not flow.enabled:
                 continue
@@ -319,8 +363,13 @@ class ForecastImpl(Forecast):
         # MONTHLY and others default to identity
         return amount
 
-    async def _add_real_estate_cash_delta(
-        self, target: date, cash_delta: Dict[str, Dezimal], include_taxes: bool = True
+    def _add_real_estate_cash_delta(
+        self,
+        target: date,
+        cash_delta: Dict[str, Dezimal],
+        real_estates: list[RealEstate],
+        linked_loans: dict[str, Loan],
+        include_taxes: bool = True,
     ) -> None:
         today = date.today()
         months_delta = relativedelta(target, today)
@@ -331,8 +380,6 @@ class ForecastImpl(Forecast):
         )
         if steps <= 0:
             return
-        real_estates: list[RealEstate] = await self._real_estate_port.get_all()
-        linked_loans = await self._resolve_linked_loans(real_estates)
         for re in real_estates:
             currency = re.currency
             # Totals based on occurrences until target (income/costs/loan payments)
@@ -509,39 +556,6 @@ class ForecastImpl(Forecast):
                 cash_delta[currency] = cash_delta.get(currency, Dezimal(0)) + net_cash
 
     # ---------- Contributions ----------
-    async def _apply_auto_contributions(
-        self,
-        target: date,
-        forecast_positions: Dict[str, GlobalPosition],
-        excluded_entities: Optional[list[UUID]],
-        cash_delta: Dict[str, Dezimal],
-    ) -> None:
-        contrib_map = await self._auto_contributions_port.get_all_grouped_by_entity(
-            ContributionQueryRequest(excluded_entities=excluded_entities)
-        )
-        for entity, contribs in contrib_map.items():
-            entity_id = str(entity.id)
-            gp = forecast_positions.get(entity_id)
-            if not gp:
-                continue
-            for pc in contribs.periodic:
-                if not pc.active:
-                    continue
-                occ = self._count_contrib_occurrences(
-                    pc.since, pc.frequency, pc.until, target
-                )
-                if occ <= 0:
-                    continue
-                total = pc.amount * Dezimal(occ)
-                # Apply to target position
-                self._apply_contribution_to_position(
-                    gp, pc.target_type, pc.target, total
-                )
-                # Subtract cash from cash_delta in the contribution currency
-                cash_delta[pc.currency] = (
-                    cash_delta.get(pc.currency, Dezimal(0)) - total
-                )
-
     def _apply_contribution_to_position(
         self,
         gp: GlobalPosition,
@@ -845,38 +859,74 @@ class ForecastImpl(Forecast):
             outstanding_now = Dezimal(0)
         if months <= 0 or payment is None or start is None:
             return outstanding_now
+        # Monthly payments from today, balance is computed in closed form within
+        # each constant rate segment (MIXED loans switch rate at the fixed end)
+        months_from_today = Recurrence(today, months=1)
+        bounds = [0, months]
+        if (
+            interest_type not in ("FIXED", "VARIABLE")
+            and fixed_years is not None
+            and start is not None
+        ):
+            fixed_end = start + relativedelta(years=fixed_years)
+            bounds.insert(1, min(months, months_from_today.index_from(fixed_end)))
+
         outstanding = outstanding_now
-        cur_date = today
-        for _ in range(max(0, months)):
+        for first, stop in pairwise(bounds):
+            if first >= stop:
+                continue
             annual = self._compute_annual_rate(
                 interest_type,
                 annual_rate_base,
                 euribor,
                 fixed_years,
                 start,
-                cur_date,
+                months_from_today.nth(first),
                 fixed_interest_rate,
             )
             # Clamp negative rates to zero to avoid increasing outstanding via negative interest side-effects
             if annual < Dezimal(0):
                 annual = Dezimal(0)
             monthly_rate = annual / 12
-            interest = outstanding * monthly_rate
-            principal_paid = payment - interest
             # Do not allow negative amortization (principal increase) in this simplified forecast
-            if principal_paid < Dezimal(0):
-                principal_paid = Dezimal(0)
-            # Cap principal payment to remaining outstanding
-            if principal_paid > outstanding:
-                principal_paid = outstanding
-            outstanding = outstanding - principal_paid
-            if outstanding < Dezimal(0):  # final guard
-                outstanding = Dezimal(0)
-            cur_date = cur_date + relativedelta(months=1)
+            if payment <= outstanding * monthly_rate:
+                continue
+            outstanding = balance_after(
+                outstanding, monthly_rate, payment, stop - first
+            )
             if outstanding == Dezimal(0):
                 break
         return outstanding
 
+    def _project_standalone_loan(self, loan: Loan, months: int, today: date) -> Dezimal:
+        return self._simulate_loan_outstanding(
+            outstanding_now=loan.principal_outstanding,
+            payment=loan.current_installment,
+            start=loan.creation,
+            interest_type=loan.interest_type.name
+            if loan.interest_type is not None
+            else None,
+            annual_rate_base=loan.interest_rate,
+            euribor=loan.euribor_rate,
+            fixed_years=loan.fixed_years,
+            months=months,
+            today=today,
+            fixed_interest_rate=loan.fixed_interest_rate,
+        )
+
+    def _standalone_loans(
+        self, forecast_positions: Dict[str, GlobalPosition], linked_hashes: set[str]
+    ) -> list[Loan]:
+        loans: list[Loan] = []
+        for entity_id, gp in forecast_positions.items():
+            if ProductType.LOAN not in gp.products:
+                continue
+            for loan in gp.products[ProductType.LOAN].entries:
+                loan_hash = loan.hash or loan.compute_hash(entity_id)
+                if loan_hash not in linked_hashes:
+                    loans.append(loan)
+        return loans
+
     def _amortize_standalone_loans(
         self,
         forecast_positions: Dict[str, GlobalPosition],
@@ -884,38 +934,13 @@ class ForecastImpl(Forecast):
         target: date,
         today: date,
     ) -> None:
-        months_delta = relativedelta(target, today)
-        months = (
-            months_delta.years * 12
-            + months_delta.months
-            + (1 if months_delta.days > 0 else 0)
-        )
+        months = _months_between(today, target)
         if months <= 0:
             return
-        for entity_id, gp in forecast_positions.items():
-            if ProductType.LOAN not in gp.products:
-                continue
-            loans: Loans = gp.products[ProductType.LOAN]
-            for loan in loans.entries:
-                loan_hash = loan.hash or loan.compute_hash(entity_id)
-                if loan_hash in linked_hashes:
-                    continue
-                projected = self._simulate_loan_outstanding(
-                    outstanding_now=loan.principal_outstanding,
-                    payment=loan.current_installment,
-                    start=loan.creation,
-                    interest_type=loan.interest_type.name
-                    if loan.interest_type is not None
-                    else None,
-                    annual_rate_base=loan.interest_rate,
-                    euribor=loan.euribor_rate,
-                    fixed_years=loan.fixed_years,
-                    months=months,
-                    today=today,
-                    fixed_interest_rate=loan.fixed_interest_rate,
-                )
-                loan.principal_outstanding = projected
-                loan.principal_paid = loan.loan_amount - projected
+        for loan in self._standalone_loans(forecast_positions, linked_hashes):
+            projected = self._project_standalone_loan(loan, months, today)
+            loan.principal_outstanding = projected
+            loan.principal_paid = loan.loan_amount - projected
 
     def _equity_for_property(
         self,
@@ -1010,12 +1035,13 @@ class ForecastImpl(Forecast):
             currency=re.currency,
         )
 
-    async def _forecast_real_estate_equity(
-        self, target: date
+    def _forecast_real_estate_equity(
+        self,
+        target: date,
+        real_estates: list[RealEstate],
+        linked_loans: dict[str, Loan],
     ) -> list[RealEstateEquityForecast]:
         today = date.today()
-        real_estate: list[RealEstate] = await self._real_estate_port.get_all()
-        linked_loans = await self._resolve_linked_loans(real_estate)
         months_delta = relativedelta(target, today)
         months = (
             months_delta.years * 12
@@ -1023,7 +1049,7 @@ class ForecastImpl(Forecast):
             + (1 if months_delta.days > 0 else 0)
         )
         results: list[RealEstateEquityForecast] = []
-        for re in real_estate:
+        for re in real_estates:
             eq = self._equity_for_property(re, today, months, linked_loans)
             if eq is not None:
                 results.append(eq)
@@ -1031,57 +1057,13 @@ class ForecastImpl(Forecast):
 
     # ---------- Monthly revaluation and contributions ----------
     def _iter_contrib_dates(self, pc: PeriodicContribution, target: date) -> list[date]:
-        dates: list[date] = []
+        if not pc.active or pc.since > target:
+            return []
         today = date.today()
-        if not pc.active:
-            return dates
-        if pc.since > target:
-            return dates
-        until = pc.until
-        # For weekly-like
-        if pc.frequency == ContributionFrequency.BIWEEKLY:
-            # find first after today
-            first = pc.since
-            if first <= today:
-                days_since = (today - pc.since).days
-                weeks_interval = 2
-                periods_passed = days_since // (weeks_interval * 7)
-                first = pc.since + timedelta(
-                    weeks=(periods_passed + 1) * weeks_interval
-                )
-                if first <= today:
-                    first = pc.since + timedelta(
-                        weeks=(periods_passed + 2) * weeks_interval
-                    )
-            cur = first
-            while cur <= target and (not until or cur <= until):
-                dates.append(cur)
-                cur = cur + timedelta(weeks=2)
-            return dates
-        # Map remaining to FlowFrequency and reuse helpers
-        mapping = {
-            ContributionFrequency.WEEKLY: FlowFrequency.WEEKLY,
-            ContributionFrequency.MONTHLY: FlowFrequency.MONTHLY,
-            ContributionFrequency.BIMONTHLY: FlowFrequency.EVERY_TWO_MONTHS,
-            ContributionFrequency.EVERY_FOUR_MONTHS: FlowFrequency.EVERY_FOUR_MONTHS,
-            ContributionFrequency.QUARTERLY: FlowFrequency.QUARTERLY,
-            ContributionFrequency.SEMIANNUAL: FlowFrequency.SEMIANNUALLY,
-            ContributionFrequency.YEARLY: FlowFrequency.YEARLY,
-        }
-        if pc.frequency not in mapping:
-            return dates
-        every = mapping[pc.frequency]
-        # find first after today
-        first = pc.since
-        if first <= today:
-            first = self._advance_after_today(pc.since, every, today)
-        if until and first > until:
-            return dates
-        cur = first
-        while cur <= target and (not until or cur <= until):
-            dates.append(cur)
-            cur = self._add_step(cur, every)
-        return dates
+        recurrence = Recurrence.for_contribution(pc.since, pc.frequency)
+        first = recurrence.index_after(today) if pc.since <= today else 0
+        until = min(target, pc.until) if pc.until else target
+        return recurrence.between(first, until)
 
     def _apply_monthly_revaluation_to_equities(
         self, gp: GlobalPosition, monthly_rate: Dezimal
@@ -1096,62 +1078,148 @@ class ForecastImpl(Forecast):
             for f in fund_inv.entries:
                 f.market_value = f.market_value * factor
 
-    async def _simulate_monthly_revaluation_and_contributions(
+    def _bucket_contributions_by_month(
         self,
-        forecast_positions: Dict[str, GlobalPosition],
+        contrib_map: dict,
         target: date,
-        avg_increase: Dezimal,
-        cash_delta: Dict[str, Dezimal],
-        excluded_entities: Optional[list[UUID]],
-    ) -> None:
-        monthly_rate = avg_increase / Dezimal(12)
-        # Build contributions map once
-        contrib_map = await self._auto_contributions_port.get_all_grouped_by_entity(
-            ContributionQueryRequest(excluded_entities=excluded_entities)
-        )
-        # Precompute occurrences per entity
-        per_entity_occurrences: dict[
-            str, list[tuple[PeriodicContribution, list[date]]]
-        ] = {}
+        months_from_today: Recurrence,
+        steps: int,
+    ) -> list[dict[str, list[tuple[PeriodicContribution, int]]]]:
+        """
+        Group contribution occurrences by forecast month, month m (1-based)
+        covering (today + (m-1) months, today + m months].
+        """
+        buckets: list[dict[str, list[tuple[PeriodicContribution, int]]]] = [
+            {} for _ in range(steps)
+        ]
         for entity, contribs in contrib_map.items():
             entity_id = str(entity.id)
-            occs: list[tuple[PeriodicContribution, list[date]]] = []
             for pc in contribs.periodic:
                 if not pc.active:
                     continue
-                dates = self._iter_contrib_dates(pc, target)
-                if dates:
-                    occs.append((pc, dates))
-            per_entity_occurrences[entity_id] = occs
+                per_month = Counter(
+                    months_from_today.index_from(d)
+                    for d in self._iter_contrib_dates(pc, target)
+                )
+                for month, count in per_month.items():
+                    if 1 <= month <= steps:
+                        buckets[month - 1].setdefault(entity_id, []).append((pc, count))
+        return buckets
 
-        # Iterate month by month
-        today = date.today()
-        months_delta = relativedelta(target, today)
-        steps = (
-            months_delta.years * 12
-            + months_delta.months
-            + (1 if months_delta.days > 0 else 0)
+    def _apply_month_contributions(
+        self,
+        forecast_positions: Dict[str, GlobalPosition],
+        contributions: dict[str, list[tuple[PeriodicContribution, int]]],
+        cash_delta: Dict[str, Dezimal],
+    ) -> None:
+        for entity_id, pcs in contributions.items():
+            gp = forecast_positions.get(entity_id)
+            if not gp:
+                continue
+            for pc, count in pcs:
+                total = pc.amount * Dezimal(count)
+                self._apply_contribution_to_position(
+                    gp, pc.target_type, pc.target, total
+                )
+                cash_delta[pc.currency] = (
+                    cash_delta.get(pc.currency, Dezimal(0)) - total
+                )
+
+    # ---------- Trajectory ----------
+    def _position_amounts(
+        self, forecast_positions: Dict[str, GlobalPosition]
+    ) -> dict[str, dict[str, Dezimal]]:
+        """Position values per bucket and currency, crypto and commodities unrevalued."""
+        amounts: dict[str, dict[str, Dezimal]] = {
+            bucket: {} for bucket in _POSITION_BUCKETS
+        }
+        cash = amounts[_CASH]
+        equities = amounts[_EQUITIES]
+        fixed_income = amounts[_FIXED_INCOME]
+        for gp in forecast_positions.values():
+            products = gp.products
+            if ProductType.ACCOUNT in products:
+                for acc in products[ProductType.ACCOUNT].entries:
+                    _add_to(cash, acc.currency, acc.total)
+            for product_type in (ProductType.STOCK_ETF, ProductType.FUND):
+                if product_type in products:
+                    for inv in products[product_type].entries:
+                        _add_to(equities, inv.currency, inv.market_value)
+            for product_type in (
+                ProductType.DEPOSIT,
+                ProductType.FACTORING,
+                ProductType.REAL_ESTATE_CF,
+            ):
+                if product_type in products:
+                    for inv in products[product_type].entries:
+                        _add_to(fixed_income, inv.currency, inv.amount)
+            if ProductType.CROWDLENDING in products:
+                crowdlending = products[ProductType.CROWDLENDING]
+                _add_to(fixed_income, crowdlending.currency, crowdlending.total)
+            if ProductType.CRYPTO in products:
+                for wallet in products[ProductType.CRYPTO].entries:
+                    for asset in wallet.assets:
+                        _add_to(amounts[_CRYPTO], asset.currency, asset.market_value)
+            if ProductType.COMMODITY in products:
+                for commodity in products[ProductType.COMMODITY].entries:
+                    _add_to(
+                        amounts[_COMMODITY], commodity.currency, commodity.market_value
+                    )
+        return amounts
+
+    def _trajectory_point(
+        self,
+        point_date: date,
+        months: int,
+        today: date,
+        amounts: dict[str, dict[str, Dezimal]],
+        cash_delta: Dict[str, Dezimal],
+        standalone_loans: list[Loan],
+        real_estates: list[RealEstate],
+        linked_loans: dict[str, Loan],
+        crypto_growth: Dezimal,
+        commodity_growth: Dezimal,
+    ) -> ForecastPoint:
+        cash = dict(cash_delta)
+        for currency, amount in amounts[_CASH].items():
+            _add_to(cash, currency, amount)
+
+        debt: dict[str, Dezimal] = {}
+        for loan in standalone_loans:
+            _add_to(
+                debt, loan.currency, self._project_standalone_loan(loan, months, today)
+            )
+
+        real_estate_equity: dict[str, Dezimal] = {}
+        for re in real_estates:
+            eq = self._equity_for_property(re, today, months, linked_loans)
+            if eq is not None:
+                _add_to(real_estate_equity, eq.currency, eq.equity_at_target)
+
+        net_worth: dict[str, Dezimal] = {}
+        for values in (
+            cash,
+            amounts[_EQUITIES],
+            amounts[_FIXED_INCOME],
+            real_estate_equity,
+        ):
+            for currency, amount in values.items():
+                _add_to(net_worth, currency, amount)
+        for currency, amount in amounts[_CRYPTO].items():
+            _add_to(net_worth, currency, amount * crypto_growth)
+        for currency, amount in amounts[_COMMODITY].items():
+            _add_to(net_worth, currency, amount * commodity_growth)
+        for currency, amount in debt.items():
+            _add_to(net_worth, currency, -amount)
+
+        return ForecastPoint(
+            date=point_date,
+            net_worth=net_worth,
+            cash=cash,
+            equities=dict(amounts[_EQUITIES]),
+            real_estate_equity=real_estate_equity,
+            debt=debt,
         )
-        prev_boundary = today
-        cur_boundary = today
-        for _ in range(max(0, steps)):
-            cur_boundary = cur_boundary + relativedelta(months=1)
-            for entity_id, gp in forecast_positions.items():
-                # Apply contributions due within (prev_boundary, cur_boundary]
-                occs = per_entity_occurrences.get(entity_id, [])
-                for pc, dates in occs:
-                    for d in dates:
-                        if prev_boundary < d <= cur_boundary:
-                            total = pc.amount
-                            self._apply_contribution_to_position(
-                                gp, pc.target_type, pc.target, total
-                            )
-                            cash_delta[pc.currency] = (
-                                cash_delta.get(pc.currency, Dezimal(0)) - total
-                            )
-                # After contributions, apply monthly revaluation to equities
-                self._apply_monthly_revaluation_to_equities(gp, monthly_rate)
-            prev_boundary = cur_boundary
 
     # ---------- Portfolio sync helper ----------
     def _sync_fund_portfolios(self, gp: GlobalPosition) -> None:
@@ -1193,45 +1261,114 @@ class ForecastImpl(Forecast):
         for entity, position in positions_by_entity.items():
             forecast_positions[str(entity.id)] = deepcopy(position)
 
-        # Cash delta (exclude linked periodic flows)
-        cash_delta: Dict[str, Dezimal] = await self._build_cash_delta_from_flows(target)
-        # Add real estate net cash (optionally including taxes)
-        await self._add_real_estate_cash_delta(
-            target, cash_delta, request.include_real_estate_taxes
-        )
+        # Real estate and its linked loans are loaded once per forecast
+        real_estates = await self._real_estate_port.get_all()
+        linked_loans = await self._resolve_linked_loans(real_estates)
+        linked_hashes = self._collect_linked_loan_hashes(real_estates)
+
+        pending_flows = await self._pending_flow_port.get_all()
+        periodic_flows = await self._periodic_flow_port.get_all()
+        linked_ids = self._linked_real_estate_periodic_ids(real_estates)
 
-        # Contributions + revaluation path
         disabled_entities = [
             e.id for e in await self._entity_port.get_disabled_entities()
         ]
+        contrib_map = await self._auto_contributions_port.get_all_grouped_by_entity(
+            ContributionQueryRequest(excluded_entities=disabled_entities)
+        )
+
+        # Contributions are applied as a lump sum unless the market is revalued
+        # monthly, in both cases the occurrences are bucketed by month once
+        monthly_rate = None
         if (
             request.avg_annual_market_increase is not None
             and request.avg_annual_market_increase > Dezimal(0)
         ):
-            await self._simulate_monthly_revaluation_and_contributions(
-                forecast_positions,
-                target,
-                request.avg_annual_market_increase,
-                cash_delta,
-                disabled_entities,
+            monthly_rate = request.avg_annual_market_increase / Dezimal(12)
+
+        steps = _months_between(today, target)
+        months_from_today = Recurrence(today, months=1)
+        contributions = self._bucket_contributions_by_month(
+            contrib_map, target, months_from_today, steps
+        )
+        standalone_loans = self._standalone_loans(forecast_positions, linked_hashes)
+
+        simulation = None
+        if request.monte_carlo is not None:
+            if self._forecast_simulator is None:
+                raise ValueError("Monte Carlo forecast is not available")
+            simulation = _SimulationCollector(
+                request, steps, self._position_amounts(forecast_positions)
             )
-        else:
-            await self._apply_auto_contributions(
-                target, forecast_positions, disabled_entities, cash_delta
+
+        # Contributions and liquidations, flows and taxes are added on top per point
+        position_cash_delta: Dict[str, Dezimal] = {}
+        trajectory: list[ForecastPoint] = []
+        for month in range(1, steps + 1):
+            point_date = min(months_from_today.nth(month), target)
+            if simulation is not None:
+                before = self._position_amounts(forecast_positions)
+            self._apply_month_contributions(
+                forecast_positions, contributions[month - 1], position_cash_delta
+            )
+            if simulation is not None:
+                simulation.add_contributions(
+                    month, before, self._position_amounts(forecast_positions)
+                )
+            if monthly_rate is not None:
+                for gp in forecast_positions.values():
+                    self._apply_monthly_revaluation_to_equities(gp, monthly_rate)
+            self._liquidate_maturing_investments(
+                forecast_positions, point_date, position_cash_delta
             )
 
-        # Liquidate matured investments
-        self._liquidate_maturing_investments(forecast_positions, target, cash_delta)
+            cash_delta = self._cash_delta_at(
+                point_date,
+                pending_flows,
+                periodic_flows,
+                linked_ids,
+                real_estates,
+                linked_loans,
+                request.include_real_estate_taxes,
+                position_cash_delta,
+            )
+            amounts = self._position_amounts(forecast_positions)
+            point = self._trajectory_point(
+                point_date,
+                month,
+                today,
+                amounts,
+                cash_delta,
+                standalone_loans,
+                real_estates,
+                linked_loans,
+                _growth(request.avg_annual_crypto_increase, month),
+                _growth(request.avg_annual_commodity_increase, month),
+            )
+            trajectory.append(point)
+            if simulation is not None:
+                simulation.add_point(point, amounts)
+
+        cash_delta = self._cash_delta_at(
+            target,
+            pending_flows,
+            periodic_flows,
+            linked_ids,
+            real_estates,
+            linked_loans,
+            request.include_real_estate_taxes,
+            position_cash_delta,
+        )
 
         # Amortize standalone loans (linked mortgages are handled via real estate equity)
-        real_estates_for_loans = await self._real_estate_port.get_all()
-        linked_hashes = self._collect_linked_loan_hashes(real_estates_for_loans)
         self._amortize_standalone_loans(
             forecast_positions, linked_hashes, target, today
         )
 
         # Real estate equity forecast
-        re_equity = await self._forecast_real_estate_equity(target)
+        re_equity = self._forecast_real_estate_equity(
+            target, real_estates, linked_loans
+        )
 
         # Keep portfolio totals in sync
         for gp in forecast_positions.values():
@@ -1257,4 +1394,31 @@ class ForecastImpl(Forecast):
             real_estate=re_equity,
             crypto_appreciation=crypto_appreciation,
             commodity_appreciation=commodity_appreciation,
+            trajectory=trajectory,
+            monte_carlo=self._forecast_simulator.simulate(simulation.inputs())
+            if simulation is not None
+            else None,
+        )
+
+    def _cash_delta_at(
+        self,
+        when: date,
+        pending_flows: list[PendingFlow],
+        periodic_flows: list[PeriodicFlow],
+        linked_ids: set,
+        real_estates: list[RealEstate],
+        linked_loans: dict[str, Loan],
+        include_taxes: bool,
+        position_cash_delta: Dict[str, Dezimal],
+    ) -> Dict[str, Dezimal]:
+        # Cash delta (exclude linked periodic flows)
+        cash_delta = self._flows_cash_delta(
+            when, pending_flows, periodic_flows, linked_ids
+        )
+        # Add real estate net cash (optionally including taxes)
+        self._add_real_estate_cash_delta(
+            when, cash_delta, real_estates, linked_loans, include_taxes
         )
+        for currency, amount in position_cash_delta.items():
+            cash_delta[currency] = cash_delta.get(currency, Dezimal(0)) + amount
+        return cash_delta
@@ -27,6 +27,10 @@ from domain.native_entities import NATIVE_ENTITIES
 from domain.use_cases.get_available_entities import GetAvailableEntities
 from domain.virtual_data import VirtualDataImport
 
+_NATIVE_ENTITIES_BY_ID = {e.id: e for e in NATIVE_ENTITIES}
+# Native entities are static, projected once and shallow copied per request
+_NATIVE_ENTITY_DICTS = {e.id: asdict(e) for e in NATIVE_ENTITIES}
+
 
 def get_last_fetches_for_virtual(
     virtual_imports: list[VirtualDataImport],
@@ -89,8 +93,31 @@ class GetAvailableEntitiesImpl(GetAvailableEntities):
         accounts_by_id = {a.id: a for a in all_accounts}
 
         all_entities = await self._entity_port.get_all()
+        listed_entities = [
+            e for e in all_entities if e.type in self.LISTED_ENTITY_TYPES
+        ]
 
-        native_entities_by_id = {e.id: e for e in NATIVE_ENTITIES}
+        external_entities_by_entity_id = (
+            await self._external_entity_port.get_by_entity_ids(
+                [
+                    e.id
+                    for e in listed_entities
+                    if e.origin == EntityOrigin.EXTERNALLY_PROVIDED
+                ]
+            )
+        )
+        wallets_by_entity_id = await self._crypto_wallet_port.get_by_entity_ids(
+            [
+                e.id
+                for e in listed_entities
+                if e.origin != EntityOrigin.EXTERNALLY_PROVIDED
+                and e.type == EntityType.CRYPTO_WALLET
+            ],
+            hd_addresses=False,
+        )
+        last_fetches_by_entity_id = await self._last_fetches_port.get_by_entity_ids(
+            [e.id for e in listed_entities if e.origin != EntityOrigin.MANUAL]
+        )
 
         last_virtual_imported_entities = await self.get_last_virtual_imports_by_entity()
 
@@ -102,10 +129,8 @@ class GetAvailableEntitiesImpl(GetAvailableEntities):
         enabled_provider_ids = set(enabled_provider_payloads.keys())
 
         entities = []
-        for entity in all_entities:
-            if entity.type not in self.LISTED_ENTITY_TYPES:
-                continue
-            native_entity = native_entities_by_id.get(entity.id)
+        for entity in listed_entities:
+            native_entity = _NATIVE_ENTITIES_BY_ID.get(entity.id)
             status = None
             wallets = None
             external_entity_id = None
@@ -120,13 +145,14 @@ class GetAvailableEntitiesImpl(GetAvailableEntities):
                     vi.feature: vi.date for vi in last_virtual_imported_data
                 }
 
-            dict_entity = asdict(native_entity or entity)
+            if native_entity:
+                dict_entity = dict(_NATIVE_ENTITY_DICTS[entity.id])
+            else:
+                dict_entity = asdict(entity)
 
             if entity.origin == EntityOrigin.EXTERNALLY_PROVIDED:
                 products = self.EXTERNAL_ENTITY_PRODUCTS
-                external_entity = await self._external_entity_port.get_by_entity_id(
-                    entity.id
-                )
+                external_entity = external_entities_by_entity_id.get(entity.id)
                 if not external_entity:
                     status = FinancialEntityStatus.DISCONNECTED
                     dict_entity["features"] = []
@@ -192,9 +218,7 @@ class GetAvailableEntitiesImpl(GetAvailableEntities):
                         status = FinancialEntityStatus.CONNECTED
 
             else:
-                wallets = await self._crypto_wallet_port.get_by_entity_id(
-                    entity.id, hd_addresses=False
-                )
+                wallets = wallets_by_entity_id.get(entity.id, [])
                 products = self.CRYPTO_WALLET_PRODUCTS
                 if native_entity:
                     fetchable = (
@@ -207,9 +231,7 @@ class GetAvailableEntitiesImpl(GetAvailableEntities):
             last_fetch = {}
             if entity.origin != EntityOrigin.MANUAL:
                 if status != FinancialEntityStatus.DISCONNECTED:
-                    last_fetch_records = await self._last_fetches_port.get_by_entity_id(
-                        entity.id
-                    )
+                    last_fetch_records = last_fetches_by_entity_id.get(entity.id, [])
                     last_fetch = {r.feature: r.date for r in last_fetch_records}
             else:
                 dict_entity["features"] = []
@@ -17,6 +17,7 @@ from domain.backup import (
     BackupsInfoRequest,
     BackupsInfo,
     BackupInfoParams,
+    merge_delta_pieces,
 )
 from domain.cloud_auth import (
     CloudAuthData,
@@ -82,6 +83,8 @@ class GetBackupsImpl(GetBackups):
             if not cloud_token:
                 self._last_remote_fetch = datetime.now(tzlocal())
 
+        local_pieces = merge_delta_pieces(local_bkg_info.pieces)
+        remote_pieces = merge_delta_pieces(remote_bkg_info.pieces)
         full_backup_pieces = {}
 
         for backup_type in BackupFileType:
@@ -90,7 +93,7 @@ class GetBackupsImpl(GetBackups):
                 continue
 
             if cloud_token:
-                remote_backup = remote_bkg_info.pieces.get(backup_type)
+                remote_backup = remote_pieces.get(backup_type)
                 if remote_backup is None:
                     continue
                 full_backup_pieces[backup_type] = FullBackupInfo(
@@ -104,8 +107,8 @@ class GetBackupsImpl(GetBackups):
 
             last_update = await backupable.get_last_updated()
 
-            local_backup = local_bkg_info.pieces.get(backup_type)
-            remote_backup = remote_bkg_info.pieces.get(backup_type)
+            local_backup = local_pieces.get(backup_type)
+            remote_backup = remote_pieces.get(backup_type)
 
             status, has_local_changes = self._calculate_sync_status(
                 local_backup, remote_backup, last_update
@@ -1,55 +1,27 @@
-from datetime import date, timedelta
+from datetime import date
 
 from application.ports.auto_contributions_port import AutoContributionsPort
 from application.ports.entity_port import EntityPort
-from dateutil.relativedelta import relativedelta
 from domain.auto_contributions import (
     AutoContributions,
-    ContributionFrequency,
     ContributionQueryRequest,
     EntityContributions,
     PeriodicContribution,
 )
+from domain.recurrence import Recurrence
 from domain.use_cases.get_contributions import GetContributions
 
-_contrib_freq_delta_map = {
-    ContributionFrequency.MONTHLY: relativedelta(months=1),
-    ContributionFrequency.BIMONTHLY: relativedelta(months=2),
-    ContributionFrequency.EVERY_FOUR_MONTHS: relativedelta(months=4),
-    ContributionFrequency.QUARTERLY: relativedelta(months=3),
-    ContributionFrequency.SEMIANNUAL: relativedelta(months=6),
-    ContributionFrequency.YEARLY: relativedelta(years=1),
-}
-
 
 def _next_contribution_date(pc: PeriodicContribution) -> date | None:
     if not pc.active:
         return None
 
     today = date.today()
-    since_date = pc.since
-    next_date: date | None = None
-
-    if since_date > today:
-        return since_date
-
-    if pc.frequency in (ContributionFrequency.WEEKLY, ContributionFrequency.BIWEEKLY):
-        weeks_interval = 2 if pc.frequency == ContributionFrequency.BIWEEKLY else 1
-        days_since = (today - since_date).days
-        periods_passed = days_since // (weeks_interval * 7)
-        next_date = since_date + timedelta(weeks=(periods_passed + 1) * weeks_interval)
-        if next_date <= today:
-            next_date = since_date + timedelta(
-                weeks=(periods_passed + 2) * weeks_interval
-            )
-
-    elif pc.frequency in _contrib_freq_delta_map:
-        delta = _contrib_freq_delta_map[pc.frequency]
-        next_date = since_date
-        while next_date <= today:
-            next_date = next_date + delta
+    if pc.since > today:
+        return pc.since
 
-    if next_date and pc.until and next_date > pc.until:
+    next_date = Recurrence.for_contribution(pc.since, pc.frequency).next_after(today)
+    if pc.until and next_date > pc.until:
         return None
 
     return next_date
@@ -1,20 +1,15 @@
-from datetime import date, timedelta
-from typing import Iterable
+from datetime import date
+from typing import Iterable, Optional
 from uuid import UUID
 
 from application.ports.entity_port import EntityPort
 from application.ports.position_port import PositionPort
-from application.use_cases.get_contributions import _contrib_freq_delta_map
-from application.use_cases.get_periodic_flows import frequency_delta_map
-from dateutil.relativedelta import relativedelta
 from domain.auto_contributions import (
     AutoContributions,
-    ContributionFrequency,
     ContributionQueryRequest,
 )
 from domain.dezimal import Dezimal
 from domain.earnings_expenses import (
-    FlowFrequency,
     FlowType,
     PendingFlow,
     PeriodicFlow,
@@ -35,6 +30,7 @@ from domain.money_event import (
     MoneyEventType,
     PeriodicContributionDetails,
 )
+from domain.recurrence import Recurrence
 from domain.use_cases.get_contributions import GetContributions
 from domain.use_cases.get_money_events import GetMoneyEvents
 from domain.use_cases.get_pending_flows import GetPendingFlows
@@ -286,68 +282,26 @@ class GetMoneyEventsImpl(GetMoneyEvents):
     def _iterate_contribution_dates(
         self, periodic, query: MoneyEventQuery
     ) -> list[date]:
-        occurrences: list[date] = []
-        next_date = periodic.next_date
-        if not next_date:
-            return occurrences
-        while next_date and next_date <= query.to_date:
-            if next_date >= query.from_date:
-                occurrences.append(next_date)
-            next_date = self._advance_contribution_date(periodic, next_date)
-            if periodic.until and next_date and next_date > periodic.until:
-                break
-        return occurrences
-
-    def _advance_contribution_date(self, periodic, current: date) -> date | None:
-        delta = self._contribution_delta(periodic.frequency.value)
-        if delta:
-            return current + delta
-        if periodic.frequency.value in ("WEEKLY", "BIWEEKLY"):
-            weeks = 2 if periodic.frequency.value == "BIWEEKLY" else 1
-            return current + timedelta(weeks=weeks)
-        return None
-
-    def _contribution_delta(self, frequency: str) -> relativedelta | None:
-        try:
-            freq_enum = ContributionFrequency(frequency)
-        except ValueError:
-            return None
-        return _contrib_freq_delta_map.get(freq_enum)
+        if not periodic.next_date:
+            return []
+        recurrence = Recurrence.for_contribution(periodic.next_date, periodic.frequency)
+        return self._occurrences_in_range(recurrence, periodic.until, query)
 
     def _iterate_periodic_flow_dates(
         self, flow: PeriodicFlow, query: MoneyEventQuery
     ) -> list[date]:
-        occurrences: list[date] = []
-        next_date = flow.next_date
-        if not next_date:
-            return occurrences
-        while next_date and next_date <= query.to_date:
-            if next_date >= query.from_date:
-                occurrences.append(next_date)
-            next_date = self._advance_periodic_flow_date(flow, next_date)
-            if flow.until and next_date and next_date > flow.until:
-                break
-        return occurrences
+        if not flow.next_date:
+            return []
+        recurrence = Recurrence.for_flow(flow.next_date, flow.frequency)
+        return self._occurrences_in_range(recurrence, flow.until, query)
 
-    def _advance_periodic_flow_date(
-        self, flow: PeriodicFlow, current: date
-    ) -> date | None:
-        delta = self._flow_delta(flow.frequency.value)
-        if delta:
-            return current + delta
-        if flow.frequency.value == FlowFrequency.WEEKLY.value:
-            return current + timedelta(weeks=1)
-        if flow.frequency.value == FlowFrequency.BIWEEKLY.value:
-            return current + timedelta(weeks=2)
-        if flow.frequency.value == FlowFrequency.SEMIMONTHLY.value:
-            return current + timedelta(days=15)
-        if flow.frequency.value == FlowFrequency.DAILY.value:
-            return current + timedelta(days=1)
-        return None
-
-    def _flow_delta(self, frequency: str) -> relativedelta | None:
-        try:
-            freq_enum = FlowFrequency(frequency)
-        except ValueError:
-            return None
-        return frequency_delta_map.get(freq_enum)
+    @staticmethod
+    def _occurrences_in_range(
+        recurrence: Recurrence, until: Optional[date], query: MoneyEventQuery
+    ) -> list[date]:
+        # The next date itself is not bounded by until, the following ones are
+        limit = min(query.to_date, until) if until else query.to_date
+        occurrences = recurrence.between(1, limit, query.from_date)
+        if query.from_date <= recurrence.start <= query.to_date:
+            occurrences.insert(0, recurrence.start)
+        return occurrences
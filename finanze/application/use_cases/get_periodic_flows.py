@@ -1,72 +1,22 @@
-from datetime import date, timedelta
+from datetime import date
 from typing import Optional
 
 from application.ports.periodic_flow_port import PeriodicFlowPort
-from dateutil.relativedelta import relativedelta
-from domain.earnings_expenses import FlowFrequency, PeriodicFlow
+from domain.earnings_expenses import PeriodicFlow
+from domain.recurrence import Recurrence
 from domain.use_cases.get_periodic_flows import GetPeriodicFlows
 
-frequency_delta_map = {
-    FlowFrequency.MONTHLY: relativedelta(months=1),
-    FlowFrequency.EVERY_TWO_MONTHS: relativedelta(months=2),
-    FlowFrequency.QUARTERLY: relativedelta(months=3),
-    FlowFrequency.EVERY_FOUR_MONTHS: relativedelta(months=4),
-    FlowFrequency.SEMIANNUALLY: relativedelta(months=6),
-    FlowFrequency.YEARLY: relativedelta(years=1),
-}
-
 
 def get_next_date(flow: PeriodicFlow) -> Optional[date]:
     if not flow.enabled:
         return None
 
     today = date.today()
-    since_date = flow.since
-    next_date = None
-
-    if since_date > today:
-        return since_date
-
-    if flow.frequency == FlowFrequency.DAILY:
-        next_date = today + timedelta(days=1)
-
-    elif flow.frequency == FlowFrequency.WEEKLY:
-        days_since = (today - since_date).days
-        weeks_passed = days_since // 7
-        next_date = since_date + timedelta(weeks=weeks_passed + 1)
-        next_date = (
-            next_date
-            if next_date > today
-            else since_date + timedelta(weeks=weeks_passed + 2)
-        )
-
-    elif flow.frequency == FlowFrequency.BIWEEKLY:
-        days_since = (today - since_date).days
-        periods_passed = days_since // 14
-        next_date = since_date + timedelta(weeks=(periods_passed + 1) * 2)
-        next_date = (
-            next_date
-            if next_date > today
-            else since_date + timedelta(weeks=(periods_passed + 2) * 2)
-        )
-
-    elif flow.frequency == FlowFrequency.SEMIMONTHLY:
-        days_since = (today - since_date).days
-        periods_passed = days_since // 15
-        next_date = since_date + timedelta(days=(periods_passed + 1) * 15)
-        next_date = (
-            next_date
-            if next_date > today
-            else since_date + timedelta(days=(periods_passed + 2) * 15)
-        )
-
-    elif flow.frequency in frequency_delta_map:
-        delta = frequency_delta_map[flow.frequency]
-        next_date = since_date
-        while next_date <= today:
-            next_date = next_date + delta
+    if flow.since > today:
+        return flow.since
 
-    if next_date and flow.until and next_date > flow.until:
+    next_date = Recurrence.for_flow(flow.since, flow.frequency).next_after(today)
+    if flow.until and next_date > flow.until:
         return None
 
     return next_date
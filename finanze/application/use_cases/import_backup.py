@@ -1,9 +1,12 @@
 import hashlib
 import logging
+import tempfile
 from datetime import datetime, timedelta
+from pathlib import Path
 
 from dateutil.tz import tzlocal
 
+from application.ports.backup_delta_calculator import BackupDeltaCalculator
 from application.ports.backup_local_registry import BackupLocalRegistry
 from application.ports.backup_processor import BackupProcessor
 from application.ports.backup_repository import BackupRepository
@@ -20,6 +23,11 @@ from domain.backup import (
     FullBackupInfo,
     SyncStatus,
     BackupInfoParams,
+    BackupTransferPiece,
+    DELTA_BASE_TYPES,
+    DELTA_TYPES,
+    merge_delta,
+    merge_delta_pieces,
 )
 from domain.cloud_auth import CloudPermission, CloudUserRole
 from domain.exception.exceptions import (
@@ -44,6 +52,7 @@ class ImportBackupImpl(ImportBackup):
         backup_repository: BackupRepository,
         backup_local_registry: BackupLocalRegistry,
         cloud_register: CloudRegister,
+        backup_delta_calculator: BackupDeltaCalculator,
     ):
         self._data_initiator = data_initiator
         self._backupable_ports = backupable_ports
@@ -51,6 +60,7 @@ class ImportBackupImpl(ImportBackup):
         self._backup_repository = backup_repository
         self._backup_local_registry = backup_local_registry
         self._cloud_register = cloud_register
+        self._backup_delta_calculator = backup_delta_calculator
 
         self._log = logging.getLogger(__name__)
 
@@ -64,9 +74,10 @@ class ImportBackupImpl(ImportBackup):
         if not request.initialize:
             await self._check_cooldown(request.types, user_auth.role)
 
-        remote_backup_pieces = (
+        remote_pieces = (
             await self._backup_repository.get_info(BackupInfoParams(auth=user_auth))
         ).pieces
+        remote_backup_pieces = merge_delta_pieces(remote_pieces)
         self._log.debug("Found %d backup pieces", len(remote_backup_pieces))
 
         if request.initialize:
@@ -84,9 +95,9 @@ class ImportBackupImpl(ImportBackup):
             if bkg_pass is None:
                 raise InvalidBackupCredentials("NO_PASSWORD_PROVIDED")
 
-            local_backup_registry = (
-                await self._backup_local_registry.get_info()
-            ).pieces
+            local_backup_registry = merge_delta_pieces(
+                (await self._backup_local_registry.get_info()).pieces
+            )
 
             piece_types_to_import = set()
             for piece in remote_backup_pieces.values():
@@ -145,29 +156,40 @@ class ImportBackupImpl(ImportBackup):
 
                 piece_types_to_import.add(piece.type)
 
+        # A full piece extended by a delta needs both to be restored
+        for bkg_type in list(piece_types_to_import):
+            delta = remote_pieces.get(DELTA_TYPES.get(bkg_type))
+            if delta is not None and remote_backup_pieces[bkg_type].id == delta.id:
+                piece_types_to_import.add(delta.type)
+
         pieces = await self._backup_repository.download(
             BackupDownloadParams(types=list(piece_types_to_import), auth=user_auth)
         )
+        deltas = {
+            DELTA_BASE_TYPES[piece.type]: piece
+            for piece in pieces.pieces
+            if piece.type in DELTA_BASE_TYPES
+        }
 
         imported_backup_infos = []
         affected_pieces = {}
         for piece in pieces.pieces:
+            if piece.type in DELTA_BASE_TYPES:
+                continue
             backupable = self._backupable_ports.get(piece.type)
+            delta = deltas.get(piece.type)
 
-            process_request = BackupProcessRequest(
-                protocol=piece.protocol,
-                password=bkg_pass,
-                type=piece.type,
-                payload=piece.payload,
-            )
-            downloaded_data = await self._backup_processor.decompile(process_request)
-            user = self._data_initiator.get_user()
-            await backupable.import_data(
-                downloaded_data.payload,
-                initialize=request.initialize,
-                user=user,
-                password=request.password,
-            )
+            with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
+                restored, delta_applied = await self._restore(
+                    piece, delta, bkg_pass, Path(tmpdir)
+                )
+                user = self._data_initiator.get_user()
+                await backupable.import_data(
+                    restored,
+                    initialize=request.initialize,
+                    user=user,
+                    password=request.password,
+                )
 
             # Register the imported backup locally so we know we're in sync
             backup_info = BackupInfo(
@@ -179,11 +201,23 @@ class ImportBackupImpl(ImportBackup):
             )
             imported_backup_infos.append(backup_info)
 
+            synced_info = backup_info
+            if delta_applied:
+                delta_info = BackupInfo(
+                    id=delta.id,
+                    protocol=delta.protocol,
+                    date=delta.date,
+                    type=delta.type,
+                    size=delta.size,
+                )
+                imported_backup_infos.append(delta_info)
+                synced_info = merge_delta(backup_info, delta_info)
+
             # Get updated state after import
             affected_pieces[piece.type] = FullBackupInfo(
-                local=backup_info,
-                remote=backup_info,
-                last_update=piece.date,
+                local=synced_info,
+                remote=synced_info,
+                last_update=synced_info.date,
                 has_local_changes=False,
                 status=SyncStatus.SYNC,
             )
@@ -193,8 +227,57 @@ class ImportBackupImpl(ImportBackup):
 
         return BackupSyncResult(pieces=affected_pieces)
 
+    async def _restore(
+        self,
+        piece: BackupTransferPiece,
+        delta: BackupTransferPiece | None,
+        password: str,
+        workdir: Path,
+    ) -> tuple[Path, bool]:
+        base = await self._decompile(piece, password, workdir)
+        if piece.type not in DELTA_TYPES:
+            return base, False
+
+        # Hashes of the full piece, so following uploads can be deltas on it
+        manifest = await self._backup_delta_calculator.build_manifest(
+            piece.type, piece.id, base
+        )
+        restored, delta_applied = base, False
+        if delta is not None:
+            delta_path = await self._decompile(delta, password, workdir)
+            patched = workdir / f"{piece.type.value}.restored"
+            delta_applied = await self._backup_delta_calculator.apply(
+                piece.id, base, delta_path, patched
+            )
+            if delta_applied:
+                restored = patched
+                manifest.deltas = 1
+            else:
+                self._log.warning(
+                    "Ignoring %s backup piece %s: it extends another full backup",
+                    delta.type,
+                    delta.id,
+                )
+
+        await self._backup_local_registry.save_manifest(manifest)
+        return restored, delta_applied
+
+    async def _decompile(
+        self, piece: BackupTransferPiece, password: str, workdir: Path
+    ) -> Path:
+        process_request = BackupProcessRequest(
+            protocol=piece.protocol,
+            password=password,
+            type=piece.type,
+            payload=piece.payload,
+            target=workdir / f"{piece.type.value}.import",
+        )
+        return (await self._backup_processor.decompile(process_request)).payload
+
     async def _check_cooldown(self, types: list[BackupFileType], role: CloudUserRole):
-        local_backup_registry = (await self._backup_local_registry.get_info()).pieces
+        local_backup_registry = merge_delta_pieces(
+            (await self._backup_local_registry.get_info()).pieces
+        )
         if not local_backup_registry:
             return
 
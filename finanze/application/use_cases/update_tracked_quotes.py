@@ -11,10 +11,12 @@ from application.ports.exchange_rate_provider import ExchangeRateProvider
 from application.ports.exchange_rate_storage import ExchangeRateStorage
 from application.ports.instrument_info_provider import InstrumentInfoProvider
 from application.ports.manual_position_data_port import ManualPositionDataPort
+from application.ports.notification_port import NotificationPort
 from application.ports.position_port import PositionPort
 from application.ports.tracked_updates_port import TrackedUpdatesPort
 from application.ports.transaction_handler_port import TransactionHandlerPort
 from application.ports.virtual_import_registry import VirtualImportRegistry
+from application.use_cases.fetch_financial_data import notify_fetch_progress
 from application.use_cases.manual_position_snapshot import (
     ManualPositionSnapshotWriter,
 )
@@ -37,6 +39,7 @@ from domain.global_position import (
 )
 from domain.instrument import InstrumentDataRequest, InstrumentInfo, InstrumentType
 from domain.native_entities import COMMODITIES
+from domain.notification import FetchPhase
 from domain.tracking import UpdateTrackedResult
 from domain.use_cases.update_tracked_quotes import UpdateTrackedQuotes
 from domain.virtual_data import VirtualDataSource
@@ -59,6 +62,7 @@ class UpdateTrackedQuotesImpl(UpdateTrackedQuotes):
         snapshot_writer: ManualPositionSnapshotWriter,
         throttle_port: TrackedUpdatesPort,
         transaction_handler_port: TransactionHandlerPort,
+        notification_port: Optional[NotificationPort] = None,
     ):
         self._position_port = position_port
         self._manual_position_data_port = manual_position_data_port
@@ -69,6 +73,7 @@ class UpdateTrackedQuotesImpl(UpdateTrackedQuotes):
         self._snapshot_writer = snapshot_writer
         self._throttle_port = throttle_port
         self._transaction_handler_port = transaction_handler_port
+        self._notification_port = notification_port
 
         self._lock = Lock()
         self._log = logging.getLogger(__name__)
@@ -162,6 +167,9 @@ class UpdateTrackedQuotesImpl(UpdateTrackedQuotes):
                         entity_id, entry_count = result
                         changed_entities.add(entity_id)
                         changed_entries += entry_count
+                        await notify_fetch_progress(
+                            self._notification_port, entity_id, FetchPhase.SAVED
+                        )
                 except Exception:
                     tracker_keys = [
                         mpd.data.tracker_key
@@ -187,6 +195,9 @@ class UpdateTrackedQuotesImpl(UpdateTrackedQuotes):
                         entity_id, entry_count = result
                         changed_entities.add(entity_id)
                         changed_entries += entry_count
+                        await notify_fetch_progress(
+                            self._notification_port, entity_id, FetchPhase.SAVED
+                        )
                 except Exception:
                     self._log.exception("Failed updating tracked commodities")
 
@@ -1,12 +1,17 @@
 import logging
+import tempfile
 from datetime import datetime, timedelta
-from uuid import uuid4
+from pathlib import Path
+from typing import Optional
+from uuid import UUID, uuid4
 
 from dateutil.tz import tzlocal
 
+from application.ports.backup_delta_calculator import BackupDeltaCalculator
 from application.ports.backup_local_registry import BackupLocalRegistry
 from application.ports.backup_processor import BackupProcessor
 from application.ports.backup_repository import BackupRepository
+from application.ports.backup_settings_port import BackupSettingsPort
 from application.ports.cloud_register import CloudRegister
 from application.ports.datasource_backup_port import Backupable
 from application.ports.datasource_initiator import DatasourceInitiator
@@ -23,6 +28,11 @@ from domain.backup import (
     SyncStatus,
     BackupUploadParams,
     BackupInfoParams,
+    BackupManifest,
+    DELTA_BASE_TYPES,
+    DELTA_TYPES,
+    merge_delta,
+    merge_delta_pieces,
 )
 from domain.cloud_auth import CloudPermission, CloudUserRole
 from domain.exception.exceptions import TooManyRequests, BackupConflict
@@ -35,6 +45,9 @@ class UploadBackupImpl(UploadBackup):
         CloudUserRole.BASIC: 1080,
     }
     BACKUP_SIZE_WARNING_THRESHOLD_PERCENT = 5.0
+    # Incremental mode, deltas are cumulative so a full backup bounds their size
+    FULL_BACKUP_EVERY_DELTAS = 10
+    MAX_DELTA_SIZE_RATIO = 0.5
 
     def __init__(
         self,
@@ -44,6 +57,9 @@ class UploadBackupImpl(UploadBackup):
         backup_repository: BackupRepository,
         backup_local_registry: BackupLocalRegistry,
         cloud_register: CloudRegister,
+        backup_settings_port: BackupSettingsPort,
+        backup_delta_calculator: Optional[BackupDeltaCalculator],
+        protocol: int = CURRENT_PROTOCOL_VERSION,
     ):
         self._data_initiator = data_initiator
         self._backupable_ports = backupable_ports
@@ -51,6 +67,9 @@ class UploadBackupImpl(UploadBackup):
         self._backup_repository = backup_repository
         self._backup_local_registry = backup_local_registry
         self._cloud_register = cloud_register
+        self._backup_settings_port = backup_settings_port
+        self._backup_delta_calculator = backup_delta_calculator
+        self._protocol = protocol
 
         self._log = logging.getLogger(__name__)
 
@@ -61,27 +80,40 @@ class UploadBackupImpl(UploadBackup):
         await self._check_cooldown(request.types, user_auth.role)
         hashed_pass = await self._data_initiator.get_hashed_password()
 
-        remote_backup_info = (
+        remote_pieces = (
             await self._backup_repository.get_info(BackupInfoParams(auth=user_auth))
         ).pieces
-        local_backup_registry = (await self._backup_local_registry.get_info()).pieces
+        local_pieces = (await self._backup_local_registry.get_info()).pieces
+        # Without a delta calculator every piece is uploaded in full
+        incremental = (
+            self._backup_delta_calculator is not None
+            and (await self._backup_settings_port.get_backup_settings()).incremental
+        )
 
-        pieces = []
-        for bkg_type in request.types:
-            piece = await self._prepare_piece_for_upload(
-                bkg_type,
-                hashed_pass,
-                local_backup_registry,
-                remote_backup_info,
-                request.force,
-            )
-            if piece is not None:
-                pieces.append(piece)
+        # Compiled pieces are kept on disk until the transfer finishes
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as workdir:
+            pieces = []
+            manifests = {}
+            for bkg_type in request.types:
+                prepared = await self._prepare_piece_for_upload(
+                    bkg_type,
+                    hashed_pass,
+                    local_pieces,
+                    remote_pieces,
+                    request.force,
+                    incremental,
+                    Path(workdir),
+                )
+                if prepared is not None:
+                    piece, manifest = prepared
+                    pieces.append(piece)
+                    if manifest is not None:
+                        manifests[piece.id] = manifest
 
-        request_pieces = BackupPieces(pieces)
-        success_uploads = await self._backup_repository.upload(
-            BackupUploadParams(pieces=request_pieces, auth=user_auth)
-        )
+            request_pieces = BackupPieces(pieces)
+            success_uploads = await self._backup_repository.upload(
+                BackupUploadParams(pieces=request_pieces, auth=user_auth)
+            )
 
         backup_infos = []
         affected_pieces = {}
@@ -101,9 +133,19 @@ class UploadBackupImpl(UploadBackup):
             )
             backup_infos.append(backup_info)
 
-            affected_pieces[piece.type] = FullBackupInfo(
-                local=backup_info,
-                remote=backup_info,
+            manifest = manifests.get(piece.id)
+            if manifest is not None:
+                await self._backup_local_registry.save_manifest(manifest)
+
+            # Deltas are reported as the full piece they extend
+            bkg_type = DELTA_BASE_TYPES.get(piece.type, piece.type)
+            synced_info = backup_info
+            if bkg_type != piece.type:
+                synced_info = merge_delta(local_pieces[bkg_type], backup_info)
+
+            affected_pieces[bkg_type] = FullBackupInfo(
+                local=synced_info,
+                remote=synced_info,
                 last_update=piece.date,
                 has_local_changes=False,
                 status=SyncStatus.SYNC,
@@ -118,17 +160,19 @@ class UploadBackupImpl(UploadBackup):
         self,
         bkg_type: BackupFileType,
         hashed_pass: str,
-        local_backup_registry: dict,
-        remote_backup_info: dict,
+        local_pieces: dict,
+        remote_pieces: dict,
         force: bool,
-    ) -> BackupTransferPiece | None:
+        incremental: bool,
+        workdir: Path,
+    ) -> tuple[BackupTransferPiece, Optional[BackupManifest]] | None:
         backupable = self._backupable_ports.get(bkg_type)
         if backupable is None:
             return None
 
         local_last_update = await backupable.get_last_updated()
-        local_backup = local_backup_registry.get(bkg_type)
-        remote_backup = remote_backup_info.get(bkg_type)
+        local_backup = merge_delta_pieces(local_pieces).get(bkg_type)
+        remote_backup = merge_delta_pieces(remote_pieces).get(bkg_type)
 
         # Check if we have any changes to upload
         has_local_changes = (
@@ -144,10 +188,32 @@ class UploadBackupImpl(UploadBackup):
         # CONFLICT: Remote backup changed since our last sync (someone else uploaded)
         await self._check_remote_conflict(bkg_type, local_backup, remote_backup, force)
 
-        data = await backupable.export()
-        local_last_update = await backupable.get_last_updated()
-        piece = await self._handle_bkg(hashed_pass, data, local_last_update, bkg_type)
-        if remote_backup:
+        # Full backup both sides share, the only one a delta can be built on
+        delta_base = None
+        if incremental and not force:
+            local_full = local_pieces.get(bkg_type)
+            remote_full = remote_pieces.get(bkg_type)
+            if local_full and remote_full and local_full.id == remote_full.id:
+                delta_base = local_full.id
+
+        # Exported to disk so the processor can stream it instead of holding it
+        with tempfile.TemporaryDirectory(
+            dir=workdir, ignore_cleanup_errors=True
+        ) as tmpdir:
+            export_path = Path(tmpdir) / f"{bkg_type.value}.export"
+            await backupable.export_to(export_path)
+            local_last_update = await backupable.get_last_updated()
+            piece, manifest = await self._handle_export(
+                hashed_pass,
+                export_path,
+                local_last_update,
+                bkg_type,
+                incremental,
+                delta_base,
+                workdir,
+            )
+
+        if remote_backup and piece.type == bkg_type:
             local_size = piece.size
             remote_size = remote_backup.size
             # Calculate size difference percentage (local vs remote)
@@ -164,7 +230,59 @@ class UploadBackupImpl(UploadBackup):
                         remote_size,
                     )
 
-        return piece
+        return piece, manifest
+
+    async def _handle_export(
+        self,
+        password: str,
+        export_path: Path,
+        local_last_update: datetime,
+        bkg_type: BackupFileType,
+        incremental: bool,
+        delta_base: Optional[UUID],
+        workdir: Path,
+    ) -> tuple[BackupTransferPiece, Optional[BackupManifest]]:
+        delta_type = DELTA_TYPES.get(bkg_type)
+        if not incremental or delta_type is None:
+            piece = await self._handle_bkg(
+                password, export_path, local_last_update, bkg_type, workdir
+            )
+            return piece, None
+
+        manifest = await self._backup_local_registry.get_manifest(bkg_type)
+        if (
+            delta_base is not None
+            and manifest is not None
+            and manifest.base_id == delta_base
+            and manifest.deltas < self.FULL_BACKUP_EVERY_DELTAS
+        ):
+            delta_path = export_path.with_name(f"{delta_type.value}.export")
+            delta = await self._backup_delta_calculator.diff(
+                manifest, export_path, delta_path
+            )
+            full_size = export_path.stat().st_size
+            if delta.size <= full_size * self.MAX_DELTA_SIZE_RATIO:
+                self._log.info(
+                    "Uploading %s as a delta: %d of %d blocks changed (%d of %d bytes)",
+                    bkg_type,
+                    delta.changed_blocks,
+                    delta.total_blocks,
+                    delta.size,
+                    full_size,
+                )
+                piece = await self._handle_bkg(
+                    password, delta_path, local_last_update, delta_type, workdir
+                )
+                manifest.deltas += 1
+                return piece, manifest
+
+        piece = await self._handle_bkg(
+            password, export_path, local_last_update, bkg_type, workdir
+        )
+        manifest = await self._backup_delta_calculator.build_manifest(
+            bkg_type, piece.id, export_path
+        )
+        return piece, manifest
 
     async def _check_remote_conflict(
         self,
@@ -190,7 +308,9 @@ class UploadBackupImpl(UploadBackup):
                 )
 
     async def _check_cooldown(self, types: list[BackupFileType], role: CloudUserRole):
-        local_backup_registry = (await self._backup_local_registry.get_info()).pieces
+        local_backup_registry = merge_delta_pieces(
+            (await self._backup_local_registry.get_info()).pieces
+        )
         if not local_backup_registry:
             return
 
@@ -220,20 +340,22 @@ class UploadBackupImpl(UploadBackup):
     async def _handle_bkg(
         self,
         password: str,
-        data: bytes,
+        data: bytes | Path,
         local_last_update: datetime,
         bkg_type: BackupFileType,
+        workdir: Path,
     ) -> BackupTransferPiece:
         data_backup_request = BackupProcessRequest(
-            protocol=CURRENT_PROTOCOL_VERSION,
+            protocol=self._protocol,
             password=password,
             type=bkg_type,
             payload=data,
+            target=workdir / f"{bkg_type.value}.compiled",
         )
         compiled = await self._backup_processor.compile(data_backup_request)
         return BackupTransferPiece(
             id=uuid4(),
-            protocol=CURRENT_PROTOCOL_VERSION,
+            protocol=self._protocol,
             date=local_last_update,
             type=bkg_type,
             payload=compiled.payload,
@@ -49,6 +49,30 @@ def app_args() -> argparse.ArgumentParser:
         choices=["NONE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         default="ERROR",
     )
+    parser.add_argument(
+        "--slow-query-ms",
+        help="Log SQL statements slower than this many milliseconds, along with their query plan.",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "--debug-routes",
+        help="Serve the /api/v1/debug routes (request history with Server-Timing headers, profiler control) to the logged user. Can also be set with FINANZE_DEBUG_ROUTES=1.",
+        action="store_true",
+        default=os.environ.get("FINANZE_DEBUG_ROUTES", "") == "1",
+    )
+    parser.add_argument(
+        "--profile-routes",
+        help="Comma separated API routes to run under the sampling profiler (* for all). Can also be set with FINANZE_PROFILE_ROUTES.",
+        type=str,
+        default=os.environ.get("FINANZE_PROFILE_ROUTES", ""),
+    )
+    parser.add_argument(
+        "--profile-threshold-ms",
+        help="Only keep profiles of requests slower than this many milliseconds. Can also be set with FINANZE_PROFILE_THRESHOLD_MS.",
+        type=float,
+        default=float(os.environ.get("FINANZE_PROFILE_THRESHOLD_MS", 500)),
+    )
     return parser
 
 
@@ -59,6 +83,10 @@ def parse_args() -> argparse.Namespace:
     args.data_dir = Path(args.data_dir)
     os.makedirs(args.data_dir, exist_ok=True)
 
+    args.profile_routes = [
+        route.strip() for route in args.profile_routes.split(",") if route.strip()
+    ]
+
     args.logged_username = os.environ.get("USERNAME")
     args.logged_password = os.environ.get("PASSWORD")
 
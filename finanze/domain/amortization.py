@@ -0,0 +1,62 @@
+from domain.dezimal import Dezimal
+
+_ZERO = Dezimal(0)
+_ONE = Dezimal(1)
+
+
+def annuity_payment(principal: Dezimal, period_rate: Dezimal, periods: int) -> Dezimal:
+    """Constant payment that repays principal in the given number of periods."""
+    if periods <= 0:
+        return principal
+    if period_rate == _ZERO:
+        return principal / periods
+    return principal * period_rate / (_ONE - (_ONE + period_rate) ** (-periods))
+
+
+def balance_after(
+    principal: Dezimal, period_rate: Dezimal, payment: Dezimal, periods: int
+) -> Dezimal:
+    """
+    Outstanding after paying a constant payment for the given number of periods
+    at a constant rate, never below zero.
+    Formula: RB_k = P*(1+r)^k - A * ((1+r)^k - 1)/r
+    """
+    if periods <= 0:
+        return principal
+    if period_rate == _ZERO:
+        return max(_ZERO, principal - payment * periods)
+    growth = (_ONE + period_rate) ** periods
+    return max(_ZERO, principal * growth - payment * (growth - _ONE) / period_rate)
+
+
+def future_value(
+    principal: Dezimal, period_rate: Dezimal, contribution: Dezimal, periods: int
+) -> Dezimal:
+    """
+    Balance after the given number of periods when contribution is added at the
+    start of every period and the balance is then revalued (annuity due).
+    Formula: FV_n = P*(1+r)^n + C*(1+r)*((1+r)^n - 1)/r
+    """
+    if periods <= 0:
+        return principal
+    if period_rate == _ZERO:
+        return principal + contribution * periods
+    growth = (_ONE + period_rate) ** periods
+    return (
+        principal * growth
+        + contribution * (_ONE + period_rate) * (growth - _ONE) / period_rate
+    )
+
+
+def annuity_due_value(payment: Dezimal, period_rate: Dezimal, periods: int) -> Dezimal:
+    """
+    Balance needed to withdraw payment at the start of every period for the
+    given number of periods, revaluing what is left in between.
+    Formula: PV = A*(1+r)*(1 - (1+r)^-n)/r
+    """
+    if periods <= 0:
+        return _ZERO
+    if period_rate == _ZERO:
+        return payment * periods
+    discount = _ONE - (_ONE + period_rate) ** (-periods)
+    return payment * (_ONE + period_rate) * discount / period_rate
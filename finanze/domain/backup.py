@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
@@ -7,12 +8,19 @@ from pydantic.dataclasses import dataclass
 
 from domain.cloud_auth import CloudAuthData
 
-CURRENT_PROTOCOL_VERSION = 1
+CURRENT_PROTOCOL_VERSION = 2
 
 
 class BackupFileType(str, Enum):
     DATA = "DATA"
     CONFIG = "CONFIG"
+    # Blocks of DATA changed since its last full backup
+    DATA_DELTA = "DATA_DELTA"
+
+
+# Types that can be uploaded as a delta on top of their last full backup
+DELTA_TYPES = {BackupFileType.DATA: BackupFileType.DATA_DELTA}
+DELTA_BASE_TYPES = {delta: base for base, delta in DELTA_TYPES.items()}
 
 
 class BackupMode(str, Enum):
@@ -35,6 +43,35 @@ class BackupsInfo:
     pieces: dict[BackupFileType, BackupInfo]
 
 
+def merge_delta(full: BackupInfo, delta: BackupInfo) -> BackupInfo:
+    return BackupInfo(
+        id=delta.id,
+        protocol=delta.protocol,
+        date=delta.date,
+        type=full.type,
+        size=full.size + delta.size,
+    )
+
+
+def merge_delta_pieces(
+    pieces: dict[BackupFileType, BackupInfo],
+) -> dict[BackupFileType, BackupInfo]:
+    """
+    Folds every delta piece into the full piece it extends, so that a full
+    backup plus its delta is seen as a single backup identified by the delta.
+    Deltas older than their full piece were superseded by it and are ignored.
+    """
+    merged = {}
+    for backup_type, info in pieces.items():
+        if backup_type in DELTA_BASE_TYPES:
+            continue
+        delta = pieces.get(DELTA_TYPES.get(backup_type))
+        if delta is not None and delta.date > info.date:
+            info = merge_delta(info, delta)
+        merged[backup_type] = info
+    return merged
+
+
 @dataclass
 class BackupsInfoRequest:
     only_local: bool = False
@@ -67,13 +104,34 @@ class BackupProcessRequest:
     protocol: int
     password: str
     type: BackupFileType
-    payload: bytes
+    # Either the content itself or a file holding it
+    payload: bytes | Path
+    # When set, the output is written to this file instead of returned
+    target: Optional[Path] = None
 
 
 @dataclass
 class BackupProcessResult:
-    payload: bytes
+    payload: bytes | Path
+    size: int
+
+
+@dataclass
+class BackupManifest:
+    type: BackupFileType
+    # Full backup the block hashes were taken from
+    base_id: UUID
+    block_size: int
+    hashes: list[str]
+    # Deltas uploaded on top of the full backup
+    deltas: int = 0
+
+
+@dataclass
+class BackupDeltaResult:
     size: int
+    changed_blocks: int
+    total_blocks: int
 
 
 @dataclass
@@ -82,7 +140,8 @@ class BackupTransferPiece:
     protocol: int
     date: datetime
     type: BackupFileType
-    payload: bytes
+    # Compiled pieces stay on disk until they are uploaded
+    payload: bytes | Path
     size: int
 
 
@@ -130,3 +189,4 @@ class BackupSyncResult:
 @dataclass
 class BackupSettings:
     mode: BackupMode
+    incremental: bool = False
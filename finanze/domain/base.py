@@ -1,5 +1,6 @@
 import inspect
 from abc import ABC
+from functools import cache
 from typing import TypeVar
 
 from domain.exception.exceptions import MissingFieldsError
@@ -7,16 +8,23 @@ from domain.exception.exceptions import MissingFieldsError
 T = TypeVar("T")
 
 
+@cache
+def _init_fields(cls: type) -> tuple[set[str], frozenset[str]]:
+    parameters = inspect.signature(cls).parameters
+    required_fields = {
+        name
+        for name, param in parameters.items()
+        if param.default == param.empty
+        and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+    }
+    return required_fields, frozenset(parameters)
+
+
 class BaseData(ABC):
     @classmethod
     def from_dict(cls: type[T], env: dict) -> T:
-        parameters = inspect.signature(cls).parameters
-        required_fields = {
-            name
-            for name, param in parameters.items()
-            if param.default == param.empty
-            and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
-        }
+        # Signatures are resolved once per class, imports build thousands of rows
+        required_fields, parameters = _init_fields(cls)
 
         missing_fields = list(required_fields - env.keys())
         if missing_fields:
@@ -6,6 +6,16 @@ ValidDezimalOperand = Union[int, Decimal, "Dezimal"]
 
 
 class Dezimal:
+    """
+    Decimal wrapper used for every amount in the domain.
+
+    Operators take a fast path when both operands are Dezimal and build their
+    results through _wrap, which skips the type dispatch of __init__ since
+    Decimal operations always return a Decimal.
+    """
+
+    __slots__ = ("val",)
+
     val: Decimal
 
     def __init__(self, value: ValidDezimal):
@@ -36,21 +46,28 @@ class Dezimal:
     def __hash__(self) -> int:
         return hash(self.val)
 
+    def __reduce__(self):
+        return Dezimal, (self.val,)
+
     def __gt__(self, other: ValidDezimalOperand) -> bool:
-        other_decimal = _parse(other)
-        return self.val.compare_signal(other_decimal) == Decimal(1)
+        if type(other) is Dezimal:
+            return self.val > other.val
+        return self.val > _parse(other)
 
     def __lt__(self, other: ValidDezimalOperand) -> bool:
-        other_decimal = _parse(other)
-        return self.val.compare_signal(other_decimal) == Decimal(-1)
+        if type(other) is Dezimal:
+            return self.val < other.val
+        return self.val < _parse(other)
 
     def __le__(self, other: ValidDezimalOperand) -> bool:
-        other_decimal = _parse(other)
-        return self.val.compare_signal(other_decimal) in (Decimal(-1), Decimal(0))
+        if type(other) is Dezimal:
+            return self.val <= other.val
+        return self.val <= _parse(other)
 
     def __ge__(self, other: ValidDezimalOperand) -> bool:
-        other_decimal = _parse(other)
-        return self.val.compare_signal(other_decimal) in (Decimal(1), Decimal(0))
+        if type(other) is Dezimal:
+            return self.val >= other.val
+        return self.val >= _parse(other)
 
     def __eq__(self, other: object) -> bool:
         other_decimal: ValidDezimalOperand
@@ -61,71 +78,73 @@ class Dezimal:
         else:
             return False
 
-        return self.val.compare_signal(other_decimal) == Decimal(0)
+        if self.val == other_decimal:
+            return True
+        # Equality against NaN signals like the ordering comparisons
+        if self.val.is_nan() or (
+            type(other_decimal) is Decimal and other_decimal.is_nan()
+        ):
+            self.val.compare_signal(other_decimal)
+        return False
 
     def __add__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__add__(other_decimal))
+        if type(other) is Dezimal:
+            return _wrap(self.val + other.val)
+        return _wrap(self.val + _parse(other))
 
     def __sub__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__sub__(other_decimal))
+        if type(other) is Dezimal:
+            return _wrap(self.val - other.val)
+        return _wrap(self.val - _parse(other))
 
     def __mul__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__mul__(other_decimal))
+        if type(other) is Dezimal:
+            return _wrap(self.val * other.val)
+        return _wrap(self.val * _parse(other))
 
     def __truediv__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__truediv__(other_decimal))
+        if type(other) is Dezimal:
+            return _wrap(self.val / other.val)
+        return _wrap(self.val / _parse(other))
 
     def __floordiv__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__floordiv__(other_decimal))
+        return _wrap(self.val // _parse(other))
 
     def __pow__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__pow__(other_decimal))
+        return _wrap(self.val ** _parse(other))
 
     def __radd__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__radd__(other_decimal))
+        return _wrap(_parse(other) + self.val)
 
     def __rsub__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__rsub__(other_decimal))
+        return _wrap(_parse(other) - self.val)
 
     def __rmul__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__rmul__(other_decimal))
+        return _wrap(_parse(other) * self.val)
 
     def __rtruediv__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__rtruediv__(other_decimal))
+        return _wrap(_parse(other) / self.val)
 
     def __rfloordiv__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__rfloordiv__(other_decimal))
+        return _wrap(_parse(other) // self.val)
 
     def __mod__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__mod__(other_decimal))
+        return _wrap(self.val % _parse(other))
 
     def __rmod__(self, other: ValidDezimalOperand) -> Self:
-        other_decimal = _parse(other)
-        return Dezimal(self.val.__rmod__(other_decimal))
+        return _wrap(_parse(other) % self.val)
 
     def __round__(self, ndigits: int) -> Self:
-        return Dezimal(round(self.val, ndigits))
+        return _wrap(round(self.val, ndigits))
 
     def __float__(self) -> float:
         return float(self.val)
 
     def __neg__(self) -> Self:
-        return Dezimal(self.val.__neg__())
+        return _wrap(-self.val)
 
     def __abs__(self) -> Self:
-        return Dezimal(self.val.copy_abs())
+        return _wrap(self.val.copy_abs())
 
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
@@ -142,10 +161,26 @@ class Dezimal:
         )
 
 
+_new_dezimal = object.__new__
+
+
+def _wrap(value: Decimal) -> Dezimal:
+    """Dezimal around an already computed Decimal, without validation."""
+    result = _new_dezimal(Dezimal)
+    result.val = value
+    return result
+
+
+# Small integers show up constantly as operands (sums starting at 0, counts,
+# periods per year), their Decimal is built once
+_SMALL_INTS = {i: Decimal(i) for i in range(-1, 101)}
+
+
 def _parse(other: ValidDezimalOperand) -> Decimal:
     if isinstance(other, Dezimal):
         return other.val
     elif isinstance(other, int):
-        return Decimal(other)
+        cached = _SMALL_INTS.get(other)
+        return cached if cached is not None else Decimal(other)
     else:
         raise ValueError(f"Invalid type {type(other)}")
@@ -189,6 +189,12 @@ class InvalidBackupCredentials(Exception):
     pass
 
 
+class CorruptedBackup(Exception):
+    """Raised when a backup payload is truncated or malformed"""
+
+    pass
+
+
 class BackupConflict(Exception):
     """Raised when local changes conflict with remote backup"""
 
@@ -1,10 +1,11 @@
 from enum import Enum
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from domain.entity import Feature
 from domain.global_position import ProductType
 from domain.settings import TemplateConfig
 from domain.template import ProcessorDataFilter, Template
+from pydantic import ConfigDict
 from pydantic.dataclasses import dataclass
 
 
@@ -47,9 +48,8 @@ class FileExportRequest:
     template: TemplateConfig | None = None
 
 
-@dataclass
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
 class FileExportResult:
     filename: str
     content_type: str
-    data: bytes
-    size: int
+    data: AsyncIterator[bytes]
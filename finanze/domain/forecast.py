@@ -1,3 +1,4 @@
+from dataclasses import field
 from datetime import date
 from typing import Optional
 from uuid import UUID
@@ -7,6 +8,28 @@ from domain.global_position import EntitiesPosition
 from pydantic.dataclasses import dataclass
 
 
+MAX_MONTE_CARLO_PATHS = 100_000
+DEFAULT_PERCENTILES = [5, 25, 50, 75, 95]
+
+
+@dataclass
+class ReturnAssumption:
+    """Annual expected return and volatility of an asset class."""
+
+    mean: Dezimal
+    volatility: Dezimal
+
+
+@dataclass
+class MonteCarloRequest:
+    market: Optional[ReturnAssumption] = None
+    crypto: Optional[ReturnAssumption] = None
+    commodity: Optional[ReturnAssumption] = None
+    paths: int = 1000
+    seed: Optional[int] = None
+    percentiles: list[int] = field(default_factory=lambda: list(DEFAULT_PERCENTILES))
+
+
 @dataclass
 class ForecastRequest:
     target_date: date
@@ -14,6 +37,7 @@ class ForecastRequest:
     avg_annual_crypto_increase: Optional[Dezimal] = None
     avg_annual_commodity_increase: Optional[Dezimal] = None
     include_real_estate_taxes: bool = True
+    monte_carlo: Optional[MonteCarloRequest] = None
 
 
 @dataclass
@@ -32,6 +56,62 @@ class RealEstateEquityForecast:
     currency: str
 
 
+@dataclass
+class ForecastPoint:
+    """Projected amounts per currency at the end of a forecast month."""
+
+    date: date
+    net_worth: dict[str, Dezimal] = field(default_factory=dict)
+    cash: dict[str, Dezimal] = field(default_factory=dict)
+    equities: dict[str, Dezimal] = field(default_factory=dict)
+    real_estate_equity: dict[str, Dezimal] = field(default_factory=dict)
+    debt: dict[str, Dezimal] = field(default_factory=dict)
+
+
+@dataclass
+class SimulatedAsset:
+    """
+    An asset class holding in a single currency, revalued with random monthly
+    returns after each month contributions. Holdings of the same asset class
+    share the same random returns.
+    """
+
+    asset_class: str
+    currency: str
+    returns: ReturnAssumption
+    initial: Dezimal
+    contributions: list[Dezimal]
+
+
+@dataclass
+class MonteCarloInputs:
+    """
+    Month end dates, the deterministic part of the net worth per currency for
+    each of them and the simulated assets on top of it.
+    """
+
+    dates: list[date]
+    base: dict[str, list[Dezimal]]
+    assets: list[SimulatedAsset]
+    paths: int
+    percentiles: list[int]
+    seed: Optional[int] = None
+
+
+@dataclass
+class MonteCarloPoint:
+    date: date
+    # Net worth per currency, one value per requested percentile
+    net_worth: dict[str, list[Dezimal]] = field(default_factory=dict)
+
+
+@dataclass
+class MonteCarloResult:
+    paths: int
+    percentiles: list[int]
+    points: list[MonteCarloPoint] = field(default_factory=list)
+
+
 @dataclass
 class ForecastResult:
     target_date: date
@@ -40,3 +120,5 @@ class ForecastResult:
     real_estate: list[RealEstateEquityForecast]
     crypto_appreciation: Dezimal
     commodity_appreciation: Dezimal
+    trajectory: list[ForecastPoint] = field(default_factory=list)
+    monte_carlo: Optional[MonteCarloResult] = None
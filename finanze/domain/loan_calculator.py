@@ -28,3 +28,19 @@ class LoanCalculationResult:
     current_installment_interests: Optional[Dezimal]
     principal_outstanding: Optional[Dezimal]
     installment_date: Optional[date] = None
+
+
+@dataclass
+class LoanInstallment:
+    date: date
+    payment: Dezimal
+    interests: Dezimal
+    principal: Dezimal
+    principal_outstanding: Dezimal
+
+
+@dataclass
+class LoanSchedule:
+    installments: list[LoanInstallment]
+    total_payment: Dezimal
+    total_interests: Dezimal
@@ -0,0 +1,39 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pydantic.dataclasses import dataclass
+
+
+class NotificationType(str, Enum):
+    FETCH_PROGRESS = "FETCH_PROGRESS"
+    DATA_CHANGED = "DATA_CHANGED"
+
+
+class FetchPhase(str, Enum):
+    LOGIN = "LOGIN"
+    POSITION = "POSITION"
+    AUTO_CONTRIBUTIONS = "AUTO_CONTRIBUTIONS"
+    TRANSACTIONS = "TRANSACTIONS"
+    HISTORIC = "HISTORIC"
+    SAVED = "SAVED"
+
+
+@dataclass
+class FetchProgress:
+    entity_id: UUID
+    phase: FetchPhase
+    entity_account_id: Optional[UUID] = None
+
+
+@dataclass
+class DataChanged:
+    tables: list[str]
+
+
+@dataclass
+class Notification:
+    type: NotificationType
+    data: FetchProgress | DataChanged
+    date: datetime
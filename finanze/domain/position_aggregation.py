@@ -1,3 +1,5 @@
+from typing import Optional
+
 from domain.dezimal import Dezimal
 from domain.global_position import (
     Credits,
@@ -9,7 +11,9 @@ from domain.global_position import (
     FundInvestments,
     FundPortfolios,
     GlobalPosition,
+    ProductPosition,
     ProductPositions,
+    ProductType,
     RealEstateCFInvestments,
     StockInvestments,
     Accounts,
@@ -18,154 +22,123 @@ from domain.global_position import (
 )
 
 
-def _add_weighted_interest_rate(
-    total1: Dezimal, interest_rate1: Dezimal, total2: Dezimal, interest_rate2: Dezimal
-) -> Dezimal:
-    return (total1 * interest_rate1 + total2 * interest_rate2) / (total1 + total2)
-
+def _merge_entries(containers: list) -> list:
+    entries = []
+    for container in containers:
+        if container.entries:
+            entries.extend(container.entries)
+    return entries
 
-def _add_stocks(self: StockInvestments, other: StockInvestments) -> StockInvestments:
-    return StockInvestments(
-        entries=self.entries + other.entries,
-    )
 
+def _merge_crowdlending(items: list[Crowdlending]) -> Crowdlending:
+    first = items[0]
+    totals = [item.total for item in items]
+    rates = [item.weighted_interest_rate for item in items]
 
-def _add_funds(self: FundInvestments, other: FundInvestments) -> FundInvestments:
-    return FundInvestments(
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_fund_portfolios(self: FundPortfolios, other: FundPortfolios) -> FundPortfolios:
-    return FundPortfolios(
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_factoring(
-    self: FactoringInvestments, other: FactoringInvestments
-) -> FactoringInvestments:
-    return FactoringInvestments(
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_real_estate_cf(
-    self: RealEstateCFInvestments, other: RealEstateCFInvestments
-) -> RealEstateCFInvestments:
-    return RealEstateCFInvestments(
-        entries=self.entries + other.entries,
-    )
+    total = None
+    if all(totals):
+        total = totals[0]
+        for item_total in totals[1:]:
+            total = total + item_total
 
+    weighted_interest_rate = None
+    if total and all(rates):
+        weighted_sum = Dezimal(0)
+        for item_total, rate in zip(totals, rates):
+            weighted_sum = weighted_sum + item_total * rate
+        weighted_interest_rate = weighted_sum / total
 
-def _add_deposits(self: Deposits, other: Deposits) -> Deposits:
-    return Deposits(
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_crowdlending(self: Crowdlending, other: Crowdlending) -> Crowdlending:
     return Crowdlending(
-        id=self.id,
-        total=(self.total + other.total) if self.total and other.total else None,
-        weighted_interest_rate=(
-            _add_weighted_interest_rate(
-                self.total,
-                self.weighted_interest_rate,
-                other.total,
-                other.weighted_interest_rate,
-            )
-        )
-        if self.weighted_interest_rate and other.weighted_interest_rate
-        else None,
-        currency=self.currency,
-        distribution=self.distribution,
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_crypto_currencies(
-    self: CryptoCurrencies, other: CryptoCurrencies
-) -> CryptoCurrencies:
-    return CryptoCurrencies(
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_accounts(self: Accounts, other: Accounts) -> Accounts:
-    return Accounts(
-        entries=self.entries + other.entries,
+        id=first.id,
+        total=total,
+        weighted_interest_rate=weighted_interest_rate,
+        currency=first.currency,
+        distribution=first.distribution,
+        entries=_merge_entries(items),
     )
 
 
-def _add_cards(self: Cards, other: Cards) -> Cards:
-    return Cards(
-        entries=self.entries + other.entries,
-    )
-
-
-def _add_loans(self: Loans, other: Loans) -> Loans:
-    return Loans(
-        entries=self.entries + other.entries,
-    )
-
+_ENTRY_CONTAINERS = (
+    StockInvestments,
+    FundInvestments,
+    FundPortfolios,
+    FactoringInvestments,
+    RealEstateCFInvestments,
+    Deposits,
+    CryptoCurrencies,
+    Accounts,
+    Cards,
+    Loans,
+    DerivativePositions,
+    Credits,
+)
 
-def _add_derivatives(
-    self: DerivativePositions, other: DerivativePositions
-) -> DerivativePositions:
-    return DerivativePositions(
-        entries=self.entries + other.entries,
-    )
 
+def _merge_product(items: list) -> ProductPosition:
+    if len(items) == 1:
+        return items[0]
+
+    product_cls = type(items[0])
+    if product_cls is Crowdlending:
+        return _merge_crowdlending(items)
+    if product_cls in _ENTRY_CONTAINERS:
+        return product_cls(entries=_merge_entries(items))
+
+    raise TypeError(f"Cannot aggregate {product_cls.__name__} positions")
+
+
+def aggregate_products(products_list: list[ProductPositions]) -> ProductPositions:
+    grouped: dict[ProductType, list[ProductPosition]] = {}
+    for products in products_list:
+        if not products:
+            continue
+        for ptype, product in products.items():
+            if product is None:
+                continue
+            grouped.setdefault(ptype, []).append(product)
+
+    return {ptype: _merge_product(items) for ptype, items in grouped.items()}
+
+
+def aggregate_positions(positions: list[GlobalPosition]) -> Optional[GlobalPosition]:
+    """
+    Merge several positions of the same entity in a single pass per product
+    type. Metadata (id, date, source) is taken from the first position.
+    """
+    positions = [position for position in positions if position is not None]
+    if not positions:
+        return None
+    if len(positions) == 1:
+        return positions[0]
+
+    first = positions[0]
+    for position in positions[1:]:
+        if position.entity != first.entity:
+            raise TypeError(
+                f"Tried to add {position.entity} position to {first.entity} position",
+            )
 
-def _add_credits(self: Credits, other: Credits) -> Credits:
-    return Credits(
-        entries=self.entries + other.entries,
+    return GlobalPosition(
+        id=first.id,
+        entity=first.entity,
+        date=first.date,
+        products=aggregate_products([position.products for position in positions]),
+        source=first.source,
     )
 
 
-def _add_products(self: ProductPositions, other: ProductPositions) -> ProductPositions:
-    if not other:
-        return self
-    merged: ProductPositions = {}
-    for ptype in set(self) | set(other):
-        if ptype in self and ptype in other:
-            merged[ptype] = self[ptype] + other[ptype]
-        else:
-            merged[ptype] = self.get(ptype) or other.get(ptype)
-    return merged
+def _add_product(self: ProductPosition, other: ProductPosition) -> ProductPosition:
+    return _merge_product([self, other])
 
 
 def _add_position(self: GlobalPosition, other: GlobalPosition) -> GlobalPosition:
     if other is None:
         return self
-
-    if self.entity != other.entity:
-        raise TypeError(
-            f"Tried to add {self.entity} position to {other.entity} position",
-        )
-
-    return GlobalPosition(
-        id=self.id,
-        entity=self.entity,
-        date=self.date,
-        products=_add_products(self.products, other.products),
-        source=self.source,
-    )
+    return aggregate_positions([self, other])
 
 
 def add_extensions():
-    StockInvestments.__add__ = _add_stocks
-    FundInvestments.__add__ = _add_funds
-    FundPortfolios.__add__ = _add_fund_portfolios
-    FactoringInvestments.__add__ = _add_factoring
-    RealEstateCFInvestments.__add__ = _add_real_estate_cf
-    Deposits.__add__ = _add_deposits
-    Crowdlending.__add__ = _add_crowdlending
-    CryptoCurrencies.__add__ = _add_crypto_currencies
-    Accounts.__add__ = _add_accounts
-    Cards.__add__ = _add_cards
-    Loans.__add__ = _add_loans
-    DerivativePositions.__add__ = _add_derivatives
-    Credits.__add__ = _add_credits
+    for product_cls in _ENTRY_CONTAINERS:
+        product_cls.__add__ = _add_product
+    Crowdlending.__add__ = _add_product
     GlobalPosition.__add__ = _add_position
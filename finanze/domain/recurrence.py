@@ -0,0 +1,144 @@
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+from domain.auto_contributions import ContributionFrequency
+from domain.earnings_expenses import FlowFrequency
+from domain.global_position import InstallmentFrequency
+
+# Day clamping only depends on the months visited and on leap years, every
+# combination is seen within 4 years for month steps dividing a year
+_CLAMP_HORIZON_MONTHS = 48
+_MIN_MONTH_LENGTH = 28
+
+# (days, months) per frequency
+FLOW_FREQUENCY_STEPS = {
+    FlowFrequency.DAILY: (1, 0),
+    FlowFrequency.WEEKLY: (7, 0),
+    FlowFrequency.BIWEEKLY: (14, 0),
+    FlowFrequency.SEMIMONTHLY: (15, 0),
+    FlowFrequency.MONTHLY: (0, 1),
+    FlowFrequency.EVERY_TWO_MONTHS: (0, 2),
+    FlowFrequency.QUARTERLY: (0, 3),
+    FlowFrequency.EVERY_FOUR_MONTHS: (0, 4),
+    FlowFrequency.SEMIANNUALLY: (0, 6),
+    FlowFrequency.YEARLY: (0, 12),
+}
+
+CONTRIBUTION_FREQUENCY_STEPS = {
+    ContributionFrequency.WEEKLY: (7, 0),
+    ContributionFrequency.BIWEEKLY: (14, 0),
+    ContributionFrequency.MONTHLY: (0, 1),
+    ContributionFrequency.BIMONTHLY: (0, 2),
+    ContributionFrequency.EVERY_FOUR_MONTHS: (0, 4),
+    ContributionFrequency.QUARTERLY: (0, 3),
+    ContributionFrequency.SEMIANNUAL: (0, 6),
+    ContributionFrequency.YEARLY: (0, 12),
+}
+
+INSTALLMENT_FREQUENCY_STEPS = {
+    InstallmentFrequency.WEEKLY: (7, 0),
+    InstallmentFrequency.BIWEEKLY: (14, 0),
+    InstallmentFrequency.SEMIMONTHLY: (15, 0),
+    InstallmentFrequency.MONTHLY: (0, 1),
+    InstallmentFrequency.BIMONTHLY: (0, 2),
+    InstallmentFrequency.QUARTERLY: (0, 3),
+    InstallmentFrequency.SEMIANNUAL: (0, 6),
+    InstallmentFrequency.YEARLY: (0, 12),
+}
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    """
+    Dates obtained by repeatedly adding a fixed step to start, either a number
+    of days or a number of months (relativedelta semantics, so a day clamped at
+    a month end stays clamped for the following occurrences). Occurrence n is
+    computed without walking the previous ones.
+    """
+
+    start: date
+    days: int = 0
+    months: int = 0
+
+    def __post_init__(self):
+        if (self.days > 0) == (self.months > 0):
+            raise ValueError("Recurrence step must be either days or months")
+        if self.months and 12 % self.months:
+            raise ValueError(f"Unsupported month step {self.months}")
+
+    @classmethod
+    def for_flow(cls, start: date, frequency: FlowFrequency) -> "Recurrence":
+        days, months = FLOW_FREQUENCY_STEPS[frequency]
+        return cls(start, days, months)
+
+    @classmethod
+    def for_contribution(
+        cls, start: date, frequency: ContributionFrequency
+    ) -> "Recurrence":
+        days, months = CONTRIBUTION_FREQUENCY_STEPS[frequency]
+        return cls(start, days, months)
+
+    @classmethod
+    def for_installment(
+        cls, start: date, frequency: InstallmentFrequency
+    ) -> "Recurrence":
+        days, months = INSTALLMENT_FREQUENCY_STEPS[frequency]
+        return cls(start, days, months)
+
+    def nth(self, n: int) -> date:
+        if self.days:
+            return self.start + timedelta(days=n * self.days)
+
+        day = self.start.day
+        if day > _MIN_MONTH_LENGTH:
+            for i in range(1, min(n, _CLAMP_HORIZON_MONTHS) + 1):
+                day = min(day, _month_length(*self._month_at(i)))
+                if day == _MIN_MONTH_LENGTH:
+                    break
+        year, month = self._month_at(n)
+        return date(year, month, day)
+
+    def index_from(self, when: date) -> int:
+        """Index of the first occurrence on or after when."""
+        if when <= self.start:
+            return 0
+
+        if self.days:
+            return -(-(when - self.start).days // self.days)
+
+        elapsed_months = (when.year - self.start.year) * 12 + (
+            when.month - self.start.month
+        )
+        n = max(0, elapsed_months // self.months)
+        while self.nth(n) < when:
+            n += 1
+        while n > 0 and self.nth(n - 1) >= when:
+            n -= 1
+        return n
+
+    def index_after(self, when: date) -> int:
+        """Index of the first occurrence strictly after when."""
+        return self.index_from(when + timedelta(days=1))
+
+    def next_after(self, when: date) -> date:
+        return self.nth(self.index_after(when))
+
+    def count(self, first: int, until: date) -> int:
+        """Occurrences from index first up to until (inclusive)."""
+        return max(0, self.index_after(until) - first)
+
+    def between(self, first: int, until: date, from_date: Optional[date] = None):
+        """Occurrences from index first up to until, skipping those before from_date."""
+        if from_date is not None:
+            first = max(first, self.index_from(from_date))
+        return [self.nth(n) for n in range(first, self.index_after(until))]
+
+    def _month_at(self, n: int) -> tuple[int, int]:
+        year, month = divmod(self.start.month - 1 + n * self.months, 12)
+        return self.start.year + year, month + 1
+
+
+def _month_length(year: int, month: int) -> int:
+    return monthrange(year, month)[1]
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 from uuid import UUID
@@ -141,6 +141,22 @@ class Transactions:
         return Transactions(investment=investment, account=account)
 
 
+@dataclass
+class TxWatermark:
+    date: datetime
+    ref: str
+
+
+def oldest_watermark_day(
+    since: Optional[dict[ProductType, TxWatermark]],
+    product_types: list[ProductType],
+) -> Optional[date]:
+    # A type without a watermark has never been fetched, so the whole history is needed
+    if not since or any(p not in since for p in product_types):
+        return None
+    return min(since[p].date.date() for p in product_types)
+
+
 @dataclass
 class TransactionsResult:
     transactions: list[BaseTx]
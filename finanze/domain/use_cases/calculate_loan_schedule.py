@@ -0,0 +1,9 @@
+import abc
+
+from domain.loan_calculator import LoanCalculationParams, LoanSchedule
+
+
+class CalculateLoanSchedule(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def execute(self, params: LoanCalculationParams) -> LoanSchedule:
+        pass
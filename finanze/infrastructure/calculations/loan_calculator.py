@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import replace
 from datetime import date
 from decimal import ROUND_HALF_UP
+from itertools import pairwise
 
 from application.ports.loan_calculator_port import LoanCalculatorPort
 from dateutil.relativedelta import relativedelta
+from domain.amortization import annuity_payment, balance_after
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import MissingFieldsError
 from domain.global_position import InstallmentFrequency, InterestType
-from domain.loan_calculator import LoanCalculationParams, LoanCalculationResult
+from domain.loan_calculator import (
+    LoanCalculationParams,
+    LoanCalculationResult,
+    LoanInstallment,
+    LoanSchedule,
+)
+from domain.recurrence import Recurrence
 
 
 class LoanCalculator(LoanCalculatorPort):
@@ -19,8 +26,8 @@ class LoanCalculator(LoanCalculatorPort):
     - Rates are annual nominal (0.03 = 3% APR). Period rate = annual / payments_per_year.
     - For VARIABLE and MIXED after the fixed period, annual = interest_rate + euribor_rate.
     - For MIXED during the fixed period, annual = fixed_interest_rate (if provided) or interest_rate.
-    - If principal_outstanding is not provided, it is computed by simulating amortization
-      from the start date using the applicable rates over time.
+    - If principal_outstanding is not provided, it is computed by amortizing from the
+      start date, in closed form within each period where the applicable rate is constant.
     - Current installment payment is computed using remaining term and current annual rate.
     - Installment interests = current outstanding * current period rate.
     """
@@ -30,8 +37,7 @@ class LoanCalculator(LoanCalculatorPort):
 
         self._validate(params)
 
-        # Normalize params to avoid accidental mutation from callers
-        p = replace(params)
+        p = params
 
         current_annual_rate = self._current_annual_rate(p, today)
         ppy = p.installment_frequency.payments_per_year
@@ -266,28 +272,7 @@ class LoanCalculator(LoanCalculatorPort):
             return 0
         if freq in self._MONTH_ALIGNED:
             return self._full_months_between(d1, d2) * freq.payments_per_year // 12
-        step = self._period_step(freq)
-        count = 0
-        cursor = d1
-        while cursor < d2:
-            cursor = cursor + step
-            if cursor <= d2:
-                count += 1
-        return count
-
-    def _period_step(self, freq: InstallmentFrequency) -> relativedelta:
-        """Return the relativedelta step corresponding to one payment period."""
-        mapping = {
-            InstallmentFrequency.WEEKLY: relativedelta(weeks=1),
-            InstallmentFrequency.BIWEEKLY: relativedelta(weeks=2),
-            InstallmentFrequency.SEMIMONTHLY: relativedelta(days=15),
-            InstallmentFrequency.MONTHLY: relativedelta(months=1),
-            InstallmentFrequency.BIMONTHLY: relativedelta(months=2),
-            InstallmentFrequency.QUARTERLY: relativedelta(months=3),
-            InstallmentFrequency.SEMIANNUAL: relativedelta(months=6),
-            InstallmentFrequency.YEARLY: relativedelta(years=1),
-        }
-        return mapping.get(freq, relativedelta(months=1))
+        return Recurrence.for_installment(d1, freq).count(1, d2)
 
     def _compute_outstanding_from_start(
         self, p: LoanCalculationParams, today: date
@@ -299,40 +284,114 @@ class LoanCalculator(LoanCalculatorPort):
             return principal
 
         ppy = p.installment_frequency.payments_per_year
-        step = self._period_step(p.installment_frequency)
+        recurrence = Recurrence.for_installment(p.start, p.installment_frequency)
 
-        # Simulate period-by-period amortization from start up to last payment before today.
+        # Installments due before today, balance is computed in closed form
+        # within each constant rate segment
+        paid = recurrence.index_from(min(today, p.end))
         outstanding = principal
-        current_date = p.start
-
-        while current_date < today and current_date < p.end:
-            annual_rate = self._annual_rate_at(p, current_date)
+        for first, stop, annual_rate in self._rate_segments(p, recurrence, 0, paid):
             period_rate = self._to_period_rate(annual_rate, ppy)
-
-            # Remaining periods counting from the next due date
-            remaining_periods = max(
-                1, self._count_periods(p.installment_frequency, current_date, p.end)
+            remaining_periods = self._remaining_periods(p, recurrence, first)
+            payment = self._round_cents(
+                annuity_payment(outstanding, period_rate, remaining_periods)
             )
+            outstanding = balance_after(outstanding, period_rate, payment, stop - first)
+            if outstanding == Dezimal(0):
+                break
 
-            # Payment for this period under current regime
-            if period_rate == Dezimal(0):
-                payment = self._round_cents(outstanding / remaining_periods)
-                interest = Dezimal(0)
-            else:
-                denom = Dezimal(1) - (Dezimal(1) + period_rate) ** (-remaining_periods)
-                payment = self._round_cents(outstanding * period_rate / denom)
-                interest = self._round_cents(outstanding * period_rate)
+        return self._round_cents(outstanding)
+
+    def _rate_segments(
+        self, p: LoanCalculationParams, recurrence: Recurrence, first: int, stop: int
+    ) -> list[tuple[int, int, Dezimal]]:
+        """Split installment indexes [first, stop) into constant annual rate ranges."""
+        bounds = [first, stop]
+        if p.interest_type == InterestType.MIXED:
+            assert p.fixed_years is not None
+            fixed_end = p.start + relativedelta(years=p.fixed_years)
+            bounds.insert(1, min(stop, max(first, recurrence.index_from(fixed_end))))
+        return [
+            (a, b, self._annual_rate_at(p, recurrence.nth(a)))
+            for a, b in pairwise(bounds)
+            if a < b
+        ]
+
+    def _remaining_periods(
+        self, p: LoanCalculationParams, recurrence: Recurrence, index: int
+    ) -> int:
+        """Installments left counting from the one at the given index."""
+        return max(
+            1,
+            self._count_periods(p.installment_frequency, recurrence.nth(index), p.end),
+        )
 
-            principal_paid = payment - interest
-            outstanding = max(Dezimal(0), outstanding - principal_paid)
+    async def schedule(self, params: LoanCalculationParams) -> LoanSchedule:
+        """
+        Full installment schedule until end. It starts at the loan start when
+        loan_amount is known, otherwise at the next installment from the
+        current principal_outstanding.
+        """
+        today = date.today()
 
-            # step forward by one period
-            current_date = current_date + step
+        self._validate(params)
+
+        p = params
+        ppy = p.installment_frequency.payments_per_year
+        recurrence = Recurrence.for_installment(p.start, p.installment_frequency)
+        total = max(1, self._count_periods(p.installment_frequency, p.start, p.end))
+
+        if p.loan_amount is not None:
+            first = 0
+            outstanding = self._round_cents(p.loan_amount)
+        else:
+            first = 0 if today <= p.start else recurrence.index_from(min(today, p.end))
+            first = min(first, total - 1)
+            outstanding = self._round_cents(p.principal_outstanding)
+
+        installments: list[LoanInstallment] = []
+        total_payment = Dezimal(0)
+        total_interests = Dezimal(0)
+        for seg_first, seg_stop, annual_rate in self._rate_segments(
+            p, recurrence, first, total
+        ):
+            period_rate = self._to_period_rate(annual_rate, ppy)
+            remaining_periods = self._remaining_periods(p, recurrence, seg_first)
+            segment_payment = self._round_cents(
+                annuity_payment(outstanding, period_rate, remaining_periods)
+            )
+
+            for index in range(seg_first, seg_stop):
+                interests = self._round_cents(outstanding * period_rate)
+                payment = segment_payment
+                if index == total - 1 or payment - interests >= outstanding:
+                    payment = outstanding + interests
+                principal = payment - interests
+                outstanding = outstanding - principal
+
+                installments.append(
+                    LoanInstallment(
+                        date=recurrence.nth(index),
+                        payment=payment,
+                        interests=interests,
+                        principal=principal,
+                        principal_outstanding=outstanding,
+                    )
+                )
+                total_payment += payment
+                total_interests += interests
+
+                if outstanding == Dezimal(0):
+                    break
 
             if outstanding == Dezimal(0):
                 break
 
-        return outstanding
+        return LoanSchedule(
+            installments=installments,
+            total_payment=total_payment,
+            total_interests=total_interests,
+        )
 
     def _annual_rate_at(self, p: LoanCalculationParams, when: date) -> Dezimal:
         base = p.interest_rate
@@ -349,30 +408,20 @@ class LoanCalculator(LoanCalculatorPort):
 
     # Finance helpers
     def _amortizing_payment(self, P: Dezimal, r: Dezimal, n: int) -> Dezimal:
-        if n <= 0:
-            return P
-        if r == Dezimal(0):
-            return P / n
-        denom = Dezimal(1) - (Dezimal(1) + r) ** (-n)
-        return P * r / denom
+        return annuity_payment(P, r, n)
 
     def _remaining_balance(
         self, P: Dezimal, r: Dezimal, n: int, k: int, A: Dezimal | None = None
     ) -> Dezimal:
         """Remaining balance after k payments on an amortizing loan.
         If A not provided, compute it from P, r, n.
-        Formula: RB_k = P*(1+r)^k - A * ((1+r)^k - 1)/r
         """
         if k <= 0:
             return P
         if k >= n:
             return Dezimal(0)
-        if r == Dezimal(0):
-            A = A or (P / n)
-            return max(Dezimal(0), P - A * k)
-        A = A or self._amortizing_payment(P, r, n)
-        factor = (Dezimal(1) + r) ** k
-        return max(Dezimal(0), P * factor - A * ((factor - Dezimal(1)) / r))
+        A = A or annuity_payment(P, r, n)
+        return balance_after(P, r, A, k)
 
     def _round_cents(self, value: Dezimal) -> Dezimal:
         # Use Decimal quantize via underlying decimal to 2 places, ROUND_HALF_UP
@@ -387,21 +436,16 @@ class LoanCalculator(LoanCalculatorPort):
         if today <= p.start:
             return p.start
 
-        # Walk periods until we reach >= today (limit to end date)
-        step = self._period_step(p.installment_frequency)
-        candidate = p.start
-        while candidate < today and candidate < p.end:
-            candidate = candidate + step
-
-        return min(candidate, p.end)
+        return self.next_installment_date(
+            p.start, p.end, p.installment_frequency, today
+        )
 
     def next_installment_date(
         self, start: date, end: date, frequency: InstallmentFrequency, today: date
     ) -> date:
         if today <= start:
             return start
-        step = self._period_step(frequency)
-        candidate = start
-        while candidate < today and candidate < end:
-            candidate = candidate + step
+        # First installment on or after today, the end date caps the schedule
+        recurrence = Recurrence.for_installment(start, frequency)
+        candidate = recurrence.nth(recurrence.index_from(min(today, end)))
         return min(candidate, end)
@@ -0,0 +1,108 @@
+import numpy as np
+
+from application.ports.forecast_simulator_port import ForecastSimulatorPort
+from domain.dezimal import Dezimal
+from domain.forecast import (
+    MonteCarloInputs,
+    MonteCarloPoint,
+    MonteCarloResult,
+    ReturnAssumption,
+)
+
+
+class MonteCarloSimulator(ForecastSimulatorPort):
+    """
+    Vectorised Monte Carlo forecast, every path of an asset is advanced at once
+    as float64 arrays of shape (paths, months).
+
+    - Monthly growth is log-normal with expectation 1 + mean / 12, matching the
+      deterministic forecast monthly revaluation, and volatility / sqrt(12).
+    - Month contributions are added before that month revaluation.
+    - Results are converted back to Dezimal only for the requested percentiles.
+    """
+
+    def simulate(self, inputs: MonteCarloInputs) -> MonteCarloResult:
+        months = len(inputs.dates)
+        paths = inputs.paths
+        rng = np.random.default_rng(inputs.seed)
+
+        totals: dict[str, np.ndarray] = {}
+        for currency, base in inputs.base.items():
+            totals[currency] = np.broadcast_to(
+                self._to_array(base), (paths, months)
+            ).copy()
+
+        growth_by_class: dict[str, np.ndarray] = {}
+        for asset in inputs.assets:
+            growth = growth_by_class.get(asset.asset_class)
+            if growth is None:
+                growth = self._cumulative_growth(rng, asset.returns, paths, months)
+                growth_by_class[asset.asset_class] = growth
+
+            values = self._asset_values(
+                float(asset.initial), self._to_array(asset.contributions), growth
+            )
+            if asset.currency in totals:
+                totals[asset.currency] += values
+            else:
+                totals[asset.currency] = values
+
+        bands = {
+            currency: np.percentile(values, inputs.percentiles, axis=0)
+            for currency, values in totals.items()
+        }
+        points = [
+            MonteCarloPoint(
+                date=point_date,
+                net_worth={
+                    currency: [_to_dezimal(v) for v in band[:, month]]
+                    for currency, band in bands.items()
+                },
+            )
+            for month, point_date in enumerate(inputs.dates)
+        ]
+        return MonteCarloResult(
+            paths=paths, percentiles=list(inputs.percentiles), points=points
+        )
+
+    @staticmethod
+    def _cumulative_growth(
+        rng: np.random.Generator, returns: ReturnAssumption, paths: int, months: int
+    ) -> np.ndarray:
+        """Growth factor from today to each month end for every path."""
+        sigma = float(returns.volatility) / np.sqrt(12)
+        mu = np.log1p(float(returns.mean) / 12) - sigma**2 / 2
+        if sigma == 0:
+            return np.broadcast_to(
+                np.exp(mu * np.arange(1, months + 1)), (paths, months)
+            )
+        log_returns = rng.standard_normal((paths, months))
+        log_returns *= sigma
+        log_returns += mu
+        np.cumsum(log_returns, axis=1, out=log_returns)
+        return np.exp(log_returns, out=log_returns)
+
+    @staticmethod
+    def _asset_values(
+        initial: float, contributions: np.ndarray, growth: np.ndarray
+    ) -> np.ndarray:
+        """
+        Closed form of v_m = (v_{m-1} + c_m) * g_m, with G_m the cumulative
+        growth: v_m = G_m * (v_0 + sum_{j<=m} c_j / G_{j-1}).
+        """
+        if not contributions.any():
+            return growth * initial
+        previous = np.empty_like(growth)
+        previous[:, 0] = 1
+        previous[:, 1:] = growth[:, :-1]
+        invested = np.cumsum(contributions / previous, axis=1)
+        invested += initial
+        return growth * invested
+
+    @staticmethod
+    def _to_array(values: list[Dezimal]) -> np.ndarray:
+        return np.fromiter((float(v) for v in values), dtype=np.float64)
+
+
+def _to_dezimal(value: float) -> Dezimal:
+    return Dezimal(f"{value:.2f}")
@@ -1,10 +1,11 @@
+import asyncio
 import logging
 import os
 from datetime import datetime
 from uuid import UUID
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 
 from application.ports.backup_repository import BackupRepository
 from domain.backup import (
@@ -23,16 +24,39 @@ from infrastructure.client.cloud.backup.file_transfer_strategy import (
     FileTransferStrategy,
 )
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class BackupClient(BackupRepository):
     BASE_URL = os.getenv("CLOUD_URL") or "https://api.finanze.me"
     TIMEOUT = 60
+    MAX_CONCURRENT_TRANSFERS = int(os.getenv("BACKUP_MAX_CONCURRENT_TRANSFERS") or 2)
 
-    def __init__(self, file_transfer_strategy: FileTransferStrategy):
+    def __init__(
+        self,
+        file_transfer_strategy: FileTransferStrategy,
+        max_concurrent_transfers: int = MAX_CONCURRENT_TRANSFERS,
+    ):
         self._log = logging.getLogger(__name__)
         self._session = get_http_session()
         self._file_transfer_strategy = file_transfer_strategy
+        self._max_concurrent_transfers = max(1, max_concurrent_transfers)
+
+    async def _gather_transfers(self, transfers) -> list:
+        """Runs the piece transfers concurrently, raising the first failure once all are done."""
+        semaphore = asyncio.Semaphore(self._max_concurrent_transfers)
+
+        async def limited(transfer):
+            async with semaphore:
+                return await transfer
+
+        results = await asyncio.gather(
+            *(limited(transfer) for transfer in transfers), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return [result for result in results if result is not None]
 
     def _get_auth_headers(self, auth: CloudAuthData) -> dict[str, str]:
         """Get authentication headers from auth data."""
@@ -75,9 +99,8 @@ class BackupClient(BackupRepository):
             response.raise_for_status()
             upload_response = await response.json()
 
-            # Step 2: Upload each piece to the presigned URL
-            uploaded_pieces = []
-            for upload_info in upload_response.get("uploads", []):
+            # Step 2: Upload the pieces to their presigned URLs
+            async def upload_piece(upload_info: dict) -> BackupTransferPiece | None:
                 piece = next(
                     (
                         p
@@ -88,7 +111,7 @@ class BackupClient(BackupRepository):
                 )
                 if not piece:
                     self._log.warning(f"No piece found for type {upload_info['type']}")
-                    continue
+                    return None
 
                 try:
                     await self._file_transfer_strategy.upload(
@@ -104,10 +127,15 @@ class BackupClient(BackupRepository):
                         f"Failed to upload backup piece {piece.type.value}"
                     ) from e
 
-                uploaded_pieces.append(piece)
                 self._log.info(
                     f"Successfully uploaded backup piece: {piece.type.value}"
                 )
+                return piece
+
+            uploaded_pieces = await self._gather_transfers(
+                upload_piece(upload_info)
+                for upload_info in upload_response.get("uploads", [])
+            )
 
             return BackupPieces(pieces=uploaded_pieces)
 
@@ -141,22 +169,22 @@ class BackupClient(BackupRepository):
             response.raise_for_status()
             download_response = await response.json()
 
-            # Step 2: Download each piece from the presigned URL
-            pieces = []
-            for backup_type_str, piece_info in download_response.get(
-                "pieces", {}
-            ).items():
+            # Step 2: Download the pieces from their presigned URLs
+            async def download_piece(
+                backup_type_str: str, piece_info: dict
+            ) -> BackupTransferPiece | None:
                 try:
                     download_url = piece_info.get("url")
                     if not download_url:
                         self._log.warning(
                             f"No URL found for backup type {backup_type_str}"
                         )
-                        continue
+                        return None
 
                     payload = await self._file_transfer_strategy.download(
                         download_url,
                         BackupFileType(piece_info["type"]),
+                        resume_key=piece_info["id"],
                     )
 
                     piece = BackupTransferPiece(
@@ -167,10 +195,10 @@ class BackupClient(BackupRepository):
                         payload=payload,
                         size=len(payload),
                     )
-                    pieces.append(piece)
                     self._log.info(
                         f"Successfully downloaded backup piece: {backup_type_str}"
                     )
+                    return piece
 
                 except Exception as e:
                     self._log.error(f"Error downloading piece {backup_type_str}: {e}")
@@ -178,6 +206,13 @@ class BackupClient(BackupRepository):
                         f"Failed to download backup piece {backup_type_str}"
                     ) from e
 
+            pieces = await self._gather_transfers(
+                download_piece(backup_type_str, piece_info)
+                for backup_type_str, piece_info in download_response.get(
+                    "pieces", {}
+                ).items()
+            )
+
             return BackupPieces(pieces=pieces)
 
         except (httpx.RequestError, TimeoutError) as e:
@@ -187,7 +222,11 @@ class BackupClient(BackupRepository):
             self._log.error(f"Unexpected error downloading backup: {e}")
             raise
 
-    @cached(cache=Cache.MEMORY, ttl=1, key_builder=lambda f, self, request: "info")
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=1,
+        key_builder=lambda f, self, request: "info",
+    )
     async def get_info(self, request: BackupInfoParams) -> BackupsInfo:
         """Get information about available backups in the cloud."""
         try:
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
 
 from domain.backup import BackupFileType
 
@@ -9,12 +11,17 @@ class FileTransferStrategy(ABC):
         self,
         url: str,
         method: str,
-        payload: bytes,
+        payload: bytes | Path,
         headers: dict[str, str],
         backup_type: BackupFileType,
     ) -> None:
         pass
 
     @abstractmethod
-    async def download(self, url: str, backup_type: BackupFileType) -> bytes:
+    async def download(
+        self,
+        url: str,
+        backup_type: BackupFileType,
+        resume_key: Optional[str] = None,
+    ) -> bytes:
         pass
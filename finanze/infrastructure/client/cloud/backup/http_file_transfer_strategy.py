@@ -1,38 +1,84 @@
+import asyncio
+import json
 import logging
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
 
 from domain.backup import BackupFileType
 from domain.exception.exceptions import TooManyRequests
 from infrastructure.client.cloud.backup.file_transfer_strategy import (
     FileTransferStrategy,
 )
-from infrastructure.client.http.http_session import get_http_session
+from infrastructure.client.http.backoff import http_request_with_backoff
+from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.client.http.http_session import HttpSession, get_http_session
+
+_CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class _FileChunks:
+    """Request body streamed from a file, reopened on every retried attempt."""
+
+    def __init__(self, path: Path, chunk_size: int):
+        self._path = path
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self):
+        with open(self._path, "rb") as f:
+            # Reads run off the event loop, a slow disk stalls only this upload
+            while chunk := await asyncio.to_thread(f.read, self._chunk_size):
+                yield chunk
 
 
 class HttpFileTransferStrategy(FileTransferStrategy):
+    """
+    Downloads are split into ranged parts fetched concurrently. Parts are
+    journaled on disk under the resume key, so an interrupted download picks up
+    the missing parts only. Presigned upload URLs take the whole piece in a
+    single request, which is retried as a unit.
+    """
+
     TIMEOUT = 60
+    PART_SIZE = 8 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+    MAX_CONCURRENT_PARTS = 4
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+    RETRIED_STATUSES = (408, 429, 500, 502, 503, 504)
 
-    def __init__(self):
+    def __init__(
+        self,
+        session: Optional[HttpSession] = None,
+        journal_dir: Optional[Path] = None,
+    ):
         self._log = logging.getLogger(__name__)
-        self._session = get_http_session()
+        self._session = session or get_http_session()
+        self._journal_dir = journal_dir or (
+            Path(tempfile.gettempdir()) / "finanze-transfers"
+        )
 
     async def upload(
         self,
         url: str,
         method: str,
-        payload: bytes,
+        payload: bytes | Path,
         headers: dict[str, str],
         backup_type: BackupFileType,
     ) -> None:
         upload_headers = headers.copy()
-        upload_headers["Content-Length"] = str(len(payload))
+        if isinstance(payload, Path):
+            upload_headers["Content-Length"] = str(payload.stat().st_size)
+            data = _FileChunks(payload, self.UPLOAD_CHUNK_SIZE)
+        else:
+            upload_headers["Content-Length"] = str(len(payload))
+            data = payload
         self._log.info(f"Uploading backup piece: {upload_headers}")
 
-        upload_response = await self._session.request(
-            method=method,
-            url=url,
-            data=payload,
-            headers=upload_headers,
-            timeout=self.TIMEOUT,
+        upload_response = await self._request(
+            method, url, data=data, headers=upload_headers
         )
 
         if upload_response.status == 429:
@@ -40,14 +86,131 @@ class HttpFileTransferStrategy(FileTransferStrategy):
 
         upload_response.raise_for_status()
 
-    async def download(self, url: str, backup_type: BackupFileType) -> bytes:
-        payload_response = await self._session.get(
-            url,
-            timeout=self.TIMEOUT,
+    async def download(
+        self,
+        url: str,
+        backup_type: BackupFileType,
+        resume_key: Optional[str] = None,
+    ) -> bytes:
+        if resume_key is None:
+            with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
+                return await self._download_parts(url, Path(tmpdir))
+
+        journal = self._journal_dir / resume_key
+        journal.mkdir(parents=True, exist_ok=True)
+        payload = await self._download_parts(url, journal)
+        shutil.rmtree(journal, ignore_errors=True)
+        return payload
+
+    async def _download_parts(self, url: str, journal: Path) -> bytes:
+        state_file = journal / "state.json"
+        data_file = journal / "data"
+
+        state = None
+        if state_file.is_file() and data_file.is_file():
+            state = json.loads(state_file.read_text())
+            if state.get("part_size") != self.PART_SIZE:
+                state = None
+
+        if state is None:
+            first = await self._fetch_range(url, 0, self.PART_SIZE - 1)
+            if first.status == 416:
+                # Empty pieces have no satisfiable range
+                return b""
+            if first.status != 206:
+                # Ranges not supported, the whole piece came in the response
+                return await first.read()
+
+            total = self._total_size(first)
+            content = await first.read()
+            if total <= self.PART_SIZE:
+                return content
+
+            with open(data_file, "wb") as f:
+                f.truncate(total)
+                f.write(content)
+            state = {"total": total, "part_size": self.PART_SIZE, "done": [0]}
+            self._save_state(state_file, state)
+        else:
+            self._log.info(
+                f"Resuming download with {len(state['done'])} parts already fetched"
+            )
+
+        total = state["total"]
+        done = set(state["done"])
+        pending = [
+            index for index in range(-(-total // self.PART_SIZE)) if index not in done
+        ]
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PARTS)
+        lock = asyncio.Lock()
+
+        async def fetch(index: int):
+            start = index * self.PART_SIZE
+            end = min(start + self.PART_SIZE, total) - 1
+            async with semaphore:
+                response = await self._fetch_range(url, start, end)
+                if response.status != 206:
+                    raise ValueError(
+                        f"Expected a partial response for part {index}, got {response.status}"
+                    )
+                content = await response.read()
+            if len(content) != end - start + 1:
+                raise ValueError(f"Part {index} is incomplete")
+
+            async with lock:
+                with open(data_file, "r+b") as f:
+                    f.seek(start)
+                    f.write(content)
+                done.add(index)
+                state["done"] = sorted(done)
+                self._save_state(state_file, state)
+
+        # Let every part finish so the journal keeps all that could be fetched
+        results = await asyncio.gather(
+            *(fetch(index) for index in pending), return_exceptions=True
         )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return data_file.read_bytes()
 
-        if payload_response.status == 429:
+    async def _fetch_range(self, url: str, start: int, end: int) -> HttpResponse:
+        response = await self._request(
+            "GET", url, headers={"Range": f"bytes={start}-{end}"}
+        )
+
+        if response.status == 429:
             raise TooManyRequests()
 
-        payload_response.raise_for_status()
-        return await payload_response.read()
+        if response.status != 416:
+            response.raise_for_status()
+        return response
+
+    async def _request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        return await http_request_with_backoff(
+            method,
+            url,
+            request_timeout=self.TIMEOUT,
+            session=self._session,
+            max_retries=self.MAX_RETRIES,
+            backoff_factor=self.BACKOFF_FACTOR,
+            retried_statuses=self.RETRIED_STATUSES,
+            log=self._log,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _total_size(response: HttpResponse) -> int:
+        content_range = response.headers.get("content-range", "")
+        match = _CONTENT_RANGE.match(content_range)
+        if match is None:
+            raise ValueError(f"Invalid Content-Range header '{content_range}'")
+        return int(match.group(3))
+
+    @staticmethod
+    def _save_state(state_file: Path, state: dict):
+        tmp = state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state))
+        tmp.replace(state_file)
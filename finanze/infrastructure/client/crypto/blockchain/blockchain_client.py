@@ -3,7 +3,7 @@ from urllib.parse import quote
 from uuid import uuid4
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 
 from domain.crypto import (
     CryptoFetchRequest,
@@ -16,6 +16,7 @@ from domain.dezimal import Dezimal
 from domain.exception.exceptions import AddressNotFound, TooManyRequests
 from infrastructure.client.http.backoff import http_get_with_backoff
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class BlockchainClient:
@@ -75,7 +76,10 @@ class BlockchainClient:
         resp = await self._fetch(url)
         return await resp.json()
 
-    @cached(cache=Cache.MEMORY, ttl=TTL)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=TTL,
+    )
     async def _fetch_address(self, address: str) -> Dezimal:
         url = f"{self.BASE_URL}/q/addressbalance/{address}"
         resp = await self._fetch(url)
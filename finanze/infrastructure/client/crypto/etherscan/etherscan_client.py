@@ -19,6 +19,7 @@ from domain.external_integration import (
 from infrastructure.client.http.backoff import http_get_with_backoff
 from infrastructure.client.http.http_session import get_http_session
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.cache_metrics import cache_metrics
 
 
 class EtherscanClient(ConnectableIntegration):
@@ -31,7 +32,11 @@ class EtherscanClient(ConnectableIntegration):
 
     def __init__(self):
         self._log = logging.getLogger(__name__)
-        self._cache = Cache(Cache.MEMORY, serializer=PickleSerializer())
+        self._cache = Cache(
+            Cache.MEMORY,
+            serializer=PickleSerializer(),
+            plugins=cache_metrics(self, "_cache"),
+        )
         self._session = get_http_session()
 
     async def setup(self, credentials: ExternalIntegrationPayload):
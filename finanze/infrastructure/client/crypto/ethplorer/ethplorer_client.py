@@ -2,7 +2,6 @@ import logging
 from typing import Optional
 
 import httpx
-from aiocache import cached
 
 from application.ports.connectable_integration import ConnectableIntegration
 from domain.exception.exceptions import (
@@ -15,6 +14,7 @@ from domain.external_integration import (
     ExternalIntegrationPayload,
 )
 from infrastructure.client.http.backoff import http_get_with_backoff
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class EthplorerClient(ConnectableIntegration):
@@ -31,7 +31,7 @@ class EthplorerClient(ConnectableIntegration):
         url = f"https://api.ethplorer.io/getLastBlock?apiKey={self._get_api_key(credentials)}"
         await self._fetch(url)
 
-    @cached(
+    @metered_cached(
         ttl=TTL,
         key_builder=lambda f, self, base_url, address, *args, **kwargs: (
             base_url + address
@@ -2,7 +2,7 @@ import logging
 from uuid import uuid4
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 
 from domain.crypto import (
     CryptoFetchRequest,
@@ -14,6 +14,7 @@ from domain.crypto import (
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import TooManyRequests
 from infrastructure.client.http.backoff import http_get_with_backoff
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class SpaceClient:
@@ -46,7 +47,7 @@ class SpaceClient:
 
         return CryptoFetchResults(results=results)
 
-    @cached(
+    @metered_cached(
         cache=Cache.MEMORY,
         ttl=TTL,
         key_builder=lambda f, self, address, fetched_results: (
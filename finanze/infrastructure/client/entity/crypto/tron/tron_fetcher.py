@@ -2,7 +2,7 @@ import logging
 from uuid import uuid4
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 from application.ports.crypto_entity_fetcher import CryptoEntityFetcher
 from domain.crypto import (
     CryptoFetchRequest,
@@ -14,6 +14,7 @@ from domain.crypto import (
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import AddressNotFound, TooManyRequests
 from infrastructure.client.http.backoff import http_get_with_backoff
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class TronFetcher(CryptoEntityFetcher):
@@ -87,7 +88,10 @@ class TronFetcher(CryptoEntityFetcher):
             )
         return tokens
 
-    @cached(cache=Cache.MEMORY, ttl=TTL)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=TTL,
+    )
     async def _fetch_account_info(self, address: str) -> dict:
         url = f"{self.BASE_URL}?address={address}"
         return await self._fetch(url)
@@ -4,10 +4,11 @@ import hmac
 import logging
 import time
 
-from aiocache import Cache, cached
+from aiocache import Cache
 
 from domain.entity_login import EntityLoginResult, LoginResultCode
 from infrastructure.client.http.http_session import HttpSession, get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 _MAX_RETRIES = 3
 _DEFAULT_RETRY_AFTER = 5
@@ -116,7 +117,10 @@ class BinanceClient:
     async def get_exchange_info(self) -> dict:
         return await self._get(f"{self.SPOT_BASE_URL}/api/v3/exchangeInfo")
 
-    @cached(cache=Cache.MEMORY, ttl=30)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=30,
+    )
     async def get_ticker_prices(self) -> list[dict]:
         return await self._get(f"{self.SPOT_BASE_URL}/api/v3/ticker/price")
 
@@ -1,6 +1,7 @@
 import logging
 import time
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -22,7 +23,7 @@ from domain.global_position import (
     ProductType,
 )
 from domain.native_entities import BINANCE
-from domain.transactions import CryptoCurrencyTx, Transactions, TxType
+from domain.transactions import CryptoCurrencyTx, Transactions, TxType, TxWatermark
 from infrastructure.client.entity.exchange.binance.binance_client import BinanceClient
 
 FIAT_CURRENCIES = {
@@ -214,7 +215,10 @@ class BinanceFetcher(FinancialEntityFetcher):
         return None, None
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         exchange_info = await self._client.get_exchange_info()
         symbol_map = self._build_symbol_map(exchange_info)
@@ -1,6 +1,7 @@
 import logging
 from datetime import date, datetime
 from hashlib import sha1
+from typing import Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -33,6 +34,7 @@ from domain.transactions import (
     StockTx,
     Transactions,
     TxType,
+    TxWatermark,
 )
 from infrastructure.client.entity.financial.degiro.degiro_client import DegiroClient
 
@@ -132,7 +134,10 @@ class DegiroFetcher(FinancialEntityFetcher):
         return GlobalPosition(id=uuid4(), entity=DEGIRO, products=products)
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         to_date = date.today()
         from_date = to_date.replace(year=to_date.year - 5, day=min(to_date.day, 28))
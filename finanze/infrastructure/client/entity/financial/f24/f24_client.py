@@ -4,12 +4,12 @@ from datetime import datetime, date
 from typing import Optional
 
 import tzlocal
-from aiocache import cached
 from requests_toolbelt import MultipartEncoder
 
 from domain.entity_login import EntityLoginResult, LoginResultCode
 from infrastructure.client.http.http_response import HttpResponse
 from infrastructure.client.http.http_session import new_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -214,7 +214,7 @@ class F24APIClient:
             "/api?cmd=switchToConnectedUser", data=data, headers=headers
         )
 
-    @cached(
+    @metered_cached(
         ttl=20,
         key_builder=lambda f, self: "f24_connected_users_assets",
     )
@@ -29,6 +29,7 @@ from domain.transactions import (
     StockTx,
     Transactions,
     TxType,
+    TxWatermark,
 )
 from infrastructure.client.entity.financial.f24.f24_client import F24APIClient
 
@@ -260,7 +261,10 @@ class F24Fetcher(FinancialEntityFetcher):
         return GlobalPosition(id=uuid4(), entity=F24, products=products)
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         account_txs = []
         savings_entry = self._users.get("savings", {})
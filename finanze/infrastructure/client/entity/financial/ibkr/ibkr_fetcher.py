@@ -24,7 +24,7 @@ from domain.global_position import (
     StockInvestments,
 )
 from domain.native_entities import IBKR
-from domain.transactions import AccountTx, StockTx, Transactions, TxType
+from domain.transactions import AccountTx, StockTx, Transactions, TxType, TxWatermark
 from infrastructure.client.entity.financial.ibkr.ibkr_client import IBKRClient
 
 INITIAL_FETCH_YEARS = 5
@@ -139,7 +139,10 @@ class IBKRFetcher(FinancialEntityFetcher):
         return stocks
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         to_date = date.today()
         all_isin_map: dict[str, str] = {}
@@ -1,9 +1,10 @@
 import logging
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from domain.entity_login import EntityLoginResult, LoginResultCode
 from infrastructure.client.http.http_session import get_http_session
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class IndexaCapitalClient:
@@ -46,7 +47,10 @@ class IndexaCapitalClient:
                 message=f"Got unexpected response code {response.status}",
             )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_user_info(self) -> dict:
         return await self._get_request("/users/me")
 
@@ -1,6 +1,7 @@
 import logging
 import re
 from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 
 from dateutil.tz import tzlocal
@@ -25,7 +26,13 @@ from domain.global_position import (
 )
 from domain.instrument_issuer import resolve_issuer
 from domain.native_entities import INDEXA_CAPITAL
-from domain.transactions import FundPortfolioTx, FundTx, Transactions, TxType
+from domain.transactions import (
+    FundPortfolioTx,
+    FundTx,
+    Transactions,
+    TxType,
+    TxWatermark,
+)
 from infrastructure.client.entity.financial.indexa_capital.indexa_capital_client import (
     IndexaCapitalClient,
 )
@@ -223,7 +230,10 @@ class IndexaCapitalFetcher(FinancialEntityFetcher):
         return None
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         user_info = await self._client.get_user_info()
         investment_txs = await self._fetch_investment_txs(registered_txs, user_info)
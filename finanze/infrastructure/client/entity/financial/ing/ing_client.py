@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta
 from typing import Optional
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import (
@@ -14,6 +14,7 @@ from domain.entity_login import (
 )
 from domain.native_entity import EntityCredentials
 from infrastructure.client.http.http_session import new_impersonated_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 SESSION_LIFETIME = 4 * 60  # 4 minutes
 
@@ -147,11 +148,11 @@ class INGAPIClient:
     async def get_user(self) -> dict:
         return await self._get_request("/client", api=False)
 
-    @cached(cache=Cache.MEMORY, ttl=30)
+    @metered_cached(cache=Cache.MEMORY, ttl=30)
     async def get_position(self) -> dict:
         return await self._get_request("/position-keeping")
 
-    @cached(cache=Cache.MEMORY, ttl=30)
+    @metered_cached(cache=Cache.MEMORY, ttl=30)
     async def get_orders(
         self,
         product_id: str,
@@ -180,14 +181,17 @@ class INGAPIClient:
             api=False,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_broker_order(self, market_code: str, order_id: str) -> dict:
         return await self._get_request(
             f"/broker/order/history/detail?marketCod={market_code}&orderId={order_id}",
             api=False,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(cache=Cache.MEMORY, ttl=120)
     async def get_movements(
         self,
         product_id: str,
@@ -208,41 +212,62 @@ class INGAPIClient:
             api=False,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_broker_portfolio(self, product_id: str) -> dict:
         return await self._get_request(f"/products/{product_id}/portfolio", api=False)
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_broker_financial_events(self, product_id: str) -> dict:
         return await self._get_request(
             f"/products/{product_id}/financialEvents", api=False
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def get_investment_catalog_products(self) -> dict:
         return await self._get_request(
             "/investment-product-offering-portfolio/v1/catalog-products?size=1000"
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def get_investment_product_details(self, product_code: str) -> dict:
         return await self._get_request(
             f"/investment-product-offering-portfolio/v1/catalog-products/{product_code}"
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def get_investment_product_details_v2(self, product_code: str) -> dict:
         return await self._get_request(
             f"/investment-product-offering-portfolio/v2/products/{product_code}"
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def get_fund_documents(self, product_subtype: str, product_type: str) -> dict:
         return await self._get_request(
             f"/investment/doc/{product_type}/legal/{product_subtype}", api=False
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def get_customer_investment_reporting(
         self, family: str, start_date: date, end_date: date
     ) -> dict:
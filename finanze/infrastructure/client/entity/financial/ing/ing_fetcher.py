@@ -36,7 +36,7 @@ from domain.global_position import (
 )
 from domain.instrument_issuer import resolve_issuer
 from domain.native_entities import ING
-from domain.transactions import FundTx, StockTx, Transactions, TxType
+from domain.transactions import FundTx, StockTx, Transactions, TxType, TxWatermark
 from infrastructure.client.entity.financial.ing.ing_client import INGAPIClient
 
 CONTRIBUTION_FREQUENCY = {
@@ -411,7 +411,10 @@ class INGFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         position = await self._client.get_position()
         products = position.get("products", [])
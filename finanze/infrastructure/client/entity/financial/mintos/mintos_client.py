@@ -3,11 +3,12 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import EntityLoginResult, LoginResultCode
 from infrastructure.client.http.http_session import new_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 def _is_selenium_available() -> bool:
@@ -93,28 +94,40 @@ class MintosAPIClient:
 
         return await login(self._log, self.complete_login, username, password)
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(cache=Cache.MEMORY, ttl=120)
     async def get_user(self) -> dict:
         return await self._get_request("/en/webapp-api/user")
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_overview(self, wallet_currency_id) -> dict:
         return await self._get_request(
             f"/marketplace-api/v1/user/overview/currency/{wallet_currency_id}"
         )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_net_annual_returns(self, wallet_currency_id) -> dict:
         return await self._get_request(
             f"/marketplace-api/v1/accounts/{wallet_currency_id}/net-annual-return"
         )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_portfolio(self, wallet_currency_id) -> dict:
         return await self._get_request(
             f"/marketplace-api/v1/user/overview/currency/{wallet_currency_id}/portfolio-data"
         )
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_smart_cash_fund(self) -> dict:
         return await self._get_request("/msc-api/v1/funds/current")
@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import uuid4
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
 
@@ -19,6 +19,7 @@ from domain.entity_login import (
 from domain.public_keychain import PublicKeychain
 from infrastructure.client.http.http_response import HttpResponse
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 GET_DATE_FORMAT = "%Y%m%d"
 DATE_FORMAT = "%Y-%m-%d"
@@ -274,7 +275,10 @@ class MyInvestorAPIV2Client:
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_cash_accounts(self):
         return (await self._get_request("/cperf-server/api/v2/cash-accounts/self"))[
             "payload"
@@ -328,7 +332,10 @@ class MyInvestorAPIV2Client:
 
         return (await self._get_request(path))["payload"]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_security_accounts(self):
         return (
             await self._get_request(
@@ -347,7 +354,10 @@ class MyInvestorAPIV2Client:
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=30)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=30,
+    )
     async def get_security_account_details(self, security_account_id: str):
         return (
             await self._get_request(
@@ -422,7 +432,10 @@ class MyInvestorAPIV2Client:
 
         return (await self._get_request(path))["payload"]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=60)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=60,
+    )
     async def get_fund_order_details(self, securities_account_id: str, order_id: str):
         return (
             await self._get_request(
@@ -440,19 +453,28 @@ class MyInvestorAPIV2Client:
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=3600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=3600,
+    )
     async def get_stock_details(self, stock_id: str):
         return (await self._get_request(f"/broker/v2/stock-etfs/{stock_id}/extended"))[
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_credit_accounts(self):
         return (await self._get_request("/loan/api/v1/credit-accounts/self"))[
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=21600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=21600,
+    )
     async def is_portfolio_pledged(self, security_account_id: str):
         return (
             await self._get_request(
@@ -460,7 +482,10 @@ class MyInvestorAPIV2Client:
             )
         )["payload"]["data"]["isPledged"]
 
-    @cached(cache=Cache.MEMORY, ttl=21600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=21600,
+    )
     async def is_fund_pledged(self, security_account_id: str, fund_isin: str):
         return (
             await self._get_request(
@@ -468,13 +493,19 @@ class MyInvestorAPIV2Client:
             )
         )["payload"]["data"]["isPledged"]
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def get_fund_details(self, isin: str):
         return (await self._get_request(f"/cperf-server/api/v2/funds/{isin}"))[
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=21600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=21600,
+    )
     async def get_fund_added_values(self, security_account_id: str, fund_isin: str):
         return (
             await self._get_request(
@@ -482,13 +513,19 @@ class MyInvestorAPIV2Client:
             )
         )["payload"]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=21600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=21600,
+    )
     async def get_pension_accounts(self):
         return (await self._get_request("/cperf-server/api/v2/pension-accounts/self"))[
             "payload"
         ]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=21600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=21600,
+    )
     async def get_pension_account_details(self, pension_account_id: str):
         return (
             await self._get_request(
@@ -531,7 +568,10 @@ class MyInvestorAPIV2Client:
 
         return (await self._get_request(path))["payload"]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=60)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=60,
+    )
     async def get_pension_plan_order_details(
         self, pension_account_id: str, order_id: str
     ):
@@ -541,7 +581,10 @@ class MyInvestorAPIV2Client:
             )
         )["payload"]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=21600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=21600,
+    )
     async def get_pension_fund_details(self, dgs_code: str):
         return (
             await self._get_request(f"/cperf-server/api/v2/pension-plans/{dgs_code}")
@@ -54,6 +54,8 @@ from domain.transactions import (
     StockTx,
     Transactions,
     TxType,
+    TxWatermark,
+    oldest_watermark_day,
 )
 from infrastructure.client.entity.financial.myinvestor.v2.myinvestor_client import (
     MyInvestorAPIV2Client,
@@ -70,6 +72,15 @@ def _parse_datetime(value: str) -> datetime:
         return datetime.strptime(value, ISO_DATE_TIME_FORMAT)
 
 
+def _min_date(
+    floor: date,
+    since: Optional[dict[ProductType, TxWatermark]],
+    product_types: list[ProductType],
+) -> date:
+    watermark_day = oldest_watermark_day(since, product_types)
+    return max(floor, watermark_day) if watermark_day else floor
+
+
 FUND_INVESTMENT_TXS = [
     "INVESTMENT_FUNDS_SUBSCRIPTION",
     "INVESTMENT_FUNDS_SUBSCRIPTION_SF",
@@ -218,7 +229,10 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
         return await self.fetch_auto_contributions()
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         accounts = await self._get_active_owned_accounts()
 
@@ -243,11 +257,26 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
                 await self._get_related_security_account(account_id)
             )["accountId"]
             investment_txs += await self._get_investment_txs(
-                registered_txs, related_security_account_id, creation_date
+                registered_txs,
+                related_security_account_id,
+                _min_date(creation_date, since, [ProductType.FUND]),
+                _min_date(creation_date, since, [ProductType.STOCK_ETF]),
             )
 
+            # Deposits, portfolio and interest txs share the account movements
             account_related_txs = await self._classify_account_txs(
-                account, registered_txs, related_security_account_id, creation_date
+                account,
+                registered_txs,
+                related_security_account_id,
+                _min_date(
+                    creation_date,
+                    since,
+                    [
+                        ProductType.DEPOSIT,
+                        ProductType.FUND_PORTFOLIO,
+                        ProductType.ACCOUNT,
+                    ],
+                ),
             )
             investment_txs += account_related_txs["deposit"]
             investment_txs += account_related_txs["portfolio"]
@@ -264,7 +293,9 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
 
             try:
                 pension_fund_txs += await self._fetch_pension_fund_txs(
-                    pension_account_id, registered_txs, min_creation_date
+                    pension_account_id,
+                    registered_txs,
+                    _min_date(min_creation_date, since, [ProductType.FUND]),
                 )
             except Exception as e:
                 self._log.exception(f"Error getting pension fund txs: {e}")
@@ -274,20 +305,24 @@ class MyInvestorFetcherV2(FinancialEntityFetcher):
         return Transactions(investment=investment_txs, account=account_txs)
 
     async def _get_investment_txs(
-        self, registered_txs, related_security_account_id, min_date: date
+        self,
+        registered_txs,
+        related_security_account_id,
+        fund_min_date: date,
+        stock_min_date: date,
     ):
         fund_txs, stock_txs = [], []
 
         try:
             fund_txs = await self.fetch_fund_txs(
-                related_security_account_id, registered_txs, min_date
+                related_security_account_id, registered_txs, fund_min_date
             )
         except Exception as e:
             self._log.exception(f"Error getting fund txs: {e}")
 
         try:
             stock_txs = await self.fetch_stock_txs(
-                related_security_account_id, registered_txs, min_date
+                related_security_account_id, registered_txs, stock_min_date
             )
         except Exception as e:
             self._log.exception(f"Error getting stock txs: {e}")
@@ -5,7 +5,7 @@ from typing import Optional
 
 import httpx
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import (
@@ -17,6 +17,7 @@ from domain.entity_login import (
 from domain.public_keychain import PublicKeychain
 from infrastructure.client.http.http_session import get_http_session
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 EXPIRATION_DATETIME_REGEX = r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.?\d{0,6})\d*(.*)$"
 
@@ -167,15 +168,18 @@ class SegoAPIClient:
     def _inject_session(self, session: EntitySession):
         self._headers["Authorization"] = "Bearer " + session.payload["token"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(cache=Cache.MEMORY, ttl=120)
     async def get_user(self):
         return await self._get_request("/core/v1/InformacionBasica")
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(cache=Cache.MEMORY, ttl=120)
     async def get_wallet(self):
         return await self._get_request("/core/v1/wallet")
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_investments(self, states: set[str] = frozenset([])):
         states = list(states)
 
@@ -193,11 +197,17 @@ class SegoAPIClient:
             await self._post_request("/factoring/v1/Inversiones/Filter", body=request)
         )["list"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_pending_investments(self):
         return await self._get_request("/factoring/v1/Inversiones/Pendientes")
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_movements(self, page: int = 1, limit: int = 100):
         if limit > 100:
             raise ValueError("Limit cannot be greater than 100")
@@ -20,7 +20,7 @@ from domain.global_position import (
     ProductType,
 )
 from domain.native_entities import SEGO
-from domain.transactions import FactoringTx, Transactions, TxType
+from domain.transactions import FactoringTx, Transactions, TxType, TxWatermark
 from infrastructure.client.entity.financial.sego.sego_client import SegoAPIClient
 
 ACTIVE_SEGO_STATES = ["disputa", "gestionando-cobro", "no-llego-fecha-cobro"]
@@ -151,7 +151,10 @@ class SegoFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         factoring_txs = await self.fetch_factoring_txs(registered_txs)
 
@@ -0,0 +1,35 @@
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+
+class TRDetailCache:
+    """
+    Resolved timelineDetailV2 payloads by event id, kept in memory for the
+    session so settled events are not requested again on the next timeline
+    fetch. Least recently used entries are dropped past max_entries.
+    """
+
+    MAX_ENTRIES = 5000
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._details: OrderedDict[str, dict] = OrderedDict()
+
+    def get(self, event_id: str) -> Optional[dict]:
+        detail = self._details.get(event_id)
+        if detail is not None:
+            self._details.move_to_end(event_id)
+        return detail
+
+    def put(self, event_id: str, detail: dict):
+        self._details[event_id] = detail
+        self._details.move_to_end(event_id)
+        while len(self._details) > self._max_entries:
+            self._details.popitem(last=False)
+
+    def discard(self, event_ids: Iterable[str]):
+        for event_id in event_ids:
+            self._details.pop(event_id, None)
+
+    def __len__(self) -> int:
+        return len(self._details)
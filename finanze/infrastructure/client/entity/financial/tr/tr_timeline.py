@@ -21,6 +21,7 @@
 
 
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Optional
 import json
@@ -29,6 +30,7 @@ from infrastructure.client.entity.financial.tr.api import (
     TradeRepublicApi,
     TradeRepublicError,
 )
+from infrastructure.client.entity.financial.tr.tr_detail_cache import TRDetailCache
 
 
 class TRTimeline:
@@ -38,12 +40,19 @@ class TRTimeline:
         "timelineDetailV2",
     ]
 
+    # Detail subscriptions kept open at once, each one is closed as it resolves
+    DETAIL_WINDOW = 16
+    # Details of events in these states no longer change and can be cached
+    SETTLED_STATUSES = ("EXECUTED", "CANCELED")
+
     def __init__(
         self,
         tr: TradeRepublicApi,
         since: Optional[datetime] = None,
         already_registered_ids: set[str] = None,
         requested_data: list = TIMELINE_DATA_TYPES,
+        detail_cache: Optional[TRDetailCache] = None,
+        detail_window: int = DETAIL_WINDOW,
     ):
         self._tr = tr
         self._since = since
@@ -51,11 +60,18 @@ class TRTimeline:
             already_registered_ids if already_registered_ids else set()
         )
         self._requested_data = requested_data
+        self._detail_cache = detail_cache
+        if detail_cache is not None:
+            # Registered transactions are never requested again
+            detail_cache.discard(self._already_registered_ids)
+        self._detail_window = max(1, detail_window)
 
         self._log = logging.getLogger(__name__)
 
         self._received_detail = 0
         self._requested_detail = 0
+        self._pending_details: deque[str] = deque()
+        self._details_in_flight: dict[str, str] = {}
 
         self._num_timelines = 0
         self._timeline_events = {}
@@ -74,12 +90,15 @@ class TRTimeline:
 
         while True:
             try:
-                _, subscription, response = await self._tr.recv()
+                subscription_id, subscription, response = await self._tr.recv()
             except TradeRepublicError as e:
                 self._log.error(
                     f'Error response for subscription "{e.subscription}". Re-subscribing...'
                 )
-                await self._tr.subscribe(e.subscription)
+                new_subscription_id = await self._tr.subscribe(e.subscription)
+                event_id = self._details_in_flight.pop(e.subscription_id, None)
+                if event_id is not None:
+                    self._details_in_flight[new_subscription_id] = event_id
                 continue
 
             if (
@@ -96,14 +115,18 @@ class TRTimeline:
                 "timelineActivityLog" in self._requested_data
                 and subscription.get("type", "") == "timelineActivityLog"
             ):
-                await self._process_and_request_next_timeline_activity_log(response)
+                result = await self._process_and_request_next_timeline_activity_log(
+                    response
+                )
+                if result is not None:
+                    return result
 
             elif (
                 "timelineDetailV2" in self._requested_data
                 and subscription.get("type", "") == "timelineDetailV2"
             ):
-                result = await self._process_timeline_detail(response)
-                if result:
+                result = await self._process_timeline_detail(subscription_id, response)
+                if result is not None:
                     return result
             else:
                 self._log.warning(
@@ -153,7 +176,7 @@ class TRTimeline:
                 await self._request_timeline_activity_log()
             else:
                 if self._timeline_events:
-                    await self._request_all_timeline_details()
+                    return await self._request_all_timeline_details()
                 else:
                     return []
         return None
@@ -189,9 +212,10 @@ class TRTimeline:
             await self._tr.timeline_activity_log(after)
         else:
             self._log.info("Received last relevant timeline activity log")
-            await self._request_all_timeline_details()
+            return await self._request_all_timeline_details()
+        return None
 
-    async def _request_all_timeline_details(self):
+    async def _request_all_timeline_details(self) -> Optional[list]:
         for event in self._timeline_events.values():
             action = event.get("action")
             msg = ""
@@ -208,21 +232,62 @@ class TRTimeline:
             if msg != "":
                 self.events.append(event)
                 self._log.debug(f"{msg} {event['title']}: {event.get('body')} ")
+                continue
+
+            cached = (
+                self._detail_cache.get(event["id"])
+                if self._detail_cache is not None
+                else None
+            )
+            if cached is not None:
+                event["details"] = cached
+                self.events.append(event)
             else:
-                self._requested_detail += 1
-                await self._tr.timeline_detail_v2(event["id"])
+                self._pending_details.append(event["id"])
 
-        self._log.info("All timeline details requested")
+        self._requested_detail = len(self._pending_details)
+        if not self._requested_detail:
+            self._log.info("No timeline details to request")
+            return self.events
+
+        self._log.info(
+            f"Requesting {self._requested_detail} timeline details, "
+            f"{self._detail_window} at a time"
+        )
+        await self._fill_detail_window()
+        return None
+
+    async def _fill_detail_window(self):
+        while (
+            self._pending_details and len(self._details_in_flight) < self._detail_window
+        ):
+            event_id = self._pending_details.popleft()
+            subscription_id = await self._tr.timeline_detail_v2(event_id)
+            self._details_in_flight[subscription_id] = event_id
+
+    async def _process_timeline_detail(
+        self, subscription_id: str, response
+    ) -> Optional[list]:
+        if self._details_in_flight.pop(subscription_id, None) is None:
+            self._log.debug(f"Dropping detail update for closed {subscription_id}")
+            return None
+
+        await self._tr.unsubscribe(subscription_id)
+        await self._fill_detail_window()
 
-    async def _process_timeline_detail(self, response) -> Optional[list]:
         self._received_detail += 1
         if response["id"] not in self._timeline_events:
             self._log.warning(f"Received unexpected detail {response['id']}")
             self._log.debug(f"{response}")
-            return None
+            return self._complete_if_all_received()
 
         event = self._timeline_events[response["id"]]
         event["details"] = response
+        if (
+            self._detail_cache is not None
+            and event.get("status") in self.SETTLED_STATUSES
+        ):
+            self._detail_cache.put(event["id"], response)
 
         max_details_digits = len(str(self._requested_detail))
         self._log.debug(
@@ -232,11 +297,14 @@ class TRTimeline:
 
         self.events.append(event)
 
-        if self._received_detail == self._requested_detail:
-            self._log.info("Received all details")
-            return self.events
+        return self._complete_if_all_received()
 
-        return None
+    def _complete_if_all_received(self) -> Optional[list]:
+        if self._received_detail < self._requested_detail:
+            return None
+
+        self._log.info("Received all details")
+        return self.events
 
 
 def preview(response, num_lines=5):
@@ -8,7 +8,6 @@ from datetime import datetime
 from typing import Optional
 
 import httpx
-from aiocache import cached
 from dateutil.tz import tzlocal
 from tzlocal import get_localzone
 
@@ -21,9 +20,11 @@ from domain.entity_login import (
 )
 from infrastructure.client.entity.financial.tr.api import TradeRepublicApi
 from infrastructure.client.entity.financial.tr.portfolio import Portfolio
+from infrastructure.client.entity.financial.tr.tr_detail_cache import TRDetailCache
 from infrastructure.client.entity.financial.tr.tr_details import TRDetails
 from infrastructure.client.entity.financial.tr.tr_timeline import TRTimeline
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 def _json_cookie_jar(jar: httpx.Cookies) -> list[dict]:
@@ -81,6 +82,8 @@ class TradeRepublicClient:
 
     def __init__(self):
         self._tr_api = None
+        # Per account, so switching logins in a session keeps them apart
+        self._detail_caches: dict[str, TRDetailCache] = {}
         self._log = logging.getLogger(__name__)
         self._cancel_event: asyncio.Event = asyncio.Event()
         self._stable_device_id: str | None = None
@@ -126,7 +129,10 @@ class TradeRepublicClient:
             "x-tr-device-info": self._build_device_info_header(),
         }
 
-    @cached(ttl=86400, noself=True)
+    @metered_cached(
+        ttl=86400,
+        noself=True,
+    )
     async def _fetch_app_version(self) -> str:
         try:
             session = get_http_session()
@@ -505,7 +511,7 @@ class TradeRepublicClient:
         if self._tr_api and self._tr_api._ws:
             await self._tr_api._ws.close()
 
-    @cached(ttl=120, noself=True)
+    @metered_cached(ttl=120, noself=True)
     async def get_portfolio(self):
         portfolio = Portfolio(self._tr_api)
         await portfolio.portfolio_loop()
@@ -532,9 +538,15 @@ class TradeRepublicClient:
             since=since,
             requested_data=["timelineTransactions", "timelineDetailV2"],
             already_registered_ids=already_registered_ids,
+            detail_cache=self._detail_cache(),
         )
         return await dl.fetch()
 
+    def _detail_cache(self) -> Optional[TRDetailCache]:
+        if not self._tr_api or not self._tr_api.phone_no:
+            return None
+        return self._detail_caches.setdefault(self._tr_api.phone_no, TRDetailCache())
+
     async def get_user_info(self):
         return await self._tr_api.settings()
 
@@ -608,14 +620,20 @@ class TradeRepublicClient:
         await self._tr_api.unsubscribe(subscription_id)
         return response
 
-    @cached(ttl=60, noself=True)
+    @metered_cached(
+        ttl=60,
+        noself=True,
+    )
     async def get_instrument_details(self, isin: str) -> dict:
         await self._tr_api.instrument_details(isin)
         subscription_id, _, response = await self._tr_api.recv()
         await self._tr_api.unsubscribe(subscription_id)
         return response
 
-    @cached(ttl=60, noself=True)
+    @metered_cached(
+        ttl=60,
+        noself=True,
+    )
     async def get_stock_details(self, isin: str) -> dict:
         await self._tr_api.stock_details(isin)
         subscription_id, _, response = await self._tr_api.recv()
@@ -628,7 +646,10 @@ class TradeRepublicClient:
         await self._tr_api.unsubscribe(subscription_id)
         return response
 
-    @cached(ttl=43200, noself=True)
+    @metered_cached(
+        ttl=43200,
+        noself=True,
+    )
     async def get_fund_details(self, isin):
         await self._tr_api.subscribe({"type": "mutualFundDetails", "id": isin})
         subscription_id, _, response = await self._tr_api.recv()
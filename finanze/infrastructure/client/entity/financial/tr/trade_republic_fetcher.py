@@ -1,6 +1,6 @@
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from typing import Optional
 from uuid import uuid4
 
@@ -43,6 +43,8 @@ from domain.transactions import (
     StockTx,
     Transactions,
     TxType,
+    TxWatermark,
+    oldest_watermark_day,
 )
 from infrastructure.client.entity.financial.tr.trade_republic_client import (
     TradeRepublicClient,
@@ -472,11 +474,33 @@ class TradeRepublicFetcher(FinancialEntityFetcher):
         ACCOUNT_INTEREST_TX_TYPES + TRADE_TX_TYPES + DIVIDEND_TX_TYPES + OTHER_TX_TYPES
     )
 
+    TX_PRODUCT_TYPES = [
+        ProductType.ACCOUNT,
+        ProductType.STOCK_ETF,
+        ProductType.FUND,
+        ProductType.CRYPTO,
+        ProductType.BOND,
+        ProductType.DERIVATIVE,
+    ]
+
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
+        # The timeline is a single newest-first stream, so paging can stop at
+        # the oldest of the per-product watermarks, with a day of margin for
+        # events whose timestamp shifts between the local and UTC day
+        oldest_day = oldest_watermark_day(since, self.TX_PRODUCT_TYPES)
+        stop_at = (
+            datetime.combine(oldest_day - timedelta(days=1), time.min)
+            if oldest_day
+            else None
+        )
         raw_txs = await self._client.get_transactions(
-            already_registered_ids=registered_txs
+            since=stop_at,
+            already_registered_ids=registered_txs,
         )
         await self._client.close()
 
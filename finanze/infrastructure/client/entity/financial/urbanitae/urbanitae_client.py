@@ -5,7 +5,7 @@ from typing import Optional
 
 import httpx
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 from dateutil.relativedelta import relativedelta
@@ -14,6 +14,7 @@ from domain.entity_login import EntityLoginResult, LoginResultCode
 from domain.public_keychain import PublicKeychain
 from infrastructure.client.http.http_session import get_http_session
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
 
@@ -178,7 +179,10 @@ class UrbanitaeAPIClient:
             params += "&projectPhases=" + ",".join(project_phases)
         return (await self._get_request(f"/investor/summary{params}"))["content"]
 
-    @cached(cache=Cache.MEMORY, ttl=600)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=600,
+    )
     async def get_project_detail(self, project_id: str):
         return await self._get_request(f"/projects/{project_id}")
 
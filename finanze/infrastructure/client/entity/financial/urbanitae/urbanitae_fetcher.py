@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 
 from application.ports.financial_entity_fetcher import FinancialEntityFetcher
@@ -20,7 +21,7 @@ from domain.global_position import (
     RealEstateCFInvestments,
 )
 from domain.native_entities import URBANITAE
-from domain.transactions import RealEstateCFTx, Transactions, TxType
+from domain.transactions import RealEstateCFTx, Transactions, TxType, TxWatermark
 from infrastructure.client.entity.financial.urbanitae.urbanitae_client import (
     UrbanitaeAPIClient,
 )
@@ -143,7 +144,10 @@ class UrbanitaeFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         raw_txs = []
         page = 0
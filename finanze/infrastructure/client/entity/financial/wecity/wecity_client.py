@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import uuid4
 
 import httpx
-from aiocache import cached, Cache
+from aiocache import Cache
 from dateutil.tz import tzlocal
 
 from domain.entity_login import (
@@ -14,6 +14,7 @@ from domain.entity_login import (
     LoginOptions,
 )
 from infrastructure.client.http.http_session import new_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 DATETIME_FORMAT = "%d/%m/%Y %H:%M:%S"
 
@@ -174,32 +175,47 @@ class WecityAPIClient:
     def _inject_session(self, session: EntitySession):
         self._session.headers["x-auth-token"] = session.payload["token"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(cache=Cache.MEMORY, ttl=120)
     async def get_wallet(self):
         return (await self._get_request("/customers/me/wallet"))["return"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_investments(self):
         return (await self._get_request("/customers/me/invests-all"))["return"]["data"]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_investment_details(self, investment_id: int):
         return (await self._get_request(f"/investments/{investment_id}/general"))[
             "return"
         ]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_investment_diary(self, investment_id: int):
         return (await self._get_request(f"/investments/{investment_id}/diary"))[
             "return"
         ]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_investment_transactions(self, investment_id: int):
         return (await self._get_request(f"/investments/{investment_id}/transactions"))[
             "return"
         ]
 
-    @cached(cache=Cache.MEMORY, ttl=120)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=120,
+    )
     async def get_transactions(self):
         return (await self._get_request("/customers/me/transactions"))["return"]
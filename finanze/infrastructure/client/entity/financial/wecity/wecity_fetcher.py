@@ -1,6 +1,7 @@
 import logging
 from datetime import date, datetime
 from hashlib import sha1
+from typing import Optional
 from uuid import uuid4
 
 from dateutil.relativedelta import relativedelta
@@ -23,7 +24,7 @@ from domain.global_position import (
     RealEstateCFInvestments,
 )
 from domain.native_entities import WECITY
-from domain.transactions import RealEstateCFTx, Transactions, TxType
+from domain.transactions import RealEstateCFTx, Transactions, TxType, TxWatermark
 from infrastructure.client.entity.financial.wecity.wecity_client import WecityAPIClient
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -277,7 +278,10 @@ class WecityFetcher(FinancialEntityFetcher):
         )
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         raw_transactions = _normalize_transactions(
             await self._client.get_transactions()
@@ -14,6 +14,7 @@ from domain.exception.exceptions import (
 )
 from domain.external_integration import ExternalIntegrationPayload
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import cache_metrics
 
 
 class EnableBankingClient(ConnectableIntegration):
@@ -31,7 +32,11 @@ class EnableBankingClient(ConnectableIntegration):
         self._session = get_http_session()
         self._application_id: Optional[str] = None
         self._private_key: Optional[str] = None
-        self._cache = Cache(Cache.MEMORY, serializer=PickleSerializer())
+        self._cache = Cache(
+            Cache.MEMORY,
+            serializer=PickleSerializer(),
+            plugins=cache_metrics(self, "_cache"),
+        )
 
     async def setup(self, credentials: ExternalIntegrationPayload) -> None:
         application_id = credentials.get("application_id")
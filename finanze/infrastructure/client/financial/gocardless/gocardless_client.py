@@ -3,7 +3,6 @@ import time
 from typing import List, Optional
 
 from application.ports.connectable_integration import ConnectableIntegration
-from cachetools import TTLCache, cached
 from domain.exception.exceptions import IntegrationSetupError, IntegrationSetupErrorCode
 from domain.external_integration import (
     ExternalIntegrationPayload,
@@ -17,6 +16,7 @@ from nordigen.types.types import (
     TokenType,
 )
 from requests.models import HTTPError
+from infrastructure.instrumentation.metered_ttl_cache import metered_ttl_cached
 
 
 class GoCardlessClient(ConnectableIntegration):
@@ -62,22 +62,22 @@ class GoCardlessClient(ConnectableIntegration):
         self._update_token_state(token)
         return token
 
-    @cached(cache=TTLCache(maxsize=100, ttl=86400))
+    @metered_ttl_cached(maxsize=100, ttl=86400)
     def list_institutions(self, country_code: str) -> List[Institutions]:
         client = self._ensure_client()
         return client.institution.get_institutions(country_code)
 
-    @cached(cache=TTLCache(maxsize=100, ttl=86400))
+    @metered_ttl_cached(maxsize=100, ttl=86400)
     def get_institution(self, institution_id: str) -> dict:
         client = self._ensure_client()
         return client.institution.get_institution_by_id(institution_id)
 
-    @cached(cache=TTLCache(maxsize=10, ttl=5))
+    @metered_ttl_cached(maxsize=10, ttl=5)
     def list_agreements(self, limit: int = 100, offset: int = 0) -> AgreementsList:
         client = self._ensure_client()
         return client.agreement.get_agreements(limit=limit, offset=offset)
 
-    @cached(cache=TTLCache(maxsize=10, ttl=60))
+    @metered_ttl_cached(maxsize=10, ttl=60)
     def get_agreement(self, agreement_id: str) -> EnduserAgreement:
         client = self._ensure_client()
         return client.agreement.get_agreement_by_id(agreement_id)
@@ -126,7 +126,7 @@ class GoCardlessClient(ConnectableIntegration):
             link=requisition["link"], requisition_id=requisition["id"]
         )
 
-    @cached(cache=TTLCache(maxsize=10, ttl=5))
+    @metered_ttl_cached(maxsize=10, ttl=5)
     def get_requisitions(self, limit: int = 100, offset: int = 0) -> dict:
         client = self._ensure_client()
         return client.requisition.get_requisitions(limit=limit, offset=offset)
@@ -143,19 +143,19 @@ class GoCardlessClient(ConnectableIntegration):
         client = self._ensure_client()
         return client.account_api(id=account_id)
 
-    @cached(cache=TTLCache(maxsize=100, ttl=10))
+    @metered_ttl_cached(maxsize=100, ttl=10)
     def get_account_balances(self, account_id: str) -> dict:
         return self._account_api(account_id).get_balances()
 
-    @cached(cache=TTLCache(maxsize=100, ttl=3600))
+    @metered_ttl_cached(maxsize=100, ttl=3600)
     def get_account_metadata(self, account_id: str) -> dict:
         return self._account_api(account_id).get_metadata()
 
-    @cached(cache=TTLCache(maxsize=100, ttl=3600))
+    @metered_ttl_cached(maxsize=100, ttl=3600)
     def get_account_details(self, account_id: str) -> dict:
         return self._account_api(account_id).get_details()
 
-    @cached(cache=TTLCache(maxsize=100, ttl=30))
+    @metered_ttl_cached(maxsize=100, ttl=30)
     def get_account_transactions(
         self,
         account_id: str,
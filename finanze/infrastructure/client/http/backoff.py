@@ -1,12 +1,13 @@
 import asyncio
 import logging
 import random
-from typing import Any, Iterable, Optional, Callable, Awaitable
+from typing import Any, AsyncIterable, Iterable, Optional, Callable, Awaitable
 
 import httpx
 
-from infrastructure.client.http.http_session import get_http_session
+from infrastructure.client.http.http_session import HttpSession, get_http_session
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.metrics import OUTBOUND_HTTP_RETRIES
 
 DEFAULT_RETRIED_STATUSES: tuple[int, ...] = (429, 408)
 
@@ -26,27 +27,68 @@ async def http_get_with_backoff(
     should_retry: Optional[
         Callable[[HttpResponse, int], bool | Awaitable[bool]]
     ] = None,
+) -> HttpResponse:
+    return await http_request_with_backoff(
+        "GET",
+        url,
+        params=params,
+        request_timeout=request_timeout,
+        max_retries=max_retries,
+        backoff_exponent_base=backoff_exponent_base,
+        backoff_factor=backoff_factor,
+        retried_statuses=retried_statuses,
+        cooldown=cooldown,
+        log=log,
+        headers=headers,
+        should_retry=should_retry,
+    )
+
+
+async def http_request_with_backoff(
+    method: str,
+    url: str,
+    params: Optional[dict[str, Any]] = None,
+    request_timeout: int = 10,
+    *,
+    data: Optional[bytes | AsyncIterable[bytes]] = None,
+    session: Optional[HttpSession] = None,
+    max_retries: int = 3,
+    backoff_exponent_base: float = 2.0,
+    backoff_factor: float = 0.5,
+    retried_statuses: Iterable[int] = DEFAULT_RETRIED_STATUSES,
+    cooldown: Optional[float] = None,
+    log: Optional[logging.Logger] = None,
+    headers: Optional[dict[str, str]] = None,
+    should_retry: Optional[
+        Callable[[HttpResponse, int], bool | Awaitable[bool]]
+    ] = None,
 ) -> HttpResponse:
     attempt = 0
     status_retry_set = set(retried_statuses)
     last_exc: Exception | None = None
 
-    session = get_http_session()
+    session = session or get_http_session()
+    host = httpx.URL(url).host or "unknown"
 
     while attempt <= max_retries:
         if cooldown:
             await asyncio.sleep(cooldown)
 
         try:
-            resp = await session.get(
-                url, params=params, timeout=request_timeout, headers=headers
+            resp = await session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                timeout=request_timeout,
+                headers=headers,
             )
         except (httpx.RequestError, TimeoutError) as e:
             last_exc = e
             if attempt == max_retries:
                 if log:
                     log.warning(
-                        f"HTTP GET {url} failed on attempt {attempt + 1}/{max_retries + 1}: {e}"
+                        f"HTTP {method} {url} failed on attempt {attempt + 1}/{max_retries + 1}: {e}"
                     )
                 raise
 
@@ -58,6 +100,9 @@ async def http_get_with_backoff(
                 log.info(
                     f"Transient {kind} on {url} (attempt {attempt + 1}/{max_retries + 1}), backing off {delay:.2f}s"
                 )
+            OUTBOUND_HTTP_RETRIES.labels(
+                host, "timeout" if isinstance(e, TimeoutError) else "error"
+            ).inc()
             await asyncio.sleep(delay)
             attempt += 1
             continue
@@ -74,6 +119,7 @@ async def http_get_with_backoff(
                 log.info(
                     f"HTTP {resp.status} for {url} (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay:.2f}s"
                 )
+            OUTBOUND_HTTP_RETRIES.labels(host, str(resp.status)).inc()
             await asyncio.sleep(delay)
             attempt += 1
             continue
@@ -91,6 +137,7 @@ async def http_get_with_backoff(
                     log.info(
                         f"Predicate retry for {url} (attempt {attempt + 1}/{max_retries + 1}) in {delay:.2f}s"
                     )
+                OUTBOUND_HTTP_RETRIES.labels(host, "predicate").inc()
                 await asyncio.sleep(delay)
                 attempt += 1
                 continue
@@ -99,4 +146,4 @@ async def http_get_with_backoff(
 
     if last_exc:
         raise last_exc
-    raise RuntimeError("http_get_with_backoff reached an unexpected state")
+    raise RuntimeError("http_request_with_backoff reached an unexpected state")
@@ -1,6 +1,11 @@
+from time import perf_counter
+from urllib.parse import urlsplit
+
 import httpx
 
 from infrastructure.client.http.http_response import HttpResponse
+from infrastructure.instrumentation.metrics import OUTBOUND_HTTP_REQUESTS
+from infrastructure.instrumentation.request_stats import record_http_call
 
 
 class NoCookieTransport(httpx.AsyncHTTPTransport):
@@ -14,6 +19,11 @@ class NoCookieTransport(httpx.AsyncHTTPTransport):
 _httpx_singleton_client: httpx.Client | None = None
 
 
+def _record_call(host: str, duration: float):
+    OUTBOUND_HTTP_REQUESTS.labels(host).inc()
+    record_http_call(host, duration)
+
+
 class HttpSession:
     def __init__(self, client: httpx.AsyncClient):
         self._client = client
@@ -44,14 +54,24 @@ class HttpSession:
         else:
             merged_headers = httpx.Headers(self._headers)
             merged_headers.update(headers)
-        resp = await self._client.request(
-            method,
-            url,
-            headers=dict(merged_headers),
-            **kwargs,
-        )
+        start = perf_counter()
+        try:
+            resp = await self._client.request(
+                method,
+                url,
+                headers=dict(merged_headers),
+                **kwargs,
+            )
+        finally:
+            _record_call(self._host(url), perf_counter() - start)
         return HttpResponse(resp)
 
+    def _host(self, url) -> str:
+        url = httpx.URL(url)
+        if not url.is_absolute_url:
+            url = self._client.base_url.join(url)
+        return url.host or "unknown"
+
     async def get(self, url: str, **kwargs) -> HttpResponse:
         resp = await self.request("GET", url, **kwargs)
         return resp
@@ -134,7 +154,13 @@ class ImpersonatedHttpSession:
         merged = dict(self._headers)
         if headers:
             merged.update(headers)
-        resp = await self._session.request(method, url, headers=merged, **kwargs)
+        start = perf_counter()
+        try:
+            resp = await self._session.request(method, url, headers=merged, **kwargs)
+        finally:
+            _record_call(
+                urlsplit(str(url)).hostname or "unknown", perf_counter() - start
+            )
         return _CurlCffiResponse(resp)
 
 
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from aiocache import cached, Cache
+from aiocache import Cache
 
 from domain.dezimal import Dezimal
 from domain.instrument import (
@@ -11,6 +11,7 @@ from domain.instrument import (
     InstrumentType,
 )
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class ExtraEtfClient:
@@ -86,7 +87,10 @@ class ExtraEtfClient:
             price=None,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=43200)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=43200,
+    )
     async def get_instrument_info(
         self, query: str, instrument_type: InstrumentType
     ) -> Optional[InstrumentInfo]:
@@ -167,7 +171,7 @@ class ExtraEtfClient:
             symbol=None,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=3600)
+    @metered_cached(cache=Cache.MEMORY, ttl=3600)
     async def _search(self, query: str, limit: int = 50, offset: int = 0) -> list[dict]:
         if not query:
             return []
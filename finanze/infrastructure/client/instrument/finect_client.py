@@ -2,7 +2,7 @@ import codecs
 import logging
 from typing import Optional
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from domain.dezimal import Dezimal
 from domain.instrument import (
     InstrumentDataRequest,
@@ -11,6 +11,7 @@ from domain.instrument import (
     InstrumentType,
 )
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class FinectClient:
@@ -84,7 +85,7 @@ class FinectClient:
             type=inferred_type,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(cache=Cache.MEMORY, ttl=86400)
     async def _search_raw(self, query: str) -> list[dict]:
         if not query:
             return []
@@ -111,7 +112,10 @@ class FinectClient:
         response.raise_for_status()
         return []
 
-    @cached(cache=Cache.MEMORY, ttl=43200)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=43200,
+    )
     async def get_instrument_info(
         self, query: str, instrument_type: InstrumentType
     ) -> Optional[InstrumentInfo]:
@@ -2,9 +2,10 @@ import logging
 import re
 from typing import Optional
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from domain.instrument import InstrumentDataRequest, InstrumentOverview, InstrumentType
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 _ISIN_REGEX = re.compile(r"^[A-Z]{2}[A-Z0-9]{9}[0-9]$")
 _CURRENCY_REGEX = re.compile(r"^[A-Z]{3}$")
@@ -64,7 +65,10 @@ class FtClient:
 
         return results
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def _search_equities(self, partial: str, count: int = 100) -> list[dict]:
         if not partial:
             return []
@@ -89,7 +93,7 @@ class FtClient:
         return []
 
     @staticmethod
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(cache=Cache.MEMORY, ttl=86400)
     def _parse_symbol(
         symbol: str,
     ) -> Optional[
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from aiocache import Cache, cached
+from aiocache import Cache
 
 from domain.dezimal import Dezimal
 from domain.instrument import (
@@ -11,13 +11,17 @@ from domain.instrument import (
 )
 
 from .etf_profile import get_etf_overview
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class JustEtfClient:
     async def search(self, request: InstrumentDataRequest) -> list[InstrumentOverview]:
         pass
 
-    @cached(cache=Cache.MEMORY, ttl=43200)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=43200,
+    )
     async def get_instrument_info(
         self, query: str, instrument_type: InstrumentType
     ) -> Optional[InstrumentInfo]:
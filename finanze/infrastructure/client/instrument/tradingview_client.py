@@ -1,13 +1,14 @@
 import logging
 from typing import Optional
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from domain.instrument import (
     InstrumentDataRequest,
     InstrumentOverview,
     InstrumentType,
 )
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class TradingViewClient:
@@ -71,7 +72,10 @@ class TradingViewClient:
             type=InstrumentType.STOCK,
         )
 
-    @cached(cache=Cache.MEMORY, ttl=86400)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=86400,
+    )
     async def _search_raw(self, query: str) -> list[dict]:
         if not query:
             return []
@@ -2,7 +2,6 @@ import logging
 from typing import Optional
 
 import yfinance as yf
-from aiocache import cached
 
 from domain.dezimal import Dezimal
 from domain.instrument import (
@@ -11,6 +10,7 @@ from domain.instrument import (
     InstrumentOverview,
     InstrumentType,
 )
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class YFinanceClient:
@@ -59,7 +59,7 @@ class YFinanceClient:
 
         return results
 
-    @cached(ttl=86400)
+    @metered_cached(ttl=86400)
     async def _resolve_symbol(
         self, query: str, instrument_type: InstrumentType
     ) -> Optional[str]:
@@ -84,7 +84,7 @@ class YFinanceClient:
 
         return query
 
-    @cached(ttl=60)
+    @metered_cached(ttl=60)
     async def get_instrument_info(
         self, query: str, instrument_type: InstrumentType
     ) -> Optional[InstrumentInfo]:
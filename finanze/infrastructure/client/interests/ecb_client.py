@@ -1,12 +1,12 @@
 import logging
 
-from aiocache import cached
 from aiocache.serializers import PickleSerializer
 
 from application.ports.euribor_provider import EuriborProvider
 from domain.dezimal import Dezimal
 from domain.euribor import EuriborHistory, EuriborRate
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 ECB_BASE_URL = "https://data-api.ecb.europa.eu/service/data/FM"
 EURIBOR_1Y_SERIES = "M.U2.EUR.RT.MM.EURIBOR1YD_.HSTA"
@@ -21,7 +21,7 @@ class ECBClient(EuriborProvider):
         self._log = logging.getLogger(__name__)
         self._session = get_http_session()
 
-    @cached(
+    @metered_cached(
         ttl=CACHE_TTL,
         key_builder=lambda f, self: "ecb_euribor_1y",
         serializer=PickleSerializer(),
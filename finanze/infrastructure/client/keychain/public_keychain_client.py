@@ -1,12 +1,13 @@
 import logging
 from datetime import datetime
 
-from aiocache import cached, Cache
+from aiocache import Cache
 from dateutil.tz import tzlocal
 
 from application.ports.public_keychain_fetcher_port import PublicKeychainFetcherPort
 from domain.public_keychain import PublicKeyEntry
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 KEYCHAIN_URL = "https://features.api.finanze.me/keys"
 CACHE_TTL = 21600
@@ -22,7 +23,10 @@ class PublicKeychainClient(PublicKeychainFetcherPort):
             self._session = get_http_session()
         return self._session
 
-    @cached(cache=Cache.MEMORY, ttl=CACHE_TTL)
+    @metered_cached(
+        cache=Cache.MEMORY,
+        ttl=CACHE_TTL,
+    )
     async def fetch(self) -> list[PublicKeyEntry]:
         try:
             response = await self._get_session().get(KEYCHAIN_URL, timeout=2)
@@ -2,7 +2,6 @@ import logging
 from datetime import timedelta
 from typing import Optional
 
-from aiocache import cached
 from aiocache.serializers import PickleSerializer
 
 from application.ports.crypto_price_provider import CryptoAssetInfoProvider
@@ -32,6 +31,7 @@ from infrastructure.client.rates.crypto.crypto_dataset_client import (
 from infrastructure.client.rates.crypto.crypto_dataset_store import (
     CryptoDatasetStore,
 )
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 
 class CryptoAssetInfoClient(CryptoAssetInfoProvider):
@@ -49,7 +49,7 @@ class CryptoAssetInfoClient(CryptoAssetInfoProvider):
     async def initialize(self):
         await self._coingecko_client.initialize()
 
-    @cached(
+    @metered_cached(
         ttl=PRICE_CACHE_TTL,
         key_builder=lambda f, self, symbol, fiat_iso, **kwargs: (
             f"crypto_price:{symbol.upper()}_{fiat_iso.upper()}"
@@ -67,7 +67,7 @@ class CryptoAssetInfoClient(CryptoAssetInfoProvider):
             .get(fiat_iso, Dezimal(1))
         )
 
-    @cached(
+    @metered_cached(
         ttl=PRICE_CACHE_TTL,
         key_builder=lambda f, self, symbols, fiat_isos, **kwargs: (
             f"crypto_multi_price:{','.join(sorted(symbols)).upper()}_{','.join(sorted(fiat_isos)).upper()}"
@@ -111,7 +111,7 @@ class CryptoAssetInfoClient(CryptoAssetInfoProvider):
         # { crypto_symbol: { fiat_iso: Dezimal(price) } }
         return result
 
-    @cached(
+    @metered_cached(
         ttl=PRICE_CACHE_TTL,
         key_builder=lambda f, self, addresses, fiat_isos, **kwargs: (
             f"crypto_addr_price:{','.join(sorted(a.lower() for a in addresses))}_{','.join(sorted(f.upper() for f in fiat_isos))}"
@@ -154,7 +154,7 @@ class CryptoAssetInfoClient(CryptoAssetInfoProvider):
 
         return result
 
-    @cached(
+    @metered_cached(
         ttl=86400,
         key_builder=lambda f, self, symbol: f"crypto_by_symbol:{symbol.upper()}",
         serializer=PickleSerializer(),
@@ -232,7 +232,7 @@ class CryptoAssetInfoClient(CryptoAssetInfoProvider):
             self._log.warning(f"CoinMarketCap asset platforms failed: {e}")
             return {}
 
-    @cached(
+    @metered_cached(
         ttl=3600,
         key_builder=lambda f, self, provider_id, currencies, provider=ExternalIntegrationId.COINGECKO: (
             f"crypto_asset_details:{provider.value}:{provider_id}_{'_'.join(sorted(currencies))}"
@@ -1,12 +1,12 @@
 import logging
 from datetime import datetime
 
-from aiocache import cached
 from aiocache.serializers import PickleSerializer
 from application.ports.exchange_rate_provider import ExchangeRateProvider
 from domain.dezimal import Dezimal
 from domain.exchange_rate import ExchangeRates
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 AVAILABLE_CURRENCIES = ["EUR", "USD"]
 
@@ -38,7 +38,7 @@ class ExchangeRateClient(ExchangeRateProvider):
             )
         return self._available_currencies
 
-    @cached(
+    @metered_cached(
         ttl=MATRIX_CACHE_TTL,
         key_builder=lambda f, self, **kwargs: "exchange_rate_matrix",
         serializer=PickleSerializer(),
@@ -10,6 +10,7 @@ from domain.commodity import COMMODITY_SYMBOLS, CommodityType, WeightUnit
 from domain.dezimal import Dezimal
 from domain.exchange_rate import HistoricMetalRates
 from infrastructure.client.http.http_session import get_http_session
+from infrastructure.instrumentation.cache_metrics import cache_metrics
 
 
 class HistoricMetalPriceClient(HistoricMetalPriceProvider):
@@ -27,7 +28,7 @@ class HistoricMetalPriceClient(HistoricMetalPriceProvider):
     def __init__(self):
         self._log = logging.getLogger(__name__)
         self._session = get_http_session()
-        self._cache = Cache(Cache.MEMORY)
+        self._cache = Cache(Cache.MEMORY, plugins=cache_metrics(self, "_cache"))
 
     async def get_partial_historic_rates(
         self, commodity: CommodityType, **kwargs
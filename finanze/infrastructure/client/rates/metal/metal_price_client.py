@@ -8,6 +8,7 @@ from domain.commodity import CommodityType
 from domain.exchange_rate import CommodityExchangeRate
 from infrastructure.client.rates.metal.gold_api_price_client import GoldApiPriceClient
 from infrastructure.client.rates.metal.rmint_api_price_client import RMintApiPriceClient
+from infrastructure.instrumentation.cache_metrics import cache_metrics
 
 
 class MetalPriceClient(MetalPriceProvider):
@@ -34,8 +35,12 @@ class MetalPriceClient(MetalPriceProvider):
             CommodityType.PALLADIUM: [self._gold_api_price_client],
         }
 
-        self._price_cache = Cache(Cache.MEMORY)
-        self._none_cache = Cache(Cache.MEMORY)
+        self._price_cache = Cache(
+            Cache.MEMORY, plugins=cache_metrics(self, "_price_cache")
+        )
+        self._none_cache = Cache(
+            Cache.MEMORY, plugins=cache_metrics(self, "_none_cache")
+        )
 
         self._log = logging.getLogger(__name__)
 
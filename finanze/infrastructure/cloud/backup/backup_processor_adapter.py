@@ -1,7 +1,9 @@
+import asyncio
 import base64
 import hashlib
 import logging
 import zlib
+from pathlib import Path
 
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -11,60 +13,76 @@ from domain.exception.exceptions import (
     UnsupportedBackupProtocol,
     InvalidBackupCredentials,
 )
+from infrastructure.cloud.backup.backup_processor_v2 import BackupProcessorV2
+from infrastructure.instrumentation.metered_ttl_cache import metered_ttl_cached
 
 
 class BackupProcessorAdapter(BackupProcessor):
     def __init__(self):
-        self._protocols = {1: BackupProcessorV1()}
+        self._protocols = {1: BackupProcessorV1(), 2: BackupProcessorV2()}
 
     async def compile(self, data: BackupProcessRequest) -> BackupProcessResult:
         implementation = self._protocols.get(data.protocol)
         if implementation is None:
             raise UnsupportedBackupProtocol(data.protocol)
 
-        return implementation.compile(data)
+        # CPU bound, keep it off the event loop
+        return await asyncio.to_thread(implementation.compile, data)
 
     async def decompile(self, data: BackupProcessRequest) -> BackupProcessResult:
         implementation = self._protocols.get(data.protocol)
         if implementation is None:
             raise UnsupportedBackupProtocol(data.protocol)
 
-        return implementation.decompile(data)
+        return await asyncio.to_thread(implementation.decompile, data)
+
+
+def _read_payload(payload: bytes | Path) -> bytes:
+    if isinstance(payload, Path):
+        return payload.read_bytes()
+    return payload
+
+
+def _result(output: bytes, target: Path | None) -> BackupProcessResult:
+    if target is None:
+        return BackupProcessResult(payload=output, size=len(output))
+    target.write_bytes(output)
+    return BackupProcessResult(payload=target, size=len(output))
 
 
 class BackupProcessorV1(BackupProcessor):
-    from cachetools import cached, TTLCache
+    """zlib + Fernet over the whole payload, which is held in memory."""
 
     def __init__(self):
         self._log = logging.getLogger(__name__)
 
     def compile(self, data: BackupProcessRequest) -> BackupProcessResult:
-        compressed = zlib.compress(data.payload, level=9)
+        compressed = zlib.compress(_read_payload(data.payload), level=9)
 
         key = self._key(data.password)
         fernet = Fernet(key)
         encrypted = fernet.encrypt(compressed)
         encrypted = base64.urlsafe_b64decode(encrypted)
 
-        return BackupProcessResult(payload=encrypted, size=len(encrypted))
+        return _result(encrypted, data.target)
 
     def decompile(self, data: BackupProcessRequest) -> BackupProcessResult:
         key = self._key(data.password)
 
         try:
             fernet = Fernet(key)
-            data.payload = base64.urlsafe_b64encode(data.payload)
-            decrypted = fernet.decrypt(data.payload)
+            token = base64.urlsafe_b64encode(_read_payload(data.payload))
+            decrypted = fernet.decrypt(token)
         except (ValueError, InvalidToken) as e:
             self._log.exception(e)
             raise InvalidBackupCredentials from e
 
         decompressed = zlib.decompress(decrypted)
 
-        return BackupProcessResult(payload=decompressed, size=len(decompressed))
+        return _result(decompressed, data.target)
 
     @staticmethod
-    @cached(cache=TTLCache(maxsize=1, ttl=60))
+    @metered_ttl_cached(maxsize=1, ttl=60)
     def _key(password: str) -> bytes:
         key_bytes = hashlib.pbkdf2_hmac(
             "sha256",
@@ -0,0 +1,194 @@
+import hashlib
+import io
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import BinaryIO
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from application.ports.backup_processor import BackupProcessor
+from domain.backup import BackupProcessRequest, BackupProcessResult
+from domain.exception.exceptions import CorruptedBackup, InvalidBackupCredentials
+
+
+class BackupProcessorV2(BackupProcessor):
+    """
+    Streaming format, memory use is bounded by the frame size regardless of
+    the payload size.
+
+    Layout: header (magic, frame size, random salt) followed by frames of
+    flag (1 byte, 1 on the last one), ciphertext length (u32) and the AES-GCM
+    ciphertext of up to FRAME_SIZE bytes of the zlib stream. Every backup
+    gets its own key through the random salt, so frame nonces are just a
+    counter. The header and the last frame flag are authenticated as AAD,
+    detecting reordering, truncation and header tampering.
+    """
+
+    MAGIC = b"FZB2"
+    FRAME_SIZE = 1024 * 1024
+    # Upper bound accepted when reading, the header is only authenticated later
+    MAX_FRAME_SIZE = 64 * 1024 * 1024
+    READ_SIZE = 1024 * 1024
+    COMPRESSION_LEVEL = 6
+    SALT_SIZE = 16
+    KDF_ITERATIONS = 100000
+
+    _HEADER = struct.Struct(f">4sI{SALT_SIZE}s")
+    _FRAME = struct.Struct(">BI")
+
+    def __init__(self):
+        self._log = logging.getLogger(__name__)
+
+    def compile(self, data: BackupProcessRequest) -> BackupProcessResult:
+        with _open_source(data.payload) as src, _open_target(data.target) as dst:
+            size = self.compile_stream(src, dst, data.password)
+            return _stream_result(dst, size, data.target)
+
+    def decompile(self, data: BackupProcessRequest) -> BackupProcessResult:
+        with _open_source(data.payload) as src, _open_target(data.target) as dst:
+            size = self.decompile_stream(src, dst, data.password)
+            return _stream_result(dst, size, data.target)
+
+    def compile_stream(self, src: BinaryIO, dst: BinaryIO, password: str) -> int:
+        salt = os.urandom(self.SALT_SIZE)
+        header = self._HEADER.pack(self.MAGIC, self.FRAME_SIZE, salt)
+        aead = AESGCM(self._key(password, salt))
+        dst.write(header)
+        written = len(header)
+
+        compressor = zlib.compressobj(self.COMPRESSION_LEVEL)
+        pending = bytearray()
+        counter = 0
+
+        def write_full_frames():
+            nonlocal counter, written
+            # Strictly greater, so there's always something left for the last frame
+            while len(pending) > self.FRAME_SIZE:
+                frame = bytes(pending[: self.FRAME_SIZE])
+                del pending[: self.FRAME_SIZE]
+                written += self._write_frame(dst, aead, header, counter, frame, False)
+                counter += 1
+
+        while chunk := src.read(self.READ_SIZE):
+            pending += compressor.compress(chunk)
+            write_full_frames()
+
+        pending += compressor.flush()
+        write_full_frames()
+        written += self._write_frame(dst, aead, header, counter, bytes(pending), True)
+
+        return written
+
+    def decompile_stream(self, src: BinaryIO, dst: BinaryIO, password: str) -> int:
+        header = src.read(self._HEADER.size)
+        if len(header) != self._HEADER.size:
+            raise CorruptedBackup("Backup header is truncated")
+        magic, frame_size, salt = self._HEADER.unpack(header)
+        if magic != self.MAGIC:
+            raise CorruptedBackup("Not a protocol 2 backup")
+        if frame_size > self.MAX_FRAME_SIZE:
+            raise CorruptedBackup("Backup frame size is too large")
+
+        aead = AESGCM(self._key(password, salt))
+        max_ciphertext = frame_size + 16
+        decompressor = zlib.decompressobj()
+        written = 0
+        counter = 0
+        while True:
+            frame_header = src.read(self._FRAME.size)
+            if len(frame_header) != self._FRAME.size:
+                raise CorruptedBackup("Backup is truncated")
+            last, length = self._FRAME.unpack(frame_header)
+            if length > max_ciphertext:
+                raise CorruptedBackup("Backup frame exceeds the frame size")
+            ciphertext = src.read(length)
+            if len(ciphertext) != length:
+                raise CorruptedBackup("Backup is truncated")
+
+            try:
+                frame = aead.decrypt(
+                    self._nonce(counter), ciphertext, header + bytes([last])
+                )
+            except InvalidTag as e:
+                # A wrong password and a tampered frame are indistinguishable
+                self._log.error("Could not authenticate backup frame %d", counter)
+                raise InvalidBackupCredentials from e
+
+            written += self._inflate(decompressor, frame, dst)
+            counter += 1
+            if last:
+                break
+
+        if src.read(1):
+            raise CorruptedBackup("Unexpected data after the last backup frame")
+        if not decompressor.eof:
+            raise CorruptedBackup("Backup compressed stream is incomplete")
+
+        return written
+
+    def _write_frame(
+        self,
+        dst: BinaryIO,
+        aead: AESGCM,
+        header: bytes,
+        counter: int,
+        frame: bytes,
+        last: bool,
+    ) -> int:
+        flag = 1 if last else 0
+        ciphertext = aead.encrypt(self._nonce(counter), frame, header + bytes([flag]))
+        dst.write(self._FRAME.pack(flag, len(ciphertext)))
+        dst.write(ciphertext)
+        return self._FRAME.size + len(ciphertext)
+
+    def _inflate(self, decompressor, frame: bytes, dst: BinaryIO) -> int:
+        # Bounded output per call, a small frame can expand a lot
+        written = 0
+        data = frame
+        while data:
+            chunk = decompressor.decompress(data, self.READ_SIZE)
+            dst.write(chunk)
+            written += len(chunk)
+            data = decompressor.unconsumed_tail
+        return written
+
+    @staticmethod
+    def _nonce(counter: int) -> bytes:
+        return counter.to_bytes(12, "big")
+
+    @classmethod
+    def _key(cls, password: str, salt: bytes) -> bytes:
+        # Not cached, the salt is random so every backup gets a different key
+        return hashlib.pbkdf2_hmac(
+            "sha256",
+            password.encode("utf-8"),
+            salt,
+            cls.KDF_ITERATIONS,
+            dklen=32,
+        )
+
+
+def _open_source(payload: bytes | Path) -> BinaryIO:
+    if isinstance(payload, Path):
+        return open(payload, "rb")
+    return io.BytesIO(payload)
+
+
+def _open_target(target: Path | None) -> BinaryIO:
+    if target is not None:
+        return open(target, "wb")
+    return tempfile.TemporaryFile()
+
+
+def _stream_result(
+    dst: BinaryIO, size: int, target: Path | None
+) -> BackupProcessResult:
+    if target is not None:
+        return BackupProcessResult(payload=target, size=size)
+    dst.seek(0)
+    return BackupProcessResult(payload=dst.read(), size=size)
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import shutil
+import struct
+from pathlib import Path
+from uuid import UUID
+
+from application.ports.backup_delta_calculator import BackupDeltaCalculator
+from domain.backup import BackupDeltaResult, BackupFileType, BackupManifest
+from domain.exception.exceptions import CorruptedBackup
+
+
+class BlockDeltaCalculator(BackupDeltaCalculator):
+    """
+    Fixed-size block deltas over plaintext exports.
+
+    Layout: header (magic, block size, base backup id, total size) followed by
+    entries of block index (u32) and the block content. Every block is
+    BLOCK_SIZE long except the last one of the file, so lengths are implied.
+    """
+
+    MAGIC = b"FZD1"
+    # A few SQLite pages, small enough for row level changes to stay small
+    BLOCK_SIZE = 16 * 1024
+    DIGEST_SIZE = 16
+
+    _HEADER = struct.Struct(">4sI16sQ")
+    _ENTRY = struct.Struct(">I")
+
+    async def build_manifest(
+        self, backup_type: BackupFileType, base_id: UUID, source: Path
+    ) -> BackupManifest:
+        hashes = await asyncio.to_thread(self._hash_blocks, source)
+        return BackupManifest(
+            type=backup_type,
+            base_id=base_id,
+            block_size=self.BLOCK_SIZE,
+            hashes=hashes,
+        )
+
+    async def diff(
+        self, manifest: BackupManifest, source: Path, target: Path
+    ) -> BackupDeltaResult:
+        return await asyncio.to_thread(self._diff, manifest, source, target)
+
+    async def apply(self, base_id: UUID, base: Path, delta: Path, target: Path) -> bool:
+        return await asyncio.to_thread(self._apply, base_id, base, delta, target)
+
+    def _hash_blocks(self, source: Path) -> list[str]:
+        hashes = []
+        with open(source, "rb") as src:
+            while block := src.read(self.BLOCK_SIZE):
+                hashes.append(self._hash(block))
+        return hashes
+
+    def _diff(
+        self, manifest: BackupManifest, source: Path, target: Path
+    ) -> BackupDeltaResult:
+        if manifest.block_size != self.BLOCK_SIZE:
+            raise ValueError(
+                f"Manifest block size {manifest.block_size} does not match {self.BLOCK_SIZE}"
+            )
+
+        total_size = source.stat().st_size
+        changed = 0
+        index = 0
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            dst.write(
+                self._HEADER.pack(
+                    self.MAGIC, self.BLOCK_SIZE, manifest.base_id.bytes, total_size
+                )
+            )
+            while block := src.read(self.BLOCK_SIZE):
+                known = manifest.hashes[index] if index < len(manifest.hashes) else None
+                if known != self._hash(block):
+                    dst.write(self._ENTRY.pack(index))
+                    dst.write(block)
+                    changed += 1
+                index += 1
+            size = dst.tell()
+
+        return BackupDeltaResult(size=size, changed_blocks=changed, total_blocks=index)
+
+    def _apply(self, base_id: UUID, base: Path, delta: Path, target: Path) -> bool:
+        with open(delta, "rb") as src:
+            header = src.read(self._HEADER.size)
+            if len(header) != self._HEADER.size:
+                raise CorruptedBackup("Backup delta header is truncated")
+            magic, block_size, delta_base, total_size = self._HEADER.unpack(header)
+            if magic != self.MAGIC:
+                raise CorruptedBackup("Not a backup delta")
+            if UUID(bytes=delta_base) != base_id:
+                return False
+
+            shutil.copyfile(base, target)
+            with open(target, "r+b") as dst:
+                dst.truncate(total_size)
+                while entry := src.read(self._ENTRY.size):
+                    if len(entry) != self._ENTRY.size:
+                        raise CorruptedBackup("Backup delta is truncated")
+                    (index,) = self._ENTRY.unpack(entry)
+                    offset = index * block_size
+                    length = min(block_size, total_size - offset)
+                    if length <= 0:
+                        raise CorruptedBackup("Backup delta block is out of range")
+                    block = src.read(length)
+                    if len(block) != length:
+                        raise CorruptedBackup("Backup delta is truncated")
+                    dst.seek(offset)
+                    dst.write(block)
+
+        return True
+
+    def _hash(self, block: bytes) -> str:
+        return hashlib.blake2b(block, digest_size=self.DIGEST_SIZE).hexdigest()
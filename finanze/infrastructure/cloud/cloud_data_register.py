@@ -6,7 +6,6 @@ from typing import Optional
 from uuid import UUID
 
 import jwt
-from aiocache import cached
 from aiocache.serializers import PickleSerializer
 from jwt import DecodeError
 
@@ -19,6 +18,7 @@ from domain.backup import (
     BackupFileType,
     BackupSettings,
     BackupMode,
+    BackupManifest,
 )
 from domain.cloud_auth import (
     CloudAuthToken,
@@ -28,24 +28,30 @@ from domain.cloud_auth import (
 )
 from domain.exception.exceptions import InvalidToken, NoUserLogged
 from domain.user import User
+from infrastructure.instrumentation.cache_metrics import metered_cached
 
 CLOUD_DATA_FILE = "cloud.json"
+# Kept apart from the cloud data as it grows with the database size
+BACKUP_MANIFEST_FILE = "backup_manifest.json"
 
 
 class CloudDataRegister(CloudRegister, BackupLocalRegistry, BackupSettingsPort):
     def __init__(self):
         self._cloud_file = None
+        self._manifest_file = None
         self._log = logging.getLogger(__name__)
 
     async def disconnect(self):
         self._log.debug("Disconnecting cloud data register")
         self._cloud_file = None
+        self._manifest_file = None
 
         await self._load_cloud_data.cache.clear()
 
     async def connect(self, user: User):
         self._log.debug("Connecting cloud data register")
         self._cloud_file = str(user.path / CLOUD_DATA_FILE)
+        self._manifest_file = user.path / BACKUP_MANIFEST_FILE
         self._ensure_cloud_file_exists()
 
     def _check_connected(self):
@@ -63,7 +69,7 @@ class CloudDataRegister(CloudRegister, BackupLocalRegistry, BackupSettingsPort):
             with open(self._cloud_file, "w") as f:
                 json.dump(default_data, f, indent=2)
 
-    @cached(
+    @metered_cached(
         ttl=30,
         key_builder=lambda f, self: f"cloud_data:{self._cloud_file}",
         serializer=PickleSerializer(),
@@ -125,6 +131,44 @@ class CloudDataRegister(CloudRegister, BackupLocalRegistry, BackupSettingsPort):
             f"Backup registry updated in cloud data file at {self._cloud_file}"
         )
 
+    async def get_manifest(
+        self, backup_type: BackupFileType
+    ) -> Optional[BackupManifest]:
+        self._check_connected()
+        if not self._manifest_file.is_file():
+            return None
+
+        with open(self._manifest_file, "r") as f:
+            entry = json.load(f).get(backup_type.value)
+        if not entry:
+            return None
+
+        return BackupManifest(
+            type=backup_type,
+            base_id=UUID(entry["base_id"]),
+            block_size=entry["block_size"],
+            hashes=entry["hashes"],
+            deltas=entry.get("deltas", 0),
+        )
+
+    async def save_manifest(self, manifest: BackupManifest):
+        self._check_connected()
+        manifests = {}
+        if self._manifest_file.is_file():
+            with open(self._manifest_file, "r") as f:
+                manifests = json.load(f)
+
+        manifests[manifest.type.value] = {
+            "base_id": str(manifest.base_id),
+            "block_size": manifest.block_size,
+            "hashes": manifest.hashes,
+            "deltas": manifest.deltas,
+        }
+        with open(self._manifest_file, "w") as f:
+            json.dump(manifests, f)
+
+        self._log.debug(f"Backup manifest updated for {manifest.type.value}")
+
     async def save_auth(self, auth_token: CloudAuthToken):
         self._check_connected()
         cloud_data = await self._load_cloud_data()
@@ -178,7 +222,7 @@ class CloudDataRegister(CloudRegister, BackupLocalRegistry, BackupSettingsPort):
         await self._save_cloud_data(cloud_data)
         self._log.debug("Auth data cleared")
 
-    @cached(
+    @metered_cached(
         ttl=120,
         key_builder=lambda f, self, token: f"decode_token:{token[:20]}",
         serializer=PickleSerializer(),
@@ -240,15 +284,22 @@ class CloudDataRegister(CloudRegister, BackupLocalRegistry, BackupSettingsPort):
             self._log.warning(f"Invalid backup mode '{mode_str}', using MANUAL")
             mode = BackupMode.MANUAL
 
-        return BackupSettings(mode=mode)
+        return BackupSettings(
+            mode=mode, incremental=settings_data.get("incremental", False)
+        )
 
     async def save_backup_settings(self, settings: BackupSettings):
         self._check_connected()
         cloud_data = await self._load_cloud_data()
         backup_section = cloud_data.get("backup") or {}
 
-        backup_section["settings"] = {"mode": settings.mode.value}
+        backup_section["settings"] = {
+            "mode": settings.mode.value,
+            "incremental": settings.incremental,
+        }
 
         cloud_data["backup"] = backup_section
         await self._save_cloud_data(cloud_data)
-        self._log.debug(f"Backup settings saved: mode={settings.mode.value}")
+        self._log.debug(
+            f"Backup settings saved: mode={settings.mode.value}, incremental={settings.incremental}"
+        )
@@ -99,8 +99,13 @@ class ConfigLoader(ConfigPort, Backupable):
         with open(self._config_file, "rb") as file:
             return file.read()
 
-    async def import_data(self, data: bytes, **kwargs):
+    async def export_to(self, target: Path):
+        target.write_bytes(await self.export())
+
+    async def import_data(self, data: bytes | Path, **kwargs):
         self._check_connected()
+        if isinstance(data, Path):
+            data = data.read_bytes()
         with open(self._config_file, "wb") as file:
             file.write(data)
 
@@ -0,0 +1,99 @@
+import zlib
+from typing import AsyncGenerator, AsyncIterable
+
+import brotli
+from cachetools import LRUCache
+from quart import Quart, Response, request
+from quart.wrappers.response import DataBody, IterableBody
+
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSIBLE_MIMETYPES = {"application/json", "text/plain", "text/csv"}
+SUPPORTED_ENCODINGS = ["br", "gzip"]
+
+# Dynamic content, favour speed over ratio
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+
+class _Encoder:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._process = compressor.process
+            self._finish = compressor.finish
+        else:
+            compressor = zlib.compressobj(
+                GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+            self._process = compressor.compress
+            self._finish = compressor.flush
+
+    def process(self, data: bytes) -> bytes:
+        return self._process(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+    def encode(self, data: bytes) -> bytes:
+        return self.process(data) + self.finish()
+
+
+async def _compress_stream(
+    body: AsyncIterable[bytes], encoder: _Encoder
+) -> AsyncGenerator[bytes, None]:
+    async with body as chunks:
+        async for chunk in chunks:
+            compressed = encoder.process(chunk)
+            if compressed:
+                yield compressed
+    yield encoder.finish()
+
+
+def register_compression(
+    app: Quart, min_size: int = COMPRESSION_MIN_SIZE, memo_size: int = 32
+):
+    """
+    Compress JSON/text responses with brotli or gzip, depending on the client
+    Accept-Encoding. Buffered bodies below min_size are left untouched, streamed
+    ones are compressed chunk by chunk. Encoded bodies of responses carrying an
+    ETag are memoised, so conditional cache hits are not compressed again.
+    """
+    memo: LRUCache = LRUCache(maxsize=memo_size)
+
+    @app.after_request
+    async def compress_response(response: Response) -> Response:
+        if (
+            response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+
+        encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+        if encoding is None:
+            return response
+
+        body = response.response
+        if isinstance(body, DataBody):
+            if len(body.data) < min_size:
+                return response
+
+            etag = response.headers.get("ETag")
+            key = (etag, encoding)
+            encoded = memo.get(key) if etag else None
+            if encoded is None:
+                encoded = _Encoder(encoding).encode(body.data)
+                if etag:
+                    memo[key] = encoded
+            response.set_data(encoded)
+
+        elif isinstance(body, IterableBody):
+            response.response = IterableBody(_compress_stream(body, _Encoder(encoding)))
+            response.content_length = None
+
+        else:
+            return response
+
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        return response
@@ -1,11 +1,31 @@
 import datetime
+from decimal import Decimal
 from pathlib import Path
 
+import orjson
 from domain.dezimal import Dezimal
 from quart import Quart
 from quart.json.provider import DefaultJSONProvider
 from quart_cors import cors
 from infrastructure.controller import exception_handler
+from infrastructure.controller.compression import register_compression
+
+# Non-str keys cover the (str, Enum) keyed dicts used across the domain
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+
+def json_default(obj):
+    if isinstance(obj, Dezimal):
+        return float(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(obj) -> bytes:
+    return orjson.dumps(obj, default=json_default, option=JSON_OPTIONS)
 
 
 class FJSONProvider(DefaultJSONProvider):
@@ -18,6 +38,15 @@ class FJSONProvider(DefaultJSONProvider):
             return obj.isoformat()
         return super().default(obj)
 
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return dump_json(obj).decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dump_json(obj), mimetype=self.mimetype)
+
 
 class QuartApp(Quart):
     json_provider_class = FJSONProvider
@@ -31,5 +60,6 @@ def quart(static_upload_dir: Path):
     )
     cors(app, expose_headers=["Content-Disposition"])
     exception_handler.register_exception_handlers(app)
+    register_compression(app)
     app.config["MAX_CONTENT_LENGTH"] = 50 * 1000 * 1000
     return app
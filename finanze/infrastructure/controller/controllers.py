@@ -2,6 +2,7 @@ from domain.use_cases.add_entity_credentials import AddEntityCredentials
 from domain.use_cases.add_manual_transaction import AddManualTransaction
 from domain.use_cases.cancel_entity_login import CancelEntityLogin
 from domain.use_cases.calculate_loan import CalculateLoan
+from domain.use_cases.calculate_loan_schedule import CalculateLoanSchedule
 from domain.use_cases.calculate_savings import CalculateSavings
 from domain.use_cases.change_user_password import ChangeUserPassword
 from domain.use_cases.complete_external_entity_connection import (
@@ -86,6 +87,9 @@ from infrastructure.controller.routes.add_manual_transaction import (
 )
 from infrastructure.controller.routes.cancel_entity_login import cancel_entity_login
 from infrastructure.controller.routes.calculate_loan import calculate_loan
+from infrastructure.controller.routes.calculate_loan_schedule import (
+    calculate_loan_schedule,
+)
 from infrastructure.controller.routes.calculate_savings import calculate_savings
 from infrastructure.controller.routes.change_user_password import change_user_password
 from infrastructure.controller.routes.complete_external_entity_connection import (
@@ -156,6 +160,7 @@ from infrastructure.controller.routes.get_templates import get_templates
 from infrastructure.controller.routes.handle_cloud_auth import handle_cloud_auth
 from infrastructure.controller.routes.historic import get_historic
 from infrastructure.controller.routes.networth_timeline import networth_timeline
+from infrastructure.controller.routes.notifications import notifications
 from infrastructure.controller.routes.import_backup import import_backup
 from infrastructure.controller.routes.import_file import import_file_route
 from infrastructure.controller.routes.import_sheets import import_sheets
@@ -186,6 +191,9 @@ from infrastructure.controller.routes.update_tracked_loans import update_tracked
 from infrastructure.controller.routes.upload_backup import upload_backup
 from infrastructure.controller.routes.user_login import user_login
 from infrastructure.controller.routes.search_crypto_assets import search_crypto_assets
+from infrastructure.notifications.notification_broadcaster import (
+    NotificationBroadcaster,
+)
 
 
 async def register_routes(
@@ -239,6 +247,7 @@ async def register_routes(
     delete_real_estate_uc: DeleteRealEstate,
     list_real_estate_uc: ListRealEstate,
     calculate_loan_uc: CalculateLoan,
+    calculate_loan_schedule_uc: CalculateLoanSchedule,
     calculate_savings_uc: CalculateSavings,
     forecast_uc: Forecast,
     update_contributions_uc: UpdateContributions,
@@ -265,6 +274,7 @@ async def register_routes(
     get_backup_settings_uc: GetBackupSettings,
     save_backup_settings_uc: SaveBackupSettings,
     get_euribor_rates_uc: GetEuriborRates,
+    notification_broadcaster: NotificationBroadcaster,
 ):
     @app.route("/api/v1/login", methods=["POST"])
     async def user_login_route():
@@ -464,6 +474,10 @@ async def register_routes(
     async def calculate_loan_route():
         return await calculate_loan(calculate_loan_uc)
 
+    @app.route("/api/v1/calculation/loan/schedule", methods=["POST"])
+    async def calculate_loan_schedule_route():
+        return await calculate_loan_schedule(calculate_loan_schedule_uc)
+
     @app.route("/api/v1/forecast", methods=["POST"])
     async def forecast_route():
         return await forecast(forecast_uc)
@@ -576,6 +590,10 @@ async def register_routes(
     async def get_euribor_rates_route():
         return await get_euribor_rates(get_euribor_rates_uc)
 
+    @app.route("/api/v1/notifications", methods=["GET"])
+    async def notifications_route():
+        return await notifications(notification_broadcaster)
+
     @app.route("/oauth/callback", methods=["GET"])
     async def oauth_callback_route():
         return await oauth_callback()
@@ -0,0 +1,48 @@
+from time import perf_counter
+
+from quart import Quart, Response, g, request
+
+from infrastructure.instrumentation.metrics import (
+    CONTENT_TYPE,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    REGISTRY,
+)
+
+METRICS_ROUTE = "/metrics"
+
+
+def register_metrics(app: Quart):
+    """
+    Prometheus scrape endpoint plus request latency and in-flight tracking.
+    Latency is labelled with the route rule instead of the path, so ids in the
+    URL don't create new series.
+    """
+
+    @app.before_request
+    async def start_request_timer():
+        if request.path == METRICS_ROUTE:
+            return
+        g.metrics_start = perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+
+    @app.after_request
+    async def observe_request(response: Response) -> Response:
+        start = g.get("metrics_start")
+        if start is not None:
+            rule = request.url_rule.rule if request.url_rule else "unmatched"
+            HTTP_REQUEST_SECONDS.labels(
+                request.method, rule, response.status_code
+            ).observe(perf_counter() - start)
+        return response
+
+    @app.teardown_request
+    async def end_request(_exc):
+        # Teardown also runs when the handler raised, keeping the gauge balanced
+        if g.pop("metrics_start", None) is not None:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+    async def metrics():
+        return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
+
+    app.add_url_rule(METRICS_ROUTE, view_func=metrics, methods=["GET"])
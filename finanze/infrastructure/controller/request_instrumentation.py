@@ -0,0 +1,116 @@
+import logging
+from collections import deque
+from typing import Callable, Optional
+
+from quart import Quart, Response, g, jsonify, request
+
+from domain.exception.exceptions import NoUserLogged
+from infrastructure.instrumentation.request_stats import (
+    RequestStats,
+    StatementTiming,
+    start_request,
+)
+from infrastructure.repository.db.client import DBClient
+
+DEBUG_REQUESTS_ROUTE = "/api/v1/debug/requests"
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class RequestInstrumentation:
+    """
+    Per-request timing. Every response gets a Server-Timing header with the
+    DB time and query count, the DB client lock wait and the outbound HTTP time
+    per provider host. The last requests, including their slowest statements,
+    are kept in memory and served by the debug route to the logged user. Query
+    plans are only worked out when the debug route is read.
+    """
+
+    def __init__(
+        self,
+        db_client: DBClient,
+        logged_in: Callable[[], bool],
+        history_size: int = 100,
+    ):
+        self._db_client = db_client
+        self._logged_in = logged_in
+        self._history: deque[dict] = deque(maxlen=history_size)
+        self._log = logging.getLogger(__name__)
+
+    def register(self, app: Quart):
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule(
+            DEBUG_REQUESTS_ROUTE,
+            view_func=self._debug_requests,
+            methods=["GET"],
+            endpoint="debug_requests",
+        )
+
+    def history(self) -> list[dict]:
+        return list(reversed(self._history))
+
+    async def _before_request(self):
+        if request.path != DEBUG_REQUESTS_ROUTE:
+            g.request_stats = start_request()
+
+    async def _after_request(self, response: Response) -> Response:
+        stats: Optional[RequestStats] = g.pop("request_stats", None)
+        if stats is None:
+            return response
+
+        elapsed = stats.elapsed()
+        response.headers["Server-Timing"] = self._server_timing(stats, elapsed)
+        self._history.append(self._profile(stats, elapsed, response.status_code))
+        return response
+
+    async def _debug_requests(self):
+        if not self._logged_in():
+            raise NoUserLogged()
+
+        requests = []
+        for profile in self.history():
+            slowest = [self._explained(t) for t in profile["slowest_statements"]]
+            requests.append({**profile, "slowest_statements": slowest})
+        return jsonify({"requests": requests})
+
+    @staticmethod
+    def _server_timing(stats: RequestStats, elapsed: float) -> str:
+        metrics = [
+            f'db;dur={_ms(stats.db_time)};desc="{stats.query_count} queries"',
+            f"lock;dur={_ms(stats.lock_wait)}",
+        ]
+        for host, duration in stats.http_time.items():
+            metrics.append(f'http;dur={_ms(duration)};desc="{host}"')
+        metrics.append(f"total;dur={_ms(elapsed)}")
+        return ", ".join(metrics)
+
+    def _explained(self, timing: StatementTiming) -> dict:
+        try:
+            plan = self._db_client.explain(timing.statement, *timing.args)
+        except Exception as e:
+            # Locked datasource or a statement that can't be re-planned
+            self._log.debug(f"Could not explain statement: {e}")
+            plan = None
+        return {
+            "statement": " ".join(timing.statement.split()),
+            "duration_ms": _ms(timing.duration),
+            "plan": plan,
+        }
+
+    @staticmethod
+    def _profile(stats: RequestStats, elapsed: float, status: int) -> dict:
+        return {
+            "method": request.method,
+            "path": request.path,
+            "status": status,
+            "duration_ms": _ms(elapsed),
+            "query_count": stats.query_count,
+            "db_ms": _ms(stats.db_time),
+            "lock_wait_ms": _ms(stats.lock_wait),
+            "http_calls": stats.http_calls,
+            "http_ms": {host: _ms(d) for host, d in stats.http_time.items()},
+            "slowest_statements": stats.slowest_statements(),
+        }
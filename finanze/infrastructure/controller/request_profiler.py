@@ -0,0 +1,182 @@
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import orjson
+from quart import Quart, Response, g, jsonify, request
+
+from domain.exception.exceptions import NoUserLogged
+from infrastructure.instrumentation.profiler import (
+    DEFAULT_INTERVAL,
+    Profile,
+    SamplingProfiler,
+)
+
+PROFILER_ROUTE = "/api/v1/debug/profiler"
+ALL_ROUTES = "*"
+
+
+def _slug(route: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+
+
+class RequestProfiler:
+    """
+    Opt-in sampling profiler for API routes. Requests to an enabled route
+    (matched against the route rule, or * for all of them) run under a
+    SamplingProfiler and, if they take longer than the threshold, their
+    profile is written to the output directory both as collapsed stacks and
+    as a speedscope file, keeping only the newest max_profiles. Routes can be
+    toggled at runtime through the debug route, which is only registered on
+    demand and requires a logged user. Only one request is profiled at a time,
+    overlapping ones run as usual.
+    """
+
+    MAX_PROFILES = 100
+
+    def __init__(
+        self,
+        output_dir: Path,
+        logged_in: Callable[[], bool],
+        routes: Iterable[str] = (),
+        threshold: float = 0.5,
+        interval: float = DEFAULT_INTERVAL,
+        max_profiles: int = MAX_PROFILES,
+    ):
+        self._output_dir = Path(output_dir)
+        self._logged_in = logged_in
+        self._routes: set[str] = set(routes)
+        self._threshold = threshold
+        self._max_profiles = max_profiles
+        self._profiler = SamplingProfiler(interval)
+        self._log = logging.getLogger(__name__)
+
+    @property
+    def routes(self) -> set[str]:
+        return set(self._routes)
+
+    def enable(self, route: str):
+        self._routes.add(route)
+
+    def disable(self, route: str):
+        self._routes.discard(route)
+
+    def register(self, app: Quart, debug_route: bool = False):
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        if not debug_route:
+            return
+
+        app.add_url_rule(
+            PROFILER_ROUTE,
+            view_func=self._get_state,
+            methods=["GET"],
+            endpoint="get_profiler",
+        )
+        app.add_url_rule(
+            PROFILER_ROUTE,
+            view_func=self._update_state,
+            methods=["POST"],
+            endpoint="update_profiler",
+        )
+
+    def _enabled_for(self, route: Optional[str]) -> bool:
+        if not self._routes or route is None or route == PROFILER_ROUTE:
+            return False
+        return ALL_ROUTES in self._routes or route in self._routes
+
+    async def _before_request(self):
+        rule = request.url_rule.rule if request.url_rule else None
+        if not self._enabled_for(rule) or self._profiler.running:
+            return
+
+        self._profiler.start()
+        g.profiled_route = rule
+
+    async def _after_request(self, response: Response) -> Response:
+        route = g.pop("profiled_route", None)
+        if route is None:
+            return response
+
+        profile = self._profiler.stop(f"{request.method} {request.path}")
+        if profile.duration >= self._threshold:
+            self._save(route, profile)
+        return response
+
+    async def _teardown_request(self, _exc):
+        # The request failed before after_request could stop the sampler
+        if g.pop("profiled_route", None) is not None:
+            self._profiler.stop()
+
+    def _save(self, route: str, profile: Profile):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        name = f"{stamp}_{_slug(route)}_{round(profile.duration * 1000)}ms"
+        try:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            (self._output_dir / f"{name}.collapsed.txt").write_text(
+                profile.to_collapsed(), encoding="utf-8"
+            )
+            (self._output_dir / f"{name}.speedscope.json").write_bytes(
+                orjson.dumps(profile.to_speedscope())
+            )
+        except OSError as e:
+            self._log.warning(f"Could not write profile {name}: {e}")
+            return
+
+        self._log.info(
+            f"Profiled {profile.name} ({profile.duration * 1000:.0f} ms, "
+            f"{profile.sample_count} samples) to {self._output_dir / name}"
+        )
+        self._rotate()
+
+    def _rotate(self):
+        # Names start with the timestamp, so they sort oldest first
+        profiles = sorted(self._output_dir.glob("*.speedscope.json"))
+        for speedscope in profiles[: max(0, len(profiles) - self._max_profiles)]:
+            name = speedscope.name.removesuffix(".speedscope.json")
+            try:
+                speedscope.unlink(missing_ok=True)
+                (self._output_dir / f"{name}.collapsed.txt").unlink(missing_ok=True)
+            except OSError as e:
+                self._log.warning(f"Could not remove old profile {name}: {e}")
+
+    async def _get_state(self):
+        if not self._logged_in():
+            raise NoUserLogged()
+        return jsonify(self._state())
+
+    async def _update_state(self):
+        if not self._logged_in():
+            raise NoUserLogged()
+
+        body = await request.get_json() or {}
+        route = body.get("route")
+        if not route:
+            return jsonify({"message": "Route not provided"}), 400
+
+        threshold_ms = body.get("thresholdMs")
+        if threshold_ms is not None:
+            try:
+                threshold_ms = float(threshold_ms)
+            except (TypeError, ValueError):
+                return jsonify({"message": "Invalid thresholdMs"}), 400
+
+        if body.get("enabled", True):
+            self.enable(route)
+        else:
+            self.disable(route)
+
+        if threshold_ms is not None:
+            self._threshold = threshold_ms / 1000
+
+        return jsonify(self._state())
+
+    def _state(self) -> dict:
+        return {
+            "routes": sorted(self._routes),
+            "thresholdMs": self._threshold * 1000,
+            "outputDir": str(self._output_dir),
+        }
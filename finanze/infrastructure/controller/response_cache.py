@@ -0,0 +1,133 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import AsyncGenerator, AsyncIterable, Awaitable, Callable, Optional
+
+from cachetools import LRUCache
+from quart import Quart, Response, g, request
+from quart.wrappers.response import DataBody, IterableBody
+
+LastUpdateProvider = Callable[[], Awaitable[datetime]]
+
+# Read-only routes whose payload only depends on the user DB contents
+CACHEABLE_ROUTES = frozenset(
+    {
+        "/api/v1/positions",
+        "/api/v1/contributions",
+        "/api/v1/transactions",
+        "/api/v1/historic",
+        "/api/v1/flows/periodic",
+        "/api/v1/flows/pending",
+        "/api/v1/real-estate",
+        "/api/v1/templates",
+    }
+)
+
+
+@dataclass
+class _CachedBody:
+    etag: str
+    body: bytes
+    mimetype: str
+
+
+class ResponseCache:
+    """
+    Conditional GET support for read-only routes. The ETag is derived from the
+    DB last_update timestamp plus the request path and query parameters, so any
+    committed write invalidates it. Matching If-None-Match requests are answered
+    with 304 and repeated ones are served from the last serialised body, both
+    without reaching the route handler.
+    """
+
+    def __init__(
+        self,
+        last_update_provider: LastUpdateProvider,
+        routes: frozenset[str] = CACHEABLE_ROUTES,
+        max_entries: int = 64,
+    ):
+        self._last_update_provider = last_update_provider
+        self._routes = routes
+        self._entries: LRUCache = LRUCache(maxsize=max_entries)
+        self._log = logging.getLogger(__name__)
+
+    def register(self, app: Quart):
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    def clear(self):
+        self._entries.clear()
+
+    async def _before_request(self) -> Optional[Response]:
+        if request.method != "GET" or request.path not in self._routes:
+            return None
+
+        try:
+            last_update = await self._last_update_provider()
+        except Exception as e:
+            # Locked/uninitialized datasource, let the route handle it
+            self._log.debug(f"Skipping response cache: {e}")
+            return None
+
+        key = self._key()
+        etag = self._etag(key, last_update)
+        g.response_cache = (key, etag)
+
+        if request.if_none_match.contains_weak(etag):
+            g.response_cache_hit = True
+            response = Response(b"", status=304)
+            response.set_etag(etag, weak=True)
+            return response
+
+        cached = self._entries.get(key)
+        if cached is not None and cached.etag == etag:
+            g.response_cache_hit = True
+            response = Response(cached.body, mimetype=cached.mimetype)
+            response.set_etag(etag, weak=True)
+            return response
+
+        return None
+
+    async def _after_request(self, response: Response) -> Response:
+        cache_ctx = g.pop("response_cache", None)
+        if cache_ctx is None or g.pop("response_cache_hit", False):
+            return response
+
+        if response.status_code != 200:
+            return response
+
+        key, etag = cache_ctx
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "no-cache"
+
+        body = response.response
+        if isinstance(body, DataBody):
+            self._entries[key] = _CachedBody(etag, body.data, response.mimetype)
+        elif isinstance(body, IterableBody):
+            response.response = IterableBody(
+                self._tee(body, key, etag, response.mimetype)
+            )
+
+        return response
+
+    async def _tee(
+        self, body: AsyncIterable[bytes], key: tuple, etag: str, mimetype: str
+    ) -> AsyncGenerator[bytes, None]:
+        chunks = []
+        async with body as parts:
+            async for chunk in parts:
+                chunks.append(chunk)
+                yield chunk
+        self._entries[key] = _CachedBody(etag, b"".join(chunks), mimetype)
+
+    @staticmethod
+    def _key() -> tuple:
+        args = tuple(sorted(request.args.items(multi=True)))
+        return request.path, args
+
+    @staticmethod
+    def _etag(key: tuple, last_update: datetime) -> str:
+        # Some payloads derive values from the current date (maturities, ...)
+        raw = f"{last_update.isoformat()}|{date.today().isoformat()}|{key!r}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
@@ -0,0 +1,24 @@
+from dataclasses import asdict
+
+from domain.exception.exceptions import MissingFieldsError
+from domain.use_cases.calculate_loan_schedule import CalculateLoanSchedule
+from infrastructure.controller.mappers.loan_calculation_mapper import (
+    map_loan_calculation_params,
+)
+from quart import jsonify, request
+
+
+async def calculate_loan_schedule(calculate_loan_schedule_uc: CalculateLoanSchedule):
+    body = await request.get_json() or {}
+
+    try:
+        params = map_loan_calculation_params(body)
+    except (KeyError, ValueError, TypeError) as e:
+        return jsonify({"code": "INVALID_REQUEST", "message": str(e)}), 400
+
+    try:
+        result = await calculate_loan_schedule_uc.execute(params)
+    except MissingFieldsError as e:
+        return jsonify({"message": str(e)}), 400
+
+    return jsonify(asdict(result)), 200
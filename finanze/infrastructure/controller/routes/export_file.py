@@ -1,12 +1,12 @@
 from http import HTTPStatus
-from io import BytesIO
 
 from domain.entity import Feature
 from domain.export import FileExportRequest, FileFormat, NumberFormat
 from domain.global_position import ProductType
 from domain.settings import TemplateConfig
 from domain.use_cases.export_file import ExportFile
-from quart import jsonify, request, send_file
+from infrastructure.controller.streaming import send_file_stream
+from quart import jsonify, request
 
 
 async def export_file(export_file_uc: ExportFile):
@@ -100,11 +100,8 @@ async def export_file(export_file_uc: ExportFile):
 
     result = await export_file_uc.execute(file_request)
 
-    response = await send_file(
-        BytesIO(result.data),
+    return await send_file_stream(
+        result.data,
         mimetype=result.content_type,
-        as_attachment=True,
         attachment_filename=result.filename,
     )
-    response.headers["Content-Length"] = str(result.size)
-    return response
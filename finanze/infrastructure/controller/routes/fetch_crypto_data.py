@@ -1,9 +1,11 @@
+from time import perf_counter
 from uuid import UUID
 
 from domain.entity import Feature
 from domain.fetch_result import FetchOptions, FetchRequest
 from domain.use_cases.fetch_crypto_data import FetchCryptoData
 from quart import jsonify, request
+from infrastructure.instrumentation.metrics import observe_fetch
 
 
 async def fetch_crypto_data(fetch_crypto_data_uc: FetchCryptoData):
@@ -20,7 +22,13 @@ async def fetch_crypto_data(fetch_crypto_data_uc: FetchCryptoData):
         features=[Feature.POSITION],
         fetch_options=FetchOptions(deep=deep),
     )
-    result = await fetch_crypto_data_uc.execute(fetch_request)
+    start = perf_counter()
+    result = None
+    try:
+        result = await fetch_crypto_data_uc.execute(fetch_request)
+    finally:
+        code = result.code if result is not None else None
+        observe_fetch("crypto", entity, code, perf_counter() - start)
 
     response = {"code": result.code}
     if result.details:
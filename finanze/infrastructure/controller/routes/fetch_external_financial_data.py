@@ -1,8 +1,10 @@
+from time import perf_counter
 from uuid import UUID
 
 from domain.external_entity import ExternalFetchRequest
 from domain.use_cases.fetch_external_financial_data import FetchExternalFinancialData
 from quart import jsonify
+from infrastructure.instrumentation.metrics import observe_fetch
 
 
 async def fetch_external_financial_data(
@@ -17,7 +19,13 @@ async def fetch_external_financial_data(
     fetch_request = ExternalFetchRequest(
         external_entity_id=external_entity_id,
     )
-    result = await fetch_external_financial_data_uc.execute(fetch_request)
+    start = perf_counter()
+    result = None
+    try:
+        result = await fetch_external_financial_data_uc.execute(fetch_request)
+    finally:
+        code = result.code if result is not None else None
+        observe_fetch("external", external_entity_id, code, perf_counter() - start)
 
     response = {"code": result.code}
     if result.details:
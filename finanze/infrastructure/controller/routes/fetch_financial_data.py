@@ -1,3 +1,4 @@
+from time import perf_counter
 from uuid import UUID
 
 from domain.entity import Feature
@@ -5,6 +6,7 @@ from domain.entity_login import LoginOptions, TwoFactor
 from domain.fetch_result import FetchOptions, FetchRequest
 from domain.use_cases.fetch_financial_data import FetchFinancialData
 from quart import jsonify, request
+from infrastructure.instrumentation.metrics import observe_fetch
 
 
 def _map_features(features: list[str]) -> list[Feature]:
@@ -44,7 +46,13 @@ async def fetch_financial_data(fetch_financial_data_uc: FetchFinancialData):
         login_options=LoginOptions(avoid_new_login=avoid_new_login),
         credentials=credentials,
     )
-    result = await fetch_financial_data_uc.execute(fetch_request)
+    start = perf_counter()
+    result = None
+    try:
+        result = await fetch_financial_data_uc.execute(fetch_request)
+    finally:
+        code = result.code if result is not None else None
+        observe_fetch("financial", entity_account_id, code, perf_counter() - start)
 
     response = {"code": result.code}
     if result.details:
@@ -1,7 +1,14 @@
 from datetime import date
+from typing import Optional
 
 from domain.dezimal import Dezimal
-from domain.forecast import ForecastRequest
+from domain.forecast import (
+    DEFAULT_PERCENTILES,
+    MAX_MONTE_CARLO_PATHS,
+    ForecastRequest,
+    MonteCarloRequest,
+    ReturnAssumption,
+)
 from domain.use_cases.forecast import Forecast
 from quart import jsonify, request
 
@@ -48,6 +55,11 @@ async def forecast(forecast_uc: Forecast):
             }
         ), 400
 
+    try:
+        monte_carlo = _parse_monte_carlo(body.get("monte_carlo"))
+    except (KeyError, ValueError, TypeError) as e:
+        return jsonify({"code": "INVALID_REQUEST", "message": str(e)}), 400
+
     try:
         result = await forecast_uc.execute(
             ForecastRequest(
@@ -56,9 +68,46 @@ async def forecast(forecast_uc: Forecast):
                 avg_annual_crypto_increase=avg_crypto_increase,
                 avg_annual_commodity_increase=avg_commodity_increase,
                 include_real_estate_taxes=bool(include_re_taxes),
+                monte_carlo=monte_carlo,
             )
         )
     except ValueError as e:
         return jsonify({"code": "INVALID_REQUEST", "message": str(e)}), 400
 
     return jsonify(result), 200
+
+
+def _parse_return_assumption(raw: Optional[dict]) -> Optional[ReturnAssumption]:
+    if raw is None:
+        return None
+    if not isinstance(raw, dict):
+        raise TypeError("expected an object")
+    volatility = Dezimal(raw["volatility"])
+    if volatility < Dezimal(0):
+        raise ValueError("volatility must not be negative")
+    return ReturnAssumption(mean=Dezimal(raw["mean"]), volatility=volatility)
+
+
+def _parse_monte_carlo(raw: Optional[dict]) -> Optional[MonteCarloRequest]:
+    if raw is None:
+        return None
+    if not isinstance(raw, dict):
+        raise TypeError("expected an object")
+
+    paths = int(raw.get("paths", 1000))
+    if not 0 < paths <= MAX_MONTE_CARLO_PATHS:
+        raise ValueError(f"paths must be between 1 and {MAX_MONTE_CARLO_PATHS}")
+
+    percentiles = [int(p) for p in raw.get("percentiles", DEFAULT_PERCENTILES)]
+    if not percentiles or any(not 0 <= p <= 100 for p in percentiles):
+        raise ValueError("percentiles must be between 0 and 100")
+
+    seed = raw.get("seed")
+    return MonteCarloRequest(
+        market=_parse_return_assumption(raw.get("market")),
+        crypto=_parse_return_assumption(raw.get("crypto")),
+        commodity=_parse_return_assumption(raw.get("commodity")),
+        paths=paths,
+        seed=int(seed) if seed is not None else None,
+        percentiles=sorted(set(percentiles)),
+    )
@@ -3,6 +3,7 @@ from uuid import UUID
 from domain.global_position import ProductType
 from domain.historic import HistoricQueryRequest, HistoricSortBy, SortOrder
 from domain.use_cases.get_historic import GetHistoric
+from infrastructure.controller.streaming import jsonify_stream
 from quart import jsonify, request
 
 
@@ -68,4 +69,4 @@ async def get_historic(get_historic_uc: GetHistoric):
     )
 
     result = await get_historic_uc.execute(query)
-    return jsonify({"entries": result.entries}), 200
+    return jsonify_stream(result.entries, key="entries"), 200
@@ -2,6 +2,7 @@ from datetime import date
 
 from domain.networth_timeline import NetworthTimelineQuery
 from domain.use_cases.get_networth_timeline import GetNetworthTimeline
+from infrastructure.controller.streaming import jsonify_stream
 from quart import jsonify, request
 
 
@@ -55,15 +56,14 @@ async def networth_timeline(get_networth_timeline_uc: GetNetworthTimeline):
 
     result = await get_networth_timeline_uc.execute(query)
 
-    payload = {
-        "currency": result.currency,
-        "points": [
-            {
-                "date": point.date.isoformat(),
-                "total": point.total,
-                "breakdown": dict(point.breakdown),
-            }
-            for point in result.points
-        ],
-    }
-    return jsonify(payload), 200
+    points = [
+        {
+            "date": point.date,
+            "total": point.total,
+            "breakdown": point.breakdown,
+        }
+        for point in result.points
+    ]
+    return jsonify_stream(
+        points, key="points", extra={"currency": result.currency}
+    ), 200
@@ -0,0 +1,42 @@
+import asyncio
+from typing import AsyncGenerator
+
+from quart import current_app
+
+from domain.notification import Notification
+from infrastructure.controller.config import dump_json
+from infrastructure.notifications.notification_broadcaster import (
+    NotificationBroadcaster,
+)
+
+KEEPALIVE_INTERVAL = 15
+
+
+def _format_event(notification: Notification) -> bytes:
+    return (
+        b"event: "
+        + notification.type.value.encode()
+        + b"\ndata: "
+        + dump_json(notification)
+        + b"\n\n"
+    )
+
+
+async def notifications(broadcaster: NotificationBroadcaster):
+    async def events() -> AsyncGenerator[bytes, None]:
+        async with broadcaster.subscribe() as queue:
+            while True:
+                try:
+                    notification = await asyncio.wait_for(
+                        queue.get(), KEEPALIVE_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield _format_event(notification)
+
+    response = current_app.response_class(events(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    response.timeout = None
+    return response
@@ -16,9 +16,13 @@ async def save_backup_settings(save_backup_settings_uc: SaveBackupSettings):
     except ValueError:
         return {"message": "Invalid mode value. Must be one of: OFF, MANUAL, AUTO"}, 400
 
-    settings = BackupSettings(mode=mode)
+    incremental = body.get("incremental", False)
+    if not isinstance(incremental, bool):
+        return {"message": "Field 'incremental' must be a boolean"}, 400
+
+    settings = BackupSettings(mode=mode, incremental=incremental)
     result = await save_backup_settings_uc.execute(settings)
 
-    response = {"mode": result.mode.value}
+    response = {"mode": result.mode.value, "incremental": result.incremental}
 
     return jsonify(response), 200
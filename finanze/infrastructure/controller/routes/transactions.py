@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from domain.transactions import TransactionQueryRequest
+from infrastructure.controller.streaming import jsonify_stream
 from quart import jsonify, request
 
 
@@ -32,4 +33,4 @@ async def transactions(get_transactions_uc):
 
     result = await get_transactions_uc.execute(query)
 
-    return jsonify({"transactions": result.transactions}), 200
+    return jsonify_stream(result.transactions, key="transactions"), 200
@@ -0,0 +1,52 @@
+from typing import Any, AsyncGenerator, AsyncIterable, Optional, Sequence
+
+from quart import Response, current_app
+
+from infrastructure.controller.config import dump_json
+
+STREAM_CHUNK_SIZE = 500
+
+
+def jsonify_stream(
+    items: Sequence[Any],
+    key: Optional[str] = None,
+    extra: Optional[dict] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Response:
+    """
+    Build a chunked JSON response for list-shaped payloads, serialising
+    chunk_size elements at a time instead of materialising the whole body.
+
+    Without key the body is a plain JSON array, otherwise the array is placed
+    under key, next to the (already small) extra fields.
+    """
+    if key is None:
+        prefix, suffix = b"[", b"]\n"
+    else:
+        head = dump_json(extra) if extra else b"{}"
+        sep = b"," if len(head) > 2 else b""
+        prefix = head[:-1] + sep + dump_json(key) + b":["
+        suffix = b"]}\n"
+
+    async def body() -> AsyncGenerator[bytes, None]:
+        yield prefix
+        for start in range(0, len(items), chunk_size):
+            chunk = dump_json(items[start : start + chunk_size])
+            if start:
+                yield b"," + chunk[1:-1]
+            else:
+                yield chunk[1:-1]
+        yield suffix
+
+    return current_app.response_class(body(), mimetype="application/json")
+
+
+async def send_file_stream(
+    chunks: AsyncIterable[bytes], mimetype: str, attachment_filename: str
+) -> Response:
+    """Attachment response sending the chunks as they are produced."""
+    response = current_app.response_class(chunks, mimetype=mimetype)
+    response.headers.add(
+        "Content-Disposition", "attachment", filename=attachment_filename
+    )
+    return response
@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+from application.ports.exchange_rate_storage import ExchangeRateStorage
+from dateutil.tz import tzlocal
+from domain.dezimal import Dezimal
+from domain.exchange_rate import ExchangeRates
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS latest_rates (
+    base TEXT NOT NULL,
+    quote TEXT NOT NULL,
+    rate TEXT NOT NULL,
+    PRIMARY KEY (base, quote)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS pivot_rates (
+    currency TEXT NOT NULL,
+    day TEXT NOT NULL,
+    rate TEXT NOT NULL,
+    PRIMARY KEY (currency, day)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ONE = Dezimal(1)
+
+
+class ExchangeRateSQLiteStorage(ExchangeRateStorage):
+    """
+    Exchange rates in rates.db. The last saved matrix is kept as is, so get()
+    returns the same rates after a restart, and each save also records that
+    day's rates against PIVOT_CURRENCY, one row per currency and day, building
+    up a daily history without storing a full cross matrix per day.
+    """
+
+    FILENAME = "rates.db"
+    LEGACY_FILENAME = "rates.json"
+    PIVOT_CURRENCY = "EUR"
+
+    LAST_SAVED_KEY = "last_saved"
+
+    def __init__(self, base_path: str):
+        os.makedirs(base_path, exist_ok=True)
+        self._log = logging.getLogger(__name__)
+
+        self._connection = sqlite3.connect(
+            os.path.join(base_path, self.FILENAME), check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+        self._last_saved: datetime | None = None
+        self._matrix: ExchangeRates | None = None
+
+        self._load_metadata()
+        self._migrate_legacy_file(os.path.join(base_path, self.LEGACY_FILENAME))
+
+    def _load_metadata(self):
+        row = self._connection.execute(
+            "SELECT value FROM metadata WHERE key = ?", (self.LAST_SAVED_KEY,)
+        ).fetchone()
+        if row:
+            self._last_saved = datetime.fromisoformat(row[0])
+
+    def _migrate_legacy_file(self, path: str):
+        if not os.path.exists(path):
+            return
+
+        try:
+            if self._last_saved is None and os.path.getsize(path) > 0:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                last_saved = datetime.fromisoformat(data[self.LAST_SAVED_KEY])
+                rates = {
+                    base: {quote: Dezimal(str(val)) for quote, val in quotes.items()}
+                    for base, quotes in data.get("rates", {}).items()
+                }
+                self._store_snapshot(rates, last_saved)
+            os.remove(path)
+        except Exception as e:
+            self._log.warning(f"Failed to migrate exchange rates from {path}: {e}")
+
+    async def get(self) -> ExchangeRates:
+        if self._matrix is None:
+            self._matrix = self._load_matrix()
+        return self._matrix
+
+    async def save(self, exchange_rates: ExchangeRates):
+        try:
+            self._store_snapshot(exchange_rates, datetime.now(tzlocal()))
+            self._matrix = exchange_rates
+        except Exception as e:
+            self._log.exception(f"Failed to persist exchange rates: {e}")
+
+    async def get_last_saved(self) -> datetime | None:
+        return self._last_saved
+
+    def _load_matrix(self) -> ExchangeRates:
+        matrix = {}
+        for base, quote, rate in self._connection.execute(
+            "SELECT base, quote, rate FROM latest_rates"
+        ):
+            matrix.setdefault(base, {})[quote] = Dezimal(rate)
+        return matrix
+
+    def _to_pivot(self, exchange_rates: ExchangeRates) -> dict[str, Dezimal]:
+        pivot_rates = dict(exchange_rates.get(self.PIVOT_CURRENCY, {}))
+        pivot_rates[self.PIVOT_CURRENCY] = _ONE
+        # Symbols only quoted against other bases are chained through them
+        for base, quotes in exchange_rates.items():
+            base_rate = pivot_rates.get(base)
+            if not base_rate:
+                continue
+            for quote, rate in quotes.items():
+                if quote not in pivot_rates:
+                    pivot_rates[quote] = base_rate * rate
+        del pivot_rates[self.PIVOT_CURRENCY]
+        return pivot_rates
+
+    def _store_snapshot(self, exchange_rates: ExchangeRates, saved_at: datetime):
+        day = saved_at.date().isoformat()
+        pivot_rows = [
+            (currency, day, str(rate))
+            for currency, rate in self._to_pivot(exchange_rates).items()
+        ]
+        latest_rows = [
+            (base, quote, str(rate))
+            for base, quotes in exchange_rates.items()
+            for quote, rate in quotes.items()
+        ]
+
+        with self._connection:
+            self._connection.execute("DELETE FROM latest_rates")
+            self._connection.executemany(
+                "INSERT INTO latest_rates (base, quote, rate) VALUES (?, ?, ?)",
+                latest_rows,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pivot_rates (currency, day, rate) VALUES (?, ?, ?)",
+                pivot_rows,
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                (self.LAST_SAVED_KEY, saved_at.isoformat()),
+            )
+
+        self._last_saved = saved_at
@@ -0,0 +1,33 @@
+from aiocache import cached
+from aiocache.plugins import BasePlugin
+
+from infrastructure.instrumentation.metrics import CACHE_REQUESTS
+
+
+class CacheMetricsPlugin(BasePlugin):
+    """Counts hits and misses of an aiocache cache."""
+
+    def __init__(self, name: str):
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+
+    async def post_get(self, client, key, took=0, ret=None, **kwargs):
+        if ret is None:
+            self._misses.inc()
+        else:
+            self._hits.inc()
+
+
+def metered_cached(**kwargs):
+    """aiocache @cached counting its hits and misses under the function's qualified name."""
+
+    def decorator(func):
+        plugins = [*kwargs.get("plugins", ()), CacheMetricsPlugin(func.__qualname__)]
+        return cached(**{**kwargs, "plugins": plugins})(func)
+
+    return decorator
+
+
+def cache_metrics(owner: object, attribute: str) -> list[BasePlugin]:
+    """Plugins argument for an aiocache Cache held by owner under attribute."""
+    return [CacheMetricsPlugin(f"{type(owner).__qualname__}.{attribute}")]
@@ -0,0 +1,31 @@
+from cachetools import TTLCache, cached
+
+from infrastructure.instrumentation.metrics import CACHE_REQUESTS
+
+
+class MeteredTTLCache(TTLCache):
+    """TTLCache counting hits and misses of the lookups done by @cached."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float, **kwargs):
+        super().__init__(maxsize=maxsize, ttl=ttl, **kwargs)
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+
+    def __getitem__(self, key):
+        try:
+            value = super().__getitem__(key)
+        except KeyError:
+            self._misses.inc()
+            raise
+        self._hits.inc()
+        return value
+
+
+def metered_ttl_cached(maxsize: int, ttl: float, **kwargs):
+    """cachetools @cached on a MeteredTTLCache named after the function's qualified name."""
+
+    def decorator(func):
+        cache = MeteredTTLCache(func.__qualname__, maxsize=maxsize, ttl=ttl, **kwargs)
+        return cached(cache=cache)(func)
+
+    return decorator
@@ -0,0 +1,360 @@
+import math
+import os
+import sys
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from domain.fetch_result import FetchResultCode
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DB_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+FETCH_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+Sample = tuple[str, dict[str, str], float]
+# (name, type, help, samples) computed at scrape time
+MetricFamily = tuple[str, str, str, list[Sample]]
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+        return f"{name}{{{rendered}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = Lock()
+
+    def labels(self, *values):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _unlabelled(self):
+        return self.labels()
+
+    def samples(self) -> list[Sample]:
+        result = []
+        for key, child in list(self._children.items()):
+            labels = dict(zip(self.labelnames, key))
+            result.extend(child.samples(self.name, labels))
+        return result
+
+
+class _CounterValue:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name: str, labels: dict[str, str]) -> list[Sample]:
+        return [(name, labels, self.value)]
+
+
+class _GaugeValue(_CounterValue):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        self.value = value
+
+
+class _HistogramValue:
+    __slots__ = ("_upper_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self._upper_bounds = buckets
+        # Non-cumulative counts, the last slot holds observations above every bound
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self, name: str, labels: dict[str, str]) -> list[Sample]:
+        result = []
+        cumulative = 0
+        bounds = (*self._upper_bounds, math.inf)
+        for bound, count in zip(bounds, self._counts):
+            cumulative += count
+            result.append(
+                (f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative)
+            )
+        result.append((f"{name}_count", labels, cumulative))
+        result.append((f"{name}_sum", labels, self._sum))
+        return result
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeValue()
+
+    def inc(self, amount: float = 1.0):
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float):
+        self._unlabelled().set(value)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._unlabelled().observe(value)
+
+
+class MetricsRegistry:
+    """
+    Minimal Prometheus registry. Updating a metric is a dict lookup plus a
+    locked increment, everything else (cumulative buckets, collectors such as
+    process memory or cache ratios) is only computed when rendering, so the
+    cost stays negligible while nobody scrapes.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Collector] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Collector):
+        self._collectors.append(collector)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        families = [
+            (m.name, m.type_name, m.documentation, m.samples())
+            for m in self._metrics.values()
+        ]
+        for collector in self._collectors:
+            families.extend(collector())
+
+        for name, type_name, documentation, samples in families:
+            lines.append(f"# HELP {name} {_escape(documentation)}")
+            lines.append(f"# TYPE {name} {type_name}")
+            lines.extend(_format_sample(*sample) for sample in samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "finanze_http_request_duration_seconds",
+    "API request latency by route",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "finanze_http_requests_in_flight", "API requests currently being served"
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "finanze_db_query_duration_seconds",
+    "SQL statement execution time",
+    buckets=DB_BUCKETS,
+)
+DB_LOCK_WAIT_SECONDS = REGISTRY.histogram(
+    "finanze_db_lock_wait_seconds",
+    "Time spent waiting for the DB client lock",
+    buckets=DB_BUCKETS,
+)
+FETCH_SECONDS = REGISTRY.histogram(
+    "finanze_fetch_duration_seconds",
+    "Entity fetch duration by result code, failed fetches have an error outcome",
+    ("source", "entity", "code", "outcome"),
+    buckets=FETCH_BUCKETS,
+)
+OUTBOUND_HTTP_REQUESTS = REGISTRY.counter(
+    "finanze_outbound_http_requests_total",
+    "Outbound HTTP requests by provider host",
+    ("host",),
+)
+OUTBOUND_HTTP_RETRIES = REGISTRY.counter(
+    "finanze_outbound_http_retries_total",
+    "Outbound HTTP retries issued by the backoff helper",
+    ("host", "reason"),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "finanze_cache_requests_total",
+    "In-memory cache lookups by result",
+    ("cache", "result"),
+)
+
+
+def observe_fetch(
+    source: str,
+    entity: Optional[UUID],
+    code: Optional[FetchResultCode],
+    duration: float,
+):
+    """A None code stands for a fetch that raised before returning a result."""
+    if code is None:
+        FETCH_SECONDS.labels(source, entity or "all", "", "error").observe(duration)
+    else:
+        FETCH_SECONDS.labels(source, entity or "all", code.value, "ok").observe(
+            duration
+        )
+
+
+def _process_memory() -> list[MetricFamily]:
+    families = []
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        rss = resident_pages * os.sysconf("SC_PAGE_SIZE")
+        families.append(
+            (
+                "process_resident_memory_bytes",
+                "gauge",
+                "Resident memory size in bytes",
+                [("process_resident_memory_bytes", {}, rss)],
+            )
+        )
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        max_rss = max_rss if sys.platform == "darwin" else max_rss * 1024
+        families.append(
+            (
+                "process_max_resident_memory_bytes",
+                "gauge",
+                "Peak resident memory size in bytes",
+                [("process_max_resident_memory_bytes", {}, max_rss)],
+            )
+        )
+    except ImportError:
+        pass
+
+    return families
+
+
+def _cache_hit_ratio() -> list[MetricFamily]:
+    totals: dict[str, dict[str, float]] = {}
+    for name, labels, value in CACHE_REQUESTS.samples():
+        totals.setdefault(labels["cache"], {})[labels["result"]] = value
+
+    samples = []
+    for cache, results in sorted(totals.items()):
+        lookups = results.get("hit", 0) + results.get("miss", 0)
+        if lookups:
+            samples.append(
+                (
+                    "finanze_cache_hit_ratio",
+                    {"cache": cache},
+                    results.get("hit", 0) / lookups,
+                )
+            )
+    return [("finanze_cache_hit_ratio", "gauge", "Cache hit ratio", samples)]
+
+
+REGISTRY.add_collector(_process_memory)
+REGISTRY.add_collector(_cache_hit_ratio)
@@ -0,0 +1,158 @@
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Optional
+
+DEFAULT_INTERVAL = 0.005
+MAX_STACK_DEPTH = 128
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+@dataclass(frozen=True)
+class StackFrame:
+    name: str
+    file: str
+    line: int
+
+    def label(self) -> str:
+        return f"{self.name} ({self.file}:{self.line})"
+
+
+Stack = tuple[StackFrame, ...]
+
+
+@dataclass
+class Profile:
+    name: str
+    interval: float
+    duration: float
+    # Root first stacks and how many times each was sampled
+    samples: Counter = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def to_collapsed(self) -> str:
+        """Brendan Gregg's collapsed stacks, readable by flamegraph.pl and speedscope."""
+        lines = [
+            f"{';'.join(frame.label() for frame in stack)} {count}"
+            for stack, count in self.samples.most_common()
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_speedscope(self) -> dict:
+        frames: list[dict] = []
+        frame_index: dict[StackFrame, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.samples.items():
+            indexes = []
+            for frame in stack:
+                index = frame_index.get(frame)
+                if index is None:
+                    index = frame_index[frame] = len(frames)
+                    frames.append(
+                        {"name": frame.name, "file": frame.file, "line": frame.line}
+                    )
+                indexes.append(index)
+            samples.append(indexes)
+            weights.append(count * self.interval)
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": self.name,
+            "exporter": "finanze",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling the stack of a single thread from a daemon
+    thread. The profiled code runs untouched, the only cost is the sampler
+    taking the GIL once per interval, so it's cheap enough to leave on for a
+    few routes in production. Profiling the event loop thread also samples
+    whatever other coroutine is running at the time.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self._interval = interval
+        self._samples: Counter = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target: Optional[int] = None
+        self._started = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, thread_id: Optional[int] = None):
+        if self._thread is not None:
+            raise RuntimeError("Profiler already running")
+
+        self._target = thread_id if thread_id is not None else threading.get_ident()
+        self._samples = Counter()
+        self._stop_event.clear()
+        self._started = perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="finanze-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, name: str = "profile") -> Profile:
+        if self._thread is None:
+            raise RuntimeError("Profiler not running")
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        return Profile(
+            name=name,
+            interval=self._interval,
+            duration=perf_counter() - self._started,
+            samples=self._samples,
+        )
+
+    def _run(self):
+        target = self._target
+        samples = self._samples
+        frames_cache: dict = {}
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(target)
+            if frame is None:
+                continue
+            samples[_walk(frame, frames_cache)] += 1
+
+
+def _walk(frame, frames_cache: dict) -> Stack:
+    stack = []
+    depth = 0
+    while frame is not None and depth < MAX_STACK_DEPTH:
+        code = frame.f_code
+        entry = frames_cache.get(code)
+        if entry is None:
+            # Function level frames, per line ones split the flame graph
+            entry = frames_cache[code] = StackFrame(
+                code.co_qualname, code.co_filename, code.co_firstlineno
+            )
+        stack.append(entry)
+        frame = frame.f_back
+        depth += 1
+    stack.reverse()
+    return tuple(stack)
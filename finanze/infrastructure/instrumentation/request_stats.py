@@ -0,0 +1,92 @@
+import heapq
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Optional
+
+# Slowest statements kept per request, the rest only count towards the totals
+MAX_TRACKED_STATEMENTS = 5
+
+
+@dataclass
+class StatementTiming:
+    statement: str
+    duration: float
+    args: tuple = ()
+
+
+@dataclass
+class RequestStats:
+    """
+    Time spent by a single request outside its own code: SQL statements, waits
+    on the DB client lock and outbound HTTP calls grouped by host. Durations are
+    in seconds.
+    """
+
+    started: float = field(default_factory=perf_counter)
+    query_count: int = 0
+    db_time: float = 0.0
+    lock_wait: float = 0.0
+    http_calls: int = 0
+    http_time: dict[str, float] = field(default_factory=dict)
+    # Min-heap on duration, so the fastest tracked statement is evicted first
+    _slowest: list[tuple[float, int, StatementTiming]] = field(
+        default_factory=list, repr=False
+    )
+
+    def add_query(self, statement: str, duration: float, args: tuple = ()):
+        self.query_count += 1
+        self.db_time += duration
+
+        slowest = self._slowest
+        if len(slowest) < MAX_TRACKED_STATEMENTS:
+            timing = StatementTiming(statement, duration, args)
+            heapq.heappush(slowest, (duration, self.query_count, timing))
+        elif duration > slowest[0][0]:
+            timing = StatementTiming(statement, duration, args)
+            heapq.heapreplace(slowest, (duration, self.query_count, timing))
+
+    def add_lock_wait(self, duration: float):
+        self.lock_wait += duration
+
+    def add_http_call(self, host: str, duration: float):
+        self.http_calls += 1
+        self.http_time[host] = self.http_time.get(host, 0.0) + duration
+
+    def slowest_statements(self) -> list[StatementTiming]:
+        return [entry[2] for entry in sorted(self._slowest, reverse=True)]
+
+    def elapsed(self) -> float:
+        return perf_counter() - self.started
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def start_request() -> RequestStats:
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[RequestStats]:
+    """Stats of the request being served in this context, None outside requests."""
+    return _current.get()
+
+
+def record_query(statement: str, duration: float, args: Any = ()):
+    stats = _current.get()
+    if stats is not None:
+        stats.add_query(statement, duration, tuple(args) if args else ())
+
+
+def record_lock_wait(duration: float):
+    stats = _current.get()
+    if stats is not None:
+        stats.add_lock_wait(duration)
+
+
+def record_http_call(host: str, duration: float):
+    stats = _current.get()
+    if stats is not None:
+        stats.add_http_call(host, duration)
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncGenerator
+
+from application.ports.notification_port import NotificationPort
+from dateutil.tz import tzlocal
+from domain.notification import DataChanged, Notification, NotificationType
+
+
+class NotificationBroadcaster(NotificationPort):
+    """
+    In-memory fan-out of notifications to the currently connected listeners
+    (SSE clients). Slow listeners lose their oldest pending notifications
+    instead of blocking publishers.
+    """
+
+    def __init__(self, queue_size: int = 256):
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._log = logging.getLogger(__name__)
+
+    async def publish(self, notification: Notification):
+        self._broadcast(notification)
+
+    def tables_changed(self, tables: frozenset[str]):
+        if not self._subscribers:
+            return
+
+        self._broadcast(
+            Notification(
+                type=NotificationType.DATA_CHANGED,
+                data=DataChanged(tables=sorted(tables)),
+                date=datetime.now(tzlocal()),
+            )
+        )
+
+    def _broadcast(self, notification: Notification):
+        for queue in list(self._subscribers):
+            if queue.full():
+                queue.get_nowait()
+                self._log.debug("Dropping oldest notification for slow listener")
+            queue.put_nowait(notification)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncGenerator[asyncio.Queue, None]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
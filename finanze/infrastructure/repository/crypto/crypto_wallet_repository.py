@@ -43,6 +43,27 @@ class CryptoWalletRepository(CryptoWalletPort):
                 cursor, await cursor.fetchall(), hd_addresses
             )
 
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID], hd_addresses: bool
+    ) -> dict[UUID, List[CryptoWallet]]:
+        if not entity_ids:
+            return {}
+
+        async with self._db_client.read() as cursor:
+            await cursor.execute(
+                CryptoWalletQueries.GET_BY_ENTITY_IDS.value.format(
+                    placeholders=",".join("?" for _ in entity_ids)
+                ),
+                tuple(str(entity_id) for entity_id in entity_ids),
+            )
+            wallets = await self._map_crypto_rows(
+                cursor, await cursor.fetchall(), hd_addresses
+            )
+            wallets_by_entity: dict[UUID, List[CryptoWallet]] = {}
+            for wallet in wallets:
+                wallets_by_entity.setdefault(wallet.entity_id, []).append(wallet)
+            return wallets_by_entity
+
     async def get_by_id(self, wallet_id: UUID) -> Optional[CryptoWallet]:
         async with self._db_client.read() as cursor:
             await cursor.execute(
@@ -1,20 +1,50 @@
 import logging
+import re
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime
 from threading import RLock
+from time import perf_counter
 from types import TracebackType
-from typing import Any, AsyncGenerator, Literal, Optional, Self
+from typing import Any, AsyncGenerator, Callable, Literal, Optional, Self
 from uuid import uuid4
 
 from domain.data_init import DataEncryptedError
+from infrastructure.instrumentation.metrics import (
+    DB_LOCK_WAIT_SECONDS,
+    DB_QUERY_SECONDS,
+)
+from infrastructure.instrumentation.request_stats import (
+    record_lock_wait,
+    record_query,
+)
 
 UnderlyingCursor = Any
 UnderlyingConnection = Any
 
+CommitListener = Callable[[frozenset[str]], None]
+
+_WRITE_STATEMENT = re.compile(
+    r"\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?"
+    r"|DELETE\s+FROM)\s+[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+_UNTRACKED_TABLES = {"sys_config"}
+_EXPLAINABLE_STATEMENT = re.compile(
+    r"\s*(?:SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE
+)
+
 
 class DBCursor:
-    def __init__(self, cursor: UnderlyingCursor) -> None:
+    def __init__(
+        self,
+        cursor: UnderlyingCursor,
+        written_tables: Optional[set[str]] = None,
+        client: Optional["DBClient"] = None,
+    ) -> None:
         self._cursor = cursor
+        self._written_tables = written_tables
+        self._client = client
 
     async def __aenter__(self) -> Self:
         return self
@@ -39,7 +69,17 @@ class DBCursor:
         return result
 
     async def execute(self, statement: str, *args) -> Self:
+        start = perf_counter()
         self._cursor.execute(statement, *args)
+        duration = perf_counter() - start
+        DB_QUERY_SECONDS.observe(duration)
+        record_query(statement, duration, args)
+        if self._client is not None:
+            self._client.check_slow_query(statement, args, duration)
+        if self._written_tables is not None:
+            match = _WRITE_STATEMENT.match(statement)
+            if match:
+                self._written_tables.add(match.group(1).lower())
         return self
 
     async def execute_script(self, script: str) -> Self:
@@ -60,12 +100,27 @@ class DBCursor:
 
 
 class DBClient:
-    def __init__(self, connection: UnderlyingConnection | None = None):
+    MAX_CACHED_PLANS = 256
+
+    def __init__(
+        self,
+        connection: UnderlyingConnection | None = None,
+        slow_query_threshold: Optional[float] = None,
+    ):
         self._conn = connection
         self.savepoint_stack: list[Optional[str]] = []
         self._lock = RLock()
+        self._written_tables: set[str] = set()
+        self._commit_listeners: list[CommitListener] = []
+        # Seconds, statements taking longer are logged along with their plan
+        self.slow_query_threshold = slow_query_threshold
+        self._plans: OrderedDict[str, list[str]] = OrderedDict()
         self._log = logging.getLogger(__name__)
 
+    def add_commit_listener(self, listener: CommitListener):
+        """Listener gets the tables written by each committed outer transaction."""
+        self._commit_listeners.append(listener)
+
     def _get_connection(self) -> UnderlyingConnection:
         if self._conn is None:
             raise DataEncryptedError()
@@ -73,8 +128,10 @@ class DBClient:
 
     @asynccontextmanager
     async def tx(self, skip_last_update=False) -> AsyncGenerator[DBCursor, None]:
+        wait_start = perf_counter()
         with self._lock:
-            cursor = self._cursor()
+            self._record_lock_wait(perf_counter() - wait_start)
+            cursor = self._cursor(track_writes=True)
             try:
                 if not self.savepoint_stack:
                     # Outer transaction
@@ -97,6 +154,7 @@ class DBClient:
                     else:
                         # Rollback outermost transaction
                         self._rollback()
+                        self._written_tables.clear()
                 raise  # Re-raise exception
             else:
                 if self.savepoint_stack:
@@ -109,6 +167,7 @@ class DBClient:
                         if not skip_last_update:
                             await self._update_last_update_date()
                         self._commit()
+                        self._notify_commit()
             finally:
                 # Cleanup stack and cursor
                 if self.savepoint_stack:
@@ -117,7 +176,9 @@ class DBClient:
 
     @asynccontextmanager
     async def read(self) -> AsyncGenerator[DBCursor, None]:
+        wait_start = perf_counter()
         with self._lock:
+            self._record_lock_wait(perf_counter() - wait_start)
             cursor = self._cursor()
             try:
                 yield cursor
@@ -138,6 +199,18 @@ class DBClient:
     def _commit(self):
         self._get_connection().commit()
 
+    def _notify_commit(self):
+        tables = frozenset(self._written_tables - _UNTRACKED_TABLES)
+        self._written_tables.clear()
+        if not tables:
+            return
+
+        for listener in self._commit_listeners:
+            try:
+                listener(tables)
+            except Exception:
+                self._log.exception("Commit listener failed")
+
     def _rollback(self):
         self._get_connection().rollback()
 
@@ -160,9 +233,61 @@ class DBClient:
             async with self.read() as cursor:
                 await cursor.execute(f"PRAGMA wal_checkpoint({mode})")
 
-    def _cursor(self) -> DBCursor:
-        return DBCursor(self._get_connection().cursor())
+    @staticmethod
+    def _record_lock_wait(duration: float):
+        DB_LOCK_WAIT_SECONDS.observe(duration)
+        record_lock_wait(duration)
+
+    def explain(self, statement: str, *args) -> Optional[list[str]]:
+        """
+        EXPLAIN QUERY PLAN details of a statement run with the given params, None
+        for statements without a plan (BEGIN, PRAGMA...). Plans are cached by
+        statement text, so params only matter the first time.
+        """
+        if not _EXPLAINABLE_STATEMENT.match(statement):
+            return None
+
+        plan = self._plans.get(statement)
+        if plan is not None:
+            self._plans.move_to_end(statement)
+            return plan
+
+        with self._lock:
+            # Raw cursor, explaining must not count as a request query
+            cursor = self._get_connection().cursor()
+            try:
+                cursor.execute(f"EXPLAIN QUERY PLAN {statement}", *args)
+                plan = [row[-1] for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+        self._plans[statement] = plan
+        if len(self._plans) > self.MAX_CACHED_PLANS:
+            self._plans.popitem(last=False)
+        return plan
+
+    def check_slow_query(self, statement: str, args: tuple, duration: float):
+        threshold = self.slow_query_threshold
+        if threshold is None or duration < threshold:
+            return
+
+        try:
+            plan = self.explain(statement, *args)
+        except Exception as e:
+            plan = [f"<unavailable: {e}>"]
+
+        plan_lines = "".join(f"\n    {line}" for line in plan or [])
+        self._log.warning(
+            f"Slow query ({duration * 1000:.1f} ms): {' '.join(statement.split())}"
+            f"{plan_lines}"
+        )
+
+    def _cursor(self, track_writes: bool = False) -> DBCursor:
+        written_tables = self._written_tables if track_writes else None
+        return DBCursor(self._get_connection().cursor(), written_tables, self)
 
     def set_connection(self, connection: UnderlyingConnection) -> None:
         self._conn = connection
         self.savepoint_stack = []
+        self._written_tables.clear()
+        self._plans.clear()
@@ -179,20 +179,7 @@ class DBManager(DatasourceInitiator, Backupable):
         tmp.close()
 
         try:
-            async with self._client.tx():
-                # Update last update timestamp before exporting
-                pass
-
-            await self._client.wal_checkpoint()
-
-            tmp_path_str = str(tmp_path.absolute())
-
-            async with self._client.tx(skip_last_update=True) as cursor:
-                await cursor.execute_script(f"""
-                ATTACH DATABASE '{tmp_path_str}' AS backup_db KEY '';
-                SELECT sqlcipher_export('backup_db');
-                DETACH DATABASE backup_db;
-                """)
+            await self.export_to(tmp_path)
 
             with open(tmp_path, "rb") as f:
                 data = f.read()
@@ -205,9 +192,25 @@ class DBManager(DatasourceInitiator, Backupable):
             except (OSError, NameError):
                 pass
 
+    async def export_to(self, target: Path):
+        async with self._client.tx():
+            # Update last update timestamp before exporting
+            pass
+
+        await self._client.wal_checkpoint()
+
+        target_str = str(target.absolute())
+
+        async with self._client.tx(skip_last_update=True) as cursor:
+            await cursor.execute_script(f"""
+            ATTACH DATABASE '{target_str}' AS backup_db KEY '';
+            SELECT sqlcipher_export('backup_db');
+            DETACH DATABASE backup_db;
+            """)
+
     async def import_data(
         self,
-        data: bytes,
+        data: bytes | Path,
         initialize: bool = False,
         user: Optional[User] = None,
         password: Optional[str] = None,
@@ -219,7 +222,7 @@ class DBManager(DatasourceInitiator, Backupable):
 
             with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
                 tmp_bkg_db_path = Path(tmpdir) / "tmp_backup.db"
-                tmp_bkg_db_path.write_bytes(data)
+                self._write_import_source(data, tmp_bkg_db_path)
 
                 connection = self._base_connect(tmp_bkg_db_path)
                 temp_client = DBClient(connection)
@@ -255,7 +258,7 @@ class DBManager(DatasourceInitiator, Backupable):
 
         with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
             tmp_bkg_db_path = Path(tmpdir) / "tmp_backup.db"
-            tmp_bkg_db_path.write_bytes(data)
+            self._write_import_source(data, tmp_bkg_db_path)
 
             connection = self._base_connect(tmp_bkg_db_path)
             temp_client = DBClient(connection)
@@ -275,6 +278,13 @@ class DBManager(DatasourceInitiator, Backupable):
 
         temp_old_db_path.unlink()
 
+    @staticmethod
+    def _write_import_source(data: bytes | Path, target: Path):
+        if isinstance(data, Path):
+            shutil.copyfile(data, target)
+        else:
+            target.write_bytes(data)
+
     async def get_last_updated(self) -> datetime:
         async with self._client.read() as cursor:
             await cursor.execute(
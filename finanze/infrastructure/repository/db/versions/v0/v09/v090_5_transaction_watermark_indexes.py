@@ -0,0 +1,20 @@
+from domain.data_init import DatasourceInitContext
+from infrastructure.repository.db.client import DBCursor
+from infrastructure.repository.db.query_mixin import QueryMixin
+from infrastructure.repository.db.upgrader import DBVersionMigration
+
+DDL = """
+      CREATE INDEX idx_itxs_entity_account_product_date ON investment_transactions (entity_account_id, product_type, date);
+      CREATE INDEX idx_account_entity_account_date ON account_transactions (entity_account_id, date);
+      """
+
+
+class V0905TransactionWatermarkIndexes(DBVersionMigration, QueryMixin):
+    @property
+    def name(self):
+        return "v0.9.0:5_transaction_watermark_indexes"
+
+    async def upgrade(self, cursor: DBCursor, context: DatasourceInitContext):
+        statements = self.parse_block(DDL)
+        for statement in statements:
+            await cursor.execute(statement)
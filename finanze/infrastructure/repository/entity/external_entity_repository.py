@@ -71,6 +71,23 @@ class ExternalEntityRepository(ExternalEntityPort):
             row = await cursor.fetchone()
             return _map_row(row) if row else None
 
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID]
+    ) -> dict[UUID, ExternalEntity]:
+        if not entity_ids:
+            return {}
+
+        async with self._db_client.read() as cursor:
+            await cursor.execute(
+                ExternalEntityQueries.GET_BY_ENTITY_IDS.value.format(
+                    placeholders=",".join("?" for _ in entity_ids)
+                ),
+                tuple(str(entity_id) for entity_id in entity_ids),
+            )
+            rows = await cursor.fetchall()
+            external_entities = (_map_row(row) for row in rows)
+            return {ee.entity_id: ee for ee in external_entities}
+
     async def delete_by_id(self, ee_id: UUID):
         async with self._db_client.tx() as cursor:
             await cursor.execute(
@@ -76,5 +76,8 @@ class ExternalEntityQueries(str, Enum):
 
     GET_BY_ID = "SELECT * FROM external_entities WHERE id = ?"
     GET_BY_ENTITY_ID = "SELECT * FROM external_entities WHERE entity_id = ?"
+    GET_BY_ENTITY_IDS = (
+        "SELECT * FROM external_entities WHERE entity_id IN ({placeholders})"
+    )
     DELETE_BY_ID = "DELETE FROM external_entities WHERE id = ?"
     GET_ALL = "SELECT * FROM external_entities"
@@ -33,6 +33,26 @@ class LastFetchesRepository(LastFetchesPort):
             rows = await cursor.fetchall()
             return [_map_row(row) for row in rows]
 
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID]
+    ) -> dict[UUID, list[FetchRecord]]:
+        if not entity_ids:
+            return {}
+
+        async with self._db_client.read() as cursor:
+            await cursor.execute(
+                LastFetchesQueries.GET_BY_ENTITY_IDS.value.format(
+                    placeholders=",".join("?" for _ in entity_ids)
+                ),
+                tuple(str(entity_id) for entity_id in entity_ids),
+            )
+            rows = await cursor.fetchall()
+            records_by_entity: dict[UUID, list[FetchRecord]] = {}
+            for row in rows:
+                record = _map_row(row)
+                records_by_entity.setdefault(record.entity_id, []).append(record)
+            return records_by_entity
+
     async def get_by_entity_account_id(
         self, entity_account_id: UUID
     ) -> list[FetchRecord]:
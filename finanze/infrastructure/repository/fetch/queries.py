@@ -4,6 +4,8 @@ from enum import Enum
 class LastFetchesQueries(str, Enum):
     GET_BY_ENTITY_ID = "SELECT entity_id, feature, date, entity_account_id FROM last_fetches WHERE entity_id = ?"
 
+    GET_BY_ENTITY_IDS = "SELECT entity_id, feature, date, entity_account_id FROM last_fetches WHERE entity_id IN ({placeholders})"
+
     GET_BY_ENTITY_ACCOUNT_ID = "SELECT entity_id, feature, date, entity_account_id FROM last_fetches WHERE entity_account_id = ?"
 
     GET_GROUPED_BY_ENTITY = """
@@ -54,6 +54,7 @@ from domain.global_position import (
     StockDetail,
     StockInvestments,
 )
+from domain.position_aggregation import aggregate_positions
 from infrastructure.repository.common.json_serialization import DezimalJSONEncoder
 from infrastructure.repository.crypto.crypto_wallet_repository import (
     CryptoWalletRepository,
@@ -492,18 +493,6 @@ async def _save_product_positions(cursor, position: GlobalPosition):
     await _save_position(cursor, position, ProductType.CREDIT, _save_credits)
 
 
-def _aggregate_positions(positions: list[GlobalPosition]) -> GlobalPosition:
-    aggregated_position = None
-
-    for position in positions:
-        if aggregated_position is None:
-            aggregated_position = position
-        else:
-            aggregated_position += position
-
-    return aggregated_position
-
-
 def _map_manual_entry_data(row) -> Optional[ManualEntryData]:
     if row["track_ticker"] is None and row["track_loan"] is None:
         return None
@@ -551,17 +540,13 @@ class PositionSQLRepository(PositionPort):
 
         global_position_by_entity = {}
         for entity, positions in real_global_position_by_entity.items():
-            aggregated_real = _aggregate_positions(positions)
             if entity in manual_global_positions_by_entity:
-                manual_positions = manual_global_positions_by_entity[entity]
-                aggregated_manual = _aggregate_positions(manual_positions)
-                global_position_by_entity[entity] = aggregated_real + aggregated_manual
+                positions = positions + manual_global_positions_by_entity[entity]
                 del manual_global_positions_by_entity[entity]
-            else:
-                global_position_by_entity[entity] = aggregated_real
+            global_position_by_entity[entity] = aggregate_positions(positions)
 
         for entity, manual_positions in manual_global_positions_by_entity.items():
-            global_position_by_entity[entity] = _aggregate_positions(manual_positions)
+            global_position_by_entity[entity] = aggregate_positions(manual_positions)
 
         return global_position_by_entity
 
@@ -9,6 +9,13 @@ class RealEstateQueries(str, Enum):
         WHERE ref.real_estate_id = ?
     """
 
+    SELECT_ALL_FLOWS = """
+        SELECT *
+        FROM real_estate_flows ref
+            JOIN periodic_flows pf ON ref.periodic_flow_id = pf.id
+        ORDER BY ref.real_estate_id, ref.rowid
+    """
+
     INSERT_FLOW = """
         INSERT INTO real_estate_flows (
             real_estate_id, periodic_flow_id, flow_subtype, description, payload, extra_reference
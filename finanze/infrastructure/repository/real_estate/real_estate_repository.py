@@ -1,4 +1,5 @@
 import json
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
@@ -195,7 +196,7 @@ def _deserialize_rental_data(data: Optional[str | bytes]) -> Optional[RentalData
     )
 
 
-async def _build_flow(flow_row) -> RealEstateFlow:
+def _build_flow(flow_row) -> RealEstateFlow:
     flow_subtype = RealEstateFlowSubtype(flow_row["flow_subtype"])
     raw_payload = flow_row["payload"]
     payload_data = json.loads(raw_payload) if raw_payload else {}
@@ -236,13 +237,8 @@ async def _build_flow(flow_row) -> RealEstateFlow:
     )
 
 
-async def _build_real_estate(row, cursor) -> RealEstate:
-    await cursor.execute(
-        RealEstateQueries.SELECT_FLOWS_BY_REAL_ESTATE_ID,
-        (row["id"],),
-    )
-    flow_rows = await cursor.fetchall()
-    flows = [await _build_flow(flow_row) for flow_row in flow_rows]
+def _build_real_estate(row, flow_rows) -> RealEstate:
+    flows = [_build_flow(flow_row) for flow_row in flow_rows]
 
     return RealEstate(
         id=UUID(row["id"]),
@@ -414,13 +410,29 @@ class RealEstateRepository(RealEstatePort):
             row = await cursor.fetchone()
             if not row:
                 return None
-            return await _build_real_estate(row, cursor)
+
+            await cursor.execute(
+                RealEstateQueries.SELECT_FLOWS_BY_REAL_ESTATE_ID,
+                (row["id"],),
+            )
+            return _build_real_estate(row, await cursor.fetchall())
 
     async def get_all(self) -> list[RealEstate]:
         async with self._db_client.read() as cursor:
             await cursor.execute(RealEstateQueries.GET_ALL)
             rows = await cursor.fetchall()
-            return [await _build_real_estate(row, cursor) for row in rows]
+            if not rows:
+                return []
+
+            await cursor.execute(RealEstateQueries.SELECT_ALL_FLOWS)
+            flows_by_real_estate = defaultdict(list)
+            for flow_row in await cursor.fetchall():
+                flows_by_real_estate[flow_row["real_estate_id"]].append(flow_row)
+
+            return [
+                _build_real_estate(row, flows_by_real_estate.get(row["id"], []))
+                for row in rows
+            ]
 
     async def sync_linked_loan_flows(self, loan: Loan) -> None:
         if not loan.hash:
@@ -89,6 +89,17 @@ class TransactionQueries(str, Enum):
         WHERE entity_account_id = ?
     """
 
+    GET_WATERMARKS_BY_ENTITY_ACCOUNT = """
+        SELECT product_type, MAX(date) AS date, ref
+        FROM investment_transactions
+        WHERE entity_account_id = ? AND is_real = TRUE
+        GROUP BY product_type
+        UNION ALL
+        SELECT 'ACCOUNT' AS product_type, MAX(date) AS date, ref
+        FROM account_transactions
+        WHERE entity_account_id = ? AND is_real = TRUE
+    """
+
     INVESTMENT_AND_ACCOUNT_BY_ENTITY_AND_SOURCE = """
         SELECT it.*,
                e.name       AS entity_name,
@@ -23,6 +23,7 @@ from domain.transactions import (
     TransactionQueryRequest,
     Transactions,
     TxType,
+    TxWatermark,
 )
 from infrastructure.repository.db.client import DBClient
 from infrastructure.repository.transaction.queries import TransactionQueries
@@ -423,6 +424,22 @@ class TransactionSQLRepository(TransactionPort):
             )
             return {row[0] for row in await cursor.fetchall()}
 
+    async def get_watermarks_by_entity_account(
+        self, entity_account_id: UUID
+    ) -> dict[ProductType, TxWatermark]:
+        async with self._db_client.read() as cursor:
+            await cursor.execute(
+                TransactionQueries.GET_WATERMARKS_BY_ENTITY_ACCOUNT,
+                (str(entity_account_id), str(entity_account_id)),
+            )
+            return {
+                ProductType(row["product_type"]): TxWatermark(
+                    date=datetime.fromisoformat(row["date"]), ref=row["ref"]
+                )
+                for row in await cursor.fetchall()
+                if row["date"]
+            }
+
     async def get_by_entity(self, entity_id: UUID) -> Transactions:
         return Transactions(
             investment=await self._get_investment_txs_by_entity(entity_id),
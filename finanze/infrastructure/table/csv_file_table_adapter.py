@@ -1,5 +1,6 @@
 import csv
 from io import StringIO, TextIOWrapper
+from typing import AsyncIterable, AsyncIterator
 
 from application.ports.file_rw_port import TableRWPort
 from domain.export import FileFormat
@@ -27,19 +28,30 @@ def _delimiter_from_upload(upload: FileUpload) -> str:
 
 
 class CSVFileTableAdapter(TableRWPort):
-    async def convert(self, rows: list[list[str]], format: FileFormat) -> bytes:
-        if not rows:
-            raise ValueError("No rows provided for export")
+    # Rows encoded per chunk
+    BATCH_SIZE = 1000
 
+    async def convert(
+        self, rows: AsyncIterable[list[str]], format: FileFormat
+    ) -> AsyncIterator[bytes]:
         delimiter = _delimiter_for_format(format)
 
         output = StringIO()
         writer = csv.writer(output, delimiter=delimiter)
-        for row in rows:
+        written = 0
+        async for row in rows:
             writer.writerow(row)
+            written += 1
+            if written % self.BATCH_SIZE == 0:
+                yield output.getvalue().encode("utf-8")
+                output.seek(0)
+                output.truncate()
+
+        if not written:
+            raise ValueError("No rows provided for export")
 
-        data_str = output.getvalue()
-        return data_str.encode("utf-8")
+        if output.tell():
+            yield output.getvalue().encode("utf-8")
 
     async def parse(self, upload: FileUpload) -> list[list[str]]:
         delimiter = _delimiter_from_upload(upload)
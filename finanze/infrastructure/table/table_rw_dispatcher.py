@@ -1,3 +1,5 @@
+from typing import AsyncIterable, AsyncIterator
+
 from application.ports.file_rw_port import TableRWPort
 from domain.exception.exceptions import UnsupportedFileFormat
 from domain.export import FileFormat
@@ -23,11 +25,13 @@ class TableRWDispatcher(TableRWPort):
     def __init__(self, adapters: dict[FileFormat, TableRWPort]):
         self._adapters = adapters
 
-    async def convert(self, rows: list[list[str]], format: FileFormat) -> bytes:
+    def convert(
+        self, rows: AsyncIterable[list[str]], format: FileFormat
+    ) -> AsyncIterator[bytes]:
         adapter = self._adapters.get(format)
         if not adapter:
             raise ValueError(f"No table adapter registered for format {format}")
-        return await adapter.convert(rows, format)
+        return adapter.convert(rows, format)
 
     async def parse(self, upload: FileUpload) -> list[list[str]]:
         detected_format = _infer_format(upload)
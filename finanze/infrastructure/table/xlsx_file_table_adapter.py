@@ -1,4 +1,6 @@
+import tempfile
 from io import BytesIO
+from typing import AsyncIterable, AsyncIterator
 
 from application.ports.file_rw_port import TableRWPort
 from domain.exception.exceptions import UnsupportedFileFormat
@@ -21,36 +23,59 @@ except ImportError:
 
 
 class XLSXFileTableAdapter(TableRWPort):
-    async def convert(self, rows: list[list[str]], format: FileFormat) -> bytes:
+    CHUNK_SIZE = 1024 * 1024
+
+    async def convert(
+        self, rows: AsyncIterable[list[str]], format: FileFormat
+    ) -> AsyncIterator[bytes]:
         if format != FileFormat.XLSX:
             raise ValueError("XLSXFileTableAdapter only supports XLSX format")
 
-        if not rows:
-            raise ValueError("No rows provided for export")
-
-        if HAS_PANDAS:
-            return self._convert_with_pandas(rows)
-        elif HAS_OPENPYXL:
-            return self._convert_with_openpyxl(rows)
+        # Write-only mode spools rows to disk, so it's preferred over pandas,
+        # which needs the whole table in a DataFrame
+        if HAS_OPENPYXL:
+            chunks = self._convert_with_openpyxl(rows)
+        elif HAS_PANDAS:
+            chunks = self._convert_with_pandas(rows)
         else:
             raise RuntimeError(
                 "Neither pandas nor openpyxl is available for XLSX export"
             )
 
-    def _convert_with_pandas(self, rows: list[list[str]]) -> bytes:
-        df = pd.DataFrame(rows)
-        output = BytesIO()
-        pd.DataFrame(df).to_excel(output, header=False, index=False)
-        return output.getvalue()
+        async for chunk in chunks:
+            yield chunk
+
+    async def _convert_with_pandas(
+        self, rows: AsyncIterable[list[str]]
+    ) -> AsyncIterator[bytes]:
+        table = [row async for row in rows]
+        if not table:
+            raise ValueError("No rows provided for export")
 
-    def _convert_with_openpyxl(self, rows: list[list[str]]) -> bytes:
-        wb = Workbook()
-        ws = wb.active
-        for row in rows:
-            ws.append(row)
         output = BytesIO()
-        wb.save(output)
-        return output.getvalue()
+        pd.DataFrame(table).to_excel(output, header=False, index=False)
+        yield output.getvalue()
+
+    async def _convert_with_openpyxl(
+        self, rows: AsyncIterable[list[str]]
+    ) -> AsyncIterator[bytes]:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        written = 0
+        async for row in rows:
+            ws.append(row)
+            written += 1
+
+        if not written:
+            wb.close()
+            raise ValueError("No rows provided for export")
+
+        # The zip container is only complete once every row is written
+        with tempfile.TemporaryFile() as output:
+            wb.save(output)
+            output.seek(0)
+            while chunk := output.read(self.CHUNK_SIZE):
+                yield chunk
 
     async def parse(self, upload: FileUpload) -> list[list[str]]:
         if upload.content_type not in (
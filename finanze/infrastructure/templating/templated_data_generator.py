@@ -1,8 +1,9 @@
 import json
-from dataclasses import asdict
+from dataclasses import asdict, fields, is_dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Optional
+from functools import cache
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
 from uuid import UUID
 
 from dateutil.tz import tzlocal, UTC
@@ -13,7 +14,6 @@ from domain.entity import Entity, Feature
 from domain.export import NumberFormat, TemplatedDataProcessorParams
 from domain.global_position import ProductType
 from domain.template import (
-    EffectiveTemplatedField,
     ProcessorDataFilter,
     Template,
     TemplatedField,
@@ -34,42 +34,177 @@ def _format_type_name(value: Any):
         return value.upper()
 
 
-def _format_field_value(value: Any, params: TemplatedDataProcessorParams):
-    if value is None:
-        return ""
+def _value_formatter(params: TemplatedDataProcessorParams) -> Callable[[Any], Any]:
+    date_format = params.date_format
+    datetime_format = params.datetime_format
+    european = params.number_format == NumberFormat.EUROPEAN
+    local_tz = tzlocal()
 
-    if isinstance(value, date) and not isinstance(value, datetime):
-        date_format = params.date_format
-        if not date_format:
-            return value.isoformat()
-        return value.strftime(date_format)
+    def format_value(value: Any):
+        if value is None:
+            return ""
 
-    elif isinstance(value, datetime):
-        datetime_format = params.datetime_format
-        value = value.replace(tzinfo=UTC).astimezone(tzlocal())
-        if not datetime_format:
-            return value.isoformat()
-        return value.strftime(datetime_format)
+        if type(value) is str:
+            return value
 
-    elif isinstance(value, dict) or isinstance(value, list):
-        return json.dumps(value, default=str)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            if not date_format:
+                return value.isoformat()
+            return value.strftime(date_format)
 
-    elif isinstance(value, Dezimal) or isinstance(value, float):
-        number_format = params.number_format
-        if number_format == NumberFormat.EUROPEAN:
-            return str(value).replace(".", ",")
+        elif isinstance(value, datetime):
+            value = value.replace(tzinfo=UTC).astimezone(local_tz)
+            if not datetime_format:
+                return value.isoformat()
+            return value.strftime(datetime_format)
 
-        return str(value)
+        elif isinstance(value, dict) or isinstance(value, list):
+            return json.dumps(_plain(value), default=str)
 
-    elif isinstance(value, UUID):
-        return str(value)
+        elif isinstance(value, Dezimal) or isinstance(value, float):
+            if european:
+                return str(value).replace(".", ",")
 
-    elif isinstance(value, Enum):
-        return value.value
+            return str(value)
 
+        elif isinstance(value, UUID):
+            return str(value)
+
+        elif isinstance(value, Enum):
+            return value.value
+
+        elif is_dataclass(value):
+            return json.dumps(asdict(value), default=str)
+
+        return value
+
+    return format_value
+
+
+def _plain(value: Any) -> Any:
+    # Nested dataclasses are exported as the dicts asdict would produce
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {_plain(k): _plain(v) for k, v in value.items()}
+    if is_dataclass(value):
+        return asdict(value)
     return value
 
 
+@cache
+def _field_names(element_type: type) -> frozenset[str]:
+    return frozenset(f.name for f in fields(element_type))
+
+
+def _lookup(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name)
+    if is_dataclass(obj):
+        return getattr(obj, name) if name in _field_names(type(obj)) else None
+    raise AttributeError(f"'{type(obj).__name__}' object has no field '{name}'")
+
+
+def _filter_value(value: Any) -> str:
+    return str(value.value) if isinstance(value, Enum) else str(value)
+
+
+Accessor = Callable[[Any, Optional[Entity]], Any]
+
+
+class _CompiledTemplate:
+    """
+    Row mapper for the effective fields of a template. Column accessors are
+    built once per element type and field path, reading attributes directly
+    instead of converting every element with asdict.
+    """
+
+    def __init__(self, params: TemplatedDataProcessorParams):
+        self._columns = [field.field for field in params.template.fields]
+        self._format = _value_formatter(params)
+        self._filters = []
+        for filter_rule in params.filters or []:
+            values = filter_rule.values
+            values = [values] if not isinstance(values, list) else values
+            self._filters.append(
+                (filter_rule.field, frozenset(_filter_value(v) for v in values))
+            )
+        self._accessors: dict[tuple[type, str], list[Accessor]] = {}
+
+    def matches(self, element: Any) -> bool:
+        for field, values in self._filters:
+            if _filter_value(getattr(element, field)) not in values:
+                return False
+        return True
+
+    def map_row(
+        self, element: Any, field_path: str, entity: Optional[Entity] = None
+    ) -> list[str]:
+        key = (type(element), field_path)
+        accessors = self._accessors.get(key)
+        if accessors is None:
+            accessors = self._compile(type(element), field_path)
+            self._accessors[key] = accessors
+        return [accessor(element, entity) for accessor in accessors]
+
+    def _compile(self, element_type: type, field_path: str) -> list[Accessor]:
+        field_names = _field_names(element_type)
+        format_value = self._format
+        accessors = []
+        for column in self._columns:
+            if column in field_names or column in (ENTITY_COLUMN, PRODUCT_TYPE_COLUMN):
+                accessors.append(self._value_accessor(column, field_names, field_path))
+            elif "." in column:
+                getter = self._nested_getter(column.split("."), field_names, field_path)
+
+                def accessor(element, entity, getter=getter):
+                    value = getter(element, entity)
+                    return format_value(value) if value != {} else ""
+
+                accessors.append(accessor)
+            else:
+                accessors.append(lambda element, entity: "")
+        return accessors
+
+    def _value_accessor(
+        self, name: str, field_names: frozenset[str], field_path: str
+    ) -> Accessor:
+        format_value = self._format
+        if name in field_names and name != ENTITY_COLUMN:
+            return lambda element, entity: format_value(getattr(element, name))
+        getter = self._root_getter(name, field_names, field_path)
+        return lambda element, entity: format_value(getter(element, entity))
+
+    @staticmethod
+    def _root_getter(
+        name: str, field_names: frozenset[str], field_path: str
+    ) -> Accessor:
+        if name == ENTITY_COLUMN:
+            if ENTITY_COLUMN in field_names:
+                return lambda element, entity: element.entity.name
+            return lambda element, entity: str(entity)
+        if name == PRODUCT_TYPE_COLUMN and name not in field_names:
+            type_name = _format_type_name(field_path)
+            return lambda element, entity: type_name
+        if name in field_names:
+            return lambda element, entity: getattr(element, name)
+        return lambda element, entity: None
+
+    def _nested_getter(
+        self, tokens: list[str], field_names: frozenset[str], field_path: str
+    ) -> Accessor:
+        root = self._root_getter(tokens[0], field_names, field_path)
+        path = tokens[1:]
+
+        def getter(element, entity):
+            obj = root(element, entity) or {}
+            for token in path:
+                obj = _lookup(obj, token) or {}
+            return obj
+
+        return getter
+
+
 def _generate_default_template(
     feature: Feature, products: Optional[list[ProductType]]
 ) -> Template:
@@ -121,7 +256,7 @@ def _update_products_as_filter(params: TemplatedDataProcessorParams):
 class TemplatedDataGenerator(TemplateProcessorPort):
     async def process(
         self, data: list, params: TemplatedDataProcessorParams
-    ) -> list[list[str]]:
+    ) -> AsyncIterator[list[str]]:
         if not params.template:
             params.template = _generate_default_template(
                 params.feature, params.products
@@ -137,14 +272,13 @@ class TemplatedDataGenerator(TemplateProcessorPort):
             for field in params.template.fields
         ]
 
-        rows = [[field.name for field in params.template.fields]]
-        rows += self._map_rows(data, params)
-
-        return rows
+        yield [field.name for field in params.template.fields]
+        for row in self._map_rows(data, params):
+            yield row
 
     def _map_rows(
         self, data: list, params: TemplatedDataProcessorParams
-    ) -> list[list[str]]:
+    ) -> Iterator[list[str]]:
         template = params.template
         if template.feature == Feature.POSITION:
             field_paths = []
@@ -180,12 +314,9 @@ class TemplatedDataGenerator(TemplateProcessorPort):
         data: list,
         params: TemplatedDataProcessorParams,
         field_paths: list[str] = [""],
-    ) -> list[list[str]]:
-        columns = []
-        for field in params.template.fields:
-            columns.append(field)
+    ) -> Iterator[list[str]]:
+        template = _CompiledTemplate(params)
 
-        product_rows = []
         for entry in data:
             for field_path in field_paths:
                 try:
@@ -206,82 +337,12 @@ class TemplatedDataGenerator(TemplateProcessorPort):
 
                     if isinstance(target_data, list):
                         for product in target_data:
-                            if not self._matches_filters(product, params):
+                            if not template.matches(product):
                                 continue
-                            product_rows.append(
-                                self._map_row(
-                                    product, field_path, columns, params, entity=entity
-                                )
-                            )
+                            yield template.map_row(product, field_path, entity)
                     else:
-                        if not self._matches_filters(target_data, params):
+                        if not template.matches(target_data):
                             continue
-                        product_rows.append(
-                            self._map_row(
-                                target_data, field_path, columns, params, entity=entity
-                            )
-                        )
+                        yield template.map_row(target_data, field_path, entity)
                 except AttributeError:
                     pass
-
-        return product_rows
-
-    @staticmethod
-    def _matches_filters(element: Any, config: TemplatedDataProcessorParams):
-        filters = config.filters or []
-        for filter_rule in filters:
-            filtered_field = filter_rule.field
-            matching_values = filter_rule.values
-            matching_values = (
-                [matching_values]
-                if not isinstance(matching_values, list)
-                else matching_values
-            )
-            matching_values = [
-                str(value.value) if isinstance(value, Enum) else str(value)
-                for value in matching_values
-            ]
-            value = (
-                str(getattr(element, filtered_field).value)
-                if isinstance(getattr(element, filtered_field), Enum)
-                else str(getattr(element, filtered_field))
-            )
-            if value not in matching_values:
-                return False
-        return True
-
-    @staticmethod
-    def _map_row(
-        element: Any,
-        field_path: str,
-        columns: list[EffectiveTemplatedField],
-        config: TemplatedDataProcessorParams,
-        entity: Entity = None,
-    ) -> list[str]:
-        rows = []
-        element = asdict(element)
-        if ENTITY_COLUMN not in element:
-            element[ENTITY_COLUMN] = str(entity)
-        else:
-            element[ENTITY_COLUMN] = element[ENTITY_COLUMN]["name"]
-
-        if PRODUCT_TYPE_COLUMN not in element:
-            element[PRODUCT_TYPE_COLUMN] = _format_type_name(field_path)
-
-        for column in columns:
-            column_name = column.field
-            if column_name in element:
-                rows.append(_format_field_value(element[column_name], config))
-            else:
-                complex_column = "." in column_name
-                if complex_column:
-                    fields = column_name.split(".")
-                    obj = element
-                    for field in fields:
-                        obj = obj.get(field) or {}
-                    value = _format_field_value(obj, config) if obj != {} else ""
-                    rows.append(value)
-                else:
-                    rows.append("")
-
-        return rows
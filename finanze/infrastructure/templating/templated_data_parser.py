@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Iterator
 from uuid import uuid4
 
 from application.ports.template_parser_port import TemplateParserPort
@@ -135,6 +135,201 @@ def _parse_cell(
     return value
 
 
+_EUROPEAN_NUMBER = str.maketrans({".": None, ",": "."})
+_DEFAULT_NUMBER = str.maketrans({",": None})
+
+# Markers for cells left out of the parsed row
+_MISSING = object()
+_INVALID = object()
+
+ParsedRow = tuple[list[str], dict[str, Any], list[tuple[str, str]], list[str]]
+
+
+def _number_parser(
+    field: EffectiveTemplatedField, number_format: NumberFormat
+) -> Callable[[Any], Dezimal]:
+    table = (
+        _EUROPEAN_NUMBER if number_format == NumberFormat.EUROPEAN else _DEFAULT_NUMBER
+    )
+
+    def parse(value: Any) -> Dezimal:
+        try:
+            if isinstance(value, str):
+                return Dezimal(value.translate(table))
+            return Dezimal(value)
+        except ValueError as e:
+            raise InvalidFieldError(field.field, str(value)) from e
+
+    return parse
+
+
+def _datetime_parser(
+    field: EffectiveTemplatedField, formats: list[str | None], as_date: bool
+) -> Callable[[Any], Any]:
+    # Formats are always tried in the configured order, a value matching
+    # several of them (01/02/2024) must not depend on the rows before it
+    formats = list(dict.fromkeys(formats))
+
+    def parse(value: Any) -> Any:
+        for date_format in formats:
+            try:
+                parsed = parse_datetime(value, date_format)
+            except ValueError:
+                continue
+
+            return parsed.date() if as_date else parsed
+
+        raise InvalidFieldError(field.field, str(value))
+
+    return parse
+
+
+def _column_parser(
+    params: TemplatedDataParserParams, field: EffectiveTemplatedField
+) -> Callable[[Any], Any] | None:
+    field_type = field.type
+    if field_type in (TemplateFieldType.DECIMAL, TemplateFieldType.INTEGER):
+        parse = _number_parser(field, params.number_format)
+    elif field_type == TemplateFieldType.DATETIME:
+        parse = _datetime_parser(
+            field, [params.datetime_format, params.date_format], False
+        )
+    elif field_type == TemplateFieldType.DATE:
+        parse = _datetime_parser(
+            field, [params.date_format, params.datetime_format], True
+        )
+    elif field_type in (
+        TemplateFieldType.ENUM,
+        TemplateFieldType.CURRENCY,
+        TemplateFieldType.BOOLEAN,
+    ):
+
+        def parse(value: Any) -> Any:
+            return _parse_cell(value, params, field)
+
+    else:
+        return None
+
+    # Imported columns repeat a lot (currencies, types, dates, fees), each
+    # distinct text is parsed once
+    parsed_values = {}
+
+    def parse_cached(value: Any) -> Any:
+        if type(value) is not str:
+            return parse(value)
+        parsed = parsed_values.get(value, _MISSING)
+        if parsed is _MISSING:
+            parsed = parsed_values[value] = parse(value)
+        return parsed
+
+    return parse_cached
+
+
+def _parse_column(
+    values: list[Any],
+    params: TemplatedDataParserParams,
+    field: EffectiveTemplatedField,
+) -> tuple[list[Any], dict[int, str]]:
+    """
+    Parses a whole column, returning its values and the invalid ones by row
+    index. Empty cells without default are _MISSING when the field is required
+    and None otherwise, invalid cells are _INVALID.
+    """
+    parse = _column_parser(params, field)
+    invalid = {}
+
+    empty = _MISSING if field.required else None
+    empty_error = None
+    if field.default_value is not None:
+        try:
+            empty = field.default_value
+            if parse:
+                empty = parse(empty)
+        except InvalidFieldError as e:
+            empty = _INVALID
+            empty_error = e.value
+
+    parsed = []
+    for i, value in enumerate(values):
+        if not value:
+            if empty is _INVALID:
+                invalid[i] = empty_error
+            parsed.append(empty)
+        elif parse is None:
+            parsed.append(value)
+        else:
+            try:
+                parsed.append(parse(value))
+            except InvalidFieldError as e:
+                invalid[i] = e.value
+                parsed.append(_INVALID)
+
+    return parsed, invalid
+
+
+def _parse_columns(
+    rows: list[list[str]],
+    columns: list[EffectiveTemplatedField | None],
+    start_column_index: int,
+    params: TemplatedDataParserParams,
+) -> Iterator[ParsedRow]:
+    parsed_columns = []
+    for j, column in enumerate(columns, start_column_index):
+        if not column:
+            continue
+        values = [row[j] if j < len(row) else None for row in rows]
+        parsed_columns.append((column.field, *_parse_column(values, params, column)))
+
+    for i, row in enumerate(rows):
+        raw_parsed_row = {}
+        invalid_fields = []
+        missing_fields = []
+        for field, values, invalid in parsed_columns:
+            value = values[i]
+            if value is _MISSING:
+                missing_fields.append(field)
+            elif value is _INVALID:
+                invalid_fields.append((field, invalid[i]))
+            else:
+                raw_parsed_row[field] = value
+
+        yield row, raw_parsed_row, invalid_fields, missing_fields
+
+
+def _parse_rows(
+    rows: list[list[str]],
+    columns: list[EffectiveTemplatedField | None],
+    start_column_index: int,
+    params: TemplatedDataParserParams,
+) -> Iterator[ParsedRow]:
+    for row in rows:
+        raw_parsed_row = {}
+        invalid_fields = []
+        missing_fields = []
+        for j, column in enumerate(columns, start_column_index):
+            if not column:
+                continue
+
+            value = row[j] if j < len(row) else None
+            if not value:
+                value = column.default_value
+                if value is None and column.required:
+                    missing_fields.append(column.field)
+                    continue
+
+            try:
+                parsed = None
+                if value is not None:
+                    parsed = _parse_cell(value, params, column)
+            except InvalidFieldError as e:
+                invalid_fields.append((e.field_name, e.value))
+                continue
+
+            raw_parsed_row[column.field] = parsed
+
+        yield row, raw_parsed_row, invalid_fields, missing_fields
+
+
 class TemplateDataParser(TemplateParserPort):
     PRODUCT_TYPE_CLS_MAP = {
         ProductType.ACCOUNT: (Accounts, Account),
@@ -156,7 +351,12 @@ class TemplateDataParser(TemplateParserPort):
         ProductType.DEPOSIT: DepositTx,
     }
 
-    def __init__(self):
+    def __init__(self, bulk: bool = True):
+        """
+        bulk parses the sheets column by column, otherwise every cell is
+        parsed on its own row by row. Both report the same errors.
+        """
+        self._bulk = bulk
         self._log = logging.getLogger(__name__)
 
     async def global_positions(
@@ -429,41 +629,25 @@ class TemplateDataParser(TemplateParserPort):
                 )
             )
 
-        for row in table[header_row_index + 1 :]:
-            raw_parsed_row = {}
-            missing_fields = []
-            for j, column in enumerate(columns, start_column_index):
-                if not column:
-                    continue
-
-                value = row[j] if j < len(row) else None
-                if not value:
-                    value = column.default_value
-                    if value is None and column.required:
-                        missing_fields.append(column.field)
-                        continue
-
-                try:
-                    parsed = None
-                    if value is not None:
-                        parsed = _parse_cell(value, config, column)
-                except InvalidFieldError as e:
-                    errors.append(
-                        ImportError(
-                            ImportErrorType.VALIDATION_ERROR,
-                            candidate.name,
-                            [
-                                {
-                                    "field": e.field_name,
-                                    "value": e.value,
-                                }
-                            ],
-                            row,
-                        )
+        parse_rows = _parse_columns if self._bulk else _parse_rows
+        parsed_rows = parse_rows(
+            table[header_row_index + 1 :], columns, start_column_index, config
+        )
+        for row, raw_parsed_row, invalid_fields, missing_fields in parsed_rows:
+            for field, value in invalid_fields:
+                errors.append(
+                    ImportError(
+                        ImportErrorType.VALIDATION_ERROR,
+                        candidate.name,
+                        [
+                            {
+                                "field": field,
+                                "value": value,
+                            }
+                        ],
+                        row,
                     )
-                    continue
-
-                raw_parsed_row[column.field] = parsed
+                )
 
             if missing_fields:
                 errors.append(
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional
 
 LOG_FILENAME = "finanze.log"
+PROFILES_DIRNAME = "profiles"
 
 
 class TZFormatter(logging.Formatter):
@@ -45,6 +46,11 @@ def _apply_third_party_level(level_name: str):
         logging.getLogger(name).setLevel(lvl)
 
 
+def profiles_dir(args) -> Path:
+    """Where request profiles are written, next to the log files."""
+    return Path(args.log_dir) / PROFILES_DIRNAME
+
+
 def configure_logging(args):
     root_logger = logging.getLogger()
     if root_logger.handlers:
@@ -11,6 +11,7 @@ from application.use_cases.add_entity_credentials import AddEntityCredentialsImp
 from application.use_cases.cancel_entity_login import CancelEntityLoginImpl
 from application.use_cases.add_manual_transaction import AddManualTransactionImpl
 from application.use_cases.calculate_loan import CalculateLoanImpl
+from application.use_cases.calculate_loan_schedule import CalculateLoanScheduleImpl
 from application.use_cases.calculate_savings import CalculateSavingsImpl
 from application.use_cases.change_user_password import ChangeUserPasswordImpl
 from application.use_cases.complete_external_entity_connection import (
@@ -170,18 +171,23 @@ from infrastructure.client.rates.metal.metal_price_client import MetalPriceClien
 from infrastructure.cloud.backup.backup_processor_adapter import (
     BackupProcessorAdapter,
 )
+from infrastructure.cloud.backup.block_delta_calculator import BlockDeltaCalculator
 from infrastructure.cloud.cloud_data_register import CloudDataRegister
 from infrastructure.config.config_loader import ConfigLoader
 from infrastructure.config.server_details_adapter import ServerDetailsAdapter
 from infrastructure.controller.config import quart
 from infrastructure.controller.controllers import register_routes
+from infrastructure.controller.metrics_endpoint import register_metrics
+from infrastructure.controller.request_instrumentation import RequestInstrumentation
+from infrastructure.controller.request_profiler import RequestProfiler
+from infrastructure.controller.response_cache import ResponseCache
 from infrastructure.crypto.public_key_derivation_adapter import (
     PublicKeyDerivationAdapter,
 )
 from infrastructure.features.env_feature_flag_adapter import EnvFeatureFlagAdapter
 from infrastructure.keychain.public_keychain_adapter import PublicKeychainAdapter
-from infrastructure.file_storage.exchange_rate_file_storage import (
-    ExchangeRateFileStorage,
+from infrastructure.file_storage.exchange_rate_sqlite_storage import (
+    ExchangeRateSQLiteStorage,
 )
 from infrastructure.file_storage.local_file_storage import LocalFileStorage
 from infrastructure.repository import (
@@ -203,6 +209,9 @@ from infrastructure.repository.crypto.crypto_asset_repository import (
 from infrastructure.repository.crypto.crypto_wallet_repository import (
     CryptoWalletRepository,
 )
+from infrastructure.notifications.notification_broadcaster import (
+    NotificationBroadcaster,
+)
 from infrastructure.repository.db.client import DBClient
 from infrastructure.repository.db.manager import DBManager
 from infrastructure.repository.db.transaction_handler import TransactionHandler
@@ -216,6 +225,7 @@ from infrastructure.repository.entity.external_entity_repository import (
     ExternalEntityRepository,
 )
 from infrastructure.calculations.loan_calculator import LoanCalculator
+from infrastructure.calculations.monte_carlo_simulator import MonteCarloSimulator
 from infrastructure.repository.external_integration.external_integration_repository import (
     ExternalIntegrationRepository,
 )
@@ -250,6 +260,7 @@ from infrastructure.table.xlsx_file_table_adapter import XLSXFileTableAdapter
 from infrastructure.templating.templated_data_generator import TemplatedDataGenerator
 from infrastructure.templating.templated_data_parser import TemplateDataParser
 from infrastructure.user_files.user_data_manager import UserDataManager
+from logs import profiles_dir
 
 
 class FinanzeServer:
@@ -265,9 +276,14 @@ class FinanzeServer:
 
         self._log.info("Initializing components...")
 
-        self._db_client = DBClient()
+        slow_query_threshold = (
+            args.slow_query_ms / 1000 if args.slow_query_ms is not None else None
+        )
+        self._db_client = DBClient(slow_query_threshold=slow_query_threshold)
         db_client = self._db_client
         db_manager = DBManager(db_client)
+        notification_broadcaster = NotificationBroadcaster()
+        db_client.add_commit_listener(notification_broadcaster.tables_changed)
         data_manager = UserDataManager(args.data_dir)
 
         static_upload_dir = args.data_dir / Path("static")
@@ -376,7 +392,7 @@ class FinanzeServer:
         file_storage_repository = LocalFileStorage(
             upload_dir=static_upload_dir, static_url_prefix="/static"
         )
-        exchange_rate_storage = ExchangeRateFileStorage(args.data_dir)
+        exchange_rate_storage = ExchangeRateSQLiteStorage(args.data_dir)
 
         exchange_rate_client = ExchangeRateClient()
         ecb_client = ECBClient()
@@ -462,6 +478,7 @@ class FinanzeServer:
             loan_calculator,
             real_estate_repository,
             feature_flag_port,
+            notification_broadcaster,
         )
         fetch_crypto_data = FetchCryptoDataImpl(
             position_repository,
@@ -473,6 +490,7 @@ class FinanzeServer:
             external_integration_repository,
             transaction_handler,
             public_key_derivation,
+            notification_broadcaster,
         )
         fetch_external_financial_data = FetchExternalFinancialDataImpl(
             entity_repository,
@@ -482,6 +500,7 @@ class FinanzeServer:
             external_integration_repository,
             last_fetches_repository,
             transaction_handler,
+            notification_broadcaster,
         )
         export_sheets = ExportSheetsImpl(
             position_repository,
@@ -676,6 +695,7 @@ class FinanzeServer:
             real_estate_repository, position_repository
         )
         calculate_loan = CalculateLoanImpl(loan_calculator)
+        calculate_loan_schedule = CalculateLoanScheduleImpl(loan_calculator)
         calculate_savings = CalculateSavingsImpl()
         get_euribor_rates = GetEuriborRatesImpl(ecb_client)
         forecast = ForecastImpl(
@@ -685,6 +705,7 @@ class FinanzeServer:
             pending_flow_port=pending_flow_repository,
             real_estate_port=real_estate_repository,
             entity_port=entity_repository,
+            forecast_simulator=MonteCarloSimulator(),
         )
         update_contributions = UpdateContributionsImpl(
             entity_port=entity_repository,
@@ -735,6 +756,7 @@ class FinanzeServer:
             snapshot_writer=manual_position_snapshot_writer,
             throttle_port=tracked_updates_repository,
             transaction_handler_port=transaction_handler,
+            notification_port=notification_broadcaster,
         )
         update_tracked_loans = UpdateTrackedLoansImpl(
             position_port=position_repository,
@@ -751,6 +773,7 @@ class FinanzeServer:
         get_template_fields = GetTemplateFieldsImpl()
 
         backup_processor = BackupProcessorAdapter()
+        backup_delta_calculator = BlockDeltaCalculator()
         backup_repository = BackupClient(HttpFileTransferStrategy())
 
         backupable_ports = {
@@ -764,6 +787,8 @@ class FinanzeServer:
             backup_repository=backup_repository,
             backup_local_registry=cloud_register,
             cloud_register=cloud_register,
+            backup_settings_port=cloud_register,
+            backup_delta_calculator=backup_delta_calculator,
         )
         import_backup = ImportBackupImpl(
             data_initiator=db_manager,
@@ -772,6 +797,7 @@ class FinanzeServer:
             backup_repository=backup_repository,
             backup_local_registry=cloud_register,
             cloud_register=cloud_register,
+            backup_delta_calculator=backup_delta_calculator,
         )
         get_backups = GetBackupsImpl(
             backupable_ports=backupable_ports,
@@ -804,6 +830,19 @@ class FinanzeServer:
         self._log.info("Setting up REST API...")
 
         self._quart_app = quart(static_upload_dir)
+        register_metrics(self._quart_app)
+        if args.debug_routes:
+            RequestInstrumentation(db_client, lambda: db_manager.unlocked).register(
+                self._quart_app
+            )
+        if args.profile_routes or args.debug_routes:
+            RequestProfiler(
+                profiles_dir(args),
+                lambda: db_manager.unlocked,
+                routes=args.profile_routes,
+                threshold=args.profile_threshold_ms / 1000,
+            ).register(self._quart_app, debug_route=args.debug_routes)
+        ResponseCache(db_manager.get_last_updated).register(self._quart_app)
         await register_routes(
             self._quart_app,
             user_login,
@@ -855,6 +894,7 @@ class FinanzeServer:
             delete_real_estate,
             list_real_estate,
             calculate_loan,
+            calculate_loan_schedule,
             calculate_savings,
             forecast,
             update_contributions,
@@ -881,6 +921,7 @@ class FinanzeServer:
             get_backup_settings,
             save_backup_settings,
             get_euribor_rates,
+            notification_broadcaster,
         )
 
         self._log.info("Warming up exchange rates...")
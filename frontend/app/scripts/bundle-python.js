@@ -68,6 +68,7 @@ const CORE_PATTERNS = [
   "finanze/infrastructure/controller/router.py",
   "finanze/infrastructure/controller/handler.py",
   "finanze/infrastructure/controller/request_wrapper.py",
+  "finanze/infrastructure/controller/streaming.py",
   "finanze/infrastructure/controller/routes/get_status.py",
   "finanze/infrastructure/repository/db/",
   "finanze/infrastructure/user_files/capacitor_data_manager.py",
@@ -95,6 +96,9 @@ const LAZY_PATTERNS = [
   "finanze/infrastructure/client/keychain/",
   "finanze/infrastructure/keychain/",
   "finanze/infrastructure/cloud/backup/capacitor_backup_processor.py",
+  "finanze/infrastructure/cloud/backup/backup_processor_v2.py",
+  "finanze/infrastructure/cloud/backup/block_delta_calculator.py",
+  "finanze/infrastructure/cloud/backup/capacitor_block_delta_calculator.py",
   "finanze/infrastructure/file_storage/mobile_file_storage.py",
   // Infrastructure - repositories (lazy-only)
   "finanze/infrastructure/repository/keychain/",
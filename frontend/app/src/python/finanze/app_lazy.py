@@ -98,6 +98,9 @@ class LazyComponents:
         from infrastructure.cloud.backup.capacitor_backup_processor import (
             CapacitorBackupProcessorAdapter,
         )
+        from infrastructure.cloud.backup.capacitor_block_delta_calculator import (
+            CapacitorBlockDeltaCalculator,
+        )
         from infrastructure.repository.historic.historic_repository import (
             HistoricSQLRepository as HistoricRepository,
         )
@@ -277,6 +280,7 @@ class LazyComponents:
 
         file_storage = MobileFileStorage()
         backup_processor = CapacitorBackupProcessorAdapter()
+        backup_delta_calculator = CapacitorBlockDeltaCalculator()
 
         if INCLUDE_CONNECTIONS:
             public_keychain_data_repo = PublicKeychainRepository(client=db_client)
@@ -414,6 +418,11 @@ class LazyComponents:
             d.backup_repository,
             d.cloud_register,
             d.cloud_register,
+            d.cloud_register,
+            # Deltas are only restored on mobile, uploads are always full
+            None,
+            # Protocol 2 is processed in Python, holding the whole backup in memory
+            protocol=1,
         )
         self.import_backup = ImportBackupImpl(
             core.db_manager,
@@ -422,6 +431,7 @@ class LazyComponents:
             d.backup_repository,
             d.cloud_register,
             d.cloud_register,
+            backup_delta_calculator,
         )
 
         self.update_settings = UpdateSettingsImpl(d.config_loader)
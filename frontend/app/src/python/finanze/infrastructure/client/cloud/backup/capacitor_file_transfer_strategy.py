@@ -1,4 +1,6 @@
 import logging
+from pathlib import Path
+from typing import Optional
 
 import js
 from pyodide.ffi import to_js
@@ -28,7 +30,7 @@ class CapacitorFileTransferStrategy(FileTransferStrategy):
         self,
         url: str,
         method: str,
-        payload: bytes,
+        payload: bytes | Path,
         headers: dict[str, str],
         backup_type: BackupFileType,
     ) -> None:
@@ -64,7 +66,13 @@ class CapacitorFileTransferStrategy(FileTransferStrategy):
             self._log.error(f"Upload failed: {e}")
             raise
 
-    async def download(self, url: str, backup_type: BackupFileType) -> bytes:
+    async def download(
+        self,
+        url: str,
+        backup_type: BackupFileType,
+        resume_key: Optional[str] = None,
+    ) -> bytes:
+        # The native plugin downloads in a single request, nothing to resume
         plugin = _get_plugin()
 
         file_name = get_file_name(backup_type, "imported")
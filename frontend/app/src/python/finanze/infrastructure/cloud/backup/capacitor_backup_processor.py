@@ -1,4 +1,5 @@
 import base64
+import io
 import logging
 
 import js
@@ -21,15 +22,23 @@ def _get_plugin():
 
 
 class CapacitorBackupProcessorAdapter(BackupProcessor):
+    # Protocols the native plugins don't implement, processed in Python. The
+    # staging API only moves whole files, so these are held in memory and the
+    # app keeps uploading protocol 1, they are only read from other devices.
+    STREAMED_PROTOCOLS = {2}
+
     def __init__(self):
         self._log = logging.getLogger(__name__)
 
     async def compile(self, data: BackupProcessRequest) -> BackupProcessResult:
-        plugin = _get_plugin()
-
         input_file = get_file_name(data.type, "exported")
         output_file = get_file_name(data.type, "compiled")
 
+        if data.protocol in self.STREAMED_PROTOCOLS:
+            return await self._process_staged(data, input_file, output_file, True)
+
+        plugin = _get_plugin()
+
         try:
             options = {
                 "inputFile": input_file,
@@ -52,11 +61,14 @@ class CapacitorBackupProcessorAdapter(BackupProcessor):
             raise
 
     async def decompile(self, data: BackupProcessRequest) -> BackupProcessResult:
-        plugin = _get_plugin()
-
         input_file = get_file_name(data.type, "imported")
         output_file = get_file_name(data.type, "decompiled")
 
+        if data.protocol in self.STREAMED_PROTOCOLS:
+            return await self._process_staged(data, input_file, output_file, False)
+
+        plugin = _get_plugin()
+
         try:
             options = {
                 "inputFile": input_file,
@@ -78,8 +90,32 @@ class CapacitorBackupProcessorAdapter(BackupProcessor):
             self._log.error(f"Decompile failed: {e}")
             raise
 
-
-async def write_staging_file(file_name: str, data: bytes) -> int:
+    async def _process_staged(
+        self,
+        data: BackupProcessRequest,
+        input_file: str,
+        output_file: str,
+        compiling: bool,
+    ) -> BackupProcessResult:
+        from infrastructure.cloud.backup.backup_processor_v2 import (
+            BackupProcessorV2,
+        )
+
+        processor = BackupProcessorV2()
+        src = io.BytesIO(await read_staging_file(input_file))
+        dst = io.BytesIO()
+        if compiling:
+            processor.compile_stream(src, dst, data.password)
+        else:
+            processor.decompile_stream(src, dst, data.password)
+
+        # Encoded straight from the buffer instead of a copy of it
+        size = await write_staging_file(output_file, dst.getbuffer())
+        self._log.info(f"Processed {input_file} -> {output_file}, size={size}")
+        return BackupProcessResult(payload=b"", size=size)
+
+
+async def write_staging_file(file_name: str, data: bytes | memoryview) -> int:
     plugin = _get_plugin()
 
     data_b64 = base64.b64encode(data).decode("ascii")
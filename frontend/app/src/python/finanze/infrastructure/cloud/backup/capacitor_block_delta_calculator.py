@@ -0,0 +1,68 @@
+import logging
+import tempfile
+from pathlib import Path
+from uuid import UUID
+
+from domain.backup import (
+    BackupDeltaResult,
+    BackupFileType,
+    BackupManifest,
+    DELTA_TYPES,
+)
+from infrastructure.cloud.backup.block_delta_calculator import BlockDeltaCalculator
+from infrastructure.cloud.backup.capacitor_backup_processor import (
+    delete_staging_file,
+    read_staging_file,
+    write_staging_file,
+)
+from infrastructure.cloud.backup.staging_registry import get_file_name
+
+
+class CapacitorBlockDeltaCalculator(BlockDeltaCalculator):
+    """
+    Block deltas over the native staging files, the paths given by the use
+    cases are not used. Only restoring deltas uploaded from other devices is
+    supported, the mobile upload use case is built without a delta calculator
+    and always uploads full pieces.
+    """
+
+    def __init__(self):
+        self._log = logging.getLogger(__name__)
+
+    async def build_manifest(
+        self, backup_type: BackupFileType, base_id: UUID, source: Path
+    ) -> BackupManifest:
+        # Hashes are only needed to build deltas
+        return BackupManifest(
+            type=backup_type,
+            base_id=base_id,
+            block_size=self.BLOCK_SIZE,
+            hashes=[],
+        )
+
+    async def diff(
+        self, manifest: BackupManifest, source: Path, target: Path
+    ) -> BackupDeltaResult:
+        raise NotImplementedError("Incremental backups are not supported on mobile")
+
+    async def apply(self, base_id: UUID, base: Path, delta: Path, target: Path) -> bool:
+        # Only data backups have deltas
+        base_file = get_file_name(BackupFileType.DATA, "decompiled")
+        delta_file = get_file_name(DELTA_TYPES[BackupFileType.DATA], "decompiled")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = Path(tmpdir)
+            base_path = workdir / "base"
+            delta_path = workdir / "delta"
+            patched_path = workdir / "patched"
+            base_path.write_bytes(await read_staging_file(base_file))
+            delta_path.write_bytes(await read_staging_file(delta_file))
+            await delete_staging_file(delta_file)
+
+            # No threads in Pyodide, patched in place
+            applied = self._apply(base_id, base_path, delta_path, patched_path)
+            if applied:
+                size = await write_staging_file(base_file, patched_path.read_bytes())
+                self._log.info(f"Applied backup delta to {base_file}, size={size}")
+
+        return applied
@@ -13,6 +13,12 @@ FILE_NAMES = {
         "imported": "IMPORTED_CONFIG",
         "decompiled": "DECOMPILED_CONFIG",
     },
+    BackupFileType.DATA_DELTA: {
+        "exported": "EXPORTED_DATA_DELTA",
+        "compiled": "COMPILED_DATA_DELTA",
+        "imported": "IMPORTED_DATA_DELTA",
+        "decompiled": "DECOMPILED_DATA_DELTA",
+    },
 }
 
 
@@ -12,6 +12,7 @@ from application.ports.backup_settings_port import BackupSettingsPort
 from application.ports.cloud_register import CloudRegister
 from domain.backup import (
     BackupInfo,
+    BackupManifest,
     BackupMode,
     BackupSettings,
     BackupsInfo,
@@ -134,6 +135,15 @@ class CapacitorCloudDataRegister(
         cloud_data["backup"] = backup_section
         await self._save_cloud_data(cloud_data)
 
+    async def get_manifest(
+        self, backup_type: BackupFileType
+    ) -> Optional[BackupManifest]:
+        # Manifests are only used for incremental uploads, not offered on mobile
+        return None
+
+    async def save_manifest(self, manifest: BackupManifest):
+        pass
+
     async def save_auth(self, token: CloudAuthToken):
         cloud_data = await self._load_cloud_data()
         cloud_data["auth"] = (
@@ -2,6 +2,7 @@ import json
 from copy import deepcopy
 from dataclasses import asdict
 from datetime import datetime
+from pathlib import Path
 from enum import Enum
 from typing import Optional
 from js import jsBridge
@@ -141,6 +142,10 @@ class CapacitorConfigAdapter(ConfigPort, Backupable):
         await write_staging_file("EXPORTED_CONFIG", yaml_bytes)
         return b""
 
+    async def export_to(self, target: Path):
+        # Exports go through the native staging files, the target is not used
+        await self.export()
+
     async def import_data(self, data: bytes, **kwargs) -> None:
         import strictyaml
 
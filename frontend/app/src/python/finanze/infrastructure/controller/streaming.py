@@ -0,0 +1,33 @@
+from io import BytesIO
+from typing import Any, AsyncIterable, Optional, Sequence
+
+from quart import Response, jsonify, send_file
+
+
+def jsonify_stream(
+    items: Sequence[Any],
+    key: Optional[str] = None,
+    extra: Optional[dict] = None,
+    chunk_size: Optional[int] = None,
+) -> Response:
+    """
+    Same payload as the server's chunked response, the bridge hands whole
+    bodies to the app so there is nothing to stream here.
+    """
+    if key is None:
+        return jsonify(list(items))
+    return jsonify({**(extra or {}), key: items})
+
+
+async def send_file_stream(
+    chunks: AsyncIterable[bytes], mimetype: str, attachment_filename: str
+) -> Response:
+    data = b"".join([chunk async for chunk in chunks])
+    response = await send_file(
+        BytesIO(data),
+        mimetype=mimetype,
+        as_attachment=True,
+        attachment_filename=attachment_filename,
+    )
+    response.headers["Content-Length"] = str(len(data))
+    return response
@@ -3,6 +3,7 @@ import hashlib
 import logging
 from asyncio import Lock
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 from application.ports.datasource_backup_port import Backupable
@@ -254,6 +255,10 @@ class CapacitorDBManager(DatasourceInitiator, Backupable):
         await js.jsBridge.sqlite.exportDatabaseToStaging("EXPORTED_DATA")
         return b""
 
+    async def export_to(self, target: Path):
+        # Exports go through the native staging files, the target is not used
+        await self.export()
+
     async def import_data(
         self,
         data: bytes,
@@ -266,6 +266,7 @@ export interface ImportBackupRequest {
 
 export interface BackupSettings {
   mode: BackupMode
+  incremental?: boolean
 }
 
 export interface StatusResponse {
@@ -1087,6 +1088,21 @@ export interface ForecastRequest {
   avg_annual_crypto_increase?: number | null
   avg_annual_commodity_increase?: number | null
   include_real_estate_taxes?: boolean
+  monte_carlo?: MonteCarloRequest | null
+}
+
+export interface ReturnAssumption {
+  mean: number
+  volatility: number
+}
+
+export interface MonteCarloRequest {
+  market?: ReturnAssumption | null
+  crypto?: ReturnAssumption | null
+  commodity?: ReturnAssumption | null
+  paths?: number
+  seed?: number | null
+  percentiles?: number[]
 }
 
 export interface CashDelta {
@@ -1103,6 +1119,26 @@ export interface RealEstateEquityForecast {
   currency: string
 }
 
+export interface ForecastPoint {
+  date: string
+  net_worth: Record<string, number>
+  cash: Record<string, number>
+  equities: Record<string, number>
+  real_estate_equity: Record<string, number>
+  debt: Record<string, number>
+}
+
+export interface MonteCarloPoint {
+  date: string
+  net_worth: Record<string, number[]>
+}
+
+export interface MonteCarloResult {
+  paths: number
+  percentiles: number[]
+  points: MonteCarloPoint[]
+}
+
 export interface ForecastResult {
   target_date: string
   positions: EntitiesPosition
@@ -1110,6 +1146,8 @@ export interface ForecastResult {
   real_estate: RealEstateEquityForecast[]
   crypto_appreciation: number
   commodity_appreciation: number
+  trajectory: ForecastPoint[]
+  monte_carlo?: MonteCarloResult | null
 }
 
 // External entity additional requests
@@ -1,6 +1,7 @@
 import asyncio
 import threading
 from datetime import date, datetime, timedelta
+from typing import Optional
 from uuid import uuid4
 
 from dateutil.tz import tzlocal
@@ -50,6 +51,7 @@ from domain.transactions import (
     StockTx,
     Transactions,
     TxType,
+    TxWatermark,
 )
 
 
@@ -154,7 +156,10 @@ class MockFinancialEntityFetcher(FinancialEntityFetcher):
         return AutoContributions(periodic=[contribution])
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         now = datetime.now(tzlocal())
         stock_a = StockTx(
@@ -397,7 +402,10 @@ class MockCryptoExchangeFetcher(FinancialEntityFetcher):
         return AutoContributions(periodic=[])
 
     async def transactions(
-        self, registered_txs: set[str], options: FetchOptions
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
     ) -> Transactions:
         now = datetime.now(tzlocal())
         counter = self._next_counter()
@@ -105,9 +105,11 @@ from application.ports.last_fetches_port import LastFetchesPort
 from application.ports.crypto_asset_port import CryptoAssetRegistryPort
 from application.ports.crypto_price_provider import CryptoAssetInfoProvider
 from application.ports.config_port import ConfigPort
+from application.ports.backup_delta_calculator import BackupDeltaCalculator
 from application.ports.backup_local_registry import BackupLocalRegistry
 from application.ports.backup_repository import BackupRepository
 from application.ports.backup_processor import BackupProcessor
+from application.ports.backup_settings_port import BackupSettingsPort
 from application.ports.datasource_backup_port import Backupable
 from application.ports.datasource_initiator import DatasourceInitiator
 from application.ports.public_keychain_loader import PublicKeychainLoader
@@ -170,7 +172,7 @@ from infrastructure.calculations.loan_calculator import LoanCalculator
 from application.ports.tracked_updates_port import TrackedUpdatesPort
 
 from domain.entity import Entity
-from domain.backup import BackupFileType
+from domain.backup import BackupFileType, BackupMode, BackupSettings
 from domain.platform import OS
 from domain.status import BackendDetails, BackendOptions
 
@@ -230,6 +232,11 @@ async def app(tmp_path):
     backup_local_registry = AsyncMock(spec=BackupLocalRegistry)
     backup_repository = AsyncMock(spec=BackupRepository)
     backup_processor = AsyncMock(spec=BackupProcessor)
+    backup_settings_port = AsyncMock(spec=BackupSettingsPort)
+    backup_settings_port.get_backup_settings = AsyncMock(
+        return_value=BackupSettings(mode=BackupMode.MANUAL)
+    )
+    backup_delta_calculator = AsyncMock(spec=BackupDeltaCalculator)
     data_initiator = MagicMock(spec=DatasourceInitiator)
     data_initiator.get_hashed_password = AsyncMock(return_value="hashed-password")
 
@@ -326,6 +333,8 @@ async def app(tmp_path):
         backup_repository,
         backup_local_registry,
         cloud_register,
+        backup_settings_port,
+        backup_delta_calculator,
     )
     import_backup_uc = ImportBackupImpl(
         data_initiator,
@@ -334,6 +343,7 @@ async def app(tmp_path):
         backup_repository,
         backup_local_registry,
         cloud_register,
+        backup_delta_calculator,
     )
     connect_crypto_wallet_uc = ConnectCryptoWalletImpl(
         crypto_wallet_port,
@@ -249,9 +249,7 @@ class TestUploadBackup:
         backupable_ports[BackupFileType.DATA].get_last_updated = AsyncMock(
             return_value=dt
         )
-        backupable_ports[BackupFileType.DATA].export = AsyncMock(
-            return_value=b"database-export-data"
-        )
+        backupable_ports[BackupFileType.DATA].export_to = AsyncMock()
         backup_processor.compile = AsyncMock(
             return_value=BackupProcessResult(payload=b"encrypted", size=9)
         )
@@ -295,7 +293,7 @@ class TestUploadBackup:
         backupable_ports[BackupFileType.DATA].get_last_updated = AsyncMock(
             return_value=dt
         )
-        backupable_ports[BackupFileType.DATA].export = AsyncMock(return_value=b"data")
+        backupable_ports[BackupFileType.DATA].export_to = AsyncMock()
         backup_processor.compile = AsyncMock(
             return_value=BackupProcessResult(payload=b"enc", size=3)
         )
@@ -312,7 +310,7 @@ class TestUploadBackup:
         )
 
         await client.post(UPLOAD_URL, json={"types": ["DATA"]})
-        backupable_ports[BackupFileType.DATA].export.assert_awaited_once()
+        backupable_ports[BackupFileType.DATA].export_to.assert_awaited_once()
         backup_processor.compile.assert_awaited_once()
 
     @pytest.mark.asyncio
@@ -333,7 +331,7 @@ class TestUploadBackup:
         backupable_ports[BackupFileType.DATA].get_last_updated = AsyncMock(
             return_value=dt
         )
-        backupable_ports[BackupFileType.DATA].export = AsyncMock(return_value=b"data")
+        backupable_ports[BackupFileType.DATA].export_to = AsyncMock()
         backup_processor.compile = AsyncMock(
             return_value=BackupProcessResult(payload=b"enc", size=3)
         )
@@ -731,7 +729,7 @@ class TestUploadMultipleTypes:
         dt = datetime.now(timezone.utc)
         for port in backupable_ports.values():
             port.get_last_updated = AsyncMock(return_value=dt)
-            port.export = AsyncMock(return_value=b"export-bytes")
+            port.export_to = AsyncMock()
 
         backup_processor.compile = AsyncMock(
             return_value=BackupProcessResult(payload=b"enc", size=3)
@@ -819,9 +817,7 @@ class TestBackupTransferFailed:
         backupable_ports[BackupFileType.DATA].get_last_updated = AsyncMock(
             return_value=dt
         )
-        backupable_ports[BackupFileType.DATA].export = AsyncMock(
-            return_value=b"export-bytes"
-        )
+        backupable_ports[BackupFileType.DATA].export_to = AsyncMock()
         backup_processor.compile = AsyncMock(
             return_value=BackupProcessResult(payload=b"enc", size=3)
         )
@@ -72,11 +72,17 @@ def _setup_get_entities_mocks(
     virtual_import_registry.get_last_import_records = AsyncMock(return_value=[])
     entity_account_port.get_for_entities = AsyncMock(return_value={})
 
-    async def get_wallets_for_entity(entity_id, hd_addresses=False):
-        return wallets_by_entity.get(entity_id, [])
-
-    crypto_wallet_port.get_by_entity_id = AsyncMock(side_effect=get_wallets_for_entity)
-    last_fetches_port.get_by_entity_id = AsyncMock(return_value=[])
+    async def get_wallets_for_entities(entity_ids, hd_addresses=False):
+        return {
+            entity_id: wallets_by_entity[entity_id]
+            for entity_id in entity_ids
+            if entity_id in wallets_by_entity
+        }
+
+    crypto_wallet_port.get_by_entity_ids = AsyncMock(
+        side_effect=get_wallets_for_entities
+    )
+    last_fetches_port.get_by_entity_ids = AsyncMock(return_value={})
 
 
 class TestConnectValidation:
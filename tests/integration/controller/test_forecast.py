@@ -0,0 +1,61 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+
+from infrastructure.controller.config import quart
+from infrastructure.controller.routes.forecast import forecast
+
+from domain.use_cases.forecast import Forecast
+
+
+FORECAST_URL = "/api/v1/forecast"
+
+
+@pytest_asyncio.fixture
+async def app(tmp_path):
+    forecast_uc = AsyncMock(spec=Forecast)
+
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    test_app = quart(static_dir)
+
+    @test_app.route(FORECAST_URL, methods=["POST"])
+    async def forecast_route():
+        return await forecast(forecast_uc)
+
+    yield test_app, forecast_uc
+
+
+@pytest_asyncio.fixture
+async def client(app):
+    test_app, *_ = app
+    async with test_app.test_client() as c:
+        yield c
+
+
+class TestForecastMonteCarloValidation:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("monte_carlo", [[], "paths", 5, True])
+    async def test_non_object_monte_carlo_returns_400(self, app, client, monte_carlo):
+        _, forecast_uc = app
+        response = await client.post(
+            FORECAST_URL,
+            json={"target_date": "2030-01-01", "monte_carlo": monte_carlo},
+        )
+
+        assert response.status_code == 400
+        body = await response.get_json()
+        assert body["code"] == "INVALID_REQUEST"
+        forecast_uc.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("market", [[0.05, 0.15], "0.05", 1])
+    async def test_non_object_return_assumption_returns_400(self, app, client, market):
+        _, forecast_uc = app
+        response = await client.post(
+            FORECAST_URL,
+            json={"target_date": "2030-01-01", "monte_carlo": {"market": market}},
+        )
+
+        assert response.status_code == 400
+        forecast_uc.execute.assert_not_called()
@@ -0,0 +1,196 @@
+import sqlite3
+from datetime import date
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from domain.dezimal import Dezimal
+from domain.earnings_expenses import FlowFrequency, FlowType, PeriodicFlow
+from domain.real_estate import (
+    BasicInfo,
+    CostPayload,
+    Location,
+    PurchaseInfo,
+    RealEstate,
+    RealEstateFlow,
+    RealEstateFlowSubtype,
+    RentPayload,
+    ValuationInfo,
+)
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.real_estate.real_estate_repository import (
+    RealEstateRepository,
+)
+
+_SCHEMA = """
+    CREATE TABLE sys_config ("key" VARCHAR(128) PRIMARY KEY, value TEXT);
+
+    CREATE TABLE periodic_flows (
+        id         CHAR(36) PRIMARY KEY,
+        name       TEXT        NOT NULL,
+        amount     TEXT        NOT NULL,
+        currency   CHAR(3)     NOT NULL,
+        flow_type  VARCHAR(16) NOT NULL,
+        frequency  VARCHAR(32) NOT NULL,
+        category   TEXT,
+        enabled    BOOLEAN     NOT NULL DEFAULT TRUE,
+        since      DATE        NOT NULL,
+        until      DATE,
+        icon       TEXT,
+        max_amount TEXT
+    );
+
+    CREATE TABLE real_estate (
+        id                     CHAR(36) PRIMARY KEY,
+        name                   VARCHAR(100) NOT NULL,
+        currency               CHAR(3)      NOT NULL,
+        photo_url              TEXT,
+        is_residence           BOOLEAN      NOT NULL,
+        is_rented              BOOLEAN      NOT NULL,
+        bathrooms              INTEGER,
+        bedrooms               INTEGER,
+        address                TEXT,
+        cadastral_reference    TEXT,
+        purchase_date          DATE         NOT NULL,
+        purchase_price         TEXT         NOT NULL,
+        purchase_expenses      JSON         NOT NULL,
+        estimated_market_value TEXT         NOT NULL,
+        annual_appreciation    TEXT,
+        valuations             JSON         NOT NULL,
+        rental_data            JSON,
+        created_at             TIMESTAMP    NOT NULL,
+        updated_at             TIMESTAMP
+    );
+
+    CREATE TABLE real_estate_flows (
+        real_estate_id   CHAR(36)    NOT NULL,
+        periodic_flow_id CHAR(36)    NOT NULL,
+        flow_subtype     VARCHAR(16) NOT NULL,
+        description      TEXT        NOT NULL,
+        payload          JSON        NOT NULL,
+        extra_reference  VARCHAR(255),
+        PRIMARY KEY (real_estate_id, periodic_flow_id)
+    );
+    CREATE INDEX idx_real_estate_flows_real_estate_id ON real_estate_flows (real_estate_id);
+"""
+
+
+def _insert_pf(conn, name: str) -> PeriodicFlow:
+    flow = PeriodicFlow(
+        id=uuid4(),
+        name=name,
+        amount=Dezimal("100"),
+        currency="EUR",
+        flow_type=FlowType.EXPENSE,
+        frequency=FlowFrequency.MONTHLY,
+        category=None,
+        enabled=True,
+        since=date(2024, 1, 1),
+        until=None,
+        icon=None,
+    )
+    conn.execute(
+        "INSERT INTO periodic_flows (id, name, amount, currency, flow_type, frequency, enabled, since) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            str(flow.id),
+            flow.name,
+            str(flow.amount),
+            flow.currency,
+            flow.flow_type.value,
+            flow.frequency.value,
+            True,
+            flow.since.isoformat(),
+        ),
+    )
+    return flow
+
+
+def _real_estate(conn, name: str, flow_names: list[str]) -> RealEstate:
+    flows = []
+    for flow_name in flow_names:
+        periodic_flow = _insert_pf(conn, flow_name)
+        subtype = (
+            RealEstateFlowSubtype.RENT
+            if flow_name.startswith("rent")
+            else RealEstateFlowSubtype.COST
+        )
+        flows.append(
+            RealEstateFlow(
+                periodic_flow_id=periodic_flow.id,
+                periodic_flow=periodic_flow,
+                flow_subtype=subtype,
+                description=flow_name,
+                payload=RentPayload()
+                if subtype == RealEstateFlowSubtype.RENT
+                else CostPayload(tax_deductible=True),
+            )
+        )
+    conn.commit()
+
+    return RealEstate(
+        id=uuid4(),
+        basic_info=BasicInfo(name=name, is_residence=False, is_rented=True),
+        location=Location(),
+        purchase_info=PurchaseInfo(
+            date=date(2020, 1, 1), price=Dezimal("200000"), expenses=[]
+        ),
+        valuation_info=ValuationInfo(
+            estimated_market_value=Dezimal("250000"), valuations=[]
+        ),
+        flows=flows,
+        currency="EUR",
+        rental_data=None,
+    )
+
+
+@pytest_asyncio.fixture
+async def setup():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+
+    repository = RealEstateRepository(client=DBClient(conn))
+    yield repository, conn
+    conn.close()
+
+
+class TestRealEstateLoading:
+    @pytest.mark.asyncio
+    async def test_get_all_loads_flows_in_two_queries(self, setup):
+        repository, conn = setup
+        expected = {
+            "A": ["rent a", "cost a1", "cost a2"],
+            "B": [],
+            "C": ["cost c1", "rent c"],
+        }
+        for name, flow_names in expected.items():
+            await repository.insert(_real_estate(conn, name, flow_names))
+
+        statements = []
+        conn.set_trace_callback(statements.append)
+        loaded = await repository.get_all()
+        conn.set_trace_callback(None)
+
+        assert len([s for s in statements if "SELECT" in s.upper()]) == 2
+        assert [re.basic_info.name for re in loaded] == ["A", "B", "C"]
+        for re in loaded:
+            assert [f.description for f in re.flows] == expected[re.basic_info.name]
+
+    @pytest.mark.asyncio
+    async def test_get_all_matches_get_by_id(self, setup):
+        repository, conn = setup
+        for name in ("X", "Y"):
+            await repository.insert(_real_estate(conn, name, ["rent", "cost"]))
+
+        loaded = await repository.get_all()
+
+        for re in loaded:
+            assert await repository.get_by_id(re.id) == re
+
+    @pytest.mark.asyncio
+    async def test_get_all_empty(self, setup):
+        repository, _ = setup
+
+        assert await repository.get_all() == []
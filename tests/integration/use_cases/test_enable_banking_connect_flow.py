@@ -82,6 +82,13 @@ class InMemoryExternalEntityPort:
     async def get_by_entity_id(self, entity_id: UUID) -> Optional[ExternalEntity]:
         return next((e for e in self._by_id.values() if e.entity_id == entity_id), None)
 
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID]
+    ) -> dict[UUID, ExternalEntity]:
+        return {
+            e.entity_id: e for e in self._by_id.values() if e.entity_id in entity_ids
+        }
+
     async def delete_by_id(self, ee_id: UUID):
         self._by_id.pop(ee_id, None)
 
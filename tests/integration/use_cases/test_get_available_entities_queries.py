@@ -0,0 +1,235 @@
+import sqlite3
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from application.use_cases.get_available_entities import GetAvailableEntitiesImpl
+from domain.available_sources import FinancialEntityStatus
+from domain.crypto import AddressSource, CryptoWallet
+from domain.entity import Entity, EntityOrigin, EntityType, Feature
+from domain.external_entity import ExternalEntity, ExternalEntityStatus
+from domain.external_integration import ExternalIntegrationId
+from domain.fetch_record import FetchRecord
+from infrastructure.repository.crypto.crypto_wallet_repository import (
+    CryptoWalletRepository,
+)
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.entity.entity_repository import EntitySQLRepository
+from infrastructure.repository.entity.external_entity_repository import (
+    ExternalEntityRepository,
+)
+from infrastructure.repository.fetch.last_fetches_repository import (
+    LastFetchesRepository,
+)
+
+_SCHEMA = """
+    CREATE TABLE sys_config ("key" VARCHAR(128) PRIMARY KEY, value TEXT);
+
+    CREATE TABLE entities (
+        id         CHAR(36)    NOT NULL PRIMARY KEY,
+        name       VARCHAR(50) NOT NULL,
+        natural_id VARCHAR(50),
+        type       VARCHAR(32) NOT NULL,
+        origin     VARCHAR(32) NOT NULL,
+        icon_url   TEXT
+    );
+
+    CREATE TABLE external_entities (
+        id                   CHAR(36)    NOT NULL PRIMARY KEY,
+        entity_id            CHAR(36)    NOT NULL,
+        status               VARCHAR(32) NOT NULL,
+        provider             VARCHAR(36) NOT NULL,
+        date                 TIMESTAMP   NOT NULL,
+        provider_instance_id TEXT,
+        payload              JSON
+    );
+    CREATE INDEX idx_ee_entity_id ON external_entities (entity_id);
+
+    CREATE TABLE crypto_wallets (
+        id             CHAR(36)    NOT NULL PRIMARY KEY,
+        entity_id      CHAR(36)    NOT NULL,
+        name           TEXT        NOT NULL,
+        address_source VARCHAR(20) NOT NULL,
+        created_at     TIMESTAMP   NOT NULL
+    );
+    CREATE INDEX idx_cw_entity_id ON crypto_wallets (entity_id);
+
+    CREATE TABLE crypto_wallet_addresses (
+        wallet_id CHAR(36) NOT NULL,
+        address   TEXT     NOT NULL
+    );
+
+    CREATE TABLE hd_wallet (
+        wallet_id   CHAR(36)    NOT NULL PRIMARY KEY,
+        xpub        TEXT        NOT NULL,
+        script_type VARCHAR(20) NOT NULL,
+        coin        VARCHAR(30) NOT NULL
+    );
+
+    CREATE TABLE last_fetches (
+        id                CHAR(36)     NOT NULL PRIMARY KEY,
+        entity_id         CHAR(36)     NOT NULL,
+        feature           VARCHAR(255) NOT NULL,
+        date              TIMESTAMP    NOT NULL,
+        entity_account_id CHAR(36)
+    );
+    CREATE INDEX idx_lfetches_entity_id ON last_fetches (entity_id);
+    CREATE UNIQUE INDEX idx_lfetches_unique ON last_fetches (entity_id, feature, COALESCE(entity_account_id, ''));
+"""
+
+FETCHED_AT = datetime(2025, 1, 1, 12, 0)
+
+
+def _entity(name: str, entity_type: EntityType, origin: EntityOrigin) -> Entity:
+    return Entity(
+        id=uuid4(),
+        name=name,
+        natural_id=None,
+        type=entity_type,
+        origin=origin,
+        icon_url=None,
+    )
+
+
+async def _populate(repositories, count: int):
+    entities, external_entities, crypto_wallets, last_fetches = repositories
+    for i in range(count):
+        bank = _entity(
+            f"Bank {i}",
+            EntityType.FINANCIAL_INSTITUTION,
+            EntityOrigin.EXTERNALLY_PROVIDED,
+        )
+        await entities.insert(bank)
+        await external_entities.upsert(
+            ExternalEntity(
+                id=uuid4(),
+                entity_id=bank.id,
+                status=ExternalEntityStatus.LINKED,
+                provider=ExternalIntegrationId.ENABLE_BANKING,
+                date=FETCHED_AT,
+            )
+        )
+
+        wallet = _entity(f"Chain {i}", EntityType.CRYPTO_WALLET, EntityOrigin.MANUAL)
+        await entities.insert(wallet)
+        await crypto_wallets.insert(
+            CryptoWallet(
+                id=uuid4(),
+                entity_id=wallet.id,
+                addresses=[f"addr-{i}-a", f"addr-{i}-b"],
+                name=f"Wallet {i}",
+                address_source=AddressSource.MANUAL,
+                hd_wallet=None,
+            )
+        )
+
+        await entities.insert(
+            _entity(
+                f"Manual {i}", EntityType.FINANCIAL_INSTITUTION, EntityOrigin.MANUAL
+            )
+        )
+
+        await last_fetches.save(
+            [FetchRecord(entity_id=bank.id, feature=Feature.POSITION, date=FETCHED_AT)]
+        )
+
+
+@pytest_asyncio.fixture
+async def setup():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+
+    client = DBClient(conn)
+    repositories = (
+        EntitySQLRepository(client),
+        ExternalEntityRepository(client),
+        CryptoWalletRepository(client),
+        LastFetchesRepository(client),
+    )
+
+    credentials_port = AsyncMock()
+    credentials_port.get_available_entities = AsyncMock(return_value=[])
+    external_integration_port = AsyncMock()
+    external_integration_port.get_payloads_by_type = AsyncMock(return_value={})
+    virtual_import_registry = AsyncMock()
+    virtual_import_registry.get_last_import_records = AsyncMock(return_value=[])
+    entity_account_port = AsyncMock()
+    entity_account_port.get_by_ids = AsyncMock(return_value=[])
+
+    entity_port, external_entity_port, crypto_wallet_port, last_fetches_port = (
+        repositories
+    )
+    use_case = GetAvailableEntitiesImpl(
+        entity_port,
+        external_entity_port,
+        external_integration_port,
+        credentials_port,
+        crypto_wallet_port,
+        last_fetches_port,
+        virtual_import_registry,
+        {},
+        {},
+        entity_account_port,
+        {},
+    )
+    yield use_case, repositories, conn
+    conn.close()
+
+
+async def _count_selects(use_case, conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    result = await use_case.execute()
+    conn.set_trace_callback(None)
+    return len([s for s in statements if "SELECT" in s.upper()]), result
+
+
+class TestGetAvailableEntitiesQueries:
+    @pytest.mark.asyncio
+    async def test_statement_count_does_not_grow_with_entities(self, setup):
+        use_case, repositories, conn = setup
+
+        await _populate(repositories, 3)
+        few_selects, few = await _count_selects(use_case, conn)
+
+        await _populate(repositories, 30)
+        many_selects, many = await _count_selects(use_case, conn)
+
+        assert len(few.entities) == 9
+        assert len(many.entities) == 99
+        assert few_selects == many_selects == 4
+
+    @pytest.mark.asyncio
+    async def test_batched_lookups_are_mapped_to_their_entities(self, setup):
+        use_case, repositories, conn = setup
+        await _populate(repositories, 2)
+
+        result = await use_case.execute()
+
+        by_name = {e.name: e for e in result.entities}
+        bank = by_name["Bank 1"]
+        assert bank.status == FinancialEntityStatus.CONNECTED
+        assert bank.provider == ExternalIntegrationId.ENABLE_BANKING
+        assert bank.last_fetch == {Feature.POSITION: FETCHED_AT}
+
+        wallet = by_name["Chain 1"]
+        assert [w.name for w in wallet.connected] == ["Wallet 1"]
+        assert sorted(wallet.connected[0].addresses) == ["addr-1-a", "addr-1-b"]
+
+        manual = by_name["Manual 1"]
+        assert manual.status == FinancialEntityStatus.DISCONNECTED
+        assert manual.connected is None
+        assert manual.last_fetch == {}
+
+    @pytest.mark.asyncio
+    async def test_no_entities(self, setup):
+        use_case, _, conn = setup
+
+        selects, result = await _count_selects(use_case, conn)
+
+        assert result.entities == []
+        assert selects == 1
@@ -0,0 +1,263 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from application.ports.financial_entity_fetcher import FinancialEntityFetcher
+from application.use_cases.fetch_financial_data import FetchFinancialDataImpl
+from domain.dezimal import Dezimal
+from domain.entity import Entity, EntityOrigin, EntityType, Feature
+from domain.fetch_record import DataSource
+from domain.fetch_result import FetchOptions, FetchResultCode
+from domain.global_position import ProductType
+from domain.transactions import AccountTx, StockTx, Transactions, TxType, TxWatermark
+from infrastructure.repository.db.client import DBClient
+from infrastructure.repository.db.transaction_handler import TransactionHandler
+from infrastructure.repository.transaction.transaction_repository import (
+    TransactionSQLRepository,
+)
+
+_SCHEMA = """
+    CREATE TABLE sys_config ("key" VARCHAR(128) PRIMARY KEY, value TEXT);
+
+    CREATE TABLE investment_transactions (
+        id                     CHAR(36)    NOT NULL PRIMARY KEY,
+        ref                    VARCHAR(255) NOT NULL,
+        name                   TEXT        NOT NULL,
+        amount                 TEXT        NOT NULL,
+        currency               CHAR(3)     NOT NULL,
+        type                   VARCHAR(20) NOT NULL,
+        date                   TIMESTAMP   NOT NULL,
+        entity_id              CHAR(36)    NOT NULL,
+        is_real                BOOLEAN     NOT NULL,
+        source                 VARCHAR(20) NOT NULL,
+        product_type           VARCHAR(20) NOT NULL,
+        created_at             TIMESTAMP   NOT NULL,
+        isin                   VARCHAR(12),
+        ticker                 VARCHAR(10),
+        market                 VARCHAR(10),
+        shares                 TEXT,
+        price                  TEXT,
+        net_amount             TEXT,
+        fees                   TEXT,
+        retentions             TEXT,
+        order_date             TIMESTAMP,
+        linked_tx              VARCHAR(255),
+        interests              TEXT,
+        iban                   TEXT,
+        portfolio_name         TEXT,
+        product_subtype        TEXT,
+        asset_contract_address TEXT,
+        entity_account_id      CHAR(36)
+    );
+    CREATE INDEX idx_itxs_entity_account_product_date ON investment_transactions (entity_account_id, product_type, date);
+
+    CREATE TABLE account_transactions (
+        id                CHAR(36)    NOT NULL PRIMARY KEY,
+        ref               VARCHAR(255) NOT NULL,
+        name              TEXT        NOT NULL,
+        amount            TEXT        NOT NULL,
+        currency          CHAR(3)     NOT NULL,
+        type              VARCHAR(20) NOT NULL,
+        date              TIMESTAMP   NOT NULL,
+        entity_id         CHAR(36)    NOT NULL,
+        is_real           BOOLEAN     NOT NULL,
+        source            VARCHAR(20) NOT NULL,
+        created_at        TIMESTAMP   NOT NULL,
+        fees              TEXT,
+        retentions        TEXT,
+        interest_rate     TEXT,
+        avg_balance       TEXT,
+        net_amount        TEXT,
+        entity_account_id CHAR(36)
+    );
+    CREATE INDEX idx_account_entity_account_date ON account_transactions (entity_account_id, date);
+"""
+
+ENTITY = Entity(
+    id=uuid4(),
+    name="Broker",
+    natural_id="broker",
+    type=EntityType.FINANCIAL_INSTITUTION,
+    origin=EntityOrigin.NATIVE,
+    icon_url=None,
+)
+
+
+def _at(day: int, hour: int = 10) -> datetime:
+    return datetime(2025, 1, day, hour, tzinfo=timezone.utc)
+
+
+def _stock_tx(ref: str, date: datetime) -> StockTx:
+    return StockTx(
+        id=uuid4(),
+        ref=ref,
+        name="ACME",
+        amount=Dezimal(100),
+        currency="EUR",
+        type=TxType.BUY,
+        date=date,
+        entity=ENTITY,
+        source=DataSource.REAL,
+        product_type=ProductType.STOCK_ETF,
+        shares=Dezimal(1),
+        price=Dezimal(100),
+        fees=Dezimal(0),
+        isin="US0000000001",
+    )
+
+
+def _account_tx(ref: str, date: datetime) -> AccountTx:
+    return AccountTx(
+        id=uuid4(),
+        ref=ref,
+        name="Interest",
+        amount=Dezimal(1),
+        currency="EUR",
+        type=TxType.INTEREST,
+        date=date,
+        entity=ENTITY,
+        source=DataSource.REAL,
+        product_type=ProductType.ACCOUNT,
+        fees=Dezimal(0),
+        retentions=Dezimal(0),
+    )
+
+
+class FakeFetcher(FinancialEntityFetcher):
+    """Remote history that honours the since hint with day granularity."""
+
+    def __init__(self):
+        self.stocks = [("s1", _at(1)), ("s2", _at(2)), ("s3", _at(3))]
+        self.accounts = [("a1", _at(1)), ("a2", _at(2))]
+        self.requests: list[Optional[dict[ProductType, TxWatermark]]] = []
+        self.served: list[int] = []
+
+    def _after(self, remote, since, product_type):
+        watermark = (since or {}).get(product_type)
+        return [
+            (ref, date)
+            for ref, date in remote
+            if not watermark or date.date() >= watermark.date.date()
+        ]
+
+    async def transactions(
+        self,
+        registered_txs: set[str],
+        options: FetchOptions,
+        since: Optional[dict[ProductType, TxWatermark]] = None,
+    ) -> Transactions:
+        self.requests.append(since)
+        investment = [
+            _stock_tx(ref, date)
+            for ref, date in self._after(self.stocks, since, ProductType.STOCK_ETF)
+        ]
+        account = [
+            _account_tx(ref, date)
+            for ref, date in self._after(self.accounts, since, ProductType.ACCOUNT)
+        ]
+        self.served.append(len(investment) + len(account))
+        return Transactions(investment=investment, account=account)
+
+
+@pytest_asyncio.fixture
+async def setup():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+
+    client = DBClient(conn)
+    use_case = FetchFinancialDataImpl(
+        position_port=AsyncMock(),
+        auto_contr_port=AsyncMock(),
+        transaction_port=TransactionSQLRepository(client),
+        historic_port=AsyncMock(),
+        entity_fetchers={},
+        config_port=AsyncMock(),
+        credentials_port=AsyncMock(),
+        sessions_port=AsyncMock(),
+        last_fetches_port=AsyncMock(),
+        crypto_asset_registry_port=AsyncMock(),
+        crypto_asset_info_provider=AsyncMock(),
+        transaction_handler_port=TransactionHandler(client),
+        keychain_loader=AsyncMock(),
+        entity_account_port=AsyncMock(),
+        loan_calculator=AsyncMock(),
+        real_estate_port=AsyncMock(),
+        feature_flag_port=MagicMock(get_all=MagicMock(return_value={})),
+    )
+    yield use_case, FakeFetcher(), conn
+    conn.close()
+
+
+async def _sync(use_case, fetcher, entity_account_id, deep: bool = False):
+    result = await use_case.get_data(
+        ENTITY,
+        [Feature.TRANSACTIONS],
+        fetcher,
+        FetchOptions(deep=deep),
+        entity_account_id,
+    )
+    assert result.code == FetchResultCode.COMPLETED
+    txs = result.data.transactions
+    return sorted(tx.ref for tx in txs.investment + txs.account)
+
+
+def _stored_refs(conn) -> list[str]:
+    rows = conn.execute(
+        "SELECT ref FROM investment_transactions UNION ALL SELECT ref FROM account_transactions"
+    ).fetchall()
+    return sorted(row[0] for row in rows)
+
+
+class TestIncrementalTransactions:
+    @pytest.mark.asyncio
+    async def test_second_sync_only_requests_and_processes_the_delta(self, setup):
+        use_case, fetcher, conn = setup
+        entity_account_id = uuid4()
+
+        first = await _sync(use_case, fetcher, entity_account_id)
+
+        assert fetcher.requests == [{}]
+        assert first == ["a1", "a2", "s1", "s2", "s3"]
+
+        fetcher.stocks += [("s4", _at(3, 18)), ("s5", _at(5))]
+        fetcher.accounts += [("a3", _at(4))]
+
+        second = await _sync(use_case, fetcher, entity_account_id)
+
+        assert fetcher.requests[1] == {
+            ProductType.STOCK_ETF: TxWatermark(date=_at(3), ref="s3"),
+            ProductType.ACCOUNT: TxWatermark(date=_at(2), ref="a2"),
+        }
+        # Only the watermark days are served again, and dropped as already stored
+        assert fetcher.served == [5, 5]
+        assert second == ["a3", "s4", "s5"]
+        assert _stored_refs(conn) == ["a1", "a2", "a3", "s1", "s2", "s3", "s4", "s5"]
+
+    @pytest.mark.asyncio
+    async def test_deep_sync_falls_back_to_full_history(self, setup):
+        use_case, fetcher, conn = setup
+        entity_account_id = uuid4()
+        await _sync(use_case, fetcher, entity_account_id)
+
+        refs = await _sync(use_case, fetcher, entity_account_id, deep=True)
+
+        assert fetcher.requests[1] is None
+        assert refs == ["a1", "a2", "s1", "s2", "s3"]
+        assert _stored_refs(conn) == ["a1", "a2", "s1", "s2", "s3"]
+
+    @pytest.mark.asyncio
+    async def test_watermarks_are_kept_per_entity_account(self, setup):
+        use_case, fetcher, _ = setup
+        await _sync(use_case, fetcher, uuid4())
+
+        other = FakeFetcher()
+        refs = await _sync(use_case, other, uuid4())
+
+        assert other.requests == [{}]
+        assert refs == ["a1", "a2", "s1", "s2", "s3"]
@@ -11,7 +11,7 @@ from domain.calculations import (
     SavingsScenarioRequest,
 )
 from domain.dezimal import Dezimal
-from domain.exception.exceptions import MissingFieldsError
+from domain.exception.exceptions import CalculationInputError, MissingFieldsError
 
 
 def _use_case() -> CalculateSavingsImpl:
@@ -280,6 +280,49 @@ class TestTargetAmount:
         assert len(scenario.accumulation_periods) == 20
         assert scenario.final_balance >= Dezimal(5000)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("performance", ["0.03", "0.07", "-0.01"])
+    async def test_solved_periods_are_the_first_reaching_target(self, performance):
+        uc = _use_case()
+        req = _request(
+            base_amount=Dezimal(2500),
+            years=None,
+            scenarios=[
+                _scenario(
+                    annual_market_performance=Dezimal(performance),
+                    periodic_contribution=Dezimal(350),
+                    target_amount=Dezimal(60000),
+                )
+            ],
+        )
+
+        result = await uc.execute(req)
+
+        rate = Dezimal(performance) / 12
+        balance, periods = Dezimal(2500), 0
+        while balance < Dezimal(60000):
+            balance = (balance + Dezimal(350)) * (Dezimal(1) + rate)
+            periods += 1
+        assert len(result.scenarios[0].accumulation_periods) == periods
+
+    @pytest.mark.asyncio
+    async def test_unreachable_target_without_years_raises(self):
+        uc = _use_case()
+        req = _request(
+            base_amount=Dezimal(1000),
+            years=None,
+            scenarios=[
+                _scenario(
+                    annual_market_performance=Dezimal("-0.05"),
+                    periodic_contribution=Dezimal(10),
+                    target_amount=Dezimal(10000),
+                )
+            ],
+        )
+
+        with pytest.raises(CalculationInputError):
+            await uc.execute(req)
+
 
 # ---------------------------------------------------------------------------
 # TestRetirement
@@ -340,3 +383,27 @@ class TestRetirement:
         assert scenario.retirement is not None
         assert scenario.retirement.withdrawal_amount > Dezimal(0)
         assert len(scenario.retirement.periods) > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("performance", ["0", "0.05"])
+    async def test_solved_contribution_funds_every_withdrawal(self, performance):
+        uc = _use_case()
+        req = _request(
+            base_amount=Dezimal(1000),
+            years=5,
+            periodicity=SavingsPeriodicity.YEARLY,
+            scenarios=[_scenario(annual_market_performance=Dezimal(performance))],
+            retirement=SavingsRetirementRequest(
+                withdrawal_amount=Dezimal(1500),
+                withdrawal_years=10,
+            ),
+        )
+
+        result = await uc.execute(req)
+
+        retirement = result.scenarios[0].retirement
+        withdrawals = [p.withdrawal for p in retirement.periods]
+        assert len(withdrawals) == 10
+        # Cent rounding of the contribution only shifts the last withdrawal
+        assert all(w == Dezimal(1500) for w in withdrawals[:-1])
+        assert abs(withdrawals[-1] - Dezimal(1500)) < Dezimal(1)
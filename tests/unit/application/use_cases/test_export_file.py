@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.use_cases.export_file import ExportFileImpl
+from domain.entity import Feature
+from domain.exception.exceptions import ExportException
+from domain.export import FileExportRequest, FileFormat, NumberFormat
+from domain.transactions import Transactions
+from infrastructure.table.csv_file_table_adapter import CSVFileTableAdapter
+
+
+class RowProcessor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.mapped = 0
+
+    async def process(self, data, params):
+        for row in self.rows:
+            self.mapped += 1
+            yield row
+
+
+def _use_case(processor):
+    transaction_port = MagicMock()
+    transaction_port.get_all = AsyncMock(
+        return_value=Transactions(account=[], investment=[])
+    )
+    entity_port = MagicMock()
+    entity_port.get_disabled_entities = AsyncMock(return_value=[])
+    return ExportFileImpl(
+        position_port=MagicMock(),
+        auto_contr_port=MagicMock(),
+        transaction_port=transaction_port,
+        historic_port=MagicMock(),
+        entity_port=entity_port,
+        template_port=MagicMock(),
+        template_processor=processor,
+        table_rw_port=CSVFileTableAdapter(),
+    )
+
+
+def _request():
+    return FileExportRequest(
+        format=FileFormat.CSV,
+        number_format=NumberFormat.ENGLISH,
+        feature=Feature.TRANSACTIONS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rows_are_mapped_while_the_file_is_read():
+    processor = RowProcessor([["name"], ["a"], ["b"]])
+
+    result = await _use_case(processor).execute(_request())
+
+    assert result.filename.startswith("export_transactions_")
+    assert result.content_type == "text/csv"
+    # Only the header is peeked before the response starts
+    assert processor.mapped == 1
+    data = b"".join([chunk async for chunk in result.data])
+    assert data == b"name\r\na\r\nb\r\n"
+    assert processor.mapped == 3
+
+
+@pytest.mark.asyncio
+async def test_no_rows():
+    with pytest.raises(ExportException):
+        await _use_case(RowProcessor([])).execute(_request())
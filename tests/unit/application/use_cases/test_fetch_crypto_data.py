@@ -50,6 +50,15 @@ class MockCryptoWalletPort(CryptoWalletPort):
     ) -> List[CryptoWallet]:
         return [w for w in self._wallets if w.entity_id == entity_id]
 
+    async def get_by_entity_ids(
+        self, entity_ids: list[UUID], hd_addresses: bool
+    ) -> dict[UUID, List[CryptoWallet]]:
+        wallets_by_entity = {}
+        for w in self._wallets:
+            if w.entity_id in entity_ids:
+                wallets_by_entity.setdefault(w.entity_id, []).append(w)
+        return wallets_by_entity
+
     async def exists_by_entity_and_address(self, entity_id: UUID, address: str) -> bool:
         return False
 
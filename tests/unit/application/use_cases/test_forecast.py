@@ -1,11 +1,27 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
 from uuid import uuid4
 
 from application.use_cases.forecast import ForecastImpl
+from dateutil.relativedelta import relativedelta
+from domain.auto_contributions import (
+    AutoContributions,
+    ContributionFrequency,
+    ContributionTargetType,
+    PeriodicContribution,
+)
 from domain.dezimal import Dezimal
 from domain.entity import Entity, EntityOrigin, EntityType
+from domain.earnings_expenses import FlowFrequency, FlowType, PeriodicFlow
 from domain.fetch_record import DataSource
+from domain.forecast import ForecastRequest, MonteCarloRequest, ReturnAssumption
 from domain.global_position import (
+    Account,
+    Accounts,
+    AccountType,
+    EquityType,
     GlobalPosition,
     InterestType,
     Loan,
@@ -14,7 +30,10 @@ from domain.global_position import (
     ProductType,
     RealEstateCFDetail,
     RealEstateCFInvestments,
+    StockDetail,
+    StockInvestments,
 )
+from infrastructure.calculations.monte_carlo_simulator import MonteCarloSimulator
 
 
 def _entity():
@@ -239,3 +258,213 @@ class TestAmortizeStandaloneLoans:
         )
 
         assert loan.principal_outstanding == Dezimal(600)
+
+
+class TestSimulateLoanOutstanding:
+    # Reference balances from the previous month by month simulation
+    def test_mixed_loan_crossing_fixed_period_end(self):
+        # Fixed period ends on 2025-03-01, 14 months at 1.5% then 46 at 4%
+        projected = _forecast_impl()._simulate_loan_outstanding(
+            outstanding_now=Dezimal(150000),
+            payment=Dezimal(900),
+            start=date(2020, 3, 1),
+            interest_type="MIXED",
+            annual_rate_base=Dezimal("0.01"),
+            euribor=Dezimal("0.03"),
+            fixed_years=5,
+            months=60,
+            today=date(2024, 1, 10),
+            fixed_interest_rate=Dezimal("0.015"),
+        )
+
+        assert abs(projected - Dezimal("118430.09188931315")) < Dezimal("0.000001")
+
+    def test_fixed_loan(self):
+        projected = _forecast_impl()._simulate_loan_outstanding(
+            outstanding_now=Dezimal(150000),
+            payment=Dezimal(900),
+            start=date(2020, 3, 1),
+            interest_type="FIXED",
+            annual_rate_base=Dezimal("0.03"),
+            euribor=None,
+            fixed_years=None,
+            months=12,
+            today=date(2024, 1, 10),
+        )
+
+        assert abs(projected - Dezimal("143612.64904816346")) < Dezimal("0.000001")
+
+    def test_payment_below_interest_keeps_outstanding(self):
+        projected = _forecast_impl()._simulate_loan_outstanding(
+            outstanding_now=Dezimal(100000),
+            payment=Dezimal(100),
+            start=date(2020, 1, 1),
+            interest_type="FIXED",
+            annual_rate_base=Dezimal("0.05"),
+            euribor=None,
+            fixed_years=None,
+            months=24,
+            today=date(2024, 1, 1),
+        )
+
+        assert projected == Dezimal(100000)
+
+
+def _trajectory_forecast(
+    entity, position, contribution, flow, forecast_simulator=None
+) -> ForecastImpl:
+    position_port = AsyncMock()
+    position_port.get_last_grouped_by_entity.return_value = {entity: position}
+    contributions_port = AsyncMock()
+    contributions_port.get_all_grouped_by_entity.return_value = {
+        entity: AutoContributions(periodic=[contribution])
+    }
+    periodic_flow_port = AsyncMock()
+    periodic_flow_port.get_all.return_value = [flow]
+    pending_flow_port = AsyncMock()
+    pending_flow_port.get_all.return_value = []
+    real_estate_port = AsyncMock()
+    real_estate_port.get_all.return_value = []
+    entity_port = AsyncMock()
+    entity_port.get_disabled_entities.return_value = []
+    return ForecastImpl(
+        position_port=position_port,
+        auto_contributions_port=contributions_port,
+        periodic_flow_port=periodic_flow_port,
+        pending_flow_port=pending_flow_port,
+        real_estate_port=real_estate_port,
+        entity_port=entity_port,
+        forecast_simulator=forecast_simulator,
+    )
+
+
+def _trajectory_setup():
+    today = date.today()
+    target = today + relativedelta(months=6)
+    since = today - timedelta(days=40)
+    entity = _entity()
+    position = GlobalPosition(
+        id=uuid4(),
+        entity=entity,
+        products={
+            ProductType.ACCOUNT: Accounts(
+                entries=[
+                    Account(
+                        id=uuid4(),
+                        total=Dezimal(1000),
+                        currency="EUR",
+                        type=AccountType.CHECKING,
+                    )
+                ]
+            ),
+            ProductType.STOCK_ETF: StockInvestments(
+                entries=[
+                    StockDetail(
+                        id=uuid4(),
+                        name="ETF",
+                        ticker="ETF",
+                        isin="IE00ETF",
+                        shares=Dezimal(10),
+                        market_value=Dezimal(2000),
+                        currency="EUR",
+                        type=EquityType.ETF,
+                        initial_investment=Dezimal(1800),
+                    )
+                ]
+            ),
+        },
+    )
+    contribution = PeriodicContribution(
+        id=uuid4(),
+        alias=None,
+        target="IE00ETF",
+        target_name="ETF",
+        target_type=ContributionTargetType.STOCK_ETF,
+        amount=Dezimal(100),
+        currency="EUR",
+        since=since,
+        until=None,
+        frequency=ContributionFrequency.MONTHLY,
+        active=True,
+        source=DataSource.MANUAL,
+    )
+    flow = PeriodicFlow(
+        id=uuid4(),
+        name="Salary",
+        amount=Dezimal(500),
+        currency="EUR",
+        flow_type=FlowType.EARNING,
+        frequency=FlowFrequency.MONTHLY,
+        category=None,
+        enabled=True,
+        since=since,
+        until=None,
+        icon=None,
+    )
+    return target, entity, position, contribution, flow
+
+
+class TestTrajectory:
+    @pytest.mark.asyncio
+    async def test_monthly_points_up_to_target(self):
+        target, entity, position, contribution, flow = _trajectory_setup()
+
+        result = await _trajectory_forecast(
+            entity, position, contribution, flow
+        ).execute(ForecastRequest(target_date=target))
+
+        points = result.trajectory
+        assert len(points) == 6
+        assert points[-1].date == target
+        assert all(a.date < b.date for a, b in zip(points, points[1:]))
+
+        # One contribution and one salary per month
+        for month, point in enumerate(points, start=1):
+            assert point.equities["EUR"] == Dezimal(2000 + 100 * month)
+            assert point.cash["EUR"] == Dezimal(1000 + 400 * month)
+            assert point.net_worth["EUR"] == Dezimal(3000 + 500 * month)
+
+        # The last point matches the end state
+        final_delta = {d.currency: d.amount for d in result.cash_delta}
+        assert points[-1].cash["EUR"] == Dezimal(1000) + final_delta["EUR"]
+        stock = result.positions.positions[str(entity.id)][0].products[
+            ProductType.STOCK_ETF
+        ]
+        assert points[-1].equities["EUR"] == stock.entries[0].market_value
+
+    @pytest.mark.asyncio
+    async def test_monte_carlo_without_volatility_matches_trajectory(self):
+        target, entity, position, contribution, flow = _trajectory_setup()
+        request = ForecastRequest(
+            target_date=target,
+            avg_annual_market_increase=Dezimal("0.06"),
+            monte_carlo=MonteCarloRequest(
+                market=ReturnAssumption(mean=Dezimal("0.06"), volatility=Dezimal(0)),
+                paths=10,
+                seed=1,
+                percentiles=[5, 50, 95],
+            ),
+        )
+
+        result = await _trajectory_forecast(
+            entity, position, contribution, flow, MonteCarloSimulator()
+        ).execute(request)
+
+        points = result.monte_carlo.points
+        assert [p.date for p in points] == [p.date for p in result.trajectory]
+        for point, expected in zip(points, result.trajectory):
+            low, median, high = point.net_worth["EUR"]
+            assert low == median == high
+            assert abs(median - expected.net_worth["EUR"]) < Dezimal("0.01")
+
+    @pytest.mark.asyncio
+    async def test_monte_carlo_requires_simulator(self):
+        target, entity, position, contribution, flow = _trajectory_setup()
+        request = ForecastRequest(
+            target_date=target, monte_carlo=MonteCarloRequest(paths=10)
+        )
+
+        with pytest.raises(ValueError):
+            await _trajectory_forecast(entity, position, contribution, flow).execute(
+                request
+            )
@@ -20,7 +20,9 @@ def _build_use_case(
     entity_port.get_all = AsyncMock(return_value=[entity])
 
     external_entity_port = AsyncMock()
-    external_entity_port.get_by_entity_id = AsyncMock(return_value=external_entity)
+    external_entity_port.get_by_entity_ids = AsyncMock(
+        return_value={entity.id: external_entity}
+    )
 
     external_integration_port = AsyncMock()
     external_integration_port.get_payloads_by_type = AsyncMock(
@@ -31,8 +33,9 @@ def _build_use_case(
     credentials_port.get_available_entities = AsyncMock(return_value=[])
 
     crypto_wallet_port = AsyncMock()
+    crypto_wallet_port.get_by_entity_ids = AsyncMock(return_value={})
     last_fetches_port = AsyncMock()
-    last_fetches_port.get_by_entity_id = AsyncMock(return_value=[])
+    last_fetches_port.get_by_entity_ids = AsyncMock(return_value={})
 
     virtual_import_registry = AsyncMock()
     virtual_import_registry.get_last_import_records = AsyncMock(return_value=[])
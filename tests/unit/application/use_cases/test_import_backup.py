@@ -9,6 +9,7 @@ from application.use_cases.import_backup import ImportBackupImpl
 from domain.backup import (
     BackupFileType,
     BackupInfo,
+    BackupManifest,
     BackupPieces,
     BackupProcessResult,
     BackupTransferPiece,
@@ -73,6 +74,17 @@ def _make_transfer_piece(
     )
 
 
+def _delta_calculator(applies=True):
+    calculator = MagicMock()
+    calculator.build_manifest = AsyncMock(
+        side_effect=lambda backup_type, base_id, source: BackupManifest(
+            type=backup_type, base_id=base_id, block_size=16384, hashes=[]
+        )
+    )
+    calculator.apply = AsyncMock(return_value=applies)
+    return calculator
+
+
 def _build_use_case(
     auth=None,
     local_info=None,
@@ -81,6 +93,7 @@ def _build_use_case(
     backupable_ports=None,
     hashed_password="hashed_pass",
     decompile_result=None,
+    delta_calculator=None,
 ):
     cloud_register = MagicMock()
     cloud_register.get_auth = AsyncMock(return_value=auth or _make_auth())
@@ -90,6 +103,10 @@ def _build_use_case(
         return_value=local_info or BackupsInfo(pieces={})
     )
     local_registry.insert = AsyncMock()
+    local_registry.save_manifest = AsyncMock()
+
+    if delta_calculator is None:
+        delta_calculator = _delta_calculator()
 
     backup_repo = MagicMock()
     backup_repo.get_info = AsyncMock(return_value=remote_info or BackupsInfo(pieces={}))
@@ -123,6 +140,7 @@ def _build_use_case(
         backup_repository=backup_repo,
         backup_local_registry=local_registry,
         cloud_register=cloud_register,
+        backup_delta_calculator=delta_calculator,
     )
     return (
         use_case,
@@ -571,3 +589,87 @@ class TestImportInitialize:
         backupable.import_data.assert_called_once()
         call_kwargs = backupable.import_data.call_args
         assert call_kwargs[1]["initialize"] is False
+
+
+class TestImportDelta:
+    def _remote(self, base_id, delta_id):
+        base = _make_backup_info(date=EARLIER, backup_id=base_id)
+        delta = _make_backup_info(
+            backup_type=BackupFileType.DATA_DELTA, date=LATER, backup_id=delta_id
+        )
+        remote_info = BackupsInfo(
+            pieces={BackupFileType.DATA: base, BackupFileType.DATA_DELTA: delta}
+        )
+        download_result = BackupPieces(
+            pieces=[
+                _make_transfer_piece(date=EARLIER, piece_id=base_id),
+                _make_transfer_piece(
+                    backup_type=BackupFileType.DATA_DELTA,
+                    date=LATER,
+                    piece_id=delta_id,
+                ),
+            ]
+        )
+        return remote_info, download_result
+
+    @pytest.mark.asyncio
+    async def test_applies_delta_on_full_backup(self):
+        base_id, delta_id = uuid4(), uuid4()
+        remote_info, download_result = self._remote(base_id, delta_id)
+        delta_calculator = _delta_calculator()
+        backupable = MagicMock()
+        backupable.get_last_updated = AsyncMock(return_value=LONG_AGO)
+        backupable.import_data = AsyncMock()
+
+        use_case, _, local_registry, backup_repo, processor, _, _ = _build_use_case(
+            remote_info=remote_info,
+            download_result=download_result,
+            backupable_ports={BackupFileType.DATA: backupable},
+            delta_calculator=delta_calculator,
+        )
+
+        result = await use_case.execute(
+            ImportBackupRequest(
+                types=[BackupFileType.DATA], password="pass", force=True
+            )
+        )
+
+        download_params = backup_repo.download.call_args[0][0]
+        assert set(download_params.types) == {
+            BackupFileType.DATA,
+            BackupFileType.DATA_DELTA,
+        }
+        assert processor.decompile.call_count == 2
+        assert delta_calculator.apply.call_args[0][0] == base_id
+        assert backupable.import_data.call_count == 1
+
+        inserted = local_registry.insert.call_args[0][0]
+        assert {info.id for info in inserted} == {base_id, delta_id}
+        saved = local_registry.save_manifest.call_args[0][0]
+        assert saved.base_id == base_id
+        assert result.pieces[BackupFileType.DATA].local.id == delta_id
+
+    @pytest.mark.asyncio
+    async def test_ignores_delta_of_another_full_backup(self):
+        base_id, delta_id = uuid4(), uuid4()
+        remote_info, download_result = self._remote(base_id, delta_id)
+        backupable = MagicMock()
+        backupable.get_last_updated = AsyncMock(return_value=LONG_AGO)
+        backupable.import_data = AsyncMock()
+
+        use_case, _, local_registry, _, _, _, _ = _build_use_case(
+            remote_info=remote_info,
+            download_result=download_result,
+            backupable_ports={BackupFileType.DATA: backupable},
+            delta_calculator=_delta_calculator(applies=False),
+        )
+
+        result = await use_case.execute(
+            ImportBackupRequest(
+                types=[BackupFileType.DATA], password="pass", force=True
+            )
+        )
+
+        inserted = local_registry.insert.call_args[0][0]
+        assert [info.id for info in inserted] == [base_id]
+        assert result.pieces[BackupFileType.DATA].local.id == base_id
@@ -7,11 +7,15 @@ from dateutil.tz import tzlocal
 
 from application.use_cases.upload_backup import UploadBackupImpl
 from domain.backup import (
+    BackupDeltaResult,
     BackupFileType,
     BackupInfo,
+    BackupManifest,
+    BackupMode,
     BackupPieces,
     BackupProcessResult,
     BackupTransferPiece,
+    BackupSettings,
     BackupsInfo,
     SyncStatus,
     UploadBackupRequest,
@@ -72,6 +76,34 @@ def _make_transfer_piece(
     )
 
 
+def _delta_calculator(delta_size=10):
+    calculator = MagicMock()
+    calculator.build_manifest = AsyncMock(
+        side_effect=lambda backup_type, base_id, source: BackupManifest(
+            type=backup_type, base_id=base_id, block_size=16384, hashes=["h"]
+        )
+    )
+    calculator.diff = AsyncMock(
+        return_value=BackupDeltaResult(
+            size=delta_size, changed_blocks=1, total_blocks=10
+        )
+    )
+    return calculator
+
+
+def _exporting_backupable(last_update=NOW, size=1000):
+    backupable = MagicMock()
+    backupable.get_last_updated = AsyncMock(return_value=last_update)
+    backupable.export_to = AsyncMock(
+        side_effect=lambda target: target.write_bytes(b"x" * size)
+    )
+    return backupable
+
+
+def _echo_upload(params):
+    return params.pieces
+
+
 def _build_use_case(
     auth=None,
     local_info=None,
@@ -80,6 +112,11 @@ def _build_use_case(
     backupable_ports=None,
     hashed_password="hashed_pass",
     compile_result=None,
+    incremental=False,
+    manifest=None,
+    delta_calculator=None,
+    deltas_supported=True,
+    **kwargs,
 ):
     cloud_register = MagicMock()
     cloud_register.get_auth = AsyncMock(return_value=auth or _make_auth())
@@ -89,6 +126,15 @@ def _build_use_case(
         return_value=local_info or BackupsInfo(pieces={})
     )
     local_registry.insert = AsyncMock()
+    local_registry.get_manifest = AsyncMock(return_value=manifest)
+    local_registry.save_manifest = AsyncMock()
+
+    settings_port = MagicMock()
+    settings_port.get_backup_settings = AsyncMock(
+        return_value=BackupSettings(mode=BackupMode.MANUAL, incremental=incremental)
+    )
+    if delta_calculator is None and deltas_supported:
+        delta_calculator = _delta_calculator()
 
     backup_repo = MagicMock()
     backup_repo.get_info = AsyncMock(return_value=remote_info or BackupsInfo(pieces={}))
@@ -110,7 +156,7 @@ def _build_use_case(
     if backupable_ports is None:
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=NOW)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
         backupable_ports = {BackupFileType.DATA: backupable}
 
@@ -121,6 +167,9 @@ def _build_use_case(
         backup_repository=backup_repo,
         backup_local_registry=local_registry,
         cloud_register=cloud_register,
+        backup_settings_port=settings_port,
+        backup_delta_calculator=delta_calculator,
+        **kwargs,
     )
     return (
         use_case,
@@ -200,7 +249,7 @@ class TestUploadSkips:
         remote_info = BackupsInfo(pieces={BackupFileType.DATA: remote_backup})
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=LONG_AGO)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
 
         use_case, _, local_registry, backup_repo, processor, _, _ = _build_use_case(
@@ -214,7 +263,7 @@ class TestUploadSkips:
         )
 
         assert result.pieces == {}
-        assert backupable.export.call_count == 0
+        assert backupable.export_to.call_count == 0
         assert local_registry.insert.call_count == 0
 
 
@@ -227,7 +276,7 @@ class TestUploadConflict:
         remote_info = BackupsInfo(pieces={BackupFileType.DATA: remote_backup})
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=NOW)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
 
         use_case, *_ = _build_use_case(
@@ -245,7 +294,7 @@ class TestUploadConflict:
         remote_info = BackupsInfo(pieces={BackupFileType.DATA: remote_backup})
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=NOW)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
 
         use_case, *_ = _build_use_case(
@@ -266,7 +315,7 @@ class TestUploadForce:
         remote_info = BackupsInfo(pieces={BackupFileType.DATA: remote_backup})
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=NOW)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
 
         uploaded_piece = _make_transfer_piece(date=NOW)
@@ -295,7 +344,7 @@ class TestUploadSuccess:
         piece_id = uuid4()
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=NOW)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
         uploaded_piece = _make_transfer_piece(date=NOW, piece_id=piece_id)
         upload_result = BackupPieces(pieces=[uploaded_piece])
@@ -320,13 +369,51 @@ class TestUploadSuccess:
 
         assert backup_repo.upload.call_count == 1
         assert processor.compile.call_count == 1
-        assert backupable.export.call_count == 1
+        assert backupable.export_to.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_compiles_with_configured_protocol(self):
+        use_case, _, _, backup_repo, processor, _, _ = _build_use_case(protocol=1)
+
+        await use_case.execute(UploadBackupRequest(types=[BackupFileType.DATA]))
+
+        assert processor.compile.call_args[0][0].protocol == 1
+        piece = backup_repo.upload.call_args[0][0].pieces.pieces[0]
+        assert piece.protocol == 1
+
+    @pytest.mark.asyncio
+    async def test_compiled_piece_stays_on_disk_until_uploaded(self):
+        backupable = _exporting_backupable()
+        use_case, _, _, backup_repo, processor, _, _ = _build_use_case(
+            backupable_ports={BackupFileType.DATA: backupable},
+        )
+
+        def compile_to_target(request):
+            request.target.write_bytes(b"compiled")
+            return BackupProcessResult(payload=request.target, size=8)
+
+        processor.compile = AsyncMock(side_effect=compile_to_target)
+        uploaded = {}
+
+        def upload(params):
+            piece = params.pieces.pieces[0]
+            uploaded["payload"] = piece.payload
+            uploaded["content"] = piece.payload.read_bytes()
+            return BackupPieces(pieces=[])
+
+        backup_repo.upload = AsyncMock(side_effect=upload)
+
+        await use_case.execute(UploadBackupRequest(types=[BackupFileType.DATA]))
+
+        target = processor.compile.call_args[0][0].target
+        assert uploaded == {"payload": target, "content": b"compiled"}
+        assert not target.exists()
 
     @pytest.mark.asyncio
     async def test_no_insert_when_nothing_uploaded(self):
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=LONG_AGO)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
         local_backup = _make_backup_info(date=LONG_AGO)
         remote_backup = _make_backup_info(date=LONG_AGO)
@@ -352,7 +439,7 @@ class TestUploadSuccess:
         upload_result = BackupPieces(pieces=[uploaded_piece])
         backupable = MagicMock()
         backupable.get_last_updated = AsyncMock(return_value=NOW)
-        backupable.export = AsyncMock(return_value=b"data")
+        backupable.export_to = AsyncMock()
         backupable.import_data = AsyncMock()
 
         use_case, _, local_registry, backup_repo, *_ = _build_use_case(
@@ -365,3 +452,171 @@ class TestUploadSuccess:
         )
 
         assert BackupFileType.CONFIG not in result.pieces
+
+
+class TestIncrementalUpload:
+    @pytest.mark.asyncio
+    async def test_uploads_delta_on_shared_full_backup(self):
+        base_id = uuid4()
+        base = _make_backup_info(date=LONG_AGO, backup_id=base_id, size=500)
+        local_info = BackupsInfo(pieces={BackupFileType.DATA: base})
+        remote_info = BackupsInfo(pieces={BackupFileType.DATA: base})
+        manifest = BackupManifest(
+            type=BackupFileType.DATA, base_id=base_id, block_size=16384, hashes=[]
+        )
+        delta_calculator = _delta_calculator()
+
+        use_case, _, local_registry, backup_repo, processor, _, _ = _build_use_case(
+            local_info=local_info,
+            remote_info=remote_info,
+            backupable_ports={BackupFileType.DATA: _exporting_backupable()},
+            incremental=True,
+            manifest=manifest,
+            delta_calculator=delta_calculator,
+        )
+        backup_repo.upload = AsyncMock(side_effect=_echo_upload)
+
+        result = await use_case.execute(
+            UploadBackupRequest(types=[BackupFileType.DATA])
+        )
+
+        compiled = processor.compile.call_args[0][0]
+        assert compiled.type == BackupFileType.DATA_DELTA
+        assert delta_calculator.diff.call_count == 1
+        assert delta_calculator.build_manifest.call_count == 0
+
+        inserted = local_registry.insert.call_args[0][0]
+        assert [info.type for info in inserted] == [BackupFileType.DATA_DELTA]
+        saved = local_registry.save_manifest.call_args[0][0]
+        assert saved.base_id == base_id
+        assert saved.deltas == 1
+
+        synced = result.pieces[BackupFileType.DATA]
+        assert synced.local.id == inserted[0].id
+        assert synced.local.type == BackupFileType.DATA
+        assert synced.local.size == 500 + inserted[0].size
+
+    @pytest.mark.asyncio
+    async def test_uploads_full_backup_without_delta_calculator(self):
+        base_id = uuid4()
+        base = _make_backup_info(date=LONG_AGO, backup_id=base_id, size=500)
+        local_info = BackupsInfo(pieces={BackupFileType.DATA: base})
+        remote_info = BackupsInfo(pieces={BackupFileType.DATA: base})
+        manifest = BackupManifest(
+            type=BackupFileType.DATA, base_id=base_id, block_size=16384, hashes=[]
+        )
+
+        use_case, _, local_registry, backup_repo, processor, _, _ = _build_use_case(
+            local_info=local_info,
+            remote_info=remote_info,
+            backupable_ports={BackupFileType.DATA: _exporting_backupable()},
+            incremental=True,
+            manifest=manifest,
+            deltas_supported=False,
+        )
+        backup_repo.upload = AsyncMock(side_effect=_echo_upload)
+
+        await use_case.execute(UploadBackupRequest(types=[BackupFileType.DATA]))
+
+        assert processor.compile.call_args[0][0].type == BackupFileType.DATA
+        assert local_registry.save_manifest.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_uploads_full_backup_after_max_deltas(self):
+        base_id = uuid4()
+        base = _make_backup_info(date=LONG_AGO, backup_id=base_id)
+        manifest = BackupManifest(
+            type=BackupFileType.DATA,
+            base_id=base_id,
+            block_size=16384,
+            hashes=[],
+            deltas=UploadBackupImpl.FULL_BACKUP_EVERY_DELTAS,
+        )
+
+        use_case, _, local_registry, backup_repo, processor, _, _ = _build_use_case(
+            local_info=BackupsInfo(pieces={BackupFileType.DATA: base}),
+            remote_info=BackupsInfo(pieces={BackupFileType.DATA: base}),
+            backupable_ports={BackupFileType.DATA: _exporting_backupable()},
+            incremental=True,
+            manifest=manifest,
+        )
+        backup_repo.upload = AsyncMock(side_effect=_echo_upload)
+
+        await use_case.execute(UploadBackupRequest(types=[BackupFileType.DATA]))
+
+        compiled = processor.compile.call_args[0][0]
+        assert compiled.type == BackupFileType.DATA
+        saved = local_registry.save_manifest.call_args[0][0]
+        assert saved.base_id == local_registry.insert.call_args[0][0][0].id
+        assert saved.deltas == 0
+
+    @pytest.mark.asyncio
+    async def test_uploads_full_backup_when_delta_is_too_large(self):
+        base_id = uuid4()
+        base = _make_backup_info(date=LONG_AGO, backup_id=base_id)
+        manifest = BackupManifest(
+            type=BackupFileType.DATA, base_id=base_id, block_size=16384, hashes=[]
+        )
+
+        use_case, _, _, backup_repo, processor, _, _ = _build_use_case(
+            local_info=BackupsInfo(pieces={BackupFileType.DATA: base}),
+            remote_info=BackupsInfo(pieces={BackupFileType.DATA: base}),
+            backupable_ports={BackupFileType.DATA: _exporting_backupable(size=1000)},
+            incremental=True,
+            manifest=manifest,
+            delta_calculator=_delta_calculator(delta_size=900),
+        )
+        backup_repo.upload = AsyncMock(side_effect=_echo_upload)
+
+        await use_case.execute(UploadBackupRequest(types=[BackupFileType.DATA]))
+
+        assert processor.compile.call_args[0][0].type == BackupFileType.DATA
+
+    @pytest.mark.asyncio
+    async def test_force_uploads_full_backup(self):
+        base_id = uuid4()
+        base = _make_backup_info(date=LONG_AGO, backup_id=base_id)
+        manifest = BackupManifest(
+            type=BackupFileType.DATA, base_id=base_id, block_size=16384, hashes=[]
+        )
+        delta_calculator = _delta_calculator()
+
+        use_case, _, _, backup_repo, processor, _, _ = _build_use_case(
+            local_info=BackupsInfo(pieces={BackupFileType.DATA: base}),
+            remote_info=BackupsInfo(pieces={BackupFileType.DATA: base}),
+            backupable_ports={BackupFileType.DATA: _exporting_backupable()},
+            incremental=True,
+            manifest=manifest,
+            delta_calculator=delta_calculator,
+        )
+        backup_repo.upload = AsyncMock(side_effect=_echo_upload)
+
+        await use_case.execute(
+            UploadBackupRequest(types=[BackupFileType.DATA], force=True)
+        )
+
+        assert processor.compile.call_args[0][0].type == BackupFileType.DATA
+        assert delta_calculator.diff.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_newer_delta_counts_as_remote_backup(self):
+        base = _make_backup_info(date=LONG_AGO)
+        delta = _make_backup_info(
+            backup_type=BackupFileType.DATA_DELTA, date=EARLIER, size=10
+        )
+        pieces = {BackupFileType.DATA: base, BackupFileType.DATA_DELTA: delta}
+        backupable = _exporting_backupable(last_update=EARLIER)
+
+        use_case, _, local_registry, _, processor, _, _ = _build_use_case(
+            local_info=BackupsInfo(pieces=pieces),
+            remote_info=BackupsInfo(pieces=pieces),
+            backupable_ports={BackupFileType.DATA: backupable},
+            incremental=True,
+        )
+
+        result = await use_case.execute(
+            UploadBackupRequest(types=[BackupFileType.DATA])
+        )
+
+        assert result.pieces == {}
+        assert processor.compile.call_count == 0
@@ -0,0 +1,119 @@
+import copy
+import pickle
+from decimal import Decimal, InvalidOperation
+
+import pytest
+from pydantic import TypeAdapter
+
+from domain.dezimal import Dezimal
+
+
+class TestConstruction:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (1, "1"),
+            (0.1, "0.1"),
+            ("12.50", "12.50"),
+            (Decimal("3.25"), "3.25"),
+            (Dezimal("7"), "7"),
+        ],
+    )
+    def test_accepted_types(self, value, expected):
+        assert Dezimal(value).val == Decimal(expected)
+
+    @pytest.mark.parametrize("value", ["abc", None, [1]])
+    def test_rejects_invalid_values(self, value):
+        with pytest.raises(ValueError):
+            Dezimal(value)
+
+    def test_has_no_instance_dict(self):
+        with pytest.raises(AttributeError):
+            Dezimal(1).other = 2
+
+    def test_copy_and_pickle(self):
+        value = Dezimal("1.25")
+
+        assert copy.deepcopy(value) == value
+        assert pickle.loads(pickle.dumps(value)) == value
+
+
+class TestArithmetic:
+    def test_operators_with_dezimal_and_int(self):
+        a, b = Dezimal("7.5"), Dezimal(2)
+
+        assert a + b == Dezimal("9.5")
+        assert a - b == Dezimal("5.5")
+        assert a * b == Dezimal(15)
+        assert a / b == Dezimal("3.75")
+        assert a // b == Dezimal(3)
+        assert a % b == Dezimal("1.5")
+        assert b**3 == Dezimal(8)
+        assert 1 + a == Dezimal("8.5")
+        assert 10 - a == Dezimal("2.5")
+        assert 2 * a == Dezimal(15)
+        assert 15 / a == Dezimal(2)
+        assert 15 // a == Dezimal(2)
+        assert 15 % a == Dezimal(0)
+        assert -a == Dezimal("-7.5")
+        assert abs(-a) == a
+        assert round(Dezimal("1.255"), 2) == Dezimal("1.26")
+        assert sum([a, b, Dezimal(1)]) == Dezimal("10.5")
+
+    def test_results_are_dezimal(self):
+        result = Dezimal(1) + Dezimal(2)
+
+        assert type(result) is Dezimal
+        assert type(result.val) is Decimal
+
+    @pytest.mark.parametrize("other", [1.5, Decimal(1), "1"])
+    def test_rejects_non_integer_operands(self, other):
+        with pytest.raises(ValueError):
+            Dezimal(1) + other
+        with pytest.raises(ValueError):
+            Dezimal(1) < other
+
+
+class TestComparison:
+    def test_ordering(self):
+        a, b = Dezimal("1.5"), Dezimal(2)
+
+        assert a < b and a <= b and b > a and b >= a
+        assert a <= Dezimal("1.50") and a >= Dezimal("1.50")
+        assert b > 1 and b >= 2 and b <= 2 and b < 3
+        assert max(a, b) is b and min(a, b) is a
+
+    def test_equality(self):
+        assert Dezimal("1.50") == Dezimal("1.5")
+        assert Dezimal(2) == 2
+        assert Dezimal(2) != Dezimal(3)
+        assert Dezimal(2) != Decimal(2)
+        assert Dezimal(2) != "2"
+        assert Dezimal(2) is not None
+
+    def test_hash_matches_equal_values(self):
+        assert hash(Dezimal("1.50")) == hash(Dezimal("1.5")) == hash(Decimal("1.5"))
+        assert len({Dezimal(1), Dezimal("1.0"), Dezimal(2)}) == 2
+
+    def test_nan_comparisons_signal(self):
+        nan = Dezimal("NaN")
+
+        with pytest.raises(InvalidOperation):
+            nan < Dezimal(1)
+        with pytest.raises(InvalidOperation):
+            Dezimal(1) >= nan
+        with pytest.raises(InvalidOperation):
+            nan == Dezimal(1)
+
+
+class TestPydanticSchema:
+    def test_validates_and_serializes_as_string(self):
+        adapter = TypeAdapter(Dezimal)
+        value = Dezimal("1.25")
+
+        assert adapter.validate_python(value) is value
+        assert adapter.validate_python("1.25") == value
+        assert adapter.validate_python(3) == Dezimal(3)
+        assert adapter.dump_python(value) is value
+        assert adapter.dump_python(value, mode="json") == "1.25"
+        assert adapter.dump_json(value) == b'"1.25"'
@@ -0,0 +1,137 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from dateutil.tz import tzlocal
+
+from domain.dezimal import Dezimal
+from domain.entity import Entity, EntityOrigin, EntityType
+from domain.fetch_record import DataSource
+from domain.global_position import (
+    Account,
+    AccountType,
+    Accounts,
+    Commodities,
+    Crowdlending,
+    GlobalPosition,
+    ProductType,
+)
+from domain.position_aggregation import aggregate_positions
+
+ENTITY = Entity(
+    id=uuid.uuid4(),
+    name="Entity",
+    natural_id=None,
+    type=EntityType.FINANCIAL_INSTITUTION,
+    origin=EntityOrigin.NATIVE,
+    icon_url=None,
+)
+
+OTHER_ENTITY = Entity(
+    id=uuid.uuid4(),
+    name="Other",
+    natural_id=None,
+    type=EntityType.FINANCIAL_INSTITUTION,
+    origin=EntityOrigin.NATIVE,
+    icon_url=None,
+)
+
+
+def _account(total: str) -> Account:
+    return Account(
+        id=uuid.uuid4(),
+        total=Dezimal(total),
+        currency="EUR",
+        type=AccountType.CHECKING,
+    )
+
+
+def _crowdlending(total, rate) -> Crowdlending:
+    return Crowdlending(
+        id=uuid.uuid4(),
+        total=Dezimal(total) if total is not None else None,
+        weighted_interest_rate=Dezimal(rate) if rate is not None else None,
+        currency="EUR",
+        entries=[],
+    )
+
+
+def _position(products, entity=ENTITY) -> GlobalPosition:
+    return GlobalPosition(
+        id=uuid.uuid4(),
+        entity=entity,
+        date=datetime.now(tzlocal()),
+        products=products,
+        source=DataSource.REAL,
+    )
+
+
+class TestAggregatePositions:
+    def test_merges_all_entries_in_order(self):
+        accounts = [[_account("1"), _account("2")], [], [_account("3")]]
+        positions = [
+            _position({ProductType.ACCOUNT: Accounts(entries)}) for entries in accounts
+        ]
+
+        result = aggregate_positions(positions)
+
+        assert result.id == positions[0].id
+        assert result.products[ProductType.ACCOUNT].entries == [
+            entry for entries in accounts for entry in entries
+        ]
+
+    def test_matches_pairwise_addition(self):
+        positions = [
+            _position({ProductType.ACCOUNT: Accounts([_account("1")])}),
+            _position({ProductType.CROWDLENDING: _crowdlending("100", "0.1")}),
+            _position(
+                {
+                    ProductType.ACCOUNT: Accounts([_account("2")]),
+                    ProductType.CROWDLENDING: _crowdlending("300", "0.05"),
+                }
+            ),
+        ]
+
+        folded = positions[0]
+        for position in positions[1:]:
+            folded = folded + position
+
+        assert aggregate_positions(positions).products == folded.products
+
+    def test_crowdlending_weighted_interest_rate(self):
+        positions = [
+            _position({ProductType.CROWDLENDING: _crowdlending(total, rate)})
+            for total, rate in (("100", "0.1"), ("100", "0.2"), ("200", "0.05"))
+        ]
+
+        crowdlending = aggregate_positions(positions).products[ProductType.CROWDLENDING]
+
+        assert crowdlending.total == Dezimal(400)
+        assert crowdlending.weighted_interest_rate == Dezimal("0.1")
+
+    def test_crowdlending_missing_rate_drops_weighted_rate(self):
+        positions = [
+            _position({ProductType.CROWDLENDING: _crowdlending("100", "0.1")}),
+            _position({ProductType.CROWDLENDING: _crowdlending("100", None)}),
+        ]
+
+        crowdlending = aggregate_positions(positions).products[ProductType.CROWDLENDING]
+
+        assert crowdlending.total == Dezimal(200)
+        assert crowdlending.weighted_interest_rate is None
+
+    def test_single_and_empty(self):
+        position = _position({})
+
+        assert aggregate_positions([position]) is position
+        assert aggregate_positions([]) is None
+
+    def test_rejects_mixed_entities(self):
+        with pytest.raises(TypeError):
+            aggregate_positions([_position({}), _position({}, OTHER_ENTITY)])
+
+    def test_rejects_unsupported_products(self):
+        products = {ProductType.COMMODITY: Commodities([])}
+
+        with pytest.raises(TypeError):
+            aggregate_positions([_position(products), _position(products)])
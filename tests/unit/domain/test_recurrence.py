@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from domain.auto_contributions import ContributionFrequency
+from domain.earnings_expenses import FlowFrequency
+from domain.global_position import InstallmentFrequency
+from domain.recurrence import Recurrence
+
+STARTS = [
+    date(2024, 1, 28),
+    date(2024, 1, 29),
+    date(2024, 1, 30),
+    date(2024, 1, 31),
+    date(2024, 2, 29),
+    date(2023, 3, 31),
+    date(2023, 8, 31),
+    date(2025, 6, 15),
+]
+
+STEPS = [(1, 0), (7, 0), (14, 0), (15, 0), (0, 1), (0, 2), (0, 3), (0, 4), (0, 6)]
+STEPS += [(0, 12)]
+
+
+def _chained(start: date, days: int, months: int, count: int) -> list[date]:
+    step = timedelta(days=days) if days else relativedelta(months=months)
+    dates = [start]
+    for _ in range(count - 1):
+        dates.append(dates[-1] + step)
+    return dates
+
+
+def _probe_dates(start: date) -> list[date]:
+    return [start + timedelta(days=d) for d in range(-3, 800, 11)]
+
+
+class TestRecurrence:
+    @pytest.mark.parametrize("start", STARTS)
+    @pytest.mark.parametrize("days,months", STEPS)
+    def test_nth_matches_chained_steps(self, start, days, months):
+        recurrence = Recurrence(start, days, months)
+        expected = _chained(start, days, months, 80)
+
+        assert [recurrence.nth(n) for n in range(80)] == expected
+
+    @pytest.mark.parametrize("start", STARTS)
+    @pytest.mark.parametrize("days,months", STEPS)
+    def test_indexes_match_chained_steps(self, start, days, months):
+        recurrence = Recurrence(start, days, months)
+        expected = _chained(start, days, months, 900)
+
+        for when in _probe_dates(start):
+            first_from = next(i for i, d in enumerate(expected) if d >= when)
+            first_after = next(i for i, d in enumerate(expected) if d > when)
+            assert recurrence.index_from(when) == first_from
+            assert recurrence.index_after(when) == first_after
+            assert recurrence.next_after(when) == expected[first_after]
+
+    @pytest.mark.parametrize("start", STARTS)
+    @pytest.mark.parametrize("days,months", STEPS)
+    def test_count_and_between(self, start, days, months):
+        recurrence = Recurrence(start, days, months)
+        expected = _chained(start, days, months, 900)
+        from_date = start + timedelta(days=45)
+
+        for until in _probe_dates(start):
+            in_range = [d for d in expected[1:] if d <= until]
+            assert recurrence.count(1, until) == len(in_range)
+            assert recurrence.between(1, until, from_date) == [
+                d for d in in_range if d >= from_date
+            ]
+
+    def test_month_end_stays_clamped(self):
+        recurrence = Recurrence(date(2024, 1, 31), months=1)
+
+        assert recurrence.nth(1) == date(2024, 2, 29)
+        assert recurrence.nth(2) == date(2024, 3, 29)
+        assert recurrence.nth(13) == date(2025, 2, 28)
+        assert recurrence.nth(14) == date(2025, 3, 28)
+
+    def test_leap_day_yearly(self):
+        recurrence = Recurrence(date(2024, 2, 29), months=12)
+
+        assert recurrence.nth(1) == date(2025, 2, 28)
+        assert recurrence.nth(4) == date(2028, 2, 28)
+
+    def test_frequency_constructors(self):
+        start = date(2025, 1, 15)
+
+        assert Recurrence.for_flow(start, FlowFrequency.SEMIMONTHLY).days == 15
+        assert (
+            Recurrence.for_contribution(start, ContributionFrequency.BIMONTHLY).months
+            == 2
+        )
+        assert (
+            Recurrence.for_installment(start, InstallmentFrequency.QUARTERLY).months
+            == 3
+        )
+
+    @pytest.mark.parametrize("days,months", [(0, 0), (7, 1), (0, 5)])
+    def test_rejects_invalid_steps(self, days, months):
+        with pytest.raises(ValueError):
+            Recurrence(date(2025, 1, 1), days, months)
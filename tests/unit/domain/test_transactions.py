@@ -0,0 +1,30 @@
+from datetime import date, datetime
+
+from domain.global_position import ProductType
+from domain.transactions import TxWatermark, oldest_watermark_day
+
+TYPES = [ProductType.STOCK_ETF, ProductType.ACCOUNT]
+
+
+def _watermark(day: date) -> TxWatermark:
+    return TxWatermark(date=datetime(day.year, day.month, day.day, 15, 30), ref="ref")
+
+
+class TestOldestWatermarkDay:
+    def test_oldest_day_of_requested_types(self):
+        since = {
+            ProductType.STOCK_ETF: _watermark(date(2024, 3, 10)),
+            ProductType.ACCOUNT: _watermark(date(2024, 2, 1)),
+            ProductType.FUND: _watermark(date(2023, 1, 1)),
+        }
+
+        assert oldest_watermark_day(since, TYPES) == date(2024, 2, 1)
+
+    def test_no_watermarks(self):
+        assert oldest_watermark_day(None, TYPES) is None
+        assert oldest_watermark_day({}, TYPES) is None
+
+    def test_type_without_watermark_needs_full_history(self):
+        since = {ProductType.STOCK_ETF: _watermark(date(2024, 3, 10))}
+
+        assert oldest_watermark_day(since, TYPES) is None
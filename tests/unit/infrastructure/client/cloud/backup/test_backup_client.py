@@ -0,0 +1,177 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from domain.backup import (
+    BackupDownloadParams,
+    BackupFileType,
+    BackupPieces,
+    BackupTransferPiece,
+    BackupUploadParams,
+)
+from domain.cloud_auth import CloudAuthData, CloudAuthToken, CloudUserRole
+from domain.exception.exceptions import BackupTransferFailed
+from infrastructure.client.cloud.backup.backup_client import BackupClient
+from infrastructure.client.cloud.backup.file_transfer_strategy import (
+    FileTransferStrategy,
+)
+
+NOW = datetime(2025, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+TYPES = [BackupFileType.DATA, BackupFileType.CONFIG, BackupFileType.DATA_DELTA]
+
+
+class SlowTransferStrategy(FileTransferStrategy):
+    def __init__(self, failing: set[BackupFileType] = frozenset()):
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.resume_keys = []
+
+    async def _transfer(self, backup_type: BackupFileType):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            if backup_type in self.failing:
+                raise ConnectionError("connection reset")
+        finally:
+            self.in_flight -= 1
+
+    async def upload(self, url, method, payload, headers, backup_type):
+        await self._transfer(backup_type)
+
+    async def download(self, url, backup_type, resume_key=None):
+        self.resume_keys.append(resume_key)
+        await self._transfer(backup_type)
+        return b"payload-" + backup_type.value.encode()
+
+
+def _auth():
+    return CloudAuthData(
+        role=CloudUserRole.PLUS,
+        permissions=[],
+        token=CloudAuthToken(
+            access_token="access",
+            refresh_token="refresh",
+            token_type="Bearer",
+            expires_at=9999999999,
+        ),
+        email="test@test.com",
+    )
+
+
+def _response(body):
+    response = MagicMock()
+    response.status = 200
+    response.raise_for_status = MagicMock()
+    response.json = AsyncMock(return_value=body)
+    return response
+
+
+def _client(strategy, max_concurrent_transfers=2):
+    client = BackupClient(strategy, max_concurrent_transfers=max_concurrent_transfers)
+    client._session = MagicMock()
+    return client
+
+
+def _upload_params():
+    pieces = [
+        BackupTransferPiece(
+            id=uuid4(),
+            protocol=2,
+            date=NOW,
+            type=backup_type,
+            payload=b"payload",
+            size=7,
+        )
+        for backup_type in TYPES
+    ]
+    return BackupUploadParams(pieces=BackupPieces(pieces=pieces), auth=_auth())
+
+
+def _upload_response():
+    return _response(
+        {
+            "uploads": [
+                {"type": t.value, "url": f"https://s/{t.value}", "method": "PUT"}
+                for t in TYPES
+            ]
+        }
+    )
+
+
+def _download_response():
+    return _response(
+        {
+            "pieces": {
+                t.value: {
+                    "id": str(uuid4()),
+                    "type": t.value,
+                    "protocol": 2,
+                    "date": NOW.isoformat(),
+                    "url": f"https://s/{t.value}",
+                }
+                for t in TYPES
+            }
+        }
+    )
+
+
+class TestConcurrentUpload:
+    @pytest.mark.asyncio
+    async def test_uploads_pieces_concurrently_within_limit(self):
+        strategy = SlowTransferStrategy()
+        client = _client(strategy, max_concurrent_transfers=2)
+        client._session.post = AsyncMock(return_value=_upload_response())
+
+        result = await client.upload(_upload_params())
+
+        assert [piece.type for piece in result.pieces] == TYPES
+        assert strategy.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_piece_raises_transfer_failed(self):
+        strategy = SlowTransferStrategy(failing={BackupFileType.CONFIG})
+        client = _client(strategy)
+        client._session.post = AsyncMock(return_value=_upload_response())
+
+        with pytest.raises(BackupTransferFailed, match="CONFIG"):
+            await client.upload(_upload_params())
+
+
+class TestConcurrentDownload:
+    @pytest.mark.asyncio
+    async def test_downloads_pieces_concurrently_within_limit(self):
+        strategy = SlowTransferStrategy()
+        client = _client(strategy, max_concurrent_transfers=3)
+        response = _download_response()
+        client._session.get = AsyncMock(return_value=response)
+
+        result = await client.download(BackupDownloadParams(types=TYPES, auth=_auth()))
+
+        assert {piece.type for piece in result.pieces} == set(TYPES)
+        assert strategy.max_in_flight == 3
+        piece_ids = {str(piece.id) for piece in result.pieces}
+        assert set(strategy.resume_keys) == piece_ids
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_limited_to_one(self):
+        strategy = SlowTransferStrategy()
+        client = _client(strategy, max_concurrent_transfers=1)
+        client._session.get = AsyncMock(return_value=_download_response())
+
+        await client.download(BackupDownloadParams(types=TYPES, auth=_auth()))
+
+        assert strategy.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_piece_raises_transfer_failed(self):
+        strategy = SlowTransferStrategy(failing={BackupFileType.DATA})
+        client = _client(strategy)
+        client._session.get = AsyncMock(return_value=_download_response())
+
+        with pytest.raises(BackupTransferFailed, match="DATA"):
+            await client.download(BackupDownloadParams(types=TYPES, auth=_auth()))
@@ -0,0 +1,242 @@
+import asyncio
+import random
+import threading
+
+import httpx
+import pytest
+
+from domain.backup import BackupFileType
+from domain.exception.exceptions import TooManyRequests
+from infrastructure.client.cloud.backup.http_file_transfer_strategy import (
+    HttpFileTransferStrategy,
+)
+from infrastructure.client.http.http_session import new_http_session
+
+PART_SIZE = 1024
+URL = "https://storage.test/bucket/piece"
+
+
+class PresignedStandIn:
+    """In-process stand-in for presigned storage URLs with injectable faults."""
+
+    def __init__(self, ranges: bool = True, latency: float = 0.0):
+        self.objects: dict[str, bytes] = {}
+        self.ranges = ranges
+        self.latency = latency
+        # Status codes returned to the next requests of a range start offset
+        self.failures: dict[int, list[int]] = {}
+        self.requested_ranges: list[tuple[int, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self._handle(request)
+        finally:
+            self.in_flight -= 1
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "PUT":
+            failures = self.failures.get(-1)
+            if failures:
+                return httpx.Response(failures.pop(0))
+            self.objects[path] = request.content
+            return httpx.Response(200)
+
+        content = self.objects[path]
+        range_header = request.headers.get("range")
+        if not self.ranges or range_header is None:
+            return httpx.Response(200, content=content)
+
+        start, end = (int(v) for v in range_header[len("bytes=") :].split("-"))
+        failures = self.failures.get(start)
+        if failures:
+            return httpx.Response(failures.pop(0))
+        if start >= len(content):
+            return httpx.Response(416)
+        end = min(end, len(content) - 1)
+        self.requested_ranges.append((start, end))
+        return httpx.Response(
+            206,
+            content=content[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+        )
+
+
+@pytest.fixture
+def fast_strategy(monkeypatch):
+    monkeypatch.setattr(HttpFileTransferStrategy, "PART_SIZE", PART_SIZE)
+    monkeypatch.setattr(HttpFileTransferStrategy, "BACKOFF_FACTOR", 0.0)
+
+
+def _strategy(stand_in, tmp_path):
+    session = new_http_session(transport=httpx.MockTransport(stand_in))
+    return HttpFileTransferStrategy(session=session, journal_dir=tmp_path)
+
+
+def _payload(size):
+    return random.Random(size).randbytes(size)
+
+
+class TestDownload:
+    @pytest.mark.asyncio
+    async def test_downloads_large_piece_in_concurrent_parts(
+        self, fast_strategy, tmp_path
+    ):
+        stand_in = PresignedStandIn(latency=0.01)
+        payload = _payload(PART_SIZE * 10 + 17)
+        stand_in.objects["/bucket/piece"] = payload
+
+        result = await _strategy(stand_in, tmp_path).download(
+            URL, BackupFileType.DATA, resume_key="piece"
+        )
+
+        assert result == payload
+        assert len(stand_in.requested_ranges) == 11
+        assert (
+            1 < stand_in.max_in_flight <= HttpFileTransferStrategy.MAX_CONCURRENT_PARTS
+        )
+        assert not (tmp_path / "piece").exists()
+
+    @pytest.mark.asyncio
+    async def test_small_piece_is_a_single_request(self, fast_strategy, tmp_path):
+        stand_in = PresignedStandIn()
+        stand_in.objects["/bucket/piece"] = b"small"
+
+        result = await _strategy(stand_in, tmp_path).download(URL, BackupFileType.DATA)
+
+        assert result == b"small"
+        assert stand_in.requested_ranges == [(0, 4)]
+
+    @pytest.mark.asyncio
+    async def test_server_without_ranges(self, fast_strategy, tmp_path):
+        stand_in = PresignedStandIn(ranges=False)
+        payload = _payload(PART_SIZE * 3)
+        stand_in.objects["/bucket/piece"] = payload
+
+        result = await _strategy(stand_in, tmp_path).download(URL, BackupFileType.DATA)
+
+        assert result == payload
+
+    @pytest.mark.asyncio
+    async def test_empty_piece(self, fast_strategy, tmp_path):
+        stand_in = PresignedStandIn()
+        stand_in.objects["/bucket/piece"] = b""
+
+        result = await _strategy(stand_in, tmp_path).download(URL, BackupFileType.DATA)
+
+        assert result == b""
+
+    @pytest.mark.asyncio
+    async def test_transient_part_failures_are_retried(self, fast_strategy, tmp_path):
+        stand_in = PresignedStandIn()
+        payload = _payload(PART_SIZE * 4)
+        stand_in.objects["/bucket/piece"] = payload
+        stand_in.failures[PART_SIZE * 2] = [503, 502]
+
+        result = await _strategy(stand_in, tmp_path).download(URL, BackupFileType.DATA)
+
+        assert result == payload
+
+    @pytest.mark.asyncio
+    async def test_interrupted_download_resumes_missing_parts(
+        self, fast_strategy, tmp_path
+    ):
+        stand_in = PresignedStandIn()
+        payload = _payload(PART_SIZE * 6)
+        stand_in.objects["/bucket/piece"] = payload
+        retries = HttpFileTransferStrategy.MAX_RETRIES
+        stand_in.failures[PART_SIZE * 3] = [503] * (retries + 1)
+        strategy = _strategy(stand_in, tmp_path)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await strategy.download(URL, BackupFileType.DATA, resume_key="piece")
+        assert (tmp_path / "piece" / "state.json").is_file()
+
+        stand_in.requested_ranges.clear()
+        result = await strategy.download(URL, BackupFileType.DATA, resume_key="piece")
+
+        assert result == payload
+        assert stand_in.requested_ranges == [(PART_SIZE * 3, PART_SIZE * 4 - 1)]
+        assert not (tmp_path / "piece").exists()
+
+    @pytest.mark.asyncio
+    async def test_too_many_requests(self, fast_strategy, tmp_path, monkeypatch):
+        monkeypatch.setattr(HttpFileTransferStrategy, "MAX_RETRIES", 0)
+        stand_in = PresignedStandIn()
+        stand_in.objects["/bucket/piece"] = b"data"
+        stand_in.failures[0] = [429]
+
+        with pytest.raises(TooManyRequests):
+            await _strategy(stand_in, tmp_path).download(URL, BackupFileType.DATA)
+
+
+class TestUpload:
+    @pytest.mark.asyncio
+    async def test_upload_is_retried_on_server_errors(self, fast_strategy, tmp_path):
+        stand_in = PresignedStandIn()
+        stand_in.failures[-1] = [500, 503]
+
+        await _strategy(stand_in, tmp_path).upload(
+            URL, "PUT", b"payload", {}, BackupFileType.DATA
+        )
+
+        assert stand_in.objects["/bucket/piece"] == b"payload"
+
+    @pytest.mark.asyncio
+    async def test_upload_fails_after_retries(self, fast_strategy, tmp_path):
+        stand_in = PresignedStandIn()
+        stand_in.failures[-1] = [500] * (HttpFileTransferStrategy.MAX_RETRIES + 1)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _strategy(stand_in, tmp_path).upload(
+                URL, "PUT", b"payload", {}, BackupFileType.DATA
+            )
+
+    @pytest.mark.asyncio
+    async def test_file_payload_is_streamed_on_every_attempt(
+        self, fast_strategy, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(HttpFileTransferStrategy, "UPLOAD_CHUNK_SIZE", PART_SIZE)
+        stand_in = PresignedStandIn()
+        stand_in.failures[-1] = [503]
+        piece = tmp_path / "piece.compiled"
+        piece.write_bytes(_payload(PART_SIZE * 3 + 7))
+
+        await _strategy(stand_in, tmp_path).upload(
+            URL, "PUT", piece, {}, BackupFileType.DATA
+        )
+
+        assert stand_in.objects["/bucket/piece"] == piece.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_file_payload_is_read_off_the_event_loop(
+        self, fast_strategy, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(HttpFileTransferStrategy, "UPLOAD_CHUNK_SIZE", PART_SIZE)
+        reader_threads = set()
+        to_thread = asyncio.to_thread
+
+        async def recording_to_thread(func, *args):
+            def run():
+                reader_threads.add(threading.get_ident())
+                return func(*args)
+
+            return await to_thread(run)
+
+        monkeypatch.setattr(asyncio, "to_thread", recording_to_thread)
+        stand_in = PresignedStandIn()
+        piece = tmp_path / "piece.compiled"
+        piece.write_bytes(_payload(PART_SIZE * 2))
+
+        await _strategy(stand_in, tmp_path).upload(
+            URL, "PUT", piece, {}, BackupFileType.DATA
+        )
+
+        assert stand_in.objects["/bucket/piece"] == piece.read_bytes()
+        assert reader_threads
+        assert threading.get_ident() not in reader_threads
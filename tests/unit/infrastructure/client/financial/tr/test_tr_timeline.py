@@ -0,0 +1,183 @@
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+import websockets
+from websockets.asyncio.server import serve
+
+from infrastructure.client.entity.financial.tr.api import TradeRepublicApi
+from infrastructure.client.entity.financial.tr.tr_detail_cache import TRDetailCache
+from infrastructure.client.entity.financial.tr.tr_timeline import TRTimeline
+
+PAGE_SIZE = 10
+
+
+def _event(i: int, status: str = "EXECUTED") -> dict:
+    event_id = f"evt-{i:04d}"
+    return {
+        "id": event_id,
+        "timestamp": f"2025-01-{1 + i % 28:02d}T10:00:00.000+0000",
+        "title": f"Stock {i}",
+        "subtitle": "Buy order",
+        "status": status,
+        "eventType": "TRADE_INVOICE",
+        "action": {"type": "timelineDetail", "payload": event_id},
+    }
+
+
+def _detail(event_id: str) -> dict:
+    return {
+        "id": event_id,
+        "sections": [{"title": "Transaction", "data": [{"title": "Shares"}]}],
+    }
+
+
+class TimelineStandIn:
+    """Local websocket server replaying timeline pages and detail frames."""
+
+    def __init__(self, events: list[dict]):
+        self.events = events
+        self.detail_requests: list[str] = []
+        self.unsubscribed: set[str] = set()
+        self.open_details: set[str] = set()
+        self.max_open_details = 0
+
+    def _page(self, after):
+        start = int(after) if after else 0
+        end = start + PAGE_SIZE
+        cursors = {"after": str(end)} if end < len(self.events) else {}
+        return {"items": self.events[start:end], "cursors": cursors}
+
+    async def handler(self, ws):
+        async for message in ws:
+            command, subscription_id, *payload = message.split(" ", 2)
+            if command == "unsub":
+                self.unsubscribed.add(subscription_id)
+                self.open_details.discard(subscription_id)
+                continue
+
+            request = json.loads(payload[0])
+            if request["type"] == "timelineTransactions":
+                frame = self._page(request.get("after"))
+            elif request["type"] == "timelineDetailV2":
+                self.detail_requests.append(request["id"])
+                self.open_details.add(subscription_id)
+                self.max_open_details = max(
+                    self.max_open_details, len(self.open_details)
+                )
+                frame = _detail(request["id"])
+            else:
+                continue
+            await ws.send(f"{subscription_id} A {json.dumps(frame)}")
+
+
+@asynccontextmanager
+async def _connected_api(stand_in: TimelineStandIn):
+    async with serve(stand_in.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        api = TradeRepublicApi("+49123456789", "1234")
+        api._weblogin = True
+        api.subscriptions = {}
+        api._previous_responses = {}
+        api._ws = await websockets.connect(f"ws://127.0.0.1:{port}")
+        try:
+            yield api
+        finally:
+            await api._ws.close()
+
+
+async def _fetch(stand_in: TimelineStandIn, **kwargs) -> list[dict]:
+    async with _connected_api(stand_in) as api:
+        timeline = TRTimeline(
+            api,
+            requested_data=["timelineTransactions", "timelineDetailV2"],
+            **kwargs,
+        )
+        return await timeline.fetch()
+
+
+class TestTimelineDetails:
+    @pytest.mark.asyncio
+    async def test_keeps_detail_subscriptions_within_window(self):
+        stand_in = TimelineStandIn([_event(i) for i in range(40)])
+
+        events = await _fetch(stand_in, detail_window=4)
+
+        assert len(events) == 40
+        assert all(e["details"] == _detail(e["id"]) for e in events)
+        assert sorted(stand_in.detail_requests) == [f"evt-{i:04d}" for i in range(40)]
+        assert stand_in.max_open_details == 4
+        assert stand_in.open_details == set()
+
+    @pytest.mark.asyncio
+    async def test_refetch_only_requests_uncached_details(self):
+        cache = TRDetailCache()
+
+        def recorded():
+            events = [_event(i) for i in range(20)]
+            events[5]["status"] = "PENDING"
+            return events
+
+        first = TimelineStandIn(recorded())
+        await _fetch(first, detail_cache=cache)
+        assert len(first.detail_requests) == 20
+
+        newer = [_event(i) for i in range(100, 103)]
+        second = TimelineStandIn(newer + recorded())
+        refetched = await _fetch(second, detail_cache=cache)
+
+        # Besides the new events only the pending one, which may still change
+        assert sorted(second.detail_requests) == [
+            "evt-0005",
+            "evt-0100",
+            "evt-0101",
+            "evt-0102",
+        ]
+        assert len(refetched) == 23
+        assert all(e["details"] == _detail(e["id"]) for e in refetched)
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_timeline_opens_no_detail_subscriptions(self):
+        cache = TRDetailCache()
+        await _fetch(
+            TimelineStandIn([_event(i) for i in range(12)]), detail_cache=cache
+        )
+
+        stand_in = TimelineStandIn([_event(i) for i in range(12)])
+        refetched = await _fetch(stand_in, detail_cache=cache)
+
+        assert stand_in.detail_requests == []
+        assert [e["id"] for e in refetched] == [f"evt-{i:04d}" for i in range(12)]
+        assert all(e["details"] == _detail(e["id"]) for e in refetched)
+
+    @pytest.mark.asyncio
+    async def test_registered_events_are_evicted_from_cache(self):
+        cache = TRDetailCache()
+        await _fetch(
+            TimelineStandIn([_event(i) for i in range(10)]), detail_cache=cache
+        )
+        assert len(cache) == 10
+
+        registered = {f"evt-{i:04d}" for i in range(4)}
+        await _fetch(
+            TimelineStandIn([_event(i) for i in range(10)]),
+            detail_cache=cache,
+            already_registered_ids=registered,
+        )
+
+        assert len(cache) == 6
+        assert all(cache.get(event_id) is None for event_id in registered)
+
+
+class TestTRDetailCache:
+    def test_drops_least_recently_used_past_max_entries(self):
+        cache = TRDetailCache(max_entries=3)
+        for i in range(3):
+            cache.put(f"evt-{i}", {"id": f"evt-{i}"})
+        cache.get("evt-0")
+
+        cache.put("evt-3", {"id": "evt-3"})
+
+        assert len(cache) == 3
+        assert cache.get("evt-1") is None
+        assert cache.get("evt-0") == {"id": "evt-0"}
@@ -2,12 +2,14 @@ import pytest
 
 from domain.backup import BackupFileType, BackupProcessRequest, BackupProcessResult
 from domain.exception.exceptions import (
+    CorruptedBackup,
     UnsupportedBackupProtocol,
     InvalidBackupCredentials,
 )
 from infrastructure.cloud.backup.backup_processor_adapter import (
     BackupProcessorAdapter,
     BackupProcessorV1,
+    BackupProcessorV2,
 )
 
 PASSWORD = "test-password-123"
@@ -22,12 +24,17 @@ def _v1():
     return BackupProcessorV1()
 
 
-def _request(payload=PAYLOAD, password=PASSWORD, protocol=1):
+def _v2():
+    return BackupProcessorV2()
+
+
+def _request(payload=PAYLOAD, password=PASSWORD, protocol=1, target=None):
     return BackupProcessRequest(
         protocol=protocol,
         password=password,
         type=BackupFileType.DATA,
         payload=payload,
+        target=target,
     )
 
 
@@ -147,3 +154,105 @@ class TestBackupProcessorV1Key:
         key = BackupProcessorV1._key.__wrapped__("any-password")
         decoded = base64.urlsafe_b64decode(key)
         assert len(decoded) == 32
+
+
+class TestBackupProcessorAdapterV2:
+    @pytest.mark.asyncio
+    async def test_roundtrip_through_files(self, tmp_path):
+        adapter = _adapter()
+        source = tmp_path / "source.db"
+        source.write_bytes(PAYLOAD)
+        compiled_path = tmp_path / "compiled"
+        restored_path = tmp_path / "restored"
+
+        compiled = await adapter.compile(
+            _request(payload=source, protocol=2, target=compiled_path)
+        )
+        assert compiled.payload == compiled_path
+        assert compiled.size == compiled_path.stat().st_size
+
+        restored = await adapter.decompile(
+            _request(payload=compiled_path, protocol=2, target=restored_path)
+        )
+        assert restored.payload == restored_path
+        assert restored.size == len(PAYLOAD)
+        assert restored_path.read_bytes() == PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_v1_backups_remain_readable(self):
+        adapter = _adapter()
+        compiled = await adapter.compile(_request(protocol=1))
+        result = await adapter.decompile(_request(payload=compiled.payload))
+        assert result.payload == PAYLOAD
+
+
+class TestBackupProcessorV2:
+    def test_roundtrip_produces_original_payload(self):
+        v2 = _v2()
+        compiled = v2.compile(_request(protocol=2))
+        assert compiled.size == len(compiled.payload)
+        result = v2.decompile(_request(payload=compiled.payload, protocol=2))
+        assert result.payload == PAYLOAD
+
+    def test_empty_payload_roundtrip(self):
+        v2 = _v2()
+        compiled = v2.compile(_request(payload=b"", protocol=2))
+        result = v2.decompile(_request(payload=compiled.payload, protocol=2))
+        assert result.payload == b""
+
+    def test_multi_frame_roundtrip(self, monkeypatch):
+        monkeypatch.setattr(BackupProcessorV2, "FRAME_SIZE", 64)
+        monkeypatch.setattr(BackupProcessorV2, "READ_SIZE", 100)
+        v2 = _v2()
+        payload = bytes(range(256)) * 40
+        compiled = v2.compile(_request(payload=payload, protocol=2))
+        result = v2.decompile(_request(payload=compiled.payload, protocol=2))
+        assert result.payload == payload
+
+    def test_same_payload_is_encrypted_differently(self):
+        v2 = _v2()
+        compiled_a = v2.compile(_request(protocol=2))
+        compiled_b = v2.compile(_request(protocol=2))
+        assert compiled_a.payload != compiled_b.payload
+
+    def test_wrong_password_raises_invalid_backup_credentials(self):
+        v2 = _v2()
+        compiled = v2.compile(_request(password="correct-password", protocol=2))
+        with pytest.raises(InvalidBackupCredentials):
+            v2.decompile(
+                _request(
+                    payload=compiled.payload, password="wrong-password", protocol=2
+                )
+            )
+
+    def test_tampered_frame_raises_invalid_backup_credentials(self):
+        v2 = _v2()
+        compiled = bytearray(v2.compile(_request(protocol=2)).payload)
+        compiled[-1] ^= 0xFF
+        with pytest.raises(InvalidBackupCredentials):
+            v2.decompile(_request(payload=bytes(compiled), protocol=2))
+
+    def test_truncated_payload_raises_corrupted_backup(self, monkeypatch):
+        monkeypatch.setattr(BackupProcessorV2, "FRAME_SIZE", 64)
+        v2 = _v2()
+        payload = bytes(range(256)) * 40
+        compiled = v2.compile(_request(payload=payload, protocol=2)).payload
+        with pytest.raises(CorruptedBackup):
+            v2.decompile(_request(payload=compiled[:-10], protocol=2))
+
+    def test_dropped_last_frame_is_detected(self, monkeypatch):
+        monkeypatch.setattr(BackupProcessorV2, "FRAME_SIZE", 64)
+        v2 = _v2()
+        payload = bytes(range(256)) * 40
+        compiled = v2.compile(_request(payload=payload, protocol=2)).payload
+        # Cut right after the first frame, which is not flagged as the last one
+        first_frame_end = (
+            BackupProcessorV2._HEADER.size + BackupProcessorV2._FRAME.size + 64 + 16
+        )
+        with pytest.raises(CorruptedBackup):
+            v2.decompile(_request(payload=compiled[:first_frame_end], protocol=2))
+
+    def test_foreign_payload_raises_corrupted_backup(self):
+        v2 = _v2()
+        with pytest.raises(CorruptedBackup):
+            v2.decompile(_request(payload=b"not-a-v2-backup-payload", protocol=2))
@@ -0,0 +1,139 @@
+import sqlite3
+from uuid import uuid4
+
+import pytest
+
+from domain.backup import BackupFileType
+from domain.exception.exceptions import CorruptedBackup
+from infrastructure.cloud.backup.block_delta_calculator import BlockDeltaCalculator
+
+ROWS = 20_000
+
+
+def _calculator():
+    return BlockDeltaCalculator()
+
+
+def _create_db(conn):
+    conn.execute(
+        "CREATE TABLE account_transactions "
+        "(id INTEGER PRIMARY KEY, ref TEXT, name TEXT, amount REAL)"
+    )
+    conn.executemany(
+        "INSERT INTO account_transactions VALUES (?, ?, ?, ?)",
+        (
+            (i, f"ref-{i:08d}", f"Transaction {i} " + "x" * 150, i * 1.5)
+            for i in range(ROWS)
+        ),
+    )
+    conn.commit()
+
+
+def _update_rows(conn, ids):
+    conn.executemany(
+        "UPDATE account_transactions SET amount = amount + 1 WHERE id = ?",
+        ((i,) for i in ids),
+    )
+    conn.commit()
+
+
+def _export(conn, target):
+    # Fresh copy of the database, like the sqlcipher_export used for backups
+    conn.execute("VACUUM INTO ?", (str(target),))
+
+
+class TestBlockDeltaCalculator:
+    @pytest.mark.asyncio
+    async def test_few_changed_rows_produce_small_delta(self, tmp_path):
+        calculator = _calculator()
+        base_id = uuid4()
+        conn = sqlite3.connect(tmp_path / "live.db")
+        _create_db(conn)
+        base = tmp_path / "base.db"
+        _export(conn, base)
+        manifest = await calculator.build_manifest(BackupFileType.DATA, base_id, base)
+
+        # Spread over the table, each one on a different block
+        updated = range(0, ROWS, ROWS // 8)
+        _update_rows(conn, updated)
+        current = tmp_path / "current.db"
+        _export(conn, current)
+        conn.close()
+
+        delta_path = tmp_path / "delta"
+        delta = await calculator.diff(manifest, current, delta_path)
+
+        assert delta.total_blocks == len(manifest.hashes)
+        assert delta.total_blocks > 100
+        # The updated rows plus the block holding the database header
+        assert len(updated) <= delta.changed_blocks <= len(updated) + 1
+        assert delta.size == delta_path.stat().st_size
+        assert delta.size < current.stat().st_size / 10
+
+        restored = tmp_path / "restored.db"
+        assert await calculator.apply(base_id, base, delta_path, restored)
+        assert restored.read_bytes() == current.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_with_size_changes(self, tmp_path):
+        calculator = _calculator()
+        block = calculator.BLOCK_SIZE
+        base_id = uuid4()
+        base = tmp_path / "base.db"
+        base.write_bytes(b"a" * (3 * block + 100))
+        manifest = await calculator.build_manifest(BackupFileType.DATA, base_id, base)
+
+        for content in (
+            b"a" * (5 * block + 7),
+            b"a" * block + b"b" * 10,
+            b"",
+        ):
+            current = tmp_path / "current.db"
+            current.write_bytes(content)
+            delta_path = tmp_path / "delta"
+            await calculator.diff(manifest, current, delta_path)
+
+            restored = tmp_path / "restored.db"
+            assert await calculator.apply(base_id, base, delta_path, restored)
+            assert restored.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_has_no_blocks(self, tmp_path):
+        calculator = _calculator()
+        base = tmp_path / "base.db"
+        base.write_bytes(b"z" * 100_000)
+        manifest = await calculator.build_manifest(BackupFileType.DATA, uuid4(), base)
+
+        delta = await calculator.diff(manifest, base, tmp_path / "delta")
+
+        assert delta.changed_blocks == 0
+        assert delta.total_blocks == len(manifest.hashes)
+
+    @pytest.mark.asyncio
+    async def test_delta_of_another_base_is_not_applied(self, tmp_path):
+        calculator = _calculator()
+        base = tmp_path / "base.db"
+        base.write_bytes(b"data")
+        manifest = await calculator.build_manifest(BackupFileType.DATA, uuid4(), base)
+        delta_path = tmp_path / "delta"
+        await calculator.diff(manifest, base, delta_path)
+
+        restored = tmp_path / "restored.db"
+        assert not await calculator.apply(uuid4(), base, delta_path, restored)
+        assert not restored.exists()
+
+    @pytest.mark.asyncio
+    async def test_truncated_delta_raises_corrupted_backup(self, tmp_path):
+        calculator = _calculator()
+        base_id = uuid4()
+        base = tmp_path / "base.db"
+        base.write_bytes(b"a" * 50_000)
+        manifest = await calculator.build_manifest(BackupFileType.DATA, base_id, base)
+        current = tmp_path / "current.db"
+        current.write_bytes(b"b" * 50_000)
+        delta_path = tmp_path / "delta"
+        await calculator.diff(manifest, current, delta_path)
+        delta_path.write_bytes(delta_path.read_bytes()[:-10])
+
+        with pytest.raises(CorruptedBackup):
+            await calculator.apply(base_id, base, delta_path, tmp_path / "restored")
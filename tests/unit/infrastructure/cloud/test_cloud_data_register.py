@@ -7,7 +7,13 @@ import jwt
 import pytest
 import pytest_asyncio
 
-from domain.backup import BackupFileType, BackupInfo, BackupMode, BackupSettings
+from domain.backup import (
+    BackupFileType,
+    BackupInfo,
+    BackupManifest,
+    BackupMode,
+    BackupSettings,
+)
 from domain.cloud_auth import CloudAuthToken, CloudUserRole
 from domain.exception.exceptions import InvalidToken, NoUserLogged
 from domain.user import User
@@ -356,6 +362,41 @@ class TestBackupSettings:
         settings = await register.get_backup_settings()
         assert settings.mode == BackupMode.MANUAL
 
+    @pytest.mark.asyncio
+    async def test_incremental_is_saved(self, register, tmp_path):
+        user = _make_user(tmp_path)
+        await register.connect(user)
+
+        assert (await register.get_backup_settings()).incremental is False
+        await register.save_backup_settings(
+            BackupSettings(mode=BackupMode.MANUAL, incremental=True)
+        )
+        assert (await register.get_backup_settings()).incremental is True
+
+
+class TestBackupManifest:
+    @pytest.mark.asyncio
+    async def test_missing_manifest_returns_none(self, register, tmp_path):
+        await register.connect(_make_user(tmp_path))
+
+        assert await register.get_manifest(BackupFileType.DATA) is None
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_manifest(self, register, tmp_path):
+        await register.connect(_make_user(tmp_path))
+        manifest = BackupManifest(
+            type=BackupFileType.DATA,
+            base_id=uuid4(),
+            block_size=16384,
+            hashes=["a" * 32, "b" * 32],
+            deltas=3,
+        )
+
+        await register.save_manifest(manifest)
+
+        assert await register.get_manifest(BackupFileType.DATA) == manifest
+        assert await register.get_manifest(BackupFileType.CONFIG) is None
+
 
 class TestDisconnect:
     @pytest.mark.asyncio
@@ -0,0 +1,99 @@
+import json
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from domain.dezimal import Dezimal
+from domain.entity import Entity, EntityOrigin, EntityType
+from domain.fetch_record import DataSource
+from domain.global_position import ProductType
+from domain.transactions import StockTx, TxType
+from infrastructure.controller.config import QuartApp
+from infrastructure.controller.streaming import jsonify_stream
+
+ENTITY = Entity(
+    id=uuid4(),
+    name="Broker",
+    natural_id=None,
+    type=EntityType.FINANCIAL_INSTITUTION,
+    origin=EntityOrigin.NATIVE,
+    icon_url=None,
+)
+
+
+def _stock_tx(i: int) -> StockTx:
+    return StockTx(
+        id=uuid4(),
+        ref=f"ref-{i}",
+        name=f"Stock {i}",
+        amount=Dezimal("1234.56"),
+        currency="EUR",
+        type=TxType.BUY,
+        date=datetime(2024, 1, 2, 10, 30, tzinfo=timezone.utc),
+        entity=ENTITY,
+        source=DataSource.REAL,
+        product_type=ProductType.STOCK_ETF,
+        shares=Dezimal("10.5"),
+        price=Dezimal("117.58"),
+        fees=Dezimal("1"),
+        isin="US0000000001",
+    )
+
+
+def _legacy_dumps(app: QuartApp, obj) -> str:
+    provider = app.json
+    return json.dumps(obj, default=provider.default, sort_keys=True)
+
+
+@pytest.fixture
+def app(tmp_path):
+    return QuartApp(__name__, static_folder=str(tmp_path))
+
+
+class TestFJSONProvider:
+    def test_matches_stdlib_encoding(self, app):
+        payload = {
+            "transactions": [_stock_tx(i) for i in range(3)],
+            "date": date(2024, 5, 1),
+            ProductType.FUND: Dezimal("0.1"),
+        }
+
+        assert json.loads(app.json.dumps(payload)) == json.loads(
+            _legacy_dumps(app, payload)
+        )
+
+    def test_dezimal_serialized_as_number(self, app):
+        assert app.json.dumps({"v": Dezimal("1.25")}) == '{"v":1.25}'
+
+    def test_kwargs_fallback_to_stdlib(self, app):
+        assert app.json.dumps({"b": 1, "a": 2}, indent=2) == json.dumps(
+            {"a": 2, "b": 1}, indent=2
+        )
+
+
+class TestJsonifyStream:
+    async def _body(self, app, *args, **kwargs):
+        async with app.app_context():
+            response = jsonify_stream(*args, **kwargs)
+            return await response.get_data(as_text=True)
+
+    @pytest.mark.asyncio
+    async def test_chunked_list_under_key(self, app):
+        txs = [_stock_tx(i) for i in range(7)]
+
+        body = await self._body(app, txs, key="transactions", chunk_size=3)
+
+        assert json.loads(body) == json.loads(_legacy_dumps(app, {"transactions": txs}))
+
+    @pytest.mark.asyncio
+    async def test_extra_fields_and_empty_list(self, app):
+        body = await self._body(app, [], key="points", extra={"currency": "EUR"})
+
+        assert json.loads(body) == {"currency": "EUR", "points": []}
+
+    @pytest.mark.asyncio
+    async def test_plain_array(self, app):
+        body = await self._body(app, [Dezimal(1), Dezimal(2)], chunk_size=1)
+
+        assert json.loads(body) == [1.0, 2.0]
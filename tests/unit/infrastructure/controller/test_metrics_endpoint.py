@@ -0,0 +1,57 @@
+import pytest
+
+from infrastructure.controller.config import quart
+from infrastructure.controller.metrics_endpoint import METRICS_ROUTE, register_metrics
+
+ROUTE = "/api/v1/items/<item_id>"
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = quart(tmp_path)
+    register_metrics(app)
+
+    @app.route(ROUTE, methods=["GET"])
+    async def item_route(item_id):
+        if item_id == "boom":
+            raise RuntimeError("boom")
+        return {"id": item_id}
+
+    return app
+
+
+def _value(text: str, prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestMetricsEndpoint:
+    @pytest.mark.asyncio
+    async def test_exposes_route_latency_by_rule(self, app):
+        client = app.test_client()
+        before = await (await client.get(METRICS_ROUTE)).get_data(as_text=True)
+        series = (
+            "finanze_http_request_duration_seconds_count"
+            '{method="GET",route="/api/v1/items/<item_id>",status="200"}'
+        )
+
+        await client.get("/api/v1/items/1")
+        await client.get("/api/v1/items/2")
+
+        response = await client.get(METRICS_ROUTE)
+        text = await response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert _value(text, series) - _value(before, series) == 2
+        assert "/metrics" not in text
+
+    @pytest.mark.asyncio
+    async def test_in_flight_is_released_on_errors(self, app):
+        client = app.test_client()
+
+        await client.get("/api/v1/items/boom")
+
+        text = await (await client.get(METRICS_ROUTE)).get_data(as_text=True)
+        assert _value(text, "finanze_http_requests_in_flight") == 0
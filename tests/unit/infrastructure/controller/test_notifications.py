@@ -0,0 +1,83 @@
+import asyncio
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from domain.notification import (
+    FetchPhase,
+    FetchProgress,
+    Notification,
+    NotificationType,
+)
+from infrastructure.controller.config import quart
+from infrastructure.controller.routes.notifications import notifications
+from infrastructure.notifications.notification_broadcaster import (
+    NotificationBroadcaster,
+)
+
+
+def _progress(phase: FetchPhase) -> Notification:
+    return Notification(
+        type=NotificationType.FETCH_PROGRESS,
+        data=FetchProgress(entity_id=uuid4(), phase=phase),
+        date=datetime(2025, 1, 1, 12, 0, 0),
+    )
+
+
+class TestNotificationBroadcaster:
+    @pytest.mark.asyncio
+    async def test_fans_out_to_subscribers(self):
+        broadcaster = NotificationBroadcaster()
+
+        async with broadcaster.subscribe() as a, broadcaster.subscribe() as b:
+            await broadcaster.publish(_progress(FetchPhase.LOGIN))
+            broadcaster.tables_changed(frozenset({"transactions", "positions"}))
+
+            for queue in (a, b):
+                assert queue.get_nowait().data.phase == FetchPhase.LOGIN
+                changed = queue.get_nowait()
+                assert changed.type == NotificationType.DATA_CHANGED
+                assert changed.data.tables == ["positions", "transactions"]
+
+        broadcaster.tables_changed(frozenset({"positions"}))
+        assert a.empty() and b.empty()
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self):
+        broadcaster = NotificationBroadcaster(queue_size=2)
+
+        async with broadcaster.subscribe() as queue:
+            for phase in (FetchPhase.LOGIN, FetchPhase.POSITION, FetchPhase.SAVED):
+                await broadcaster.publish(_progress(phase))
+
+            assert queue.get_nowait().data.phase == FetchPhase.POSITION
+            assert queue.get_nowait().data.phase == FetchPhase.SAVED
+
+
+class TestNotificationsRoute:
+    @pytest.mark.asyncio
+    async def test_streams_server_sent_events(self, tmp_path):
+        app = quart(tmp_path)
+        broadcaster = NotificationBroadcaster()
+
+        @app.route("/api/v1/notifications", methods=["GET"])
+        async def notifications_route():
+            return await notifications(broadcaster)
+
+        async with app.test_app() as test_app:
+            client = test_app.test_client()
+            async with client.request("/api/v1/notifications") as connection:
+                while not broadcaster._subscribers:
+                    await asyncio.sleep(0)
+                await broadcaster.publish(_progress(FetchPhase.SAVED))
+
+                event = await asyncio.wait_for(connection.receive(), 5)
+                await connection.disconnect()
+
+        lines = event.decode().strip().split("\n")
+        assert lines[0] == "event: FETCH_PROGRESS"
+        data = json.loads(lines[1].removeprefix("data: "))
+        assert data["type"] == "FETCH_PROGRESS"
+        assert data["data"]["phase"] == "SAVED"
@@ -0,0 +1,115 @@
+import sqlite3
+
+import pytest
+
+from infrastructure.controller.config import quart
+from infrastructure.controller.request_instrumentation import (
+    DEBUG_REQUESTS_ROUTE,
+    RequestInstrumentation,
+)
+from infrastructure.instrumentation.request_stats import record_http_call
+from infrastructure.repository.db.client import DBClient
+
+ROUTE = "/api/v1/positions"
+
+
+@pytest.fixture
+def db_client():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE positions (id TEXT PRIMARY KEY, entity TEXT);
+        CREATE INDEX idx_positions_entity ON positions (entity);
+        """
+    )
+    yield DBClient(connection=conn)
+    conn.close()
+
+
+@pytest.fixture
+def session():
+    return {"logged": True}
+
+
+@pytest.fixture
+def app(tmp_path, db_client, session):
+    app = quart(tmp_path)
+    RequestInstrumentation(db_client, lambda: session["logged"]).register(app)
+
+    @app.route(ROUTE, methods=["GET"])
+    async def positions_route():
+        async with db_client.read() as cursor:
+            await cursor.execute("SELECT * FROM positions WHERE entity = ?", ("e",))
+            await cursor.execute("SELECT count(*) FROM positions")
+        record_http_call("api.example.com", 0.25)
+        return {"ok": True}
+
+    return app
+
+
+class TestRequestInstrumentation:
+    @pytest.mark.asyncio
+    async def test_sets_server_timing_header(self, app):
+        response = await app.test_client().get(ROUTE)
+
+        timing = response.headers["Server-Timing"]
+        assert "db;dur=" in timing and 'desc="2 queries"' in timing
+        assert "lock;dur=" in timing
+        assert 'http;dur=250.0;desc="api.example.com"' in timing
+        assert "total;dur=" in timing
+
+    @pytest.mark.asyncio
+    async def test_debug_route_lists_recent_requests(self, app):
+        client = app.test_client()
+        await client.get(ROUTE)
+
+        response = await client.get(DEBUG_REQUESTS_ROUTE)
+        requests = (await response.get_json())["requests"]
+
+        assert len(requests) == 1
+        profile = requests[0]
+        assert profile["path"] == ROUTE
+        assert profile["status"] == 200
+        assert profile["query_count"] == 2
+        assert profile["http_ms"] == {"api.example.com": 250.0}
+        statements = {s["statement"]: s for s in profile["slowest_statements"]}
+        plan = statements["SELECT * FROM positions WHERE entity = ?"]["plan"]
+        assert any("idx_positions_entity" in line for line in plan)
+
+    @pytest.mark.asyncio
+    async def test_plans_are_only_worked_out_when_read(self, app, db_client):
+        client = app.test_client()
+        await client.get(ROUTE)
+        assert db_client._plans == {}
+
+        await client.get(DEBUG_REQUESTS_ROUTE)
+
+        assert "SELECT * FROM positions WHERE entity = ?" in db_client._plans
+
+    @pytest.mark.asyncio
+    async def test_debug_route_requires_logged_user(self, app, session):
+        client = app.test_client()
+        await client.get(ROUTE)
+        session["logged"] = False
+
+        response = await client.get(DEBUG_REQUESTS_ROUTE)
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, tmp_path, db_client):
+        app = quart(tmp_path)
+        instrumentation = RequestInstrumentation(
+            db_client, lambda: True, history_size=2
+        )
+        instrumentation.register(app)
+
+        @app.route(ROUTE, methods=["GET"])
+        async def positions_route():
+            return {"ok": True}
+
+        client = app.test_client()
+        for i in range(3):
+            await client.get(f"{ROUTE}?page={i}")
+
+        assert len(instrumentation.history()) == 2
@@ -0,0 +1,154 @@
+import json
+import time
+
+import pytest
+
+from infrastructure.controller.config import quart
+from infrastructure.controller.request_profiler import PROFILER_ROUTE, RequestProfiler
+
+SLOW_ROUTE = "/api/v1/forecast"
+FAST_ROUTE = "/api/v1/positions"
+
+
+def _busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.fixture
+def profiles_dir(tmp_path):
+    return tmp_path / "logs" / "profiles"
+
+
+@pytest.fixture
+def session():
+    return {"logged": True}
+
+
+@pytest.fixture
+def profiler(profiles_dir, session):
+    return RequestProfiler(
+        profiles_dir,
+        lambda: session["logged"],
+        threshold=0.02,
+        interval=0.001,
+        max_profiles=2,
+    )
+
+
+@pytest.fixture
+def app(tmp_path, profiler):
+    app = quart(tmp_path)
+    profiler.register(app, debug_route=True)
+
+    @app.route(SLOW_ROUTE, methods=["POST"])
+    async def forecast_route():
+        _busy(0.05)
+        return {"ok": True}
+
+    @app.route(FAST_ROUTE, methods=["GET"])
+    async def positions_route():
+        return {"ok": True}
+
+    return app
+
+
+class TestRequestProfiler:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, app, profiles_dir):
+        await app.test_client().post(SLOW_ROUTE)
+
+        assert not profiles_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_writes_profiles_of_slow_requests(self, app, profiler, profiles_dir):
+        profiler.enable(SLOW_ROUTE)
+        client = app.test_client()
+
+        await client.post(SLOW_ROUTE)
+        await client.get(FAST_ROUTE)
+
+        files = sorted(p.name for p in profiles_dir.iterdir())
+        assert len(files) == 2
+        assert "_api_v1_forecast_" in files[0]
+        assert files[0].endswith(".collapsed.txt")
+        assert files[1].endswith(".speedscope.json")
+        speedscope = json.loads((profiles_dir / files[1]).read_text())
+        assert speedscope["name"] == f"POST {SLOW_ROUTE}"
+        assert "forecast_route" in (profiles_dir / files[0]).read_text()
+
+    @pytest.mark.asyncio
+    async def test_skips_requests_below_threshold(self, app, profiler, profiles_dir):
+        profiler.enable("*")
+
+        await app.test_client().get(FAST_ROUTE)
+
+        assert not profiles_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_toggled_through_debug_route(self, app, profiler):
+        client = app.test_client()
+
+        response = await client.post(
+            PROFILER_ROUTE, json={"route": SLOW_ROUTE, "thresholdMs": 100}
+        )
+        assert (await response.get_json())["routes"] == [SLOW_ROUTE]
+        assert profiler.routes == {SLOW_ROUTE}
+
+        await client.post(PROFILER_ROUTE, json={"route": SLOW_ROUTE, "enabled": False})
+        state = await (await client.get(PROFILER_ROUTE)).get_json()
+        assert state["routes"] == []
+        assert state["thresholdMs"] == 100
+
+        bad = await client.post(PROFILER_ROUTE, json={})
+        assert bad.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_updates(self, app, profiler):
+        client = app.test_client()
+
+        no_body = await client.post(PROFILER_ROUTE)
+        assert no_body.status_code == 400
+
+        bad_threshold = await client.post(
+            PROFILER_ROUTE, json={"route": SLOW_ROUTE, "thresholdMs": "slow"}
+        )
+        assert bad_threshold.status_code == 400
+        assert (await bad_threshold.get_json())["message"] == "Invalid thresholdMs"
+        assert profiler.routes == set()
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_newest_profiles(self, app, profiler, profiles_dir):
+        profiler.enable(SLOW_ROUTE)
+        client = app.test_client()
+
+        for _ in range(4):
+            await client.post(SLOW_ROUTE)
+
+        files = sorted(p.name for p in profiles_dir.iterdir())
+        assert len(files) == 4
+        names = {f.split(".")[0] for f in files}
+        assert len(names) == 2
+
+    @pytest.mark.asyncio
+    async def test_debug_route_requires_logged_user(self, app, profiler, session):
+        session["logged"] = False
+        client = app.test_client()
+
+        update = await client.post(PROFILER_ROUTE, json={"route": "*"})
+        state = await client.get(PROFILER_ROUTE)
+
+        assert update.status_code == 401
+        assert state.status_code == 401
+        assert profiler.routes == set()
+
+    @pytest.mark.asyncio
+    async def test_debug_route_not_served_unless_requested(self, tmp_path, profiler):
+        app = quart(tmp_path)
+        profiler.register(app)
+
+        response = await app.test_client().post(PROFILER_ROUTE, json={"route": "*"})
+
+        assert response.status_code in (404, 405)
+        assert profiler.routes == set()
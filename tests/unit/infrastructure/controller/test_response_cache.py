@@ -0,0 +1,152 @@
+import gzip
+import json
+from datetime import datetime
+
+import brotli
+import pytest
+
+from domain.data_init import DataEncryptedError
+from infrastructure.controller.config import quart
+from infrastructure.controller.response_cache import ResponseCache
+from infrastructure.controller.streaming import jsonify_stream
+
+ROUTE = "/api/v1/positions"
+STREAM_ROUTE = "/api/v1/transactions"
+OTHER_ROUTE = "/api/v1/settings"
+
+
+class _State:
+    def __init__(self):
+        self.last_update = datetime(2025, 1, 1, 12, 0, 0)
+        self.locked = False
+        self.calls = 0
+
+    async def get_last_updated(self) -> datetime:
+        if self.locked:
+            raise DataEncryptedError()
+        return self.last_update
+
+
+@pytest.fixture
+def state():
+    return _State()
+
+
+@pytest.fixture
+def app(tmp_path, state):
+    app = quart(tmp_path)
+    ResponseCache(state.get_last_updated).register(app)
+
+    @app.route(ROUTE, methods=["GET"])
+    async def positions_route():
+        state.calls += 1
+        return {"calls": state.calls, "values": list(range(500))}
+
+    @app.route(STREAM_ROUTE, methods=["GET"])
+    async def transactions_route():
+        state.calls += 1
+        return jsonify_stream(list(range(2000)), key="transactions", chunk_size=100)
+
+    @app.route(OTHER_ROUTE, methods=["GET"])
+    async def settings_route():
+        state.calls += 1
+        return {"calls": state.calls}
+
+    return app
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_sets_etag_and_answers_not_modified(self, app, state):
+        client = app.test_client()
+
+        first = await client.get(ROUTE)
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+
+        second = await client.get(ROUTE, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert state.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_body_until_db_changes(self, app, state):
+        client = app.test_client()
+
+        await client.get(ROUTE)
+        cached = await client.get(ROUTE)
+        assert (await cached.get_json())["calls"] == 1
+        assert state.calls == 1
+
+        state.last_update = datetime(2025, 1, 2)
+        refreshed = await client.get(ROUTE)
+        assert (await refreshed.get_json())["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_query_params_are_part_of_the_key(self, app, state):
+        client = app.test_client()
+
+        a = await client.get(ROUTE, query_string={"entity": "a"})
+        b = await client.get(ROUTE, query_string={"entity": "b"})
+
+        assert a.headers["ETag"] != b.headers["ETag"]
+        assert state.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_streamed_bodies_are_cached(self, app, state):
+        client = app.test_client()
+
+        first = await client.get(STREAM_ROUTE)
+        second = await client.get(STREAM_ROUTE)
+
+        assert await first.get_data() == await second.get_data()
+        assert len((await second.get_json())["transactions"]) == 2000
+        assert state.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_bypassed_when_locked_or_not_cacheable(self, app, state):
+        client = app.test_client()
+        state.locked = True
+
+        locked = await client.get(ROUTE)
+        other = await client.get(OTHER_ROUTE)
+
+        assert "ETag" not in locked.headers
+        assert "ETag" not in other.headers
+        assert state.calls == 2
+
+
+class TestCompression:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "encoding,decode", [("br", brotli.decompress), ("gzip", gzip.decompress)]
+    )
+    async def test_compresses_large_responses(self, app, encoding, decode):
+        client = app.test_client()
+
+        response = await client.get(ROUTE, headers={"Accept-Encoding": encoding})
+
+        assert response.headers["Content-Encoding"] == encoding
+        assert "Accept-Encoding" in response.headers["Vary"]
+        body = json.loads(decode(await response.get_data()))
+        assert body["values"] == list(range(500))
+
+    @pytest.mark.asyncio
+    async def test_compresses_streamed_responses(self, app):
+        client = app.test_client()
+
+        response = await client.get(STREAM_ROUTE, headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(await response.get_data()))
+        assert body["transactions"] == list(range(2000))
+
+    @pytest.mark.asyncio
+    async def test_small_responses_are_not_compressed(self, app):
+        client = app.test_client()
+
+        response = await client.get(OTHER_ROUTE, headers={"Accept-Encoding": "br"})
+
+        assert "Content-Encoding" not in response.headers
+        assert (await response.get_json())["calls"] == 1
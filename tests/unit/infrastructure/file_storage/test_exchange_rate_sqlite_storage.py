@@ -0,0 +1,106 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from domain.dezimal import Dezimal
+from infrastructure.file_storage.exchange_rate_sqlite_storage import (
+    ExchangeRateSQLiteStorage,
+)
+
+MATRIX = {
+    "EUR": {"USD": Dezimal("1.10"), "GBP": Dezimal("0.85"), "BTC": Dezimal("0.00001")},
+    "USD": {
+        "EUR": Dezimal("0.90909"),
+        "GBP": Dezimal("0.7727"),
+        "XAU": Dezimal("0.0005"),
+    },
+}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return ExchangeRateSQLiteStorage(str(tmp_path))
+
+
+def _pivot_rows(tmp_path) -> list[tuple[str, str, str]]:
+    with sqlite3.connect(tmp_path / ExchangeRateSQLiteStorage.FILENAME) as conn:
+        return conn.execute(
+            "SELECT currency, day, rate FROM pivot_rates ORDER BY currency, day"
+        ).fetchall()
+
+
+class TestSnapshot:
+    @pytest.mark.asyncio
+    async def test_saved_rates_survive_reopening(self, tmp_path):
+        storage = ExchangeRateSQLiteStorage(str(tmp_path))
+        await storage.save(MATRIX)
+
+        reopened = ExchangeRateSQLiteStorage(str(tmp_path))
+
+        assert await reopened.get() == MATRIX
+        assert await reopened.get_last_saved() == await storage.get_last_saved()
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_previous_rates(self, tmp_path):
+        storage = ExchangeRateSQLiteStorage(str(tmp_path))
+        await storage.save(MATRIX)
+        await storage.save({"EUR": {"USD": Dezimal("1.12")}})
+
+        reopened = ExchangeRateSQLiteStorage(str(tmp_path))
+
+        assert await reopened.get() == {"EUR": {"USD": Dezimal("1.12")}}
+
+    @pytest.mark.asyncio
+    async def test_empty(self, storage):
+        assert await storage.get() == {}
+        assert await storage.get_last_saved() is None
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_json_file(self, tmp_path):
+        legacy = tmp_path / "rates.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "last_saved": "2024-06-01T10:00:00+00:00",
+                    "rates": {"EUR": {"USD": "1.08"}, "USD": {"EUR": "0.9259"}},
+                }
+            )
+        )
+
+        storage = ExchangeRateSQLiteStorage(str(tmp_path))
+
+        assert not legacy.exists()
+        assert await storage.get() == {
+            "EUR": {"USD": Dezimal("1.08")},
+            "USD": {"EUR": Dezimal("0.9259")},
+        }
+        assert await storage.get_last_saved() == datetime(
+            2024, 6, 1, 10, tzinfo=timezone.utc
+        )
+        assert _pivot_rows(tmp_path) == [("USD", "2024-06-01", "1.08")]
+
+
+class TestPivotHistory:
+    @pytest.mark.asyncio
+    async def test_save_records_the_day_against_pivot(self, tmp_path, storage):
+        await storage.save(MATRIX)
+
+        day = (await storage.get_last_saved()).date().isoformat()
+        assert _pivot_rows(tmp_path) == [
+            ("BTC", day, "0.00001"),
+            ("GBP", day, "0.85"),
+            ("USD", day, "1.10"),
+            # Only quoted against USD, chained through it
+            ("XAU", day, str(Dezimal("1.10") * Dezimal("0.0005"))),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keeps_one_row_per_currency_and_day(self, tmp_path, storage):
+        await storage.save(MATRIX)
+        await storage.save({"EUR": {"USD": Dezimal("1.12")}})
+
+        day = (await storage.get_last_saved()).date().isoformat()
+        assert ("USD", day, "1.12") in _pivot_rows(tmp_path)
+        assert len([row for row in _pivot_rows(tmp_path) if row[0] == "USD"]) == 1
@@ -0,0 +1,145 @@
+from uuid import uuid4
+
+import pytest
+from aiocache import Cache
+
+from domain.fetch_result import FetchResultCode
+from infrastructure.instrumentation.cache_metrics import cache_metrics, metered_cached
+from infrastructure.instrumentation.metered_ttl_cache import metered_ttl_cached
+from infrastructure.instrumentation.metrics import (
+    CACHE_REQUESTS,
+    REGISTRY,
+    MetricsRegistry,
+    observe_fetch,
+)
+
+
+def _sample(registry: MetricsRegistry, line_prefix: str) -> float:
+    for line in registry.render().splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} not rendered")
+
+
+class TestMetricsRegistry:
+    def test_renders_counters_and_gauges(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls", ("host",))
+        in_flight = registry.gauge("in_flight", "In flight")
+
+        calls.labels("a.com").inc()
+        calls.labels("a.com").inc(2)
+        calls.labels('b"c').inc()
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+
+        text = registry.render()
+        assert "# HELP calls_total Calls\n# TYPE calls_total counter" in text
+        assert 'calls_total{host="a.com"} 3' in text
+        assert 'calls_total{host="b\\"c"} 1' in text
+        assert "# TYPE in_flight gauge\nin_flight 1" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        assert _sample(registry, 'latency_seconds_bucket{le="0.1"}') == 2
+        assert _sample(registry, 'latency_seconds_bucket{le="1"}') == 3
+        assert _sample(registry, 'latency_seconds_bucket{le="+Inf"}') == 4
+        assert _sample(registry, "latency_seconds_count") == 4
+        assert _sample(registry, "latency_seconds_sum") == pytest.approx(3.65)
+
+    def test_rejects_wrong_label_count_and_duplicates(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls", ("host",))
+
+        with pytest.raises(ValueError):
+            calls.labels("a", "b")
+        with pytest.raises(ValueError):
+            registry.counter("calls_total", "Calls")
+
+    def test_collectors_run_on_render(self):
+        registry = MetricsRegistry()
+        registry.add_collector(
+            lambda: [("answer", "gauge", "Answer", [("answer", {}, 42)])]
+        )
+
+        assert "# TYPE answer gauge\nanswer 42" in registry.render()
+
+    def test_default_registry_exposes_process_memory(self):
+        text = REGISTRY.render()
+
+        assert "# TYPE finanze_http_request_duration_seconds histogram" in text
+        assert "process_max_resident_memory_bytes" in text
+
+
+class TestCacheMetrics:
+    @pytest.mark.asyncio
+    async def test_counts_aiocache_hits_and_misses(self):
+        calls = []
+
+        class Client:
+            @metered_cached(cache=Cache.MEMORY)
+            async def lookup(self, key):
+                calls.append(key)
+                return key * 2
+
+        client = Client()
+        await client.lookup(1)
+        await client.lookup(1)
+        await client.lookup(2)
+
+        name = Client.lookup.__qualname__
+        assert name.endswith("Client.lookup")
+        assert calls == [1, 2]
+        assert CACHE_REQUESTS.labels(name, "hit").value == 1
+        assert CACHE_REQUESTS.labels(name, "miss").value == 2
+        assert f'finanze_cache_hit_ratio{{cache="{name}"}}' in REGISTRY.render()
+
+    @pytest.mark.asyncio
+    async def test_names_instance_caches_after_their_owner(self):
+        class Client:
+            def __init__(self):
+                self._cache = Cache(Cache.MEMORY, plugins=cache_metrics(self, "_cache"))
+
+        cache = Client()._cache
+        await cache.get("missing")
+
+        name = f"{Client.__qualname__}._cache"
+        assert CACHE_REQUESTS.labels(name, "miss").value == 1
+
+    def test_counts_ttl_cache_hits_and_misses(self):
+        @metered_ttl_cached(maxsize=10, ttl=60)
+        def lookup(key):
+            return key * 2
+
+        assert lookup(1) == 2
+        assert lookup(1) == 2
+        assert lookup(1) == 2
+
+        name = lookup.__qualname__
+        assert CACHE_REQUESTS.labels(name, "hit").value == 2
+        assert CACHE_REQUESTS.labels(name, "miss").value == 1
+
+
+class TestFetchMetrics:
+    def test_failed_fetches_have_error_outcome(self):
+        entity = uuid4()
+
+        observe_fetch("financial", entity, FetchResultCode.COMPLETED, 1.5)
+        observe_fetch("financial", entity, None, 0.5)
+
+        text = REGISTRY.render()
+        completed = FetchResultCode.COMPLETED.value
+        assert (
+            f'finanze_fetch_duration_seconds_count{{source="financial",entity="{entity}",'
+            f'code="{completed}",outcome="ok"}} 1'
+        ) in text
+        assert (
+            f'finanze_fetch_duration_seconds_count{{source="financial",entity="{entity}",'
+            'code="",outcome="error"} 1'
+        ) in text
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from infrastructure.instrumentation.profiler import SamplingProfiler
+
+
+def _busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler:
+    def test_samples_the_running_thread(self):
+        profiler = SamplingProfiler(interval=0.001)
+
+        profiler.start()
+        _busy(0.1)
+        profile = profiler.stop("busy")
+
+        assert profile.sample_count > 0
+        assert profile.duration >= 0.1
+        assert any(
+            frame.name == "_busy" for stack in profile.samples for frame in stack
+        )
+
+    def test_exports_collapsed_stacks_and_speedscope(self):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        _busy(0.05)
+        profile = profiler.stop("busy")
+
+        collapsed = profile.to_collapsed().splitlines()
+        stack, count = collapsed[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+        speedscope = profile.to_speedscope()
+        sampled = speedscope["profiles"][0]
+        frames = speedscope["shared"]["frames"]
+        assert sampled["type"] == "sampled"
+        assert len(sampled["samples"]) == len(sampled["weights"])
+        assert sum(sampled["weights"]) == pytest.approx(profile.sample_count * 0.001)
+        assert all(0 <= i < len(frames) for s in sampled["samples"] for i in s)
+
+    def test_start_and_stop_are_not_reentrant(self):
+        profiler = SamplingProfiler()
+
+        with pytest.raises(RuntimeError):
+            profiler.stop()
+
+        profiler.start()
+        with pytest.raises(RuntimeError):
+            profiler.start()
+        profiler.stop()
+        assert not profiler.running
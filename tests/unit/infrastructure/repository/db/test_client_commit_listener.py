@@ -0,0 +1,74 @@
+import sqlite3
+
+import pytest
+
+from infrastructure.repository.db.client import DBClient
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE sys_config (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE positions (id TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE transactions (id TEXT PRIMARY KEY, value TEXT);
+        """
+    )
+    conn.commit()
+    client = DBClient(connection=conn)
+    committed = []
+    client.add_commit_listener(committed.append)
+    yield client, committed
+    conn.close()
+
+
+class TestCommitListener:
+    @pytest.mark.asyncio
+    async def test_notifies_written_tables_on_outer_commit(self, db):
+        client, committed = db
+
+        async with client.tx() as cursor:
+            await cursor.execute("INSERT INTO positions VALUES (?, ?)", ("1", "a"))
+            async with client.tx() as nested:
+                await nested.execute(
+                    "INSERT OR REPLACE INTO transactions VALUES (?, ?)", ("1", "b")
+                )
+            assert committed == []
+            await cursor.execute("UPDATE positions SET value = ?", ("c",))
+
+        assert committed == [frozenset({"positions", "transactions"})]
+
+    @pytest.mark.asyncio
+    async def test_rollback_and_reads_do_not_notify(self, db):
+        client, committed = db
+
+        with pytest.raises(ValueError):
+            async with client.tx() as cursor:
+                await cursor.execute("DELETE FROM positions")
+                raise ValueError()
+
+        async with client.read() as cursor:
+            await cursor.execute("SELECT * FROM positions")
+
+        async with client.tx() as cursor:
+            await cursor.execute("SELECT * FROM transactions")
+
+        assert committed == []
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_does_not_break_commit(self, db):
+        client, committed = db
+
+        def failing(_):
+            raise RuntimeError()
+
+        client.add_commit_listener(failing)
+
+        async with client.tx() as cursor:
+            await cursor.execute("INSERT INTO positions VALUES (?, ?)", ("1", "a"))
+
+        assert committed == [frozenset({"positions"})]
+        async with client.read() as cursor:
+            await cursor.execute("SELECT COUNT(*) FROM positions")
+            assert (await cursor.fetchone())[0] == 1
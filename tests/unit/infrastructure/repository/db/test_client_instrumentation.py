@@ -0,0 +1,95 @@
+import logging
+import sqlite3
+
+import pytest
+
+from infrastructure.instrumentation.request_stats import current_stats, start_request
+from infrastructure.repository.db.client import DBClient
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE sys_config (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE positions (id TEXT PRIMARY KEY, entity TEXT, value TEXT);
+        CREATE INDEX idx_positions_entity ON positions (entity);
+        """
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+class TestQueryInstrumentation:
+    @pytest.mark.asyncio
+    async def test_records_queries_of_the_current_request(self, conn):
+        client = DBClient(connection=conn)
+        stats = start_request()
+
+        async with client.tx() as cursor:
+            await cursor.execute(
+                "INSERT INTO positions VALUES (?, ?, ?)", ("1", "e1", "a")
+            )
+        async with client.read() as cursor:
+            await cursor.execute("SELECT * FROM positions WHERE entity = ?", ("e1",))
+
+        assert current_stats() is stats
+        # BEGIN, INSERT, last update stamp, SELECT
+        assert stats.query_count == 4
+        assert stats.db_time > 0
+        assert stats.lock_wait >= 0
+        statements = [t.statement for t in stats.slowest_statements()]
+        assert "SELECT * FROM positions WHERE entity = ?" in statements
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_the_slowest_statements(self, conn):
+        client = DBClient(connection=conn)
+        stats = start_request()
+
+        async with client.read() as cursor:
+            for i in range(20):
+                await cursor.execute(f"SELECT {i}")
+
+        slowest = stats.slowest_statements()
+        assert stats.query_count == 20
+        assert len(slowest) == 5
+        durations = [t.duration for t in slowest]
+        assert durations == sorted(durations, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_explain_uses_indexes_and_is_not_counted(self, conn):
+        client = DBClient(connection=conn)
+        stats = start_request()
+
+        plan = client.explain("SELECT * FROM positions WHERE entity = ?", ("e1",))
+
+        assert any("idx_positions_entity" in line for line in plan)
+        assert client.explain("BEGIN") is None
+        assert stats.query_count == 0
+
+    @pytest.mark.asyncio
+    async def test_logs_slow_queries_with_plan(self, conn, caplog):
+        client = DBClient(connection=conn, slow_query_threshold=0)
+
+        with caplog.at_level(logging.WARNING):
+            async with client.read() as cursor:
+                await cursor.execute(
+                    "SELECT * FROM positions WHERE entity = ?", ("e1",)
+                )
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert len(messages) == 1
+        assert messages[0].startswith("Slow query")
+        assert "idx_positions_entity" in messages[0]
+
+    @pytest.mark.asyncio
+    async def test_no_slow_query_log_without_threshold(self, conn, caplog):
+        client = DBClient(connection=conn)
+
+        with caplog.at_level(logging.WARNING):
+            async with client.read() as cursor:
+                await cursor.execute("SELECT * FROM positions")
+
+        assert caplog.records == []
@@ -271,8 +271,7 @@ class TestGetLastGroupedByEntity:
 
         result = await repo.get_last_grouped_by_entity()
         assert ENTITY_A in result
-        # _aggregate_positions returns the single item for single-element lists
-        # then real + manual are combined via +
+        # real and manual positions are merged in a single aggregation
         combined = result[ENTITY_A]
         assert combined is not None
 
@@ -0,0 +1,99 @@
+from io import BytesIO
+
+import pytest
+
+from domain.export import FileFormat
+from domain.file_upload import FileUpload
+from infrastructure.table.csv_file_table_adapter import CSVFileTableAdapter
+from infrastructure.table.xlsx_file_table_adapter import XLSXFileTableAdapter
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+ROWS = [["name", "amount"]] + [[f"Payment {i}", f"{i}.50"] for i in range(25)]
+
+
+class RowSource:
+    """Async row iterator recording how many rows were pulled."""
+
+    def __init__(self, rows):
+        self._rows = rows
+        self.pulled = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.pulled == len(self._rows):
+            raise StopAsyncIteration
+        row = self._rows[self.pulled]
+        self.pulled += 1
+        return row
+
+
+async def _chunks(adapter, rows, file_format):
+    return [chunk async for chunk in adapter.convert(RowSource(rows), file_format)]
+
+
+def _upload(data: bytes, filename: str, content_type: str) -> FileUpload:
+    return FileUpload(
+        filename=filename,
+        content_type=content_type,
+        content_length=len(data),
+        data=BytesIO(data),
+    )
+
+
+class TestCSVFileTableAdapter:
+    @pytest.mark.asyncio
+    async def test_rows_are_written_in_batches(self, monkeypatch):
+        monkeypatch.setattr(CSVFileTableAdapter, "BATCH_SIZE", 10)
+        adapter = CSVFileTableAdapter()
+        source = RowSource(ROWS)
+
+        stream = adapter.convert(source, FileFormat.CSV)
+        first = await anext(stream)
+
+        assert source.pulled == 10
+        assert first.decode().splitlines()[0] == "name,amount"
+
+        rest = [chunk async for chunk in stream]
+        assert len(rest) == 2
+
+        data = first + b"".join(rest)
+        parsed = await adapter.parse(_upload(data, "export.csv", "text/csv"))
+        assert parsed == ROWS
+
+    @pytest.mark.asyncio
+    async def test_tsv_delimiter(self):
+        chunks = await _chunks(CSVFileTableAdapter(), ROWS[:2], FileFormat.TSV)
+
+        assert b"".join(chunks) == b"name\tamount\r\nPayment 0\t0.50\r\n"
+
+    @pytest.mark.asyncio
+    async def test_no_rows(self):
+        with pytest.raises(ValueError):
+            await _chunks(CSVFileTableAdapter(), [], FileFormat.CSV)
+
+
+class TestXLSXFileTableAdapter:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, monkeypatch):
+        monkeypatch.setattr(XLSXFileTableAdapter, "CHUNK_SIZE", 1024)
+        adapter = XLSXFileTableAdapter()
+
+        chunks = await _chunks(adapter, ROWS, FileFormat.XLSX)
+
+        assert len(chunks) > 1
+        data = b"".join(chunks)
+        parsed = await adapter.parse(_upload(data, "export.xlsx", XLSX_CONTENT_TYPE))
+        assert parsed == ROWS
+
+    @pytest.mark.asyncio
+    async def test_no_rows(self):
+        with pytest.raises(ValueError):
+            await _chunks(XLSXFileTableAdapter(), [], FileFormat.XLSX)
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format(self):
+        with pytest.raises(ValueError):
+            await _chunks(XLSXFileTableAdapter(), ROWS, FileFormat.CSV)
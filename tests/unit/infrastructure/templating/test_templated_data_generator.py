@@ -0,0 +1,571 @@
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+import pytest
+from dateutil.tz import UTC
+
+from domain.auto_contributions import (
+    AutoContributions,
+    ContributionFrequency,
+    ContributionTargetType,
+    PeriodicContribution,
+)
+from domain.dezimal import Dezimal
+from domain.entity import Entity, EntityOrigin, EntityType, Feature
+from domain.export import NumberFormat, TemplatedDataProcessorParams
+from domain.fetch_record import DataSource
+from domain.global_position import (
+    CryptoCurrencies,
+    CryptoCurrencyPosition,
+    CryptoCurrencyType,
+    CryptoCurrencyWallet,
+    EquityType,
+    FundDetail,
+    FundInvestments,
+    FundPortfolio,
+    FundType,
+    GlobalPosition,
+    ProductType,
+    StockDetail,
+    StockInvestments,
+)
+from domain.template import ProcessorDataFilter, Template, TemplatedField
+from domain.template_type import TemplateType
+from domain.transactions import AccountTx, FundTx, StockTx, TxType
+from infrastructure.templating import templated_data_generator
+from infrastructure.templating.templated_data_generator import TemplatedDataGenerator
+
+ENTITY = Entity(
+    id=UUID(int=1),
+    name="Broker",
+    natural_id=None,
+    type=EntityType.FINANCIAL_INSTITUTION,
+    origin=EntityOrigin.NATIVE,
+    icon_url=None,
+)
+WALLETS = Entity(
+    id=UUID(int=2),
+    name="Wallets",
+    natural_id=None,
+    type=EntityType.CRYPTO_WALLET,
+    origin=EntityOrigin.NATIVE,
+    icon_url=None,
+)
+DATE = datetime(2025, 3, 14, 9, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def utc_local_time(monkeypatch):
+    monkeypatch.setattr(templated_data_generator, "tzlocal", lambda: UTC)
+
+
+def _params(feature, products=None, template=None, filters=None, **kwargs):
+    return TemplatedDataProcessorParams(
+        template=template,
+        number_format=kwargs.get("number_format", NumberFormat.EUROPEAN),
+        feature=feature,
+        products=products,
+        datetime_format=kwargs.get("datetime_format"),
+        date_format=kwargs.get("date_format"),
+        filters=filters,
+    )
+
+
+def _template(feature, fields, products=None):
+    return Template(
+        id=None,
+        name="",
+        feature=feature,
+        type=TemplateType.EXPORT,
+        fields=[TemplatedField(field=field, name=name) for field, name in fields],
+        products=products,
+    )
+
+
+def _transactions():
+    common = dict(
+        currency="EUR",
+        date=DATE,
+        entity=ENTITY,
+        source=DataSource.REAL,
+    )
+    return [
+        AccountTx(
+            id=UUID(int=10),
+            ref="acc-1",
+            name="Salary",
+            amount=Dezimal("2500.50"),
+            type=TxType.TRANSFER_IN,
+            product_type=ProductType.ACCOUNT,
+            fees=Dezimal(0),
+            retentions=Dezimal("0.5"),
+            **common,
+        ),
+        StockTx(
+            id=UUID(int=11),
+            ref="stk-1",
+            name="ACME",
+            amount=Dezimal("1175.80"),
+            type=TxType.BUY,
+            product_type=ProductType.STOCK_ETF,
+            shares=Dezimal(10),
+            price=Dezimal("117.58"),
+            fees=Dezimal("1.25"),
+            isin="US0000000001",
+            ticker="ACME",
+            equity_type=EquityType.STOCK,
+            **common,
+        ),
+        FundTx(
+            id=UUID(int=12),
+            ref="fnd-1",
+            name="World Fund",
+            amount=Dezimal("300"),
+            type=TxType.BUY,
+            product_type=ProductType.FUND,
+            shares=Dezimal(3),
+            price=Dezimal(100),
+            fees=Dezimal(0),
+            isin="LU0000000001",
+            **common,
+        ),
+    ]
+
+
+def _positions():
+    portfolio = FundPortfolio(id=UUID(int=20), name="Growth")
+    return [
+        GlobalPosition(
+            id=UUID(int=30),
+            entity=ENTITY,
+            date=DATE,
+            products={
+                ProductType.STOCK_ETF: StockInvestments(
+                    [
+                        StockDetail(
+                            id=UUID(int=31),
+                            name="ACME",
+                            ticker="ACME",
+                            isin="US0000000001",
+                            shares=Dezimal(10),
+                            market_value=Dezimal("1234.5"),
+                            currency="EUR",
+                            type=EquityType.ETF,
+                            initial_investment=Dezimal(1000),
+                        )
+                    ]
+                ),
+                ProductType.FUND: FundInvestments(
+                    [
+                        FundDetail(
+                            id=UUID(int=32),
+                            name="World Fund",
+                            isin="LU0000000001",
+                            market=None,
+                            shares=Dezimal(3),
+                            market_value=Dezimal("310.25"),
+                            currency="EUR",
+                            type=FundType.MUTUAL_FUND,
+                            initial_investment=Dezimal(300),
+                            portfolio=portfolio,
+                        ),
+                        FundDetail(
+                            id=UUID(int=33),
+                            name="Bond Fund",
+                            isin="LU0000000002",
+                            market="XETRA",
+                            shares=Dezimal(1),
+                            market_value=Dezimal(99),
+                            currency="USD",
+                            type=FundType.MUTUAL_FUND,
+                            initial_investment=Dezimal(100),
+                        ),
+                    ]
+                ),
+            },
+        ),
+        GlobalPosition(
+            id=UUID(int=40),
+            entity=WALLETS,
+            date=DATE,
+            products={
+                ProductType.CRYPTO: CryptoCurrencies(
+                    [
+                        CryptoCurrencyWallet(
+                            id=UUID(int=41),
+                            name="Cold",
+                            assets=[
+                                CryptoCurrencyPosition(
+                                    id=UUID(int=42),
+                                    symbol="BTC",
+                                    amount=Dezimal("0.85"),
+                                    type=CryptoCurrencyType.NATIVE,
+                                    name="Bitcoin",
+                                    market_value=Dezimal("51000.10"),
+                                    currency="EUR",
+                                )
+                            ],
+                        )
+                    ]
+                )
+            },
+        ),
+    ]
+
+
+def _contributions():
+    return [
+        AutoContributions(
+            periodic=[
+                PeriodicContribution(
+                    id=UUID(int=50),
+                    alias=None,
+                    target="LU0000000001",
+                    target_name="World Fund",
+                    target_type=ContributionTargetType.FUND,
+                    amount=Dezimal(150),
+                    currency="EUR",
+                    since=date(2024, 1, 5),
+                    until=None,
+                    frequency=ContributionFrequency.MONTHLY,
+                    active=True,
+                    source=DataSource.REAL,
+                    next_date=date(2025, 4, 5),
+                    entity=ENTITY,
+                )
+            ]
+        )
+    ]
+
+
+async def _process(data, params):
+    return [row async for row in TemplatedDataGenerator().process(data, params)]
+
+
+# Rows produced by the asdict based mapper, kept to pin the output format
+TX_DEFAULT_ROWS = [
+    [
+        "ref",
+        "name",
+        "amount",
+        "currency",
+        "type",
+        "product_type",
+        "date",
+        "entity",
+        "fees",
+        "retentions",
+        "interest_rate",
+        "avg_balance",
+        "net_amount",
+        "isin",
+        "ticker",
+        "market",
+        "shares",
+        "price",
+        "order_date",
+        "equity_type",
+    ],
+    [
+        "acc-1",
+        "Salary",
+        "2500,50",
+        "EUR",
+        "TRANSFER_IN",
+        "ACCOUNT",
+        "14/03/2025 09:30",
+        "Broker",
+        "0",
+        "0,5",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ],
+    [
+        "stk-1",
+        "ACME",
+        "1175,80",
+        "EUR",
+        "BUY",
+        "STOCK_ETF",
+        "14/03/2025 09:30",
+        "Broker",
+        "1,25",
+        "",
+        "",
+        "",
+        "",
+        "US0000000001",
+        "ACME",
+        "",
+        "10",
+        "117,58",
+        "",
+        "STOCK",
+    ],
+]
+
+
+TX_CUSTOM_ROWS = [
+    ["Date", "Entity", "Product", "name", "Amount", "Type", "ISIN", "Fees"],
+    [
+        "2025-03-14T09:30:00+00:00",
+        "Broker",
+        "STOCK_ETF",
+        "ACME",
+        "1175.80",
+        "BUY",
+        "US0000000001",
+        "1.25",
+    ],
+    [
+        "2025-03-14T09:30:00+00:00",
+        "Broker",
+        "FUND",
+        "World Fund",
+        "300",
+        "BUY",
+        "LU0000000001",
+        "0",
+    ],
+]
+
+
+POS_DEFAULT_ROWS = [
+    [
+        "name",
+        "ticker",
+        "isin",
+        "market",
+        "shares",
+        "initial_investment",
+        "average_buy_price",
+        "market_value",
+        "currency",
+        "type",
+        "subtype",
+        "info_sheet_url",
+        "product_type",
+        "entity",
+        "asset_type",
+        "portfolio.name",
+        "symbol",
+        "amount",
+        "contract_address",
+        "wallet_address",
+        "wallet_name",
+    ],
+    [
+        "ACME",
+        "ACME",
+        "US0000000001",
+        "",
+        "10",
+        "1000",
+        "100",
+        "1234,5",
+        "EUR",
+        "ETF",
+        "",
+        "",
+        "STOCK_ETF",
+        "Broker",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ],
+    [
+        "World Fund",
+        "",
+        "LU0000000001",
+        "",
+        "3",
+        "300",
+        "100",
+        "310,25",
+        "EUR",
+        "MUTUAL_FUND",
+        "",
+        "",
+        "FUND",
+        "Broker",
+        "",
+        "Growth",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ],
+    [
+        "Bond Fund",
+        "",
+        "LU0000000002",
+        "XETRA",
+        "1",
+        "100",
+        "100",
+        "99",
+        "USD",
+        "MUTUAL_FUND",
+        "",
+        "",
+        "FUND",
+        "Broker",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ],
+    [
+        "Bitcoin",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "51000,10",
+        "EUR",
+        "NATIVE",
+        "",
+        "",
+        "CRYPTO",
+        "Wallets",
+        "",
+        "",
+        "BTC",
+        "0,85",
+        "",
+        "",
+        "",
+    ],
+]
+
+
+POS_CUSTOM_ROWS = [
+    ["Entity", "Product", "Name", "Value", "Portfolio", "Market"],
+    ["Broker", "FUND", "World Fund", "310,25", "Growth", ""],
+    ["Broker", "FUND", "Bond Fund", "99", "", "XETRA"],
+]
+
+
+CONTRIB_ROWS = [
+    [
+        "alias",
+        "target",
+        "target_name",
+        "target_type",
+        "target_subtype",
+        "amount",
+        "currency",
+        "frequency",
+        "active",
+        "since",
+        "until",
+        "next_date",
+        "entity",
+    ],
+    [
+        "",
+        "LU0000000001",
+        "World Fund",
+        "FUND",
+        "",
+        "150",
+        "EUR",
+        "MONTHLY",
+        True,
+        "05/01/2024",
+        "",
+        "05/04/2025",
+        "Broker",
+    ],
+]
+
+
+class TestTransactions:
+    @pytest.mark.asyncio
+    async def test_default_template_keeps_requested_products(self):
+        params = _params(
+            Feature.TRANSACTIONS,
+            [ProductType.STOCK_ETF, ProductType.ACCOUNT],
+            datetime_format="%d/%m/%Y %H:%M",
+        )
+
+        assert await _process(_transactions(), params) == TX_DEFAULT_ROWS
+
+    @pytest.mark.asyncio
+    async def test_custom_template_with_filters(self):
+        template = _template(
+            Feature.TRANSACTIONS,
+            [
+                ("date", "Date"),
+                ("entity", "Entity"),
+                ("product_type", "Product"),
+                ("name", None),
+                ("amount", "Amount"),
+                ("type", "Type"),
+                ("isin", "ISIN"),
+                ("fees", "Fees"),
+            ],
+        )
+        params = _params(
+            Feature.TRANSACTIONS,
+            template=template,
+            filters=[ProcessorDataFilter(field="type", values="BUY")],
+            number_format=NumberFormat.ENGLISH,
+        )
+
+        assert await _process(_transactions(), params) == TX_CUSTOM_ROWS
+
+
+class TestPositions:
+    @pytest.mark.asyncio
+    async def test_default_template_flattens_crypto_wallets(self):
+        params = _params(
+            Feature.POSITION,
+            [ProductType.STOCK_ETF, ProductType.FUND, ProductType.CRYPTO],
+        )
+
+        assert await _process(_positions(), params) == POS_DEFAULT_ROWS
+
+    @pytest.mark.asyncio
+    async def test_nested_field_column(self):
+        template = _template(
+            Feature.POSITION,
+            [
+                ("entity", "Entity"),
+                ("product_type", "Product"),
+                ("name", "Name"),
+                ("market_value", "Value"),
+                ("portfolio.name", "Portfolio"),
+                ("market", "Market"),
+            ],
+            [ProductType.FUND],
+        )
+        params = _params(Feature.POSITION, [ProductType.FUND], template=template)
+
+        assert await _process(_positions(), params) == POS_CUSTOM_ROWS
+
+
+class TestAutoContributions:
+    @pytest.mark.asyncio
+    async def test_default_template(self):
+        params = _params(Feature.AUTO_CONTRIBUTIONS, date_format="%d/%m/%Y")
+
+        assert await _process(_contributions(), params) == CONTRIB_ROWS
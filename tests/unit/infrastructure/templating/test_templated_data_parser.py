@@ -0,0 +1,291 @@
+from datetime import datetime
+
+import pytest
+
+from domain.dezimal import Dezimal
+from domain.entity import Feature
+from domain.export import NumberFormat
+from domain.fetch_record import DataSource
+from domain.global_position import ProductType
+from domain.importing import (
+    ImportCandidate,
+    ImportErrorType,
+    TemplatedDataParserParams,
+)
+from domain.template import Template, TemplatedField
+from domain.template_type import TemplateType
+from domain.transactions import TxType
+from infrastructure.templating.templated_data_parser import TemplateDataParser
+
+STOCK_TX_COLUMNS = [
+    "ref",
+    "name",
+    "amount",
+    "currency",
+    "type",
+    "date",
+    "entity",
+    "shares",
+    "price",
+    "fees",
+    "order_date",
+]
+
+STOCK_COLUMNS = [
+    "name",
+    "ticker",
+    "isin",
+    "shares",
+    "market_value",
+    "currency",
+    "type",
+    "initial_investment",
+    "average_buy_price",
+]
+
+
+def _candidate(feature, product, columns, rows, **kwargs):
+    template = Template(
+        id=None,
+        name="",
+        feature=feature,
+        type=TemplateType.IMPORT,
+        fields=[
+            TemplatedField(field=column, name=None, default_value=default)
+            for column, default in (
+                (column, kwargs.get("defaults", {}).get(column)) for column in columns
+            )
+        ],
+        products=[product],
+    )
+    params = TemplatedDataParserParams(
+        template=template,
+        number_format=kwargs.get("number_format", NumberFormat.EUROPEAN),
+        feature=feature,
+        product=product,
+        datetime_format=kwargs.get("datetime_format", "%d/%m/%Y %H:%M"),
+        date_format=kwargs.get("date_format", "%d/%m/%Y"),
+        params=kwargs.get("params", {}),
+    )
+    header = kwargs.get("header", columns)
+    return ImportCandidate(
+        name="Sheet", source=DataSource.MANUAL, params=params, data=[header] + rows
+    )
+
+
+def _tx_row(ref, **overrides):
+    row = {
+        "ref": ref,
+        "name": "Apple",
+        "amount": "1.234,50",
+        "currency": "eur",
+        "type": "buy",
+        "date": "14/03/2025 09:30",
+        "entity": "Broker",
+        "shares": "10",
+        "price": "123,45",
+        "fees": "",
+        "order_date": "",
+    }
+    row.update(overrides)
+    return [row[column] for column in STOCK_TX_COLUMNS]
+
+
+def _tx_candidate(rows, **kwargs):
+    return _candidate(
+        Feature.TRANSACTIONS, ProductType.STOCK_ETF, STOCK_TX_COLUMNS, rows, **kwargs
+    )
+
+
+def _load_txs(parser, candidate):
+    txs, _, errors = parser._load_txs(candidate, {}, {})
+    return txs, errors
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "rows"])
+def parser(request):
+    return TemplateDataParser(bulk=request.param)
+
+
+class TestTransactions:
+    def test_parses_typed_columns(self, parser):
+        candidate = _tx_candidate([_tx_row("r1"), _tx_row("r2", date="15/03/2025")])
+
+        txs, errors = _load_txs(parser, candidate)
+
+        assert errors == []
+        assert [tx.ref for tx in txs] == ["r1", "r2"]
+        tx = txs[0]
+        assert tx.amount == Dezimal("1234.50")
+        assert tx.price == Dezimal("123.45")
+        assert tx.currency == "EUR"
+        assert tx.type == TxType.BUY
+        assert tx.fees == Dezimal(0)
+        assert tx.date == datetime(2025, 3, 14, 9, 30)
+        assert tx.order_date is None
+        assert txs[1].date == datetime(2025, 3, 15)
+
+    def test_english_number_format(self, parser):
+        candidate = _tx_candidate(
+            [_tx_row("r1", amount="1,234.50")], number_format=NumberFormat.ENGLISH
+        )
+
+        txs, errors = _load_txs(parser, candidate)
+
+        assert errors == []
+        assert txs[0].amount == Dezimal("1234.50")
+
+    def test_template_defaults_fill_empty_cells(self, parser):
+        candidate = _tx_candidate(
+            [_tx_row("r1", currency="")], defaults={"currency": "USD"}
+        )
+
+        txs, errors = _load_txs(parser, candidate)
+
+        assert errors == []
+        assert txs[0].currency == "USD"
+
+    def test_invalid_cells_and_missing_fields(self, parser):
+        candidate = _tx_candidate(
+            [
+                _tx_row("r1", amount="abc"),
+                _tx_row("r2", currency="ZZZ"),
+                _tx_row("r3", name=""),
+                _tx_row("r4", fees="1,x"),
+                _tx_row("r5", type="gift"),
+            ]
+        )
+
+        txs, errors = _load_txs(parser, candidate)
+
+        assert txs == []
+        assert [(e.type, e.detail, e.row[0]) for e in errors] == [
+            (
+                ImportErrorType.VALIDATION_ERROR,
+                [{"field": "amount", "value": "abc"}],
+                "r1",
+            ),
+            (ImportErrorType.MISSING_FIELD, ["amount"], "r1"),
+            (
+                ImportErrorType.VALIDATION_ERROR,
+                [{"field": "currency", "value": "ZZZ"}],
+                "r2",
+            ),
+            (ImportErrorType.MISSING_FIELD, ["currency"], "r2"),
+            (ImportErrorType.MISSING_FIELD, [{"field": "name"}], "r3"),
+            (
+                ImportErrorType.VALIDATION_ERROR,
+                [{"field": "fees", "value": "1,x"}],
+                "r4",
+            ),
+            (ImportErrorType.MISSING_FIELD, ["fees"], "r4"),
+            (
+                ImportErrorType.VALIDATION_ERROR,
+                [{"field": "type", "value": "gift"}],
+                "r5",
+            ),
+            (ImportErrorType.MISSING_FIELD, ["type"], "r5"),
+        ]
+
+    def test_unexpected_columns(self, parser):
+        candidate = _tx_candidate(
+            [_tx_row("r1") + ["extra"]], header=STOCK_TX_COLUMNS + ["notes"]
+        )
+
+        txs, errors = _load_txs(parser, candidate)
+
+        assert len(txs) == 1
+        assert errors[0].type == ImportErrorType.UNEXPECTED_COLUMN
+        assert errors[0].detail == ["notes"]
+
+
+class TestBulkParity:
+    def test_same_errors_and_entries_as_row_parser(self):
+        rows = []
+        for i in range(300):
+            overrides = {}
+            if i % 7 == 0:
+                overrides["amount"] = "n/a"
+            if i % 11 == 0:
+                overrides["date"] = f"{1 + i % 28:02d}/01/2025"
+            if i % 13 == 0:
+                overrides["currency"] = ""
+            if i % 17 == 0:
+                overrides["order_date"] = "2025-01-01"
+            rows.append(_tx_row(f"r{i}", **overrides))
+        candidate = _tx_candidate(rows)
+
+        bulk_txs, bulk_errors = _load_txs(TemplateDataParser(bulk=True), candidate)
+        row_txs, row_errors = _load_txs(TemplateDataParser(bulk=False), candidate)
+
+        assert bulk_errors == row_errors
+        assert [(tx.ref, tx.amount, tx.date, tx.order_date) for tx in bulk_txs] == [
+            (tx.ref, tx.amount, tx.date, tx.order_date) for tx in row_txs
+        ]
+
+
+class TestPositions:
+    @pytest.mark.asyncio
+    async def test_positions_per_entity(self, parser):
+        candidate = _candidate(
+            Feature.POSITION,
+            ProductType.STOCK_ETF,
+            STOCK_COLUMNS,
+            [
+                [
+                    "Apple",
+                    "AAPL",
+                    "US0378331005",
+                    "10",
+                    "1.500,25",
+                    "usd",
+                    "stock",
+                    "1.400",
+                    "140",
+                ],
+                ["Bad", "BAD", "US0000000000", "ten", "1", "usd", "etf", "1", "1"],
+            ],
+            params={"entity": "Broker"},
+        )
+
+        result = await parser.global_positions([candidate], {})
+
+        assert len(result.positions) == 1
+        entries = result.positions[0].products[ProductType.STOCK_ETF].entries
+        assert [(e.name, e.shares, e.market_value) for e in entries] == [
+            ("Apple", Dezimal(10), Dezimal("1500.25"))
+        ]
+        assert result.positions[0].entity.name == "Broker"
+        assert [e.detail for e in result.errors] == [
+            [{"field": "shares", "value": "ten"}],
+            ["shares"],
+        ]
+
+
+def test_mixed_date_formats_in_a_column(parser):
+    dates = ["01/02/2025", "02/02/2025 10:00", "03/02/2025", "2025-02-04"]
+    candidate = _tx_candidate([_tx_row(f"r{i}", date=d) for i, d in enumerate(dates)])
+
+    txs, errors = _load_txs(parser, candidate)
+
+    assert [tx.date for tx in txs] == [
+        datetime(2025, 2, 1),
+        datetime(2025, 2, 2, 10, 0),
+        datetime(2025, 2, 3),
+    ]
+    assert errors[0].detail == [{"field": "date", "value": "2025-02-04"}]
+
+
+def test_ambiguous_dates_follow_configured_format_order(parser):
+    # 13/02/2024 only matches the fallback format, 01/02/2024 matches both
+    dates = ["13/02/2024", "01/02/2024"]
+    candidate = _tx_candidate(
+        [_tx_row(f"r{i}", date=d) for i, d in enumerate(dates)],
+        datetime_format="%m/%d/%Y",
+        date_format="%d/%m/%Y",
+    )
+
+    txs, errors = _load_txs(parser, candidate)
+
+    assert errors == []
+    assert [tx.date for tx in txs] == [datetime(2024, 2, 13), datetime(2024, 1, 2)]
@@ -5,7 +5,7 @@ import pytest
 from domain.dezimal import Dezimal
 from domain.exception.exceptions import MissingFieldsError
 from domain.global_position import InstallmentFrequency, InterestType
-from domain.loan_calculator import LoanCalculationParams
+from domain.loan_calculator import LoanCalculationParams, LoanInstallment
 from infrastructure.calculations.loan_calculator import LoanCalculator
 
 
@@ -524,3 +524,134 @@ class TestInterestBreakdown:
         )
 
         assert low.current_installment_interests < high.current_installment_interests
+
+
+# ---------------------------------------------------------------------------
+# TestOutstandingFromStart
+# ---------------------------------------------------------------------------
+
+
+class TestOutstandingFromStart:
+    # Reference balances from the previous period by period simulation, which
+    # rounded every installment to cents
+    @pytest.mark.parametrize(
+        "frequency, today, expected",
+        [
+            (InstallmentFrequency.MONTHLY, date(2021, 6, 1), Dezimal("96503.41")),
+            (InstallmentFrequency.MONTHLY, date(2023, 1, 15), Dezimal("92476.48")),
+            (InstallmentFrequency.MONTHLY, date(2031, 6, 1), Dezimal("72323.12")),
+            (InstallmentFrequency.MONTHLY, date(2049, 12, 20), Dezimal(0)),
+            (InstallmentFrequency.WEEKLY, date(2021, 6, 1), Dezimal("96598.70")),
+            (InstallmentFrequency.WEEKLY, date(2023, 1, 15), Dezimal("92460.14")),
+            (InstallmentFrequency.WEEKLY, date(2031, 6, 1), Dezimal("72441.61")),
+        ],
+    )
+    def test_mixed_loan_matches_reference_schedule(self, frequency, today, expected):
+        calc = _calculator()
+        params = _params(
+            interest_type=InterestType.MIXED,
+            interest_rate=Dezimal("0.01"),
+            euribor_rate=Dezimal("0.025"),
+            fixed_years=3,
+            fixed_interest_rate=Dezimal("0.02"),
+            installment_frequency=frequency,
+        )
+
+        outstanding = calc._compute_outstanding_from_start(params, today)
+
+        # Only the per installment cent rounding differs
+        assert abs(outstanding - expected) < Dezimal("0.5")
+
+    def test_before_start_returns_loan_amount(self):
+        calc = _calculator()
+        params = _params(interest_type=InterestType.VARIABLE, euribor_rate=Dezimal(0))
+
+        assert calc._compute_outstanding_from_start(
+            params, date(2019, 1, 1)
+        ) == Dezimal(100000)
+
+
+# ---------------------------------------------------------------------------
+# TestSchedule
+# ---------------------------------------------------------------------------
+
+
+class TestSchedule:
+    @pytest.mark.asyncio
+    async def test_fixed_schedule_repays_loan(self):
+        calc = _calculator()
+
+        schedule = await calc.schedule(_params())
+        installments = schedule.installments
+
+        assert len(installments) == 360
+        # 100000 at 3% over 360 months, payment 100000 * r / (1 - (1 + r)^-360)
+        assert installments[0] == LoanInstallment(
+            date=date(2020, 1, 15),
+            payment=Dezimal("421.60"),
+            interests=Dezimal("250.00"),
+            principal=Dezimal("171.60"),
+            principal_outstanding=Dezimal("99828.40"),
+        )
+        assert installments[1] == LoanInstallment(
+            date=date(2020, 2, 15),
+            payment=Dezimal("421.60"),
+            interests=Dezimal("249.57"),
+            principal=Dezimal("172.03"),
+            principal_outstanding=Dezimal("99656.37"),
+        )
+        assert {i.payment for i in installments[:-1]} == {Dezimal("421.60")}
+        assert installments[-1].date == date(2049, 12, 15)
+        assert installments[-1].principal_outstanding == Dezimal(0)
+        assert sum((i.principal for i in installments), Dezimal(0)) == Dezimal(100000)
+        assert schedule.total_payment == schedule.total_interests + Dezimal(100000)
+        for installment in installments:
+            assert installment.payment == installment.interests + installment.principal
+
+    @pytest.mark.asyncio
+    async def test_schedule_matches_calculated_installment(self):
+        calc = _calculator()
+        params = _params()
+
+        result = await calc.calculate(params)
+        schedule = await calc.schedule(params)
+
+        assert schedule.installments[0].payment == result.current_installment_payment
+
+    @pytest.mark.asyncio
+    async def test_mixed_schedule_changes_payment_after_fixed_period(self):
+        calc = _calculator()
+        params = _params(
+            interest_type=InterestType.MIXED,
+            interest_rate=Dezimal("0.01"),
+            euribor_rate=Dezimal("0.03"),
+            fixed_years=5,
+            fixed_interest_rate=Dezimal("0.02"),
+        )
+
+        installments = (await calc.schedule(params)).installments
+
+        fixed = [i for i in installments if i.date < date(2025, 1, 15)]
+        variable = [i for i in installments if i.date >= date(2025, 1, 15)]
+        assert len(fixed) == 60
+        assert len({i.payment for i in fixed}) == 1
+        assert variable[0].payment > fixed[0].payment
+        assert installments[-1].principal_outstanding == Dezimal(0)
+
+    @pytest.mark.asyncio
+    async def test_schedule_from_outstanding_starts_at_next_installment(self):
+        calc = _calculator()
+        params = _params(
+            loan_amount=None,
+            principal_outstanding=Dezimal(50000),
+            start=date(2020, 1, 15),
+            end=date(2090, 1, 15),
+        )
+
+        installments = (await calc.schedule(params)).installments
+
+        assert installments[0].date >= date.today()
+        assert installments[0].date == calc.next_installment_date(
+            params.start, params.end, params.installment_frequency, date.today()
+        )
+        assert installments[-1].principal_outstanding == Dezimal(0)
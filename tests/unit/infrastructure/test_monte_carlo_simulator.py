@@ -0,0 +1,73 @@
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from domain.dezimal import Dezimal
+from domain.forecast import MonteCarloInputs, ReturnAssumption, SimulatedAsset
+from infrastructure.calculations.monte_carlo_simulator import MonteCarloSimulator
+
+MONTHS = 24
+DATES = [date(2025, 1, 1) + relativedelta(months=m) for m in range(1, MONTHS + 1)]
+
+
+def _inputs(assets, base=None, paths=2000, seed=7, percentiles=None):
+    return MonteCarloInputs(
+        dates=DATES,
+        base=base or {},
+        assets=assets,
+        paths=paths,
+        percentiles=percentiles or [5, 50, 95],
+        seed=seed,
+    )
+
+
+def _asset(mean, volatility, initial=1000, contribution=0, currency="EUR"):
+    return SimulatedAsset(
+        asset_class="equities",
+        currency=currency,
+        returns=ReturnAssumption(mean=Dezimal(mean), volatility=Dezimal(volatility)),
+        initial=Dezimal(initial),
+        contributions=[Dezimal(contribution)] * MONTHS,
+    )
+
+
+class TestMonteCarloSimulator:
+    def test_zero_volatility_matches_deterministic_compounding(self):
+        base = {"EUR": [Dezimal(500)] * MONTHS}
+        result = MonteCarloSimulator().simulate(
+            _inputs([_asset("0.06", "0", contribution=100)], base=base)
+        )
+
+        value = Dezimal(1000)
+        for point in result.points:
+            value = (value + Dezimal(100)) * (Dezimal(1) + Dezimal("0.06") / 12)
+            expected = round(value + Dezimal(500), 2)
+            assert point.net_worth["EUR"] == [expected] * 3
+
+    def test_seed_is_reproducible(self):
+        inputs = _inputs([_asset("0.07", "0.2", contribution=50)])
+
+        first = MonteCarloSimulator().simulate(inputs)
+        second = MonteCarloSimulator().simulate(inputs)
+
+        assert first == second
+
+    def test_percentiles_are_ordered_and_spread_grows(self):
+        result = MonteCarloSimulator().simulate(_inputs([_asset("0.07", "0.2")]))
+
+        spreads = []
+        for point in result.points:
+            low, median, high = point.net_worth["EUR"]
+            assert low < median < high
+            spreads.append(high - low)
+        assert spreads[-1] > spreads[0]
+        assert result.percentiles == [5, 50, 95]
+        assert len(result.points) == MONTHS
+
+    def test_same_class_shares_returns_across_currencies(self):
+        assets = [_asset("0.07", "0.3"), _asset("0.07", "0.3", currency="USD")]
+
+        result = MonteCarloSimulator().simulate(_inputs(assets, percentiles=[10, 90]))
+
+        for point in result.points:
+            assert point.net_worth["EUR"] == point.net_worth["USD"]